@@ -0,0 +1,185 @@
+"""
+Weighted cutflows of the ntuple processing
+
+The raw and weighted event counts at each selection step are booked as lazy
+RDataFrame actions, so they are filled in the event loop that produces the
+arrays instead of one extra loop per Count(). A cutflow is a list of steps
+  [{'step': name, 'events': raw count, 'sumw': sum of weights, 'sumw2': sum of squared weights}, ...]
+stored as the attribute 'cutflow' of the HDF5 output and in its manifest.
+
+Cutflows of many job outputs can be merged:
+
+  python python/cutflow.py <output_dir>/ttbar/nominal/*/*_ljets.h5 -o cutflow_ttbar.json
+"""
+import os
+import json
+import h5py
+
+from manifest import readManifest
+
+import logging
+logger = logging.getLogger(__name__)
+
+class Cutflow():
+    """ Raw and weighted event counts at selection steps, booked on a data frame
+    ______
+    Arguments
+    weight: str; column of the event weight. Only the raw counts are booked if
+            it is None or not defined on the node of a step
+    """
+    def __init__(self, weight=None):
+        self.weight = weight
+        self.weight2 = None
+
+        # (step name, result pointers of the count, the sum of weights and the sum of squared weights)
+        self.steps = []
+
+    def book(self, node, step):
+        """
+        Book the counts of the events reaching node as selection step.
+        Return the node, on which the squared weight column is defined the first time
+        """
+        if self.weight2 is None and self.weight and node.HasColumn(self.weight):
+            self.weight2 = f"_cutflow_{self.weight}2"
+            node = node.Define(self.weight2, f"{self.weight}*{self.weight}")
+
+        count = node.Count()
+        if self.weight2 and node.HasColumn(self.weight2):
+            sumw, sumw2 = node.Sum(self.weight), node.Sum(self.weight2)
+        else:
+            sumw, sumw2 = None, None
+
+        self.steps.append((step, count, sumw, sumw2))
+        return node
+
+    def bookSteps(self, node, steps):
+        """
+        Book cumulative selection steps on filters branching off node. node itself is not filtered.
+        steps: list of (step name, selection expression)
+        """
+        for step, selection in steps:
+            node = node.Filter(selection, step)
+            self.book(node, step)
+
+    def getResults(self):
+        """
+        List of the counts of each step. Runs the event loop if it has not run yet.
+        """
+        results = []
+        for step, count, sumw, sumw2 in self.steps:
+            results.append({
+                'step': step,
+                'events': int(count.GetValue()),
+                'sumw': float(sumw.GetValue()) if sumw is not None else None,
+                'sumw2': float(sumw2.GetValue()) if sumw2 is not None else None
+            })
+        return results
+
+def formatCutflow(cutflow):
+    lines = [f"{'step':<20} {'events':>12} {'sumw':>14} {'error':>12} {'efficiency':>10}"]
+    prev = None
+    for s in cutflow:
+        sumw = f"{s['sumw']:.4g}" if s['sumw'] is not None else '-'
+        err = f"{s['sumw2']**0.5:.3g}" if s['sumw2'] is not None else '-'
+        eff = f"{s['events']/prev:.4f}" if prev else '-'
+        lines.append(f"{s['step']:<20} {s['events']:>12} {sumw:>14} {err:>12} {eff:>10}")
+        prev = s['events']
+    return '\n'.join(lines)
+
+def writeCutflow(h5file, cutflow):
+    """
+    Store the cutflow as an attribute of an open HDF5 file, which leaves the columns untouched
+    """
+    h5file.attrs['cutflow'] = json.dumps(cutflow)
+
+def readCutflow(fpath):
+    """
+    Cutflow of an HDF5 output, from its manifest if it is up to date or else from the file.
+    None if the output has no cutflow.
+    """
+    manifest = readManifest(fpath)
+    if manifest is not None and 'cutflow' in manifest:
+        return manifest['cutflow']
+
+    with h5py.File(fpath, 'r') as f:
+        if 'cutflow' in f.attrs:
+            return json.loads(f.attrs['cutflow'])
+
+    return None
+
+def mergeCutflows(cutflows):
+    """
+    Sum the cutflows of several outputs step by step.
+    Steps are in the order of the first cutflow they appear in.
+    """
+    merged = {}
+    for cutflow in cutflows:
+        for s in cutflow:
+            m = merged.setdefault(s['step'], {'step': s['step'], 'events': 0, 'sumw': 0., 'sumw2': 0.})
+            m['events'] += s['events']
+            for k in ['sumw', 'sumw2']:
+                if s[k] is None or m[k] is None:
+                    m[k] = None
+                else:
+                    m[k] += s[k]
+
+    return list(merged.values())
+
+def collectCutflows(fpaths):
+    """
+    Merge the cutflows of the HDF5 outputs. Return the merged cutflow and the outputs without a cutflow.
+    """
+    cutflows = []
+    missing = []
+    for fpath in fpaths:
+        cutflow = readCutflow(fpath)
+        if cutflow is None:
+            missing.append(fpath)
+        else:
+            cutflows.append(cutflow)
+
+    if missing:
+        logger.warning(f"{len(missing)} outputs have no cutflow")
+
+    return mergeCutflows(cutflows), missing
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Merge the cutflows of the HDF5 outputs of processMiniNtuples.py")
+
+    parser.add_argument("inputs", nargs='+', type=str,
+                        help="HDF5 outputs, or directories to look for them")
+    parser.add_argument("-t", "--truth", action='store_true',
+                        help="If True, look for the unmatched truth outputs in the directories instead of the reco-level outputs")
+    parser.add_argument("-o", "--output", type=str,
+                        help="Output json file name of the merged cutflow")
+    parser.add_argument("-v", "--verbose", action='store_true',
+                        help="If True, set logging level to DEBUG, otherwise INFO")
+
+    args = parser.parse_args()
+
+    logging.basicConfig(format='%(asctime)s %(levelname)-7s %(name)-10s %(message)s')
+    logger.setLevel(logging.DEBUG if args.verbose else logging.INFO)
+
+    fpaths = []
+    for inp in args.inputs:
+        if os.path.isdir(inp):
+            for dirpath, _, fnames in os.walk(inp):
+                fpaths += sorted(
+                    os.path.join(dirpath, fn) for fn in fnames
+                    if fn.endswith('.h5') and fn.endswith('_unmatched_truth.h5') == args.truth)
+        else:
+            fpaths.append(inp)
+
+    logger.info(f"Read cutflows of {len(fpaths)} outputs")
+    merged, missing = collectCutflows(fpaths)
+    for fpath in missing:
+        logger.debug(f"No cutflow: {fpath}")
+
+    print(formatCutflow(merged))
+
+    if args.output:
+        logger.info(f"Write merged cutflow to {args.output}")
+        with open(args.output, 'w') as f:
+            json.dump({'cutflow': merged, 'inputs': fpaths, 'missing': missing}, f, indent=1)
@@ -2,34 +2,14 @@
 Utilities to handle datasets
 """
 import os
-import subprocess
 import yaml
 
+from replicas import did_str2dict, getReplicaResolver
+
 def read_config(config_filepath):
     f = open(config_filepath, 'r')
     return yaml.load(f, yaml.FullLoader)
 
-def did_str2dict(did, scope=None):
-    """
-    Convert a DID string to a dictionary with keys 'scope' and 'name'
-    """
-    dlist = did.split(':')
-    if len(dlist) == 2:
-        if scope is not None:
-            print("WARNING: overwrite dataset scope!")
-            dlist[0] = scope
-        return {'scope': dlist[0], 'name': dlist[1]}
-    elif len(dlist) == 1:
-        if scope is not None:
-            return {'scope': scope, 'name': did}
-        else:
-            # try guessing the scope if the DID starts with 'user.<username>'
-            if did.startswith('user.'):
-                scope = '.'.join(did.split('.')[:2])
-                return {'scope': scope, 'name': did}
-
-    raise RuntimeError("Failed to get the scope of dataset {}".format(did))
-
 def listFiles_local(dids, directory):
     if not isinstance(dids, list):
         dids = [dids]
@@ -62,43 +42,24 @@ def listFiles_rucio(dids, localSite='CA-SFU-T2_LOCALGROUPDISK', getLocalPath=Fal
     if not isinstance(dids, list):
         dids = [dids]
 
-    filelist, sizelist = [], []
-
-    # Rucio client
-    import rucio.client
-    rc = rucio.client.Client()
-
-    # get dataset replicas
-    replicas = rc.list_replicas([ did_str2dict(d) for d in dids ], schemes=['root'])
-
-    for replica in replicas:
-        sites = replicasites = replica['rses'].keys()
-        file_path = ''
-        if localSite in sites:
-            # the data file is available at local site
-            file_path = replica['rses'][localSite][0]
-
-            if getLocalPath:
-                try:
-                    file_path = subprocess.check_output(['getLocalDataPath', 'echo', file_path]).decode('utf-8').strip('\n')
-                except:
-                    print("Failed to get local file paths")
-        else:
-            # the data file is not available at the local site
-            # access the file via xrootd
-            if replica['pfns']:
-                # pick the one with the highest priority
-                file_path = max(replica['pfns'].items(), key=lambda pfns:pfns[1]['priority'])[0]
-
-        if file_path:
-            filelist.append(file_path)
-            sizelist.append(replica['bytes'])
+    # the shared resolver keeps its answers and client for all local sites
+    filelist, sizelist = getReplicaResolver().listFiles(dids, getLocalPath=getLocalPath, localSite=localSite)
 
     if not filelist:
         print(f"Warning: cannot find files for {dids}!")
 
     return filelist, sizelist
 
+def prefetchFiles_rucio(dids, getLocalPath=False):
+    """
+    Resolve all DIDs in batched queries so that later calls of listFiles_rucio
+    are served from the shared resolver
+    """
+    try:
+        getReplicaResolver().resolve(dids, getLocalPath=getLocalPath)
+    except Exception as e:
+        print(e)
+
 def listDataFiles(dids, local_directory=None, host=''):
     """ List data file paths and sizes given DIDs
     ______
@@ -132,7 +93,8 @@ def writeDataFileLists(dataset_config,
                        host='',
                        truthLevel = '', # or 'parton' or 'particle'
                        localDir = None,
-                       quiet=False):
+                       quiet=False,
+                       return_sizes=False):
     """ List input file names to be processed to txt files
     These txt files can be used as inputs to the processMiniNtuples.py
     ______
@@ -146,10 +108,12 @@ def writeDataFileLists(dataset_config,
     truthLevel      str; truth levels
     localDir        str; local directory to look for sample files if not None
     quiet:          bool; less verbose
+    return_sizes:   bool; if True, also return the total size of the reco files in each list
 
     Return
     A dictionary of data list file paths.
     Keys: 'tt', 'sumWeights', 'tt_truth' (optional), 'tt_PL' (optional)
+    If return_sizes is True, also a list of the reco file sizes in bytes of each job.
     """
 
     if njobs <= 0:
@@ -179,6 +143,17 @@ def writeDataFileLists(dataset_config,
         datafiles[s] = []
         filesizes[s] = []
 
+    if localDir is None:
+        # resolve the datasets of all subcampaigns in one go
+        dids_all = []
+        for era in subcampaigns:
+            data = datasets[sample_name][era]
+            if not isinstance(data, list):
+                data = [data]
+            dids_all += [dn.rstrip('_')+'_'+s+'.root' for dn in data for s in suffix]
+
+        prefetchFiles_rucio(dids_all, getLocalPath = "cedar" in host)
+
     for era in subcampaigns:
         data = datasets[sample_name][era]
         if not isinstance(data, list):
@@ -213,6 +188,7 @@ def writeDataFileLists(dataset_config,
     nfiles = len(filesizes['tt'])
     ijob = 0
     current_size = 0
+    job_sizes = [0]
 
     for ifile in range(nfiles):
         # check file names are consistent
@@ -231,6 +207,7 @@ def writeDataFileLists(dataset_config,
             else:
                 ijob += 1
                 current_size = 0
+                job_sizes.append(0)
                 # close the current output files and create new ones
                 for s in foutputs:
                     foutputs[s].close()
@@ -245,6 +222,7 @@ def writeDataFileLists(dataset_config,
             foutputs[s].write(f_s+'\n')
 
         current_size += filesizes['tt'][ifile]
+        job_sizes[-1] += filesizes['tt'][ifile]
 
     # close files
     for s in foutputs:
@@ -254,7 +232,10 @@ def writeDataFileLists(dataset_config,
     #    print("Warning: not enough data files to split into {} jobs".format(njobs))
 
     # return a dictionary of the file names
-    return fnames
+    if return_sizes:
+        return fnames, job_sizes
+    else:
+        return fnames
 
 def getInputFileNames(input_list, check_file=True):
     rootFiles = []
@@ -0,0 +1,404 @@
+"""
+Flattened multi-dimensional histograms backed by numpy arrays
+
+A multi-differential binning has bins of an outer variable, e.g. mtt, and in each
+outer bin its own bin edges of the inner variables, e.g. ptt. The bins of all
+inner histograms are laid out one after the other in one flat array, so that a
+2D or 3D histogram is a 1D array and a response is a 2D array indexed by
+[flat reco bin, flat truth bin].
+
+Binning configs are the same as the multi-dimensional entries of
+configs/deprecated/binning/bins_ttdiffxs_run2_ljets.json:
+  {"axis": "x_vs_y", "y_bin1": {"edge": [325, 500], "x_bins": [0, 60, 150]}, "y_bin2": ...}
+  {"axis": "x_vs_y_vs_z", "z_bin1": {"edge": [0, 0.5], "y_bin1": {...}, ...}, ...}
+
+Bin lookup and filling are vectorized over arrays of events, the histograms of
+an outer bin are views of the flat array, and ROOT histograms are only made when
+writing.
+"""
+import re
+import numpy as np
+
+import logging
+logger = logging.getLogger(__name__)
+
+def _parseNode(binning_d):
+    """
+    Nested binning as a tree: {'edges': array of bin edges, 'children': list of nodes or None}
+    """
+    if isinstance(binning_d, dict) and 'nbins' in binning_d:
+        return {'edges': np.linspace(binning_d['xmin'], binning_d['xmax'], binning_d['nbins']+1), 'children': None}
+    elif not isinstance(binning_d, dict):
+        return {'edges': np.asarray(binning_d, dtype=float), 'children': None}
+
+    # outer bins e.g. y_bin1, y_bin2, ...
+    labels = [k for k in binning_d if re.fullmatch(r'[a-z]_bin\d+', k)]
+    labels.sort(key=lambda k: int(k.split('_bin')[-1]))
+    if not labels:
+        raise RuntimeError(f"Cannot find the outer bins in the binning config {binning_d}")
+
+    edges = []
+    children = []
+    for label in labels:
+        low, high = binning_d[label]['edge']
+        if edges and low != edges[-1]:
+            raise RuntimeError(f"Outer bin {label} [{low}, {high}] does not start at the upper edge of the previous bin {edges[-1]}")
+        if not edges:
+            edges.append(low)
+        edges.append(high)
+
+        child_d = binning_d[label]
+        children.append(_parseNode(child_d['x_bins'] if 'x_bins' in child_d else child_d))
+
+    return {'edges': np.asarray(edges, dtype=float), 'children': children}
+
+class FlattenedBinning():
+    """ Nested variable binning with a flat bin numbering
+    ______
+    Arguments
+    binning_d: dict; multi-dimensional binning config, or a list of bin edges for 1D
+    varnames: list of str; variable names from the innermost (x) to the outermost
+    """
+    def __init__(self, binning_d, varnames=None):
+        self.root = _parseNode(binning_d)
+
+        # nodes of each level from the outermost to the innermost variable
+        self.levels = []
+        nodes = [self.root]
+        while nodes:
+            nbins = np.array([len(n['edges'])-1 for n in nodes])
+            maxedges = max(len(n['edges']) for n in nodes)
+
+            # bin edges of the nodes padded with +inf so that all nodes are looked up at once
+            edges = np.full((len(nodes), maxedges), np.inf)
+            for i, n in enumerate(nodes):
+                edges[i, :len(n['edges'])] = n['edges']
+
+            self.levels.append({
+                'nodes': nodes,
+                'edges': edges,
+                'nbins': nbins,
+                # index of the first bin of each node among all bins of the level
+                'offsets': np.concatenate([[0], np.cumsum(nbins)[:-1]])
+            })
+
+            if nodes[0]['children'] is None:
+                if any(n['children'] is not None for n in nodes):
+                    raise RuntimeError("Inconsistent number of dimensions in the binning config")
+                break
+            nodes = [c for n in nodes for c in n['children']]
+
+        self.ndim = len(self.levels)
+        self.nbins = int(self.levels[-1]['nbins'].sum())
+        self.varnames = list(varnames) if varnames else ['x', 'y', 'z'][:self.ndim]
+
+    def findBins(self, *values):
+        """
+        Flat bin indices of events: values are arrays of the variables from the
+        innermost (x) to the outermost. -1 if an event is outside the binning.
+        """
+        if len(values) != self.ndim:
+            raise ValueError(f"Expect {self.ndim} arrays of values, got {len(values)}")
+
+        values = [np.asarray(v) for v in values]
+        node = np.zeros(len(values[0]), dtype=np.int64)
+        valid = np.ones(len(values[0]), dtype=bool)
+
+        for level, v in zip(self.levels, reversed(values)):
+            # bin of each event in its node; the upper edge is excluded as in ROOT
+            ibin = (v[:, np.newaxis] >= level['edges'][node]).sum(axis=1) - 1
+            valid &= (ibin >= 0) & (ibin < level['nbins'][node])
+            node = level['offsets'][node] + np.where(valid, ibin, 0)
+
+        return np.where(valid, node, -1)
+
+    def getLeaves(self):
+        """
+        List of the innermost histograms: (tuple of outer bin indices starting from 1, bin edges, flat slice)
+        """
+        leaves = []
+
+        def visit(node, path, start):
+            if node['children'] is None:
+                nb = len(node['edges']) - 1
+                leaves.append((path, node['edges'], slice(start, start+nb)))
+                return start + nb
+            for i, child in enumerate(node['children']):
+                start = visit(child, path+(i+1,), start)
+            return start
+
+        visit(self.root, (), 0)
+        return leaves
+
+    def getOuterSlices(self):
+        """
+        Flat slices of the bins of the outermost variable
+        """
+        slices = []
+        start = 0
+        for child in (self.root['children'] or []):
+            nb = FlattenedBinning._countBins(child)
+            slices.append(slice(start, start+nb))
+            start += nb
+        return slices
+
+    @staticmethod
+    def _countBins(node):
+        if node['children'] is None:
+            return len(node['edges']) - 1
+        return sum(FlattenedBinning._countBins(c) for c in node['children'])
+
+    def getFlatEdges(self):
+        """
+        Bin edges of the flat histogram: the inner bin edges of each outer bin are
+        mapped linearly into the range of the outer bin.
+        """
+        def mapEdges(node, low, high):
+            edges = node['edges']
+            scaled = (edges - edges[0]) / (edges[-1] - edges[0]) * (high - low) + low
+            if node['children'] is None:
+                return list(scaled)
+            flat = []
+            for i, child in enumerate(node['children']):
+                flat = flat[:-1] + mapEdges(child, scaled[i], scaled[i+1])
+            return flat
+
+        edges = self.root['edges']
+        return np.asarray(mapEdges(self.root, edges[0], edges[-1]))
+
+def _binning(binning, varnames=None):
+    return binning if isinstance(binning, FlattenedBinning) else FlattenedBinning(binning, varnames)
+
+def _bufferArray(buf, size):
+    # numpy view of a ROOT array buffer
+    buf.reshape((size,))
+    return np.frombuffer(buf, dtype=np.float64, count=size)
+
+def histogramArrays(h):
+    """
+    Bin contents and sums of squared weights of a ROOT TH1D or TH2D as numpy views, including flow bins.
+    For a TH2D the arrays have the shape (ny+2, nx+2).
+    """
+    ncells = h.GetNcells()
+    if not h.GetSumw2N():
+        h.Sumw2()
+    values = _bufferArray(h.GetArray(), ncells)
+    sumw2 = _bufferArray(h.GetSumw2().GetArray(), ncells)
+    if h.GetDimension() == 2:
+        shape = (h.GetNbinsY()+2, h.GetNbinsX()+2)
+        values, sumw2 = values.reshape(shape), sumw2.reshape(shape)
+    return values, sumw2
+
+class FlattenedHistogram():
+    """ Flattened histogram of one, two or three variables
+    ______
+    Arguments
+    name: str; histogram name
+    binning: FlattenedBinning or binning config
+    varnames: list of str; variable names from the innermost to the outermost
+    """
+    def __init__(self, name, binning, varnames=None):
+        self.name = name
+        self.binning = _binning(binning, varnames)
+        self.values = np.zeros(self.binning.nbins)
+        self.sumw2 = np.zeros(self.binning.nbins)
+
+    def __len__(self):
+        return self.binning.nbins
+
+    def __getitem__(self, outer_bin):
+        """
+        Bin contents of the inner histogram of an outer bin (starting from 1). A view, not a copy.
+        """
+        return self.values[self.binning.getOuterSlices()[outer_bin-1]]
+
+    def findBins(self, *values):
+        return self.binning.findBins(*values)
+
+    def fill(self, *values, w=None):
+        """
+        Fill arrays of values of the variables from the innermost to the outermost, with weights w
+        """
+        ibins = self.binning.findBins(*values)
+        self.fillBins(ibins, w)
+
+    def fillBins(self, ibins, w=None):
+        sel = ibins >= 0
+        w = np.ones(len(ibins)) if w is None else np.broadcast_to(np.asarray(w, dtype=float), ibins.shape)
+        self.values += np.bincount(ibins[sel], w[sel], minlength=len(self))
+        self.sumw2 += np.bincount(ibins[sel], w[sel]**2, minlength=len(self))
+
+    def errors(self):
+        return np.sqrt(self.sumw2)
+
+    def reset(self):
+        self.values[:] = 0.
+        self.sumw2[:] = 0.
+
+    def copy(self, name=None):
+        h = FlattenedHistogram(name or self.name, self.binning)
+        h.values = self.values.copy()
+        h.sumw2 = self.sumw2.copy()
+        return h
+
+    def projectOuter(self):
+        """
+        Bin contents and errors of the outermost variable
+        """
+        starts = [s.start for s in self.binning.getOuterSlices()]
+        if not starts:
+            return self.values.copy(), self.errors()
+        return np.add.reduceat(self.values, starts), np.sqrt(np.add.reduceat(self.sumw2, starts))
+
+    def divide(self, denom, name=None):
+        """
+        Ratio to another flattened histogram with the same binning, with uncorrelated errors as in TH1::Divide
+        """
+        h = FlattenedHistogram(name or self.name, self.binning)
+        d = denom.values
+        nonzero = d != 0
+        h.values = np.divide(self.values, d, out=np.zeros_like(d), where=nonzero)
+        h.sumw2 = np.divide(self.sumw2 * d**2 + denom.sumw2 * self.values**2, d**4, out=np.zeros_like(d), where=nonzero)
+        return h
+
+    def fromArrays(self, values, errors=None):
+        self.values = np.asarray(values, dtype=float).copy()
+        self.sumw2 = np.asarray(errors, dtype=float)**2 if errors is not None else self.values.copy()
+        return self
+
+    def fromROOT(self, h_flat):
+        """
+        Set the bin contents from a flat ROOT histogram with the same number of bins
+        """
+        if h_flat.GetNbinsX() != len(self):
+            raise ValueError(f"Histogram {h_flat.GetName()} has {h_flat.GetNbinsX()} bins instead of {len(self)}")
+        values, sumw2 = histogramArrays(h_flat)
+        self.values = values[1:-1].copy()
+        self.sumw2 = sumw2[1:-1].copy()
+        return self
+
+    def toROOT(self, flat_only=False):
+        """
+        Dictionary of ROOT histograms with names relative to the histogram directory:
+        '_flat', the histogram of the outermost variable, and one histogram per innermost bin
+        e.g. 'y_bin1' for 2D or 'z_bin1/y_bin2' for 3D
+        """
+        import ROOT
+
+        hists = {}
+
+        edges = self.binning.getFlatEdges()
+        h = ROOT.TH1D(f"{self.name}_flat", "", len(edges)-1, edges)
+        histogramArrays(h)[0][1:-1] = self.values
+        histogramArrays(h)[1][1:-1] = self.sumw2
+        hists['_flat'] = h
+
+        if flat_only or self.binning.ndim == 1:
+            return hists
+
+        outer_label = ['x', 'y', 'z'][self.binning.ndim-1]
+        edges = self.binning.root['edges']
+        vals, errs = self.projectOuter()
+        h = ROOT.TH1D(f"{self.name}_{outer_label}hist", "", len(edges)-1, edges)
+        h.GetXaxis().SetTitle(self.binning.varnames[-1])
+        histogramArrays(h)[0][1:-1] = vals
+        histogramArrays(h)[1][1:-1] = errs**2
+        hists[f"_{outer_label}hist"] = h
+
+        labels = ['x', 'y', 'z'][1:self.binning.ndim][::-1]
+        for path, edges, s in self.binning.getLeaves():
+            hpath = '/'.join(f"{l}_bin{i}" for l, i in zip(labels, path))
+            h = ROOT.TH1D(f"{self.name}_{hpath.replace('/', '_')}", "", len(edges)-1, edges)
+            h.GetXaxis().SetTitle(self.binning.varnames[0])
+            histogramArrays(h)[0][1:-1] = self.values[s]
+            histogramArrays(h)[1][1:-1] = self.sumw2[s]
+            hists[hpath] = h
+
+        return hists
+
+    def write(self, directory=None, flat_only=False):
+        """
+        Write the ROOT histograms to a directory of the current ROOT file, by default named after the histogram
+        """
+        import ROOT
+
+        topdir = ROOT.gDirectory.GetDirectory('')
+        savedir = directory if directory is not None else self.name
+        if not topdir.GetDirectory(savedir):
+            topdir.mkdir(savedir)
+
+        for hpath, h in self.toROOT(flat_only).items():
+            subdir = '/'.join([savedir] + hpath.split('/')[:-1])
+            if not topdir.GetDirectory(subdir):
+                topdir.mkdir(subdir)
+            topdir.cd(subdir)
+            h.Write(hpath.split('/')[-1])
+
+        topdir.cd()
+
+class FlattenedResponse():
+    """ Response of flattened histograms: a 2D array indexed by [flat reco bin, flat truth bin]
+    ______
+    Arguments
+    name: str; histogram name
+    binning_reco: FlattenedBinning or binning config of the reco-level variables
+    binning_truth: FlattenedBinning or binning config of the truth-level variables. Default: same as reco
+    """
+    def __init__(self, name, binning_reco, binning_truth=None):
+        self.name = name
+        self.binning_reco = _binning(binning_reco)
+        self.binning_truth = _binning(binning_truth) if binning_truth is not None else self.binning_reco
+
+        shape = (self.binning_reco.nbins, self.binning_truth.nbins)
+        self.values = np.zeros(shape)
+        self.sumw2 = np.zeros(shape)
+
+    def fill(self, values_reco, values_truth, w=None):
+        """
+        values_reco, values_truth: lists of arrays of the variables from the innermost to the outermost
+        """
+        self.fillBins(self.binning_reco.findBins(*values_reco), self.binning_truth.findBins(*values_truth), w)
+
+    def fillBins(self, ibins_reco, ibins_truth, w=None):
+        sel = (ibins_reco >= 0) & (ibins_truth >= 0)
+        w = np.ones(len(ibins_reco)) if w is None else np.broadcast_to(np.asarray(w, dtype=float), ibins_reco.shape)
+        ibins = ibins_reco[sel] * self.values.shape[1] + ibins_truth[sel]
+        self.values += np.bincount(ibins, w[sel], minlength=self.values.size).reshape(self.values.shape)
+        self.sumw2 += np.bincount(ibins, w[sel]**2, minlength=self.values.size).reshape(self.values.shape)
+
+    def errors(self):
+        return np.sqrt(self.sumw2)
+
+    def projectionX(self, name=None):
+        """
+        Projection on the reco axis as a FlattenedHistogram
+        """
+        h = FlattenedHistogram(name or f"{self.name}_px", self.binning_reco)
+        h.values = self.values.sum(axis=1)
+        h.sumw2 = self.sumw2.sum(axis=1)
+        return h
+
+    def projectionY(self, name=None):
+        """
+        Projection on the truth axis as a FlattenedHistogram
+        """
+        h = FlattenedHistogram(name or f"{self.name}_py", self.binning_truth)
+        h.values = self.values.sum(axis=0)
+        h.sumw2 = self.sumw2.sum(axis=0)
+        return h
+
+    def toROOT(self):
+        import ROOT
+
+        edges_reco = self.binning_reco.getFlatEdges()
+        edges_truth = self.binning_truth.getFlatEdges()
+        h = ROOT.TH2D(self.name, "", len(edges_reco)-1, edges_reco, len(edges_truth)-1, edges_truth)
+
+        # ROOT arrays are indexed by [truth bin, reco bin]
+        values, sumw2 = histogramArrays(h)
+        values[1:-1, 1:-1] = self.values.T
+        sumw2[1:-1, 1:-1] = self.sumw2.T
+        return h
+
+    def write(self):
+        self.toROOT().Write()
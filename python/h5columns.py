@@ -0,0 +1,46 @@
+"""
+Direct access to the columns of the HDF5 outputs
+
+The outputs of NtupleRDF store each column as an uncompressed, contiguous 1D
+dataset. The position of the data of such a dataset in the file is fixed, so
+once its offset, dtype and length are known it can be read as a numpy view of a
+memory-mapped file without going through HDF5, also when the file is a member of
+an uncompressed archive. Chunked or compressed datasets are read with h5py.
+"""
+import numpy as np
+import h5py
+
+def getColumnLayout(h5file):
+    """
+    Column name -> {'offset', 'dtype', 'length'} of the datasets at the top level of an open h5py.File.
+    offset is the position of the data in the file, or None if the dataset is
+    chunked, compressed, or has no data allocated.
+    """
+    layout = {}
+    for name, ds in h5file.items():
+        if not isinstance(ds, h5py.Dataset) or ds.ndim != 1:
+            continue
+
+        offset = None
+        if ds.chunks is None and ds.compression is None:
+            offset = ds.id.get_offset()
+
+        layout[name] = {
+            'offset': int(offset) if offset is not None else None,
+            'dtype': ds.dtype.str,
+            'length': int(ds.shape[0])
+        }
+
+    return layout
+
+def isMappable(entry):
+    return entry['offset'] is not None or entry['length'] == 0
+
+def mapColumn(buffer, entry, base_offset=0):
+    """
+    Read-only numpy view of a contiguous column in a buffer, e.g. an mmap of the
+    file or of the archive containing it at base_offset
+    """
+    if entry['length'] == 0:
+        return np.empty(0, dtype=np.dtype(entry['dtype']))
+    return np.frombuffer(buffer, dtype=np.dtype(entry['dtype']), count=entry['length'], offset=base_offset+entry['offset'])
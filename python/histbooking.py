@@ -0,0 +1,219 @@
+"""
+Book many histograms and fill them in one pass over the input trees
+
+TTree::Draw loops over the inputs once per histogram. Here all histograms and
+their selections are declared up front as lazy RDataFrame actions, which are
+filled together in one multi-threaded event loop when the results are first
+accessed, so the run time does not grow with the number of histograms.
+
+  booker = HistogramBooker(inputfiles, 'reco', friend_treename='parton')
+  booker.book1D('h_res_pt', 'PseudoTop_Reco_ttbar_pt/(MC_ttbar_afterFSR_pt/1000)-1', (100, -1, 5), selection='isMatched')
+  booker.book2D('h_ttbar_m', 'PseudoTop_Reco_ttbar_m', 'MC_ttbar_afterFSR_m/1000', (40, 300, 1500), (40, 300, 1500))
+  booker.write('histograms.root')
+
+Expressions and selections are C++ expressions of the branches as in RDataFrame.
+Branches of the friend tree can be used with or without the friend tree name as
+a prefix.
+
+Histograms can also be booked on an existing data frame node, so that they are
+filled in the event loop run for other results of the same data frame:
+
+  booker = HistogramBooker.fromDataFrame(df)
+  booker.book1D(...)
+  booker.book()
+  arrays = df.AsNumpy(columns) # fills the histograms too
+  results = booker.run()
+"""
+import re
+import time
+from array import array
+
+import ROOT
+
+import logging
+logger = logging.getLogger(__name__)
+
+class HistogramBooker():
+    """ Histograms booked on one RDataFrame
+    ______
+    Arguments
+    inputfiles: list of str; input root files
+    treename: str; name of the main tree
+    friend_treename: str; name of a tree in the same files to be added as a friend
+    nthreads: int; number of threads of the event loop. 0 to use all cores, None to run sequentially
+    """
+    def __init__(self, inputfiles, treename, friend_treename=None, nthreads=0):
+        if nthreads is not None:
+            ROOT.EnableImplicitMT(nthreads)
+
+        # keep the chains alive as long as the data frame
+        self.chain = ROOT.TChain(treename)
+        for infile in inputfiles:
+            self.chain.Add(infile)
+
+        self.friend = None
+        if friend_treename:
+            self.friend = ROOT.TChain(friend_treename)
+            for infile in inputfiles:
+                self.friend.Add(infile)
+            self.chain.AddFriend(self.friend)
+
+        self.rdf = ROOT.RDataFrame(self.chain)
+
+        # (directory, histogram name) -> histogram specification
+        self.specs = {}
+        self.hptrs = None
+
+    @classmethod
+    def fromDataFrame(cls, rdf):
+        """
+        Booker of histograms on an existing data frame node
+        """
+        booker = cls.__new__(cls)
+        booker.chain, booker.friend = None, None
+        booker.rdf = rdf
+        booker.specs = {}
+        booker.hptrs = None
+        return booker
+
+    def _checkName(self, name, directory):
+        if self.hptrs is not None:
+            raise RuntimeError(f"Cannot book histogram {directory}/{name}: the histograms are already booked on the data frame")
+        if (directory, name) in self.specs:
+            raise RuntimeError(f"Histogram {directory}/{name} is already booked")
+
+    def book1D(self, name, expression, bins, selection='', weight=None, directory='', title='', xtitle=None):
+        """ Book a 1D histogram
+        ______
+        Arguments
+        name: str; histogram name
+        expression: str; expression to fill the histogram with
+        bins: (nbins, xlow, xhigh) or list of bin edges
+        selection: str; events to fill the histogram with
+        weight: str; expression of the event weight
+        directory: str; directory in the output file
+        title: str; histogram title
+        xtitle: str; x axis title. Default: the expression
+        """
+        self._checkName(name, directory)
+        self.specs[(directory, name)] = {
+            'model': ROOT.RDF.TH1DModel(name, title, *_binArgs(bins)),
+            'expressions': [expression],
+            'titles': [xtitle if xtitle is not None else expression],
+            'selection': selection.strip() if selection else '',
+            'weight': weight
+        }
+
+    def book2D(self, name, xexpression, yexpression, xbins, ybins, selection='', weight=None, directory='', title='', xtitle=None, ytitle=None):
+        """ Book a 2D histogram
+        ______
+        Arguments
+        name: str; histogram name
+        xexpression, yexpression: str; expressions for the x and y axes
+        xbins, ybins: (nbins, low, high) or list of bin edges
+        selection: str; events to fill the histogram with
+        weight: str; expression of the event weight
+        directory: str; directory in the output file
+        title: str; histogram title
+        xtitle, ytitle: str; axis titles. Default: the expressions
+        """
+        self._checkName(name, directory)
+        self.specs[(directory, name)] = {
+            'model': ROOT.RDF.TH2DModel(name, title, *_binArgs(xbins), *_binArgs(ybins)),
+            'expressions': [xexpression, yexpression],
+            'titles': [xtitle if xtitle is not None else xexpression, ytitle if ytitle is not None else yexpression],
+            'selection': selection.strip() if selection else '',
+            'weight': weight
+        }
+
+    def book(self):
+        """
+        Declare the columns, the selections and the histograms on the data frame.
+        Expressions other than plain branch names are defined once as new columns,
+        and histograms with the same selection share one filter.
+        Nothing is filled until one of the results of the data frame is accessed.
+        """
+        if self.hptrs is not None:
+            return self.hptrs
+
+        node = self.rdf
+
+        columns = {}
+        for spec in self.specs.values():
+            for expr in spec['expressions'] + ([spec['weight']] if spec['weight'] else []):
+                expr = expr.strip()
+                if expr in columns:
+                    continue
+                if re.fullmatch(r'[A-Za-z_]\w*(\.\w+)?', expr):
+                    columns[expr] = expr
+                else:
+                    columns[expr] = f"_hist_column_{len(columns)}"
+                    node = node.Define(columns[expr], expr)
+
+        filters = {'': node}
+        hptrs = {}
+        for key, spec in self.specs.items():
+            sel = spec['selection']
+            if not sel in filters:
+                filters[sel] = node.Filter(sel)
+
+            args = [spec['model']] + [columns[e.strip()] for e in spec['expressions']]
+            if spec['weight']:
+                args.append(columns[spec['weight'].strip()])
+
+            if len(spec['expressions']) == 1:
+                hptrs[key] = filters[sel].Histo1D(*args)
+            else:
+                hptrs[key] = filters[sel].Histo2D(*args)
+
+        self.hptrs = hptrs
+        return hptrs
+
+    def run(self):
+        """
+        Fill all booked histograms in one event loop, unless the loop already ran.
+        Return a dictionary: (directory, histogram name) -> histogram
+        """
+        hptrs = self.book()
+
+        logger.info(f"Fill {len(hptrs)} histograms")
+        tstart = time.time()
+
+        results = {}
+        for key, hptr in hptrs.items():
+            # the first access runs the event loop for all booked histograms
+            h = hptr.GetValue()
+            for axis, title in zip([h.GetXaxis(), h.GetYaxis()], self.specs[key]['titles']):
+                axis.SetTitle(title)
+            results[key] = h
+
+        logger.info(f"Done in {time.time()-tstart:.1f} s (event loops run: {self.rdf.GetNRuns()})")
+        return results
+
+    def write(self, output):
+        """
+        Fill the histograms and write them to the output root file
+        Return a dictionary: (directory, histogram name) -> histogram
+        """
+        results = self.run()
+
+        outfile = ROOT.TFile.Open(output, 'recreate')
+        for (directory, name), h in results.items():
+            if directory:
+                if not outfile.GetDirectory(directory):
+                    outfile.mkdir(directory)
+                outfile.cd(directory)
+            else:
+                outfile.cd()
+            h.Write(name)
+        outfile.Close()
+
+        logger.info(f"Write histograms to {output}")
+        return results
+
+def _binArgs(bins):
+    if isinstance(bins, tuple):
+        nbins, low, high = bins
+        return int(nbins), float(low), float(high)
+    else:
+        return len(bins)-1, array('d', bins)
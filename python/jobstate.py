@@ -0,0 +1,417 @@
+"""
+SQLite store of the job states
+
+Jobs (one job file per sample/systematic/era), their array tasks, submission
+attempts with the requested resources, exit codes and output status are kept in
+<job_summary>.db next to the job summary yaml. The store can be updated
+concurrently by the submitting and checking tools. The submission status and
+the check results can still be exported as the nested yaml dictionaries:
+  python python/jobstate.py <job_summary.db> query -s ttbar -e mc16e --status failed
+  python python/jobstate.py <job_summary.db> export
+"""
+import os
+import time
+import sqlite3
+from contextlib import contextmanager
+
+schema = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    sample TEXT NOT NULL,
+    syst TEXT, -- NULL for data
+    era TEXT NOT NULL,
+    jobfile TEXT UNIQUE NOT NULL,
+    submitted INTEGER DEFAULT 0,
+    result TEXT,
+    updated REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_keys ON jobs (sample, syst, era);
+
+CREATE TABLE IF NOT EXISTS tasks (
+    job_id INTEGER NOT NULL REFERENCES jobs(id),
+    arrayid INTEGER NOT NULL,
+    status TEXT DEFAULT 'pending', -- pending, submitted, success, failed, incomplete
+    failure TEXT,
+    exit_code INTEGER,
+    output_status TEXT, -- good, bad, missing
+    updated REAL,
+    PRIMARY KEY (job_id, arrayid)
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status);
+
+CREATE TABLE IF NOT EXISTS attempts (
+    id INTEGER PRIMARY KEY,
+    job_id INTEGER NOT NULL REFERENCES jobs(id),
+    arrayid INTEGER NOT NULL,
+    batch_jobid TEXT,
+    backend TEXT,
+    submitted_at REAL,
+    exit_code INTEGER,
+    status TEXT,
+    failure TEXT,
+    logname TEXT,
+    sched_state TEXT -- state reported by the batch system accounting
+);
+CREATE INDEX IF NOT EXISTS idx_attempts_task ON attempts (job_id, arrayid);
+CREATE INDEX IF NOT EXISTS idx_attempts_batch ON attempts (batch_jobid);
+
+CREATE TABLE IF NOT EXISTS resources (
+    attempt_id INTEGER PRIMARY KEY REFERENCES attempts(id),
+    mem_requested REAL, -- GB
+    walltime_requested REAL, -- seconds
+    peak_memory REAL, -- MB
+    runtime REAL -- seconds
+);
+"""
+
+def getJobStoreName(jobs_config):
+    """
+    Name of the job state store of a job summary yaml e.g. jobfiles.yaml -> jobfiles.db
+    """
+    return os.path.splitext(jobs_config)[0] + '.db'
+
+def iterJobPaths(jobs_dict, keys=()):
+    """
+    Iterate over (tuple of keys, job file) in a nested job dictionary of any depth
+    """
+    for k, v in jobs_dict.items():
+        if isinstance(v, dict):
+            yield from iterJobPaths(v, keys+(k,))
+        elif keys:
+            yield keys+(k,), v
+
+def getJobKeys(path):
+    """
+    (sample, syst, era) of the keys of a job file: the first key, the keys in between
+    joined by '/', and the last key, e.g. detNP -> ttbar -> nominal -> mc16a gives
+    ('detNP', 'ttbar/nominal', 'mc16a'). syst is None for data samples with the
+    layout sample -> year -> job file.
+    """
+    return path[0], '/'.join(str(k) for k in path[1:-1]) or None, path[-1]
+
+def iterJobKeys(jobs_dict):
+    """
+    Iterate over (sample, syst, era, job file) in a nested job dictionary
+    """
+    for path, jobfile in iterJobPaths(jobs_dict):
+        yield (*getJobKeys(path), jobfile)
+
+def getNested(d, keys, default=None):
+    for k in keys:
+        if not isinstance(d, dict) or not k in d:
+            return default
+        d = d[k]
+    return d
+
+class JobStore():
+    def __init__(self, filename, timeout=60.):
+        self.filename = filename
+        self.conn = sqlite3.connect(filename, timeout=timeout, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        # allow readers while another process writes
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(schema)
+
+        # columns added after the store was created
+        columns = [row['name'] for row in self.conn.execute("PRAGMA table_info(attempts)")]
+        if not 'sched_state' in columns:
+            self.conn.execute("ALTER TABLE attempts ADD COLUMN sched_state TEXT")
+
+    def close(self):
+        self.conn.close()
+
+    @contextmanager
+    def transaction(self):
+        # take the write lock at the beginning to avoid deadlocks between writers
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self.conn
+        except:
+            self.conn.execute("ROLLBACK")
+            raise
+        else:
+            self.conn.execute("COMMIT")
+
+    ###
+    # jobs
+    def importJobs(self, jobs_dict, submitted_dict={}):
+        """
+        Register the job files in a job summary dictionary and optionally their submission status
+        """
+        now = time.time()
+        with self.transaction() as c:
+            for path, jobfile in iterJobPaths(jobs_dict):
+                if not jobfile:
+                    continue
+
+                sample, syst, era = getJobKeys(path)
+                submitted = getNested(submitted_dict, path, False)
+
+                c.execute(
+                    "INSERT INTO jobs (sample, syst, era, jobfile, submitted, updated) VALUES (?,?,?,?,?,?) "
+                    "ON CONFLICT(jobfile) DO UPDATE SET sample=excluded.sample, syst=excluded.syst, era=excluded.era, "
+                    "submitted=MAX(jobs.submitted, excluded.submitted)",
+                    (sample, syst, era, jobfile, int(bool(submitted)), now))
+
+    def getJobId(self, jobfile):
+        row = self.conn.execute("SELECT id FROM jobs WHERE jobfile=?", (jobfile,)).fetchone()
+        return row['id'] if row else None
+
+    def isSubmitted(self, jobfile):
+        row = self.conn.execute("SELECT submitted FROM jobs WHERE jobfile=?", (jobfile,)).fetchone()
+        return bool(row['submitted']) if row else False
+
+    def countSubmitted(self):
+        return self.conn.execute("SELECT COUNT(*) FROM jobs WHERE submitted=1").fetchone()[0]
+
+    def findJobFile(self, fname):
+        """
+        The registered job file of fname, which can also be a resubmission script in the same directory
+        """
+        if self.getJobId(fname) is not None:
+            return fname
+
+        dirname = os.path.dirname(os.path.realpath(fname))
+        for row in self.conn.execute("SELECT jobfile FROM jobs"):
+            if os.path.dirname(os.path.realpath(row['jobfile'])) == dirname:
+                return row['jobfile']
+
+        return None
+
+    def setSubmitted(self, jobfile, submitted=True):
+        with self.transaction() as c:
+            c.execute("UPDATE jobs SET submitted=?, updated=? WHERE jobfile=?", (int(submitted), time.time(), jobfile))
+
+    def setResult(self, jobfile, result):
+        with self.transaction() as c:
+            c.execute("UPDATE jobs SET result=?, updated=? WHERE jobfile=?", (result, time.time(), jobfile))
+
+    ###
+    # tasks and attempts
+    def addAttempts(self, jobfile, arrayids, batch_jobid=None, backend=None, mem_requested=None, walltime_requested=None, lognames={}):
+        """
+        Record the submission of array tasks of a job file
+        """
+        job_id = self.getJobId(jobfile)
+        if job_id is None:
+            raise RuntimeError(f"Unknown job file {jobfile}")
+
+        now = time.time()
+        with self.transaction() as c:
+            c.execute("UPDATE jobs SET submitted=1, updated=? WHERE id=?", (now, job_id))
+            for arrayid in arrayids:
+                c.execute(
+                    "INSERT INTO tasks (job_id, arrayid, status, updated) VALUES (?,?,'submitted',?) "
+                    "ON CONFLICT(job_id, arrayid) DO UPDATE SET status='submitted', failure=NULL, exit_code=NULL, updated=excluded.updated",
+                    (job_id, arrayid, now))
+                cur = c.execute(
+                    "INSERT INTO attempts (job_id, arrayid, batch_jobid, backend, submitted_at, status, logname) VALUES (?,?,?,?,?,'submitted',?)",
+                    (job_id, arrayid, batch_jobid, backend, now, lognames.get(arrayid)))
+                c.execute(
+                    "INSERT INTO resources (attempt_id, mem_requested, walltime_requested) VALUES (?,?,?)",
+                    (cur.lastrowid, mem_requested, walltime_requested))
+
+    def updateTasks(self, jobfile, task_results):
+        """ Update the status of array tasks of a job file and of their latest attempts
+        ______
+        Arguments
+        jobfile: str; job file path
+        task_results: dict; array index -> dict with any of the keys
+          'status', 'failure', 'exit_code', 'output_status', 'peak_memory', 'runtime', 'logname'
+        """
+        job_id = self.getJobId(jobfile)
+        if job_id is None:
+            raise RuntimeError(f"Unknown job file {jobfile}")
+
+        now = time.time()
+        with self.transaction() as c:
+            for arrayid, res in task_results.items():
+                c.execute("INSERT OR IGNORE INTO tasks (job_id, arrayid, updated) VALUES (?,?,?)", (job_id, arrayid, now))
+
+                fields = {k: res[k] for k in ['status', 'failure', 'exit_code', 'output_status'] if k in res}
+                if fields:
+                    assignments = ', '.join(f"{k}=?" for k in fields)
+                    c.execute(f"UPDATE tasks SET {assignments}, updated=? WHERE job_id=? AND arrayid=?",
+                              (*fields.values(), now, job_id, arrayid))
+
+                # latest attempt
+                row = c.execute("SELECT id FROM attempts WHERE job_id=? AND arrayid=? ORDER BY id DESC LIMIT 1", (job_id, arrayid)).fetchone()
+                if row is None:
+                    continue
+
+                fields = {k: res[k] for k in ['status', 'failure', 'exit_code', 'logname'] if k in res}
+                if fields:
+                    assignments = ', '.join(f"{k}=?" for k in fields)
+                    c.execute(f"UPDATE attempts SET {assignments} WHERE id=?", (*fields.values(), row['id']))
+
+                fields = {k: res[k] for k in ['peak_memory', 'runtime'] if res.get(k) is not None}
+                if fields:
+                    assignments = ', '.join(f"{k}=?" for k in fields)
+                    c.execute(f"UPDATE resources SET {assignments} WHERE attempt_id=?", (*fields.values(), row['id']))
+
+    def getOpenAttempts(self, backends=None):
+        """
+        Latest attempts of the tasks whose final state is not known from the batch system yet.
+        Return a list of dict with keys 'id', 'jobfile', 'arrayid', 'batch_jobid', 'backend'
+        """
+        sql = "SELECT a.id, j.jobfile, a.arrayid, a.batch_jobid, a.backend FROM attempts a JOIN jobs j ON a.job_id=j.id " \
+              "WHERE a.batch_jobid IS NOT NULL AND a.sched_state IS NULL " \
+              "AND a.id=(SELECT MAX(id) FROM attempts WHERE job_id=a.job_id AND arrayid=a.arrayid)"
+        rows = [dict(row) for row in self.conn.execute(sql)]
+        if backends:
+            rows = [r for r in rows if r['backend'] in backends]
+        return rows
+
+    def setSchedulerStates(self, states):
+        """ Record the final states reported by the batch system
+        ______
+        Arguments
+        states: dict; attempt id -> dict with keys 'sched_state', 'exit_code', and
+                optionally 'status', 'failure', 'peak_memory' (MB), 'runtime' (s)
+        """
+        now = time.time()
+        with self.transaction() as c:
+            for attempt_id, st in states.items():
+                c.execute("UPDATE attempts SET sched_state=?, exit_code=COALESCE(?, exit_code), status=COALESCE(?, status), failure=COALESCE(?, failure) WHERE id=?",
+                          (st['sched_state'], st.get('exit_code'), st.get('status'), st.get('failure'), attempt_id))
+                c.execute("UPDATE resources SET peak_memory=COALESCE(?, peak_memory), runtime=COALESCE(?, runtime) WHERE attempt_id=?",
+                          (st.get('peak_memory'), st.get('runtime'), attempt_id))
+
+                if st.get('status'):
+                    c.execute("UPDATE tasks SET status=?, failure=?, exit_code=COALESCE(?, exit_code), updated=? "
+                              "WHERE (job_id, arrayid)=(SELECT job_id, arrayid FROM attempts WHERE id=?)",
+                              (st['status'], st.get('failure'), st.get('exit_code'), now, attempt_id))
+
+    ###
+    # queries
+    def query(self, sample=None, syst=None, era=None, status=None, output_status=None):
+        """
+        Array tasks matching the selection. syst is matched as a substring as in submitJobs.py.
+        Return a list of dict with the job and task columns.
+        """
+        conditions, params = [], []
+        if sample:
+            conditions.append("j.sample=?")
+            params.append(sample)
+        if syst:
+            conditions.append("j.syst LIKE ?")
+            params.append(f"%{syst}%")
+        if era:
+            conditions.append("j.era=?")
+            params.append(era)
+        if status:
+            conditions.append("t.status=?")
+            params.append(status)
+        if output_status:
+            conditions.append("t.output_status=?")
+            params.append(output_status)
+
+        sql = "SELECT j.sample, j.syst, j.era, j.jobfile, t.arrayid, t.status, t.failure, t.exit_code, t.output_status " \
+              "FROM tasks t JOIN jobs j ON t.job_id=j.id"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY j.sample, j.syst, j.era, t.arrayid"
+
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    ###
+    # export
+    def _exportNested(self, column):
+        d = {}
+        for row in self.conn.execute(f"SELECT sample, syst, era, {column} FROM jobs ORDER BY id"):
+            d_era = d.setdefault(row['sample'], {})
+            if row['syst'] is not None:
+                for k in row['syst'].split('/'):
+                    d_era = d_era.setdefault(k, {})
+            d_era[row['era']] = row[column]
+        return d
+
+    def exportSubmitted(self):
+        """
+        Job submission status in the same layout as the _submitted yaml of submitJobs.py
+        """
+        d = self._exportNested('submitted')
+        def tobool(x):
+            return {k: tobool(v) for k, v in x.items()} if isinstance(x, dict) else bool(x)
+        return tobool(d)
+
+    def exportResults(self):
+        """
+        Check results in the same layout as the _results yaml of checkOutputs.py
+        """
+        d = self._exportNested('result')
+        def prune(x):
+            if isinstance(x, dict):
+                x = {k: prune(v) for k, v in x.items()}
+                return {k: v for k, v in x.items() if v is not None and v != {}}
+            return x
+        return prune(d)
+
+def openJobStore(jobs_config, jobs_dict=None, submitted_config=None):
+    """
+    Open the job state store of a job summary yaml. If the store is new, import
+    the jobs and the submission status from the existing yaml files.
+    """
+    import yaml
+
+    fname_db = getJobStoreName(jobs_config)
+    is_new = not os.path.isfile(fname_db)
+    store = JobStore(fname_db)
+
+    if jobs_dict is None:
+        with open(jobs_config) as f:
+            jobs_dict = yaml.load(f, yaml.FullLoader)
+
+    submitted_dict = {}
+    if is_new:
+        if submitted_config is None:
+            jcfg_names = os.path.splitext(jobs_config)
+            submitted_config = jcfg_names[0] + '_submitted' + jcfg_names[1]
+        if os.path.isfile(submitted_config):
+            with open(submitted_config) as f:
+                submitted_dict = yaml.load(f, yaml.FullLoader) or {}
+
+    # register new job files if any
+    store.importJobs(jobs_dict, submitted_dict)
+
+    return store
+
+if __name__ == "__main__":
+
+    import argparse
+    import yaml
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+
+    parser.add_argument("store", type=str, help="Job state store")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    p_query = subparsers.add_parser('query', help="List array tasks")
+    p_query.add_argument("-s", "--sample", type=str)
+    p_query.add_argument("-u", "--systematic", type=str)
+    p_query.add_argument("-e", "--era", type=str)
+    p_query.add_argument("--status", choices=['pending', 'submitted', 'success', 'failed', 'incomplete'])
+    p_query.add_argument("--output-status", choices=['good', 'bad', 'missing'])
+
+    p_export = subparsers.add_parser('export', help="Export the submission status and the check results as yaml")
+    p_export.add_argument("-o", "--output-prefix", type=str,
+                          help="Prefix of the output yaml files. Default: the name of the store")
+
+    args = parser.parse_args()
+
+    store = JobStore(args.store)
+
+    if args.command == 'query':
+        rows = store.query(args.sample, args.systematic, args.era, args.status, args.output_status)
+        for r in rows:
+            print(f"{r['sample']:<20} {r['syst'] or '':<40} {r['era']:<6} {r['arrayid']:>4} {r['status']:<10} {r['failure'] or '':<16} {r['output_status'] or ''}")
+        print(f"{len(rows)} tasks")
+
+    elif args.command == 'export':
+        prefix = args.output_prefix or os.path.splitext(args.store)[0]
+        for suffix, d in [('_submitted', store.exportSubmitted()), ('_results', store.exportResults())]:
+            print(f"Write {prefix}{suffix}.yaml")
+            with open(f"{prefix}{suffix}.yaml", 'w') as outfile:
+                yaml.dump(d, outfile)
+
+    store.close()
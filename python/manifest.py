@@ -0,0 +1,123 @@
+"""
+Manifest sidecar files of the job outputs
+
+A manifest <output>.manifest.json is written next to each output file. It records
+the columns, event counts at each selection stage, the checksum of the output,
+the input files and timing, together with the size and mtime of the output file
+at the time of writing. A manifest is only trusted if the output file still has
+the same size and mtime.
+"""
+import os
+import json
+import zlib
+import time
+import socket
+
+manifest_suffix = '.manifest.json'
+
+def getManifestName(fpath):
+    return fpath + manifest_suffix
+
+def isManifest(fpath):
+    return fpath.endswith(manifest_suffix)
+
+def adler32(fpath, blocksize=16*1024**2):
+    value = 1
+    with open(fpath, 'rb') as f:
+        while True:
+            block = f.read(blocksize)
+            if not block:
+                break
+            value = zlib.adler32(block, value)
+    return f"{value & 0xffffffff:08x}"
+
+def describeColumns(arrays_d):
+    """
+    Column name -> {'dtype', 'length'} from a dictionary of numpy arrays
+    """
+    columns = {}
+    for vname, arr in arrays_d.items():
+        columns[vname] = {'dtype': str(arr.dtype), 'length': int(len(arr))}
+    return columns
+
+def writeManifest(
+    fpath,
+    columns,
+    event_counts = {},
+    input_files = [],
+    timing = {},
+    checksum = True,
+    **extra
+    ):
+    """ Write the manifest of the output file fpath
+    ______
+    Arguments
+    fpath: str; path to the output file
+    columns: dict; column name -> {'dtype', 'length'} as returned by describeColumns()
+    event_counts: dict; number of events after each selection stage
+    input_files: list of str; input files used to produce the output
+    timing: dict; processing times in seconds
+    checksum: bool; if True, compute the adler32 checksum of the output file
+    extra: other entries to store in the manifest
+
+    Return
+    The manifest dictionary
+    """
+    st = os.stat(fpath)
+
+    manifest = {
+        'file': os.path.basename(fpath),
+        'size': st.st_size,
+        'mtime': st.st_mtime_ns,
+        'adler32': adler32(fpath) if checksum else None,
+        'columns': columns,
+        'event_counts': event_counts,
+        'input_files': list(input_files),
+        'timing': timing,
+        'host': socket.gethostname(),
+        'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+    }
+    manifest.update(extra)
+
+    fname_manifest = getManifestName(fpath)
+    ftmp = f"{fname_manifest}.{os.getpid()}.tmp"
+    with open(ftmp, 'w') as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(ftmp, fname_manifest)
+
+    return manifest
+
+def readManifest(fpath):
+    """
+    Read the manifest of the output file fpath. Return None if the manifest does
+    not exist or does not match the current size and mtime of the file.
+    """
+    try:
+        with open(getManifestName(fpath)) as f:
+            manifest = json.load(f)
+        st = os.stat(fpath)
+    except (OSError, ValueError):
+        return None
+
+    if manifest.get('size') != st.st_size or manifest.get('mtime') != st.st_mtime_ns:
+        return None
+
+    return manifest
+
+def checkManifest(manifest, weight_name='normalized_weight'):
+    """
+    Same checks as on the HDF5 outputs, based on the manifest only:
+    the weight column exists, all columns have the same non-zero length
+    """
+    columns = manifest.get('columns', {})
+    if not columns:
+        return False
+
+    if not weight_name in columns:
+        return False
+
+    lengths = set(c['length'] for c in columns.values())
+    if len(lengths) != 1:
+        return False
+
+    return lengths.pop() > 0
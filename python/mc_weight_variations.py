@@ -1,1356 +1,178 @@
 # Name and index of MC generator weight variations
-# Taken from https://gitlab.cern.ch/ttbarDiffXs13TeV/pyTTbarDiffXs13TeV/-/blob/DM_ljets_resolved/python/MC_variations.py
+# Aliases taken from https://gitlab.cern.ch/ttbarDiffXs13TeV/pyTTbarDiffXs13TeV/-/blob/DM_ljets_resolved/python/MC_variations.py
+#
+# Only the aliases of the generator weights used in the analysis are kept here.
+# The index of each generator weight is looked up from the weight names stored
+# by computeSumWeights.py ("names" in the sumWeights_variations config), which
+# are compiled once into a resolved DSID -> (names, index) table:
+#   python python/mc_weight_variations.py <sumWeights_variations.yaml>
+import os
+import re
+import json
 
-def get_var_index(dsid, weight_name):
-    if not dsid in dict_systname_varindex:
+# Alias -> generator weight name
+_aliases_PhPy8 = {
+    "nominal": " nominal ",
+    "scale_muF_up": " muR = 1.0, muF = 2.0 ",
+    "scale_muF_down": " muR = 1.0, muF = 0.5 ",
+    "scale_muR_up": " muR = 2.0, muF = 1.0 ",
+    "scale_muR_down": " muR = 0.5, muF = 1.0 ",
+    **{f"PDF4LHC15_{i}": f" PDF set = {90900+i} " for i in range(31)},
+    "isr_alphaS_Var3cUp": "Var3cUp",
+    "isr_alphaS_Var3cDown": "Var3cDown",
+    "fsr_muR_up": "isr:muRfac=1.0_fsr:muRfac=2.0",
+    "fsr_muR_down": "isr:muRfac=1.0_fsr:muRfac=0.5",
+}
+
+_aliases_MGPy8 = {
+    "nominal": "Default",
+    "scale_muF_up": "dyn=  10 muR=0.10000E+01 muF=0.20000E+01",
+    "scale_muF_down": "dyn=  10 muR=0.10000E+01 muF=0.50000E+00",
+    "scale_muR_up": "dyn=  10 muR=0.20000E+01 muF=0.10000E+01",
+    "scale_muR_down": "dyn=  10 muR=0.50000E+00 muF=0.10000E+01",
+}
+
+_aliases_PhPy8_ttH = {
+    "nominal": "Default",
+    "scale_muF_up": " muR = 1.0, muF = 2.0 ",
+    "scale_muF_down": " muR = 1.0, muF = 0.5 ",
+    "scale_muR_up": " muR = 2.0, muF = 1.0 ",
+    "scale_muR_down": " muR = 0.5, muF = 1.0 ",
+    "isr_alphaS_Var3cUp": "Var3cUp",
+    "isr_alphaS_Var3cDown": "Var3cDown",
+    "fsr_muR_up": "isr:muRfac=1.0_fsr:muRfac=2.0",
+    "fsr_muR_down": "isr:muRfac=1.0_fsr:muRfac=0.5",
+}
+
+dict_systname_wname = {
+    410470: _aliases_PhPy8,
+    412116: _aliases_MGPy8,
+    412117: _aliases_MGPy8,
+    601491: _aliases_PhPy8_ttH,
+    601492: _aliases_PhPy8_ttH,
+    601497: _aliases_PhPy8_ttH,
+    601498: _aliases_PhPy8_ttH,
+}
+
+def sanitize_weight_name(wname):
+    """
+    Convert a generator weight name to a string that can be used as part of a
+    C++ variable name, e.g. ' muR = 0.5, muF = 2.0 ' -> 'muR_0p5_muF_2p0'
+    """
+    vname = wname.strip().replace('.', 'p').replace('-', 'm').replace('+', '')
+    vname = re.sub(r'[^0-9a-zA-Z]+', '_', vname).strip('_')
+    return vname
+
+def compileWeightIndex(sumw_variations, aliases=dict_systname_wname):
+    """ Resolve generator weight names into a DSID -> (names, index) table
+    ______
+    Arguments
+    sumw_variations: dict or str; sum weight variations written by computeSumWeights.py or path to its yaml file
+    aliases: dict; DSID -> {alias: generator weight name}
+
+    Return
+    A dictionary: {dsid: {'names': [str], 'index': [int], 'aliased': int}}
+    The first 'aliased' entries are the aliases defined in `aliases`; the rest
+    are the other generator weights with their sanitized names.
+    """
+    if isinstance(sumw_variations, str):
+        import yaml
+        with open(sumw_variations) as f:
+            sumw_variations = yaml.load(f, getattr(yaml, 'CLoader', yaml.FullLoader))
+
+    index_d = {}
+
+    for dsid, sumw_vars_d in sumw_variations.items():
+        wnames = sumw_vars_d.get("names")
+        if not wnames:
+            continue
+
+        windex_d = {wn: i for i, wn in enumerate(wnames)}
+
+        names, indices = [], []
+        for alias, wn in aliases.get(dsid, {}).items():
+            if not wn in windex_d:
+                raise RuntimeError(f"No generator weight '{wn}' for DSID {dsid}!")
+            names.append(alias)
+            indices.append(windex_d[wn])
+
+        naliased = len(names)
+        used_names = set(names)
+        used_indices = set(indices)
+
+        # the remaining generator weights
+        for i, wn in enumerate(wnames):
+            if i in used_indices:
+                continue
+
+            vname = sanitize_weight_name(wn)
+            if not vname or vname in used_names or vname[0].isdigit():
+                vname = f"{vname}_{i}" if vname else f"{i}"
+
+            names.append(vname)
+            indices.append(i)
+            used_names.add(vname)
+
+        index_d[int(dsid)] = {'names': names, 'index': indices, 'aliased': naliased}
+
+    return index_d
+
+def getWeightIndexFileName(sumw_config):
+    """
+    Name of the compiled weight index file based on the sum weights config name
+    e.g. sumWeights_AFII.yaml -> genWeightsIndex_AFII.json
+    """
+    dirname, basename = os.path.split(sumw_config)
+    basename = os.path.splitext(basename)[0].replace("sumWeights_variations", "sumWeights")
+    return os.path.join(dirname, basename.replace("sumWeights", "genWeightsIndex")+".json")
+
+def writeWeightIndex(index_d, filename):
+    with open(filename, 'w') as outfile:
+        json.dump({str(dsid): index_d[dsid] for dsid in sorted(index_d)}, outfile)
+
+_index_cache = {}
+
+def loadWeightIndex(filename, dsids=None):
+    """
+    Load the compiled weight index from filename. Return only the entries of
+    dsids if provided. The file is read once per process.
+    """
+    if not filename in _index_cache:
+        if os.path.isfile(filename):
+            with open(filename) as f:
+                _index_cache[filename] = json.load(f)
+        else:
+            _index_cache[filename] = {}
+
+    index_d = _index_cache[filename]
+
+    if dsids is None:
+        dsids = index_d.keys()
+
+    return {int(dsid): index_d[str(dsid)] for dsid in dsids if str(dsid) in index_d}
+
+def get_var_index(dsid, weight_name, index_d):
+    if not dsid in index_d:
         raise RuntimeError(f"DSID {dsid} not in the weight variation dictionary!")
-    elif not weight_name in dict_systname_varindex[dsid]:
+
+    names = index_d[dsid]['names']
+    if not weight_name in names:
         raise RuntimeError(f"No '{weight_name}' in the weight variation dictionary for DSID {dsid}!")
 
-    res = dict_systname_varindex[dsid][weight_name]
-    if isinstance(res, int):
-        return res
-    else:
-        # keep looking
-        return get_var_index(dsid, res)
+    return index_d[dsid]['index'][names.index(weight_name)]
+
+if __name__ == "__main__":
+
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compile the generator weight index from sum weight variation configs")
+
+    parser.add_argument('sumw_variations', nargs='+', type=str,
+                        help="Sum weight variation yaml files produced by computeSumWeights.py")
 
-dict_systname_varindex={
-    410470:{
-        "nominal":" nominal "," nominal ":0,
-        "scale_muF_up":" muR = 1.0, muF = 2.0 "," muR = 1.0, muF = 2.0 ":1,
-        "scale_muF_down":" muR = 1.0, muF = 0.5 "," muR = 1.0, muF = 0.5 ":2,
-        "scale_muR_up":" muR = 2.0, muF = 1.0 "," muR = 2.0, muF = 1.0 ":3,
-        "scale_muR_down":" muR = 0.5, muF = 1.0 "," muR = 0.5, muF = 1.0 ":4,
-        "PLACEHOLDER5":" muR = 0.5, muF = 0.5 "," muR = 0.5, muF = 0.5 ":5,
-        "PLACEHOLDER6":" muR = 2.0, muF = 2.0 "," muR = 2.0, muF = 2.0 ":6,
-        "PLACEHOLDER7":" muR = 2.0, muF = 0.5 "," muR = 2.0, muF = 0.5 ":7,
-        "PLACEHOLDER8":" muR = 0.5, muF = 2.0 "," muR = 0.5, muF = 2.0 ":8,
-        "PLACEHOLDER9":" PDF set = 25200 "," PDF set = 25200 ":9,
-        "PLACEHOLDER10":" PDF set = 13165 "," PDF set = 13165 ":10,
-        "PDF4LHC15_0":" PDF set = 90900 "," PDF set = 90900 ":11,
-        "PLACEHOLDER12":" PDF set = 265000 "," PDF set = 265000 ":12,
-        "PLACEHOLDER13":" PDF set = 266000 "," PDF set = 266000 ":13,
-        "PLACEHOLDER14":" PDF set = 303400 "," PDF set = 303400 ":14,
-        "PLACEHOLDER15":" PDF set = 260001 "," PDF set = 260001 ":15,
-        "PLACEHOLDER16":" PDF set = 260002 "," PDF set = 260002 ":16,
-        "PLACEHOLDER17":" PDF set = 260003 "," PDF set = 260003 ":17,
-        "PLACEHOLDER18":" PDF set = 260004 "," PDF set = 260004 ":18,
-        "PLACEHOLDER19":" PDF set = 260005 "," PDF set = 260005 ":19,
-        "PLACEHOLDER20":" PDF set = 260006 "," PDF set = 260006 ":20,
-        "PLACEHOLDER21":" PDF set = 260007 "," PDF set = 260007 ":21,
-        "PLACEHOLDER22":" PDF set = 260008 "," PDF set = 260008 ":22,
-        "PLACEHOLDER23":" PDF set = 260009 "," PDF set = 260009 ":23,
-        "PLACEHOLDER24":" PDF set = 260010 "," PDF set = 260010 ":24,
-        "PLACEHOLDER25":" PDF set = 260011 "," PDF set = 260011 ":25,
-        "PLACEHOLDER26":" PDF set = 260012 "," PDF set = 260012 ":26,
-        "PLACEHOLDER27":" PDF set = 260013 "," PDF set = 260013 ":27,
-        "PLACEHOLDER28":" PDF set = 260014 "," PDF set = 260014 ":28,
-        "PLACEHOLDER29":" PDF set = 260015 "," PDF set = 260015 ":29,
-        "PLACEHOLDER30":" PDF set = 260016 "," PDF set = 260016 ":30,
-        "PLACEHOLDER31":" PDF set = 260017 "," PDF set = 260017 ":31,
-        "PLACEHOLDER32":" PDF set = 260018 "," PDF set = 260018 ":32,
-        "PLACEHOLDER33":" PDF set = 260019 "," PDF set = 260019 ":33,
-        "PLACEHOLDER34":" PDF set = 260020 "," PDF set = 260020 ":34,
-        "PLACEHOLDER35":" PDF set = 260021 "," PDF set = 260021 ":35,
-        "PLACEHOLDER36":" PDF set = 260022 "," PDF set = 260022 ":36,
-        "PLACEHOLDER37":" PDF set = 260023 "," PDF set = 260023 ":37,
-        "PLACEHOLDER38":" PDF set = 260024 "," PDF set = 260024 ":38,
-        "PLACEHOLDER39":" PDF set = 260025 "," PDF set = 260025 ":39,
-        "PLACEHOLDER40":" PDF set = 260026 "," PDF set = 260026 ":40,
-        "PLACEHOLDER41":" PDF set = 260027 "," PDF set = 260027 ":41,
-        "PLACEHOLDER42":" PDF set = 260028 "," PDF set = 260028 ":42,
-        "PLACEHOLDER43":" PDF set = 260029 "," PDF set = 260029 ":43,
-        "PLACEHOLDER44":" PDF set = 260030 "," PDF set = 260030 ":44,
-        "PLACEHOLDER45":" PDF set = 260031 "," PDF set = 260031 ":45,
-        "PLACEHOLDER46":" PDF set = 260032 "," PDF set = 260032 ":46,
-        "PLACEHOLDER47":" PDF set = 260033 "," PDF set = 260033 ":47,
-        "PLACEHOLDER48":" PDF set = 260034 "," PDF set = 260034 ":48,
-        "PLACEHOLDER49":" PDF set = 260035 "," PDF set = 260035 ":49,
-        "PLACEHOLDER50":" PDF set = 260036 "," PDF set = 260036 ":50,
-        "PLACEHOLDER51":" PDF set = 260037 "," PDF set = 260037 ":51,
-        "PLACEHOLDER52":" PDF set = 260038 "," PDF set = 260038 ":52,
-        "PLACEHOLDER53":" PDF set = 260039 "," PDF set = 260039 ":53,
-        "PLACEHOLDER54":" PDF set = 260040 "," PDF set = 260040 ":54,
-        "PLACEHOLDER55":" PDF set = 260041 "," PDF set = 260041 ":55,
-        "PLACEHOLDER56":" PDF set = 260042 "," PDF set = 260042 ":56,
-        "PLACEHOLDER57":" PDF set = 260043 "," PDF set = 260043 ":57,
-        "PLACEHOLDER58":" PDF set = 260044 "," PDF set = 260044 ":58,
-        "PLACEHOLDER59":" PDF set = 260045 "," PDF set = 260045 ":59,
-        "PLACEHOLDER60":" PDF set = 260046 "," PDF set = 260046 ":60,
-        "PLACEHOLDER61":" PDF set = 260047 "," PDF set = 260047 ":61,
-        "PLACEHOLDER62":" PDF set = 260048 "," PDF set = 260048 ":62,
-        "PLACEHOLDER63":" PDF set = 260049 "," PDF set = 260049 ":63,
-        "PLACEHOLDER64":" PDF set = 260050 "," PDF set = 260050 ":64,
-        "PLACEHOLDER65":" PDF set = 260051 "," PDF set = 260051 ":65,
-        "PLACEHOLDER66":" PDF set = 260052 "," PDF set = 260052 ":66,
-        "PLACEHOLDER67":" PDF set = 260053 "," PDF set = 260053 ":67,
-        "PLACEHOLDER68":" PDF set = 260054 "," PDF set = 260054 ":68,
-        "PLACEHOLDER69":" PDF set = 260055 "," PDF set = 260055 ":69,
-        "PLACEHOLDER70":" PDF set = 260056 "," PDF set = 260056 ":70,
-        "PLACEHOLDER71":" PDF set = 260057 "," PDF set = 260057 ":71,
-        "PLACEHOLDER72":" PDF set = 260058 "," PDF set = 260058 ":72,
-        "PLACEHOLDER73":" PDF set = 260059 "," PDF set = 260059 ":73,
-        "PLACEHOLDER74":" PDF set = 260060 "," PDF set = 260060 ":74,
-        "PLACEHOLDER75":" PDF set = 260061 "," PDF set = 260061 ":75,
-        "PLACEHOLDER76":" PDF set = 260062 "," PDF set = 260062 ":76,
-        "PLACEHOLDER77":" PDF set = 260063 "," PDF set = 260063 ":77,
-        "PLACEHOLDER78":" PDF set = 260064 "," PDF set = 260064 ":78,
-        "PLACEHOLDER79":" PDF set = 260065 "," PDF set = 260065 ":79,
-        "PLACEHOLDER80":" PDF set = 260066 "," PDF set = 260066 ":80,
-        "PLACEHOLDER81":" PDF set = 260067 "," PDF set = 260067 ":81,
-        "PLACEHOLDER82":" PDF set = 260068 "," PDF set = 260068 ":82,
-        "PLACEHOLDER83":" PDF set = 260069 "," PDF set = 260069 ":83,
-        "PLACEHOLDER84":" PDF set = 260070 "," PDF set = 260070 ":84,
-        "PLACEHOLDER85":" PDF set = 260071 "," PDF set = 260071 ":85,
-        "PLACEHOLDER86":" PDF set = 260072 "," PDF set = 260072 ":86,
-        "PLACEHOLDER87":" PDF set = 260073 "," PDF set = 260073 ":87,
-        "PLACEHOLDER88":" PDF set = 260074 "," PDF set = 260074 ":88,
-        "PLACEHOLDER89":" PDF set = 260075 "," PDF set = 260075 ":89,
-        "PLACEHOLDER90":" PDF set = 260076 "," PDF set = 260076 ":90,
-        "PLACEHOLDER91":" PDF set = 260077 "," PDF set = 260077 ":91,
-        "PLACEHOLDER92":" PDF set = 260078 "," PDF set = 260078 ":92,
-        "PLACEHOLDER93":" PDF set = 260079 "," PDF set = 260079 ":93,
-        "PLACEHOLDER94":" PDF set = 260080 "," PDF set = 260080 ":94,
-        "PLACEHOLDER95":" PDF set = 260081 "," PDF set = 260081 ":95,
-        "PLACEHOLDER96":" PDF set = 260082 "," PDF set = 260082 ":96,
-        "PLACEHOLDER97":" PDF set = 260083 "," PDF set = 260083 ":97,
-        "PLACEHOLDER98":" PDF set = 260084 "," PDF set = 260084 ":98,
-        "PLACEHOLDER99":" PDF set = 260085 "," PDF set = 260085 ":99,
-        "PLACEHOLDER100":" PDF set = 260086 "," PDF set = 260086 ":100,
-        "PLACEHOLDER101":" PDF set = 260087 "," PDF set = 260087 ":101,
-        "PLACEHOLDER102":" PDF set = 260088 "," PDF set = 260088 ":102,
-        "PLACEHOLDER103":" PDF set = 260089 "," PDF set = 260089 ":103,
-        "PLACEHOLDER104":" PDF set = 260090 "," PDF set = 260090 ":104,
-        "PLACEHOLDER105":" PDF set = 260091 "," PDF set = 260091 ":105,
-        "PLACEHOLDER106":" PDF set = 260092 "," PDF set = 260092 ":106,
-        "PLACEHOLDER107":" PDF set = 260093 "," PDF set = 260093 ":107,
-        "PLACEHOLDER108":" PDF set = 260094 "," PDF set = 260094 ":108,
-        "PLACEHOLDER109":" PDF set = 260095 "," PDF set = 260095 ":109,
-        "PLACEHOLDER110":" PDF set = 260096 "," PDF set = 260096 ":110,
-        "PLACEHOLDER111":" PDF set = 260097 "," PDF set = 260097 ":111,
-        "PLACEHOLDER112":" PDF set = 260098 "," PDF set = 260098 ":112,
-        "PLACEHOLDER113":" PDF set = 260099 "," PDF set = 260099 ":113,
-        "PLACEHOLDER114":" PDF set = 260100 "," PDF set = 260100 ":114,
-        "PDF4LHC15_1":" PDF set = 90901 "," PDF set = 90901 ":115,
-        "PDF4LHC15_2":" PDF set = 90902 "," PDF set = 90902 ":116,
-        "PDF4LHC15_3":" PDF set = 90903 "," PDF set = 90903 ":117,
-        "PDF4LHC15_4":" PDF set = 90904 "," PDF set = 90904 ":118,
-        "PDF4LHC15_5":" PDF set = 90905 "," PDF set = 90905 ":119,
-        "PDF4LHC15_6":" PDF set = 90906 "," PDF set = 90906 ":120,
-        "PDF4LHC15_7":" PDF set = 90907 "," PDF set = 90907 ":121,
-        "PDF4LHC15_8":" PDF set = 90908 "," PDF set = 90908 ":122,
-        "PDF4LHC15_9":" PDF set = 90909 "," PDF set = 90909 ":123,
-        "PDF4LHC15_10":" PDF set = 90910 "," PDF set = 90910 ":124,
-        "PDF4LHC15_11":" PDF set = 90911 "," PDF set = 90911 ":125,
-        "PDF4LHC15_12":" PDF set = 90912 "," PDF set = 90912 ":126,
-        "PDF4LHC15_13":" PDF set = 90913 "," PDF set = 90913 ":127,
-        "PDF4LHC15_14":" PDF set = 90914 "," PDF set = 90914 ":128,
-        "PDF4LHC15_15":" PDF set = 90915 "," PDF set = 90915 ":129,
-        "PDF4LHC15_16":" PDF set = 90916 "," PDF set = 90916 ":130,
-        "PDF4LHC15_17":" PDF set = 90917 "," PDF set = 90917 ":131,
-        "PDF4LHC15_18":" PDF set = 90918 "," PDF set = 90918 ":132,
-        "PDF4LHC15_19":" PDF set = 90919 "," PDF set = 90919 ":133,
-        "PDF4LHC15_20":" PDF set = 90920 "," PDF set = 90920 ":134,
-        "PDF4LHC15_21":" PDF set = 90921 "," PDF set = 90921 ":135,
-        "PDF4LHC15_22":" PDF set = 90922 "," PDF set = 90922 ":136,
-        "PDF4LHC15_23":" PDF set = 90923 "," PDF set = 90923 ":137,
-        "PDF4LHC15_24":" PDF set = 90924 "," PDF set = 90924 ":138,
-        "PDF4LHC15_25":" PDF set = 90925 "," PDF set = 90925 ":139,
-        "PDF4LHC15_26":" PDF set = 90926 "," PDF set = 90926 ":140,
-        "PDF4LHC15_27":" PDF set = 90927 "," PDF set = 90927 ":141,
-        "PDF4LHC15_28":" PDF set = 90928 "," PDF set = 90928 ":142,
-        "PDF4LHC15_29":" PDF set = 90929 "," PDF set = 90929 ":143,
-        "PDF4LHC15_30":" PDF set = 90930 "," PDF set = 90930 ":144,
-        "PLACEHOLDER145":" 2muF_MMHT "," 2muF_MMHT ":145,
-        "PLACEHOLDER146":" 0p5muF_MMHT "," 0p5muF_MMHT ":146,
-        "PLACEHOLDER147":" 2muR_MMHT "," 2muR_MMHT ":147,
-        "PLACEHOLDER148":" 0p5muR_MMHT "," 0p5muR_MMHT ":148,
-        "PLACEHOLDER149":" 0p5muF_0p5muR_MMHT "," 0p5muF_0p5muR_MMHT ":149,
-        "PLACEHOLDER150":" 2muF_2muR_MMHT "," 2muF_2muR_MMHT ":150,
-        "PLACEHOLDER151":" 0p5muF_2muR_MMHT "," 0p5muF_2muR_MMHT ":151,
-        "PLACEHOLDER152":" 2muF_0p5muR_MMHT "," 2muF_0p5muR_MMHT ":152,
-        "PLACEHOLDER153":" 2muF_CT14 "," 2muF_CT14 ":153,
-        "PLACEHOLDER154":" 0p5muF_CT14 "," 0p5muF_CT14 ":154,
-        "PLACEHOLDER155":" 2muR_CT14 "," 2muR_CT14 ":155,
-        "PLACEHOLDER156":" 0p5muR_CT14 "," 0p5muR_CT14 ":156,
-        "PLACEHOLDER157":" 0p5muF_0p5muR_CT14 "," 0p5muF_0p5muR_CT14 ":157,
-        "PLACEHOLDER158":" 2muF_2muR_CT14 "," 2muF_2muR_CT14 ":158,
-        "PLACEHOLDER159":" 0p5muF_2muR_CT14 "," 0p5muF_2muR_CT14 ":159,
-        "PLACEHOLDER160":" 2muF_0p5muR_CT14 "," 2muF_0p5muR_CT14 ":160,
-        "PLACEHOLDER161":" 2muF_PDF4LHC15_NLO_30 "," 2muF_PDF4LHC15_NLO_30 ":161,
-        "PLACEHOLDER162":" 0p5muF_PDF4LHC15_NLO_30 "," 0p5muF_PDF4LHC15_NLO_30 ":162,
-        "PLACEHOLDER163":" 2muR_PDF4LHC15_NLO_30 "," 2muR_PDF4LHC15_NLO_30 ":163,
-        "PLACEHOLDER164":" 0p5muR_PDF4LHC15_NLO_30 "," 0p5muR_PDF4LHC15_NLO_30 ":164,
-        "PLACEHOLDER165":" 0p5muF_0p5muR_PDF4LHC15_NLO_30 "," 0p5muF_0p5muR_PDF4LHC15_NLO_30 ":165,
-        "PLACEHOLDER166":" 2muF_2muR_PDF4LHC15_NLO_30 "," 2muF_2muR_PDF4LHC15_NLO_30 ":166,
-        "PLACEHOLDER167":" 0p5muF_2muR_PDF4LHC15_NLO_30 "," 0p5muF_2muR_PDF4LHC15_NLO_30 ":167,
-        "PLACEHOLDER168":" 2muF_0p5muR_PDF4LHC15_NLO_30 "," 2muF_0p5muR_PDF4LHC15_NLO_30 ":168,
-        "PLACEHOLDER169":" 2muF_NNPDF_NLO_0117 "," 2muF_NNPDF_NLO_0117 ":169,
-        "PLACEHOLDER170":" 0p5muF_NNPDF_NLO_0117 "," 0p5muF_NNPDF_NLO_0117 ":170,
-        "PLACEHOLDER171":" 2muR_NNPDF_NLO_0117 "," 2muR_NNPDF_NLO_0117 ":171,
-        "PLACEHOLDER172":" 0p5muR_NNPDF_0117 "," 0p5muR_NNPDF_0117 ":172,
-        "PLACEHOLDER173":" 0p5muF_0p5muR_NNPDF_NLO_0117 "," 0p5muF_0p5muR_NNPDF_NLO_0117 ":173,
-        "PLACEHOLDER174":" 2muF_2muR_NNPDF_NLO_0117 "," 2muF_2muR_NNPDF_NLO_0117 ":174,
-        "PLACEHOLDER175":" 0p5muF_2muR_NNPDF_NLO_0117 "," 0p5muF_2muR_NNPDF_NLO_0117 ":175,
-        "PLACEHOLDER176":" 2muF_0p5muR_NNPDF_NLO_0117 "," 2muF_0p5muR_NNPDF_NLO_0117 ":176,
-        "PLACEHOLDER177":" 2muF_NNPDF_NLO_0119 "," 2muF_NNPDF_NLO_0119 ":177,
-        "PLACEHOLDER178":" 0p5muF_NNPDF_NLO_0119 "," 0p5muF_NNPDF_NLO_0119 ":178,
-        "PLACEHOLDER179":" 2muR_NNPDF_NLO_0119 "," 2muR_NNPDF_NLO_0119 ":179,
-        "PLACEHOLDER180":" 0p5muR_NNPDF_NLO_0119 "," 0p5muR_NNPDF_NLO_0119 ":180,
-        "PLACEHOLDER181":" 0p5muF_0p5muR_NNPDF_NLO_0119 "," 0p5muF_0p5muR_NNPDF_NLO_0119 ":181,
-        "PLACEHOLDER182":" 2muF_2muR_NNPDF_NLO_0119 "," 2muF_2muR_NNPDF_NLO_0119 ":182,
-        "PLACEHOLDER183":" 0p5muF_2muR_NNPDF_NLO_0119 "," 0p5muF_2muR_NNPDF_NLO_0119 ":183,
-        "PLACEHOLDER184":" 2muF_0p5muR_NNPDF_NLO_0119 "," 2muF_0p5muR_NNPDF_NLO_0119 ":184,
-        "PLACEHOLDER185":" 2muF_NNPDF31_NLO_0118 "," 2muF_NNPDF31_NLO_0118 ":185,
-        "PLACEHOLDER186":" 0p5muF_NNPDF31_NLO_0118 "," 0p5muF_NNPDF31_NLO_0118 ":186,
-        "PLACEHOLDER187":" 2muR_NNPDF31_NLO_0118 "," 2muR_NNPDF31_NLO_0118 ":187,
-        "PLACEHOLDER188":" 0p5muR_NNPDF31_NLO_0118 "," 0p5muR_NNPDF31_NLO_0118 ":188,
-        "PLACEHOLDER189":" 0p5muF_0p5muR_NNPDF31_NLO_0118 "," 0p5muF_0p5muR_NNPDF31_NLO_0118 ":189,
-        "PLACEHOLDER190":" 2muF_2muR_NNPDF31_NLO_0118 "," 2muF_2muR_NNPDF31_NLO_0118 ":190,
-        "PLACEHOLDER191":" 0p5muF_2muR_NNPDF31_NLO_0118 "," 0p5muF_2muR_NNPDF31_NLO_0118 ":191,
-        "PLACEHOLDER192":" 2muF_0p5muR_NNPDF31_NLO_0118 "," 2muF_0p5muR_NNPDF31_NLO_0118 ":192,
-        "isr_alphaS_Var3cUp":"Var3cUp","Var3cUp":193,
-        "isr_alphaS_Var3cDown":"Var3cDown","Var3cDown":194,
-        "PLACEHOLDER195":"isr:muRfac=2.0_fsr:muRfac=2.0","isr:muRfac=2.0_fsr:muRfac=2.0":195,
-        "PLACEHOLDER196":"isr:muRfac=2.0_fsr:muRfac=1.0","isr:muRfac=2.0_fsr:muRfac=1.0":196,
-        "PLACEHOLDER197":"isr:muRfac=2.0_fsr:muRfac=0.5","isr:muRfac=2.0_fsr:muRfac=0.5":197,
-        "fsr_muR_up":"isr:muRfac=1.0_fsr:muRfac=2.0","isr:muRfac=1.0_fsr:muRfac=2.0":198,
-        "fsr_muR_down":"isr:muRfac=1.0_fsr:muRfac=0.5","isr:muRfac=1.0_fsr:muRfac=0.5":199,
-        "PLACEHOLDER200":"isr:muRfac=0.5_fsr:muRfac=2.0","isr:muRfac=0.5_fsr:muRfac=2.0":200,
-        "PLACEHOLDER201":"isr:muRfac=0.5_fsr:muRfac=1.0","isr:muRfac=0.5_fsr:muRfac=1.0":201,
-        "PLACEHOLDER202":"isr:muRfac=0.5_fsr:muRfac=0.5","isr:muRfac=0.5_fsr:muRfac=0.5":202,
-        "PLACEHOLDER203":"isr:muRfac=1.75_fsr:muRfac=1.0","isr:muRfac=1.75_fsr:muRfac=1.0":203,
-        "PLACEHOLDER204":"isr:muRfac=1.5_fsr:muRfac=1.0","isr:muRfac=1.5_fsr:muRfac=1.0":204,
-        "PLACEHOLDER205":"isr:muRfac=1.25_fsr:muRfac=1.0","isr:muRfac=1.25_fsr:muRfac=1.0":205,
-        "PLACEHOLDER206":"isr:muRfac=0.625_fsr:muRfac=1.0","isr:muRfac=0.625_fsr:muRfac=1.0":206,
-        "PLACEHOLDER207":"isr:muRfac=0.75_fsr:muRfac=1.0","isr:muRfac=0.75_fsr:muRfac=1.0":207,
-        "PLACEHOLDER208":"isr:muRfac=0.875_fsr:muRfac=1.0","isr:muRfac=0.875_fsr:muRfac=1.0":208,
-        "PLACEHOLDER209":"isr:muRfac=1.0_fsr:muRfac=1.75","isr:muRfac=1.0_fsr:muRfac=1.75":209,
-        "PLACEHOLDER210":"isr:muRfac=1.0_fsr:muRfac=1.5","isr:muRfac=1.0_fsr:muRfac=1.5":210,
-        "PLACEHOLDER211":"isr:muRfac=1.0_fsr:muRfac=1.25","isr:muRfac=1.0_fsr:muRfac=1.25":211,
-        "PLACEHOLDER212":"isr:muRfac=1.0_fsr:muRfac=0.625","isr:muRfac=1.0_fsr:muRfac=0.625":212,
-        "PLACEHOLDER213":"isr:muRfac=1.0_fsr:muRfac=0.75","isr:muRfac=1.0_fsr:muRfac=0.75":213,
-        "PLACEHOLDER214":"isr:muRfac=1.0_fsr:muRfac=0.875","isr:muRfac=1.0_fsr:muRfac=0.875":214,
-        "PLACEHOLDER215":"hardHi","hardHi":215,
-        "PLACEHOLDER216":"hardLo","hardLo":216,
-        },
-412116:{
-        "nominal":"Default","Default":0,
-        "PLACEHOLDER1":"PDF=  260000 NNPDF30_nlo_as_0118","PDF=  260000 NNPDF30_nlo_as_0118":1,
-        "PLACEHOLDER2":"PDF=  260001 NNPDF30_nlo_as_0118","PDF=  260001 NNPDF30_nlo_as_0118":2,
-        "PLACEHOLDER3":"PDF=  260002 NNPDF30_nlo_as_0118","PDF=  260002 NNPDF30_nlo_as_0118":3,
-        "PLACEHOLDER4":"PDF=  260003 NNPDF30_nlo_as_0118","PDF=  260003 NNPDF30_nlo_as_0118":4,
-        "PLACEHOLDER5":"PDF=  260004 NNPDF30_nlo_as_0118","PDF=  260004 NNPDF30_nlo_as_0118":5,
-        "PLACEHOLDER6":"PDF=  260005 NNPDF30_nlo_as_0118","PDF=  260005 NNPDF30_nlo_as_0118":6,
-        "PLACEHOLDER7":"PDF=  260006 NNPDF30_nlo_as_0118","PDF=  260006 NNPDF30_nlo_as_0118":7,
-        "PLACEHOLDER8":"PDF=  260007 NNPDF30_nlo_as_0118","PDF=  260007 NNPDF30_nlo_as_0118":8,
-        "PLACEHOLDER9":"PDF=  260008 NNPDF30_nlo_as_0118","PDF=  260008 NNPDF30_nlo_as_0118":9,
-        "PLACEHOLDER10":"PDF=  260009 NNPDF30_nlo_as_0118","PDF=  260009 NNPDF30_nlo_as_0118":10,
-        "PLACEHOLDER11":"PDF=  260010 NNPDF30_nlo_as_0118","PDF=  260010 NNPDF30_nlo_as_0118":11,
-        "PLACEHOLDER12":"PDF=  260011 NNPDF30_nlo_as_0118","PDF=  260011 NNPDF30_nlo_as_0118":12,
-        "PLACEHOLDER13":"PDF=  260012 NNPDF30_nlo_as_0118","PDF=  260012 NNPDF30_nlo_as_0118":13,
-        "PLACEHOLDER14":"PDF=  260013 NNPDF30_nlo_as_0118","PDF=  260013 NNPDF30_nlo_as_0118":14,
-        "PLACEHOLDER15":"PDF=  260014 NNPDF30_nlo_as_0118","PDF=  260014 NNPDF30_nlo_as_0118":15,
-        "PLACEHOLDER16":"PDF=  260015 NNPDF30_nlo_as_0118","PDF=  260015 NNPDF30_nlo_as_0118":16,
-        "PLACEHOLDER17":"PDF=  260016 NNPDF30_nlo_as_0118","PDF=  260016 NNPDF30_nlo_as_0118":17,
-        "PLACEHOLDER18":"PDF=  260017 NNPDF30_nlo_as_0118","PDF=  260017 NNPDF30_nlo_as_0118":18,
-        "PLACEHOLDER19":"PDF=  260018 NNPDF30_nlo_as_0118","PDF=  260018 NNPDF30_nlo_as_0118":19,
-        "PLACEHOLDER20":"PDF=  260019 NNPDF30_nlo_as_0118","PDF=  260019 NNPDF30_nlo_as_0118":20,
-        "PLACEHOLDER21":"PDF=  260020 NNPDF30_nlo_as_0118","PDF=  260020 NNPDF30_nlo_as_0118":21,
-        "PLACEHOLDER22":"PDF=  260021 NNPDF30_nlo_as_0118","PDF=  260021 NNPDF30_nlo_as_0118":22,
-        "PLACEHOLDER23":"PDF=  260022 NNPDF30_nlo_as_0118","PDF=  260022 NNPDF30_nlo_as_0118":23,
-        "PLACEHOLDER24":"PDF=  260023 NNPDF30_nlo_as_0118","PDF=  260023 NNPDF30_nlo_as_0118":24,
-        "PLACEHOLDER25":"PDF=  260024 NNPDF30_nlo_as_0118","PDF=  260024 NNPDF30_nlo_as_0118":25,
-        "PLACEHOLDER26":"PDF=  260025 NNPDF30_nlo_as_0118","PDF=  260025 NNPDF30_nlo_as_0118":26,
-        "PLACEHOLDER27":"PDF=  260026 NNPDF30_nlo_as_0118","PDF=  260026 NNPDF30_nlo_as_0118":27,
-        "PLACEHOLDER28":"PDF=  260027 NNPDF30_nlo_as_0118","PDF=  260027 NNPDF30_nlo_as_0118":28,
-        "PLACEHOLDER29":"PDF=  260028 NNPDF30_nlo_as_0118","PDF=  260028 NNPDF30_nlo_as_0118":29,
-        "PLACEHOLDER30":"PDF=  260029 NNPDF30_nlo_as_0118","PDF=  260029 NNPDF30_nlo_as_0118":30,
-        "PLACEHOLDER31":"PDF=  260030 NNPDF30_nlo_as_0118","PDF=  260030 NNPDF30_nlo_as_0118":31,
-        "PLACEHOLDER32":"PDF=  260031 NNPDF30_nlo_as_0118","PDF=  260031 NNPDF30_nlo_as_0118":32,
-        "PLACEHOLDER33":"PDF=  260032 NNPDF30_nlo_as_0118","PDF=  260032 NNPDF30_nlo_as_0118":33,
-        "PLACEHOLDER34":"PDF=  260033 NNPDF30_nlo_as_0118","PDF=  260033 NNPDF30_nlo_as_0118":34,
-        "PLACEHOLDER35":"PDF=  260034 NNPDF30_nlo_as_0118","PDF=  260034 NNPDF30_nlo_as_0118":35,
-        "PLACEHOLDER36":"PDF=  260035 NNPDF30_nlo_as_0118","PDF=  260035 NNPDF30_nlo_as_0118":36,
-        "PLACEHOLDER37":"PDF=  260036 NNPDF30_nlo_as_0118","PDF=  260036 NNPDF30_nlo_as_0118":37,
-        "PLACEHOLDER38":"PDF=  260037 NNPDF30_nlo_as_0118","PDF=  260037 NNPDF30_nlo_as_0118":38,
-        "PLACEHOLDER39":"PDF=  260038 NNPDF30_nlo_as_0118","PDF=  260038 NNPDF30_nlo_as_0118":39,
-        "PLACEHOLDER40":"PDF=  260039 NNPDF30_nlo_as_0118","PDF=  260039 NNPDF30_nlo_as_0118":40,
-        "PLACEHOLDER41":"PDF=  260040 NNPDF30_nlo_as_0118","PDF=  260040 NNPDF30_nlo_as_0118":41,
-        "PLACEHOLDER42":"PDF=  260041 NNPDF30_nlo_as_0118","PDF=  260041 NNPDF30_nlo_as_0118":42,
-        "PLACEHOLDER43":"PDF=  260042 NNPDF30_nlo_as_0118","PDF=  260042 NNPDF30_nlo_as_0118":43,
-        "PLACEHOLDER44":"PDF=  260043 NNPDF30_nlo_as_0118","PDF=  260043 NNPDF30_nlo_as_0118":44,
-        "PLACEHOLDER45":"PDF=  260044 NNPDF30_nlo_as_0118","PDF=  260044 NNPDF30_nlo_as_0118":45,
-        "PLACEHOLDER46":"PDF=  260045 NNPDF30_nlo_as_0118","PDF=  260045 NNPDF30_nlo_as_0118":46,
-        "PLACEHOLDER47":"PDF=  260046 NNPDF30_nlo_as_0118","PDF=  260046 NNPDF30_nlo_as_0118":47,
-        "PLACEHOLDER48":"PDF=  260047 NNPDF30_nlo_as_0118","PDF=  260047 NNPDF30_nlo_as_0118":48,
-        "PLACEHOLDER49":"PDF=  260048 NNPDF30_nlo_as_0118","PDF=  260048 NNPDF30_nlo_as_0118":49,
-        "PLACEHOLDER50":"PDF=  260049 NNPDF30_nlo_as_0118","PDF=  260049 NNPDF30_nlo_as_0118":50,
-        "PLACEHOLDER51":"PDF=  260050 NNPDF30_nlo_as_0118","PDF=  260050 NNPDF30_nlo_as_0118":51,
-        "PLACEHOLDER52":"PDF=  260051 NNPDF30_nlo_as_0118","PDF=  260051 NNPDF30_nlo_as_0118":52,
-        "PLACEHOLDER53":"PDF=  260052 NNPDF30_nlo_as_0118","PDF=  260052 NNPDF30_nlo_as_0118":53,
-        "PLACEHOLDER54":"PDF=  260053 NNPDF30_nlo_as_0118","PDF=  260053 NNPDF30_nlo_as_0118":54,
-        "PLACEHOLDER55":"PDF=  260054 NNPDF30_nlo_as_0118","PDF=  260054 NNPDF30_nlo_as_0118":55,
-        "PLACEHOLDER56":"PDF=  260055 NNPDF30_nlo_as_0118","PDF=  260055 NNPDF30_nlo_as_0118":56,
-        "PLACEHOLDER57":"PDF=  260056 NNPDF30_nlo_as_0118","PDF=  260056 NNPDF30_nlo_as_0118":57,
-        "PLACEHOLDER58":"PDF=  260057 NNPDF30_nlo_as_0118","PDF=  260057 NNPDF30_nlo_as_0118":58,
-        "PLACEHOLDER59":"PDF=  260058 NNPDF30_nlo_as_0118","PDF=  260058 NNPDF30_nlo_as_0118":59,
-        "PLACEHOLDER60":"PDF=  260059 NNPDF30_nlo_as_0118","PDF=  260059 NNPDF30_nlo_as_0118":60,
-        "PLACEHOLDER61":"PDF=  260060 NNPDF30_nlo_as_0118","PDF=  260060 NNPDF30_nlo_as_0118":61,
-        "PLACEHOLDER62":"PDF=  260061 NNPDF30_nlo_as_0118","PDF=  260061 NNPDF30_nlo_as_0118":62,
-        "PLACEHOLDER63":"PDF=  260062 NNPDF30_nlo_as_0118","PDF=  260062 NNPDF30_nlo_as_0118":63,
-        "PLACEHOLDER64":"PDF=  260063 NNPDF30_nlo_as_0118","PDF=  260063 NNPDF30_nlo_as_0118":64,
-        "PLACEHOLDER65":"PDF=  260064 NNPDF30_nlo_as_0118","PDF=  260064 NNPDF30_nlo_as_0118":65,
-        "PLACEHOLDER66":"PDF=  260065 NNPDF30_nlo_as_0118","PDF=  260065 NNPDF30_nlo_as_0118":66,
-        "PLACEHOLDER67":"PDF=  260066 NNPDF30_nlo_as_0118","PDF=  260066 NNPDF30_nlo_as_0118":67,
-        "PLACEHOLDER68":"PDF=  260067 NNPDF30_nlo_as_0118","PDF=  260067 NNPDF30_nlo_as_0118":68,
-        "PLACEHOLDER69":"PDF=  260068 NNPDF30_nlo_as_0118","PDF=  260068 NNPDF30_nlo_as_0118":69,
-        "PLACEHOLDER70":"PDF=  260069 NNPDF30_nlo_as_0118","PDF=  260069 NNPDF30_nlo_as_0118":70,
-        "PLACEHOLDER71":"PDF=  260070 NNPDF30_nlo_as_0118","PDF=  260070 NNPDF30_nlo_as_0118":71,
-        "PLACEHOLDER72":"PDF=  260071 NNPDF30_nlo_as_0118","PDF=  260071 NNPDF30_nlo_as_0118":72,
-        "PLACEHOLDER73":"PDF=  260072 NNPDF30_nlo_as_0118","PDF=  260072 NNPDF30_nlo_as_0118":73,
-        "PLACEHOLDER74":"PDF=  260073 NNPDF30_nlo_as_0118","PDF=  260073 NNPDF30_nlo_as_0118":74,
-        "PLACEHOLDER75":"PDF=  260074 NNPDF30_nlo_as_0118","PDF=  260074 NNPDF30_nlo_as_0118":75,
-        "PLACEHOLDER76":"PDF=  260075 NNPDF30_nlo_as_0118","PDF=  260075 NNPDF30_nlo_as_0118":76,
-        "PLACEHOLDER77":"PDF=  260076 NNPDF30_nlo_as_0118","PDF=  260076 NNPDF30_nlo_as_0118":77,
-        "PLACEHOLDER78":"PDF=  260077 NNPDF30_nlo_as_0118","PDF=  260077 NNPDF30_nlo_as_0118":78,
-        "PLACEHOLDER79":"PDF=  260078 NNPDF30_nlo_as_0118","PDF=  260078 NNPDF30_nlo_as_0118":79,
-        "PLACEHOLDER80":"PDF=  260079 NNPDF30_nlo_as_0118","PDF=  260079 NNPDF30_nlo_as_0118":80,
-        "PLACEHOLDER81":"PDF=  260080 NNPDF30_nlo_as_0118","PDF=  260080 NNPDF30_nlo_as_0118":81,
-        "PLACEHOLDER82":"PDF=  260081 NNPDF30_nlo_as_0118","PDF=  260081 NNPDF30_nlo_as_0118":82,
-        "PLACEHOLDER83":"PDF=  260082 NNPDF30_nlo_as_0118","PDF=  260082 NNPDF30_nlo_as_0118":83,
-        "PLACEHOLDER84":"PDF=  260083 NNPDF30_nlo_as_0118","PDF=  260083 NNPDF30_nlo_as_0118":84,
-        "PLACEHOLDER85":"PDF=  260084 NNPDF30_nlo_as_0118","PDF=  260084 NNPDF30_nlo_as_0118":85,
-        "PLACEHOLDER86":"PDF=  260085 NNPDF30_nlo_as_0118","PDF=  260085 NNPDF30_nlo_as_0118":86,
-        "PLACEHOLDER87":"PDF=  260086 NNPDF30_nlo_as_0118","PDF=  260086 NNPDF30_nlo_as_0118":87,
-        "PLACEHOLDER88":"PDF=  260087 NNPDF30_nlo_as_0118","PDF=  260087 NNPDF30_nlo_as_0118":88,
-        "PLACEHOLDER89":"PDF=  260088 NNPDF30_nlo_as_0118","PDF=  260088 NNPDF30_nlo_as_0118":89,
-        "PLACEHOLDER90":"PDF=  260089 NNPDF30_nlo_as_0118","PDF=  260089 NNPDF30_nlo_as_0118":90,
-        "PLACEHOLDER91":"PDF=  260090 NNPDF30_nlo_as_0118","PDF=  260090 NNPDF30_nlo_as_0118":91,
-        "PLACEHOLDER92":"PDF=  260091 NNPDF30_nlo_as_0118","PDF=  260091 NNPDF30_nlo_as_0118":92,
-        "PLACEHOLDER93":"PDF=  260092 NNPDF30_nlo_as_0118","PDF=  260092 NNPDF30_nlo_as_0118":93,
-        "PLACEHOLDER94":"PDF=  260093 NNPDF30_nlo_as_0118","PDF=  260093 NNPDF30_nlo_as_0118":94,
-        "PLACEHOLDER95":"PDF=  260094 NNPDF30_nlo_as_0118","PDF=  260094 NNPDF30_nlo_as_0118":95,
-        "PLACEHOLDER96":"PDF=  260095 NNPDF30_nlo_as_0118","PDF=  260095 NNPDF30_nlo_as_0118":96,
-        "PLACEHOLDER97":"PDF=  260096 NNPDF30_nlo_as_0118","PDF=  260096 NNPDF30_nlo_as_0118":97,
-        "PLACEHOLDER98":"PDF=  260097 NNPDF30_nlo_as_0118","PDF=  260097 NNPDF30_nlo_as_0118":98,
-        "PLACEHOLDER99":"PDF=  260098 NNPDF30_nlo_as_0118","PDF=  260098 NNPDF30_nlo_as_0118":99,
-        "PLACEHOLDER100":"PDF=  260099 NNPDF30_nlo_as_0118","PDF=  260099 NNPDF30_nlo_as_0118":100,
-        "PLACEHOLDER101":"PDF=  260100 NNPDF30_nlo_as_0118","PDF=  260100 NNPDF30_nlo_as_0118":101,
-        "PLACEHOLDER102":"dyn=  10 muR=0.10000E+01 muF=0.10000E+01","dyn=  10 muR=0.10000E+01 muF=0.10000E+01":102,
-        "scale_muF_up":"dyn=  10 muR=0.10000E+01 muF=0.20000E+01","dyn=  10 muR=0.10000E+01 muF=0.20000E+01":103,
-        "scale_muF_down":"dyn=  10 muR=0.10000E+01 muF=0.50000E+00","dyn=  10 muR=0.10000E+01 muF=0.50000E+00":104,
-        "scale_muR_up":"dyn=  10 muR=0.20000E+01 muF=0.10000E+01","dyn=  10 muR=0.20000E+01 muF=0.10000E+01":105,
-        "PLACEHOLDER106":"dyn=  10 muR=0.20000E+01 muF=0.20000E+01","dyn=  10 muR=0.20000E+01 muF=0.20000E+01":106,
-        "PLACEHOLDER107":"dyn=  10 muR=0.20000E+01 muF=0.50000E+00","dyn=  10 muR=0.20000E+01 muF=0.50000E+00":107,
-        "scale_muR_down":"dyn=  10 muR=0.50000E+00 muF=0.10000E+01","dyn=  10 muR=0.50000E+00 muF=0.10000E+01":108,
-        "PLACEHOLDER109":"dyn=  10 muR=0.50000E+00 muF=0.20000E+01","dyn=  10 muR=0.50000E+00 muF=0.20000E+01":109,
-        "PLACEHOLDER110":"dyn=  10 muR=0.50000E+00 muF=0.50000E+00","dyn=  10 muR=0.50000E+00 muF=0.50000E+00":110,
-        },
-412117:{
-        "nominal":"Default","Default":0,
-        "PLACEHOLDER1":"PDF=  260000 NNPDF30_nlo_as_0118","PDF=  260000 NNPDF30_nlo_as_0118":1,
-        "PLACEHOLDER2":"PDF=  260001 NNPDF30_nlo_as_0118","PDF=  260001 NNPDF30_nlo_as_0118":2,
-        "PLACEHOLDER3":"PDF=  260002 NNPDF30_nlo_as_0118","PDF=  260002 NNPDF30_nlo_as_0118":3,
-        "PLACEHOLDER4":"PDF=  260003 NNPDF30_nlo_as_0118","PDF=  260003 NNPDF30_nlo_as_0118":4,
-        "PLACEHOLDER5":"PDF=  260004 NNPDF30_nlo_as_0118","PDF=  260004 NNPDF30_nlo_as_0118":5,
-        "PLACEHOLDER6":"PDF=  260005 NNPDF30_nlo_as_0118","PDF=  260005 NNPDF30_nlo_as_0118":6,
-        "PLACEHOLDER7":"PDF=  260006 NNPDF30_nlo_as_0118","PDF=  260006 NNPDF30_nlo_as_0118":7,
-        "PLACEHOLDER8":"PDF=  260007 NNPDF30_nlo_as_0118","PDF=  260007 NNPDF30_nlo_as_0118":8,
-        "PLACEHOLDER9":"PDF=  260008 NNPDF30_nlo_as_0118","PDF=  260008 NNPDF30_nlo_as_0118":9,
-        "PLACEHOLDER10":"PDF=  260009 NNPDF30_nlo_as_0118","PDF=  260009 NNPDF30_nlo_as_0118":10,
-        "PLACEHOLDER11":"PDF=  260010 NNPDF30_nlo_as_0118","PDF=  260010 NNPDF30_nlo_as_0118":11,
-        "PLACEHOLDER12":"PDF=  260011 NNPDF30_nlo_as_0118","PDF=  260011 NNPDF30_nlo_as_0118":12,
-        "PLACEHOLDER13":"PDF=  260012 NNPDF30_nlo_as_0118","PDF=  260012 NNPDF30_nlo_as_0118":13,
-        "PLACEHOLDER14":"PDF=  260013 NNPDF30_nlo_as_0118","PDF=  260013 NNPDF30_nlo_as_0118":14,
-        "PLACEHOLDER15":"PDF=  260014 NNPDF30_nlo_as_0118","PDF=  260014 NNPDF30_nlo_as_0118":15,
-        "PLACEHOLDER16":"PDF=  260015 NNPDF30_nlo_as_0118","PDF=  260015 NNPDF30_nlo_as_0118":16,
-        "PLACEHOLDER17":"PDF=  260016 NNPDF30_nlo_as_0118","PDF=  260016 NNPDF30_nlo_as_0118":17,
-        "PLACEHOLDER18":"PDF=  260017 NNPDF30_nlo_as_0118","PDF=  260017 NNPDF30_nlo_as_0118":18,
-        "PLACEHOLDER19":"PDF=  260018 NNPDF30_nlo_as_0118","PDF=  260018 NNPDF30_nlo_as_0118":19,
-        "PLACEHOLDER20":"PDF=  260019 NNPDF30_nlo_as_0118","PDF=  260019 NNPDF30_nlo_as_0118":20,
-        "PLACEHOLDER21":"PDF=  260020 NNPDF30_nlo_as_0118","PDF=  260020 NNPDF30_nlo_as_0118":21,
-        "PLACEHOLDER22":"PDF=  260021 NNPDF30_nlo_as_0118","PDF=  260021 NNPDF30_nlo_as_0118":22,
-        "PLACEHOLDER23":"PDF=  260022 NNPDF30_nlo_as_0118","PDF=  260022 NNPDF30_nlo_as_0118":23,
-        "PLACEHOLDER24":"PDF=  260023 NNPDF30_nlo_as_0118","PDF=  260023 NNPDF30_nlo_as_0118":24,
-        "PLACEHOLDER25":"PDF=  260024 NNPDF30_nlo_as_0118","PDF=  260024 NNPDF30_nlo_as_0118":25,
-        "PLACEHOLDER26":"PDF=  260025 NNPDF30_nlo_as_0118","PDF=  260025 NNPDF30_nlo_as_0118":26,
-        "PLACEHOLDER27":"PDF=  260026 NNPDF30_nlo_as_0118","PDF=  260026 NNPDF30_nlo_as_0118":27,
-        "PLACEHOLDER28":"PDF=  260027 NNPDF30_nlo_as_0118","PDF=  260027 NNPDF30_nlo_as_0118":28,
-        "PLACEHOLDER29":"PDF=  260028 NNPDF30_nlo_as_0118","PDF=  260028 NNPDF30_nlo_as_0118":29,
-        "PLACEHOLDER30":"PDF=  260029 NNPDF30_nlo_as_0118","PDF=  260029 NNPDF30_nlo_as_0118":30,
-        "PLACEHOLDER31":"PDF=  260030 NNPDF30_nlo_as_0118","PDF=  260030 NNPDF30_nlo_as_0118":31,
-        "PLACEHOLDER32":"PDF=  260031 NNPDF30_nlo_as_0118","PDF=  260031 NNPDF30_nlo_as_0118":32,
-        "PLACEHOLDER33":"PDF=  260032 NNPDF30_nlo_as_0118","PDF=  260032 NNPDF30_nlo_as_0118":33,
-        "PLACEHOLDER34":"PDF=  260033 NNPDF30_nlo_as_0118","PDF=  260033 NNPDF30_nlo_as_0118":34,
-        "PLACEHOLDER35":"PDF=  260034 NNPDF30_nlo_as_0118","PDF=  260034 NNPDF30_nlo_as_0118":35,
-        "PLACEHOLDER36":"PDF=  260035 NNPDF30_nlo_as_0118","PDF=  260035 NNPDF30_nlo_as_0118":36,
-        "PLACEHOLDER37":"PDF=  260036 NNPDF30_nlo_as_0118","PDF=  260036 NNPDF30_nlo_as_0118":37,
-        "PLACEHOLDER38":"PDF=  260037 NNPDF30_nlo_as_0118","PDF=  260037 NNPDF30_nlo_as_0118":38,
-        "PLACEHOLDER39":"PDF=  260038 NNPDF30_nlo_as_0118","PDF=  260038 NNPDF30_nlo_as_0118":39,
-        "PLACEHOLDER40":"PDF=  260039 NNPDF30_nlo_as_0118","PDF=  260039 NNPDF30_nlo_as_0118":40,
-        "PLACEHOLDER41":"PDF=  260040 NNPDF30_nlo_as_0118","PDF=  260040 NNPDF30_nlo_as_0118":41,
-        "PLACEHOLDER42":"PDF=  260041 NNPDF30_nlo_as_0118","PDF=  260041 NNPDF30_nlo_as_0118":42,
-        "PLACEHOLDER43":"PDF=  260042 NNPDF30_nlo_as_0118","PDF=  260042 NNPDF30_nlo_as_0118":43,
-        "PLACEHOLDER44":"PDF=  260043 NNPDF30_nlo_as_0118","PDF=  260043 NNPDF30_nlo_as_0118":44,
-        "PLACEHOLDER45":"PDF=  260044 NNPDF30_nlo_as_0118","PDF=  260044 NNPDF30_nlo_as_0118":45,
-        "PLACEHOLDER46":"PDF=  260045 NNPDF30_nlo_as_0118","PDF=  260045 NNPDF30_nlo_as_0118":46,
-        "PLACEHOLDER47":"PDF=  260046 NNPDF30_nlo_as_0118","PDF=  260046 NNPDF30_nlo_as_0118":47,
-        "PLACEHOLDER48":"PDF=  260047 NNPDF30_nlo_as_0118","PDF=  260047 NNPDF30_nlo_as_0118":48,
-        "PLACEHOLDER49":"PDF=  260048 NNPDF30_nlo_as_0118","PDF=  260048 NNPDF30_nlo_as_0118":49,
-        "PLACEHOLDER50":"PDF=  260049 NNPDF30_nlo_as_0118","PDF=  260049 NNPDF30_nlo_as_0118":50,
-        "PLACEHOLDER51":"PDF=  260050 NNPDF30_nlo_as_0118","PDF=  260050 NNPDF30_nlo_as_0118":51,
-        "PLACEHOLDER52":"PDF=  260051 NNPDF30_nlo_as_0118","PDF=  260051 NNPDF30_nlo_as_0118":52,
-        "PLACEHOLDER53":"PDF=  260052 NNPDF30_nlo_as_0118","PDF=  260052 NNPDF30_nlo_as_0118":53,
-        "PLACEHOLDER54":"PDF=  260053 NNPDF30_nlo_as_0118","PDF=  260053 NNPDF30_nlo_as_0118":54,
-        "PLACEHOLDER55":"PDF=  260054 NNPDF30_nlo_as_0118","PDF=  260054 NNPDF30_nlo_as_0118":55,
-        "PLACEHOLDER56":"PDF=  260055 NNPDF30_nlo_as_0118","PDF=  260055 NNPDF30_nlo_as_0118":56,
-        "PLACEHOLDER57":"PDF=  260056 NNPDF30_nlo_as_0118","PDF=  260056 NNPDF30_nlo_as_0118":57,
-        "PLACEHOLDER58":"PDF=  260057 NNPDF30_nlo_as_0118","PDF=  260057 NNPDF30_nlo_as_0118":58,
-        "PLACEHOLDER59":"PDF=  260058 NNPDF30_nlo_as_0118","PDF=  260058 NNPDF30_nlo_as_0118":59,
-        "PLACEHOLDER60":"PDF=  260059 NNPDF30_nlo_as_0118","PDF=  260059 NNPDF30_nlo_as_0118":60,
-        "PLACEHOLDER61":"PDF=  260060 NNPDF30_nlo_as_0118","PDF=  260060 NNPDF30_nlo_as_0118":61,
-        "PLACEHOLDER62":"PDF=  260061 NNPDF30_nlo_as_0118","PDF=  260061 NNPDF30_nlo_as_0118":62,
-        "PLACEHOLDER63":"PDF=  260062 NNPDF30_nlo_as_0118","PDF=  260062 NNPDF30_nlo_as_0118":63,
-        "PLACEHOLDER64":"PDF=  260063 NNPDF30_nlo_as_0118","PDF=  260063 NNPDF30_nlo_as_0118":64,
-        "PLACEHOLDER65":"PDF=  260064 NNPDF30_nlo_as_0118","PDF=  260064 NNPDF30_nlo_as_0118":65,
-        "PLACEHOLDER66":"PDF=  260065 NNPDF30_nlo_as_0118","PDF=  260065 NNPDF30_nlo_as_0118":66,
-        "PLACEHOLDER67":"PDF=  260066 NNPDF30_nlo_as_0118","PDF=  260066 NNPDF30_nlo_as_0118":67,
-        "PLACEHOLDER68":"PDF=  260067 NNPDF30_nlo_as_0118","PDF=  260067 NNPDF30_nlo_as_0118":68,
-        "PLACEHOLDER69":"PDF=  260068 NNPDF30_nlo_as_0118","PDF=  260068 NNPDF30_nlo_as_0118":69,
-        "PLACEHOLDER70":"PDF=  260069 NNPDF30_nlo_as_0118","PDF=  260069 NNPDF30_nlo_as_0118":70,
-        "PLACEHOLDER71":"PDF=  260070 NNPDF30_nlo_as_0118","PDF=  260070 NNPDF30_nlo_as_0118":71,
-        "PLACEHOLDER72":"PDF=  260071 NNPDF30_nlo_as_0118","PDF=  260071 NNPDF30_nlo_as_0118":72,
-        "PLACEHOLDER73":"PDF=  260072 NNPDF30_nlo_as_0118","PDF=  260072 NNPDF30_nlo_as_0118":73,
-        "PLACEHOLDER74":"PDF=  260073 NNPDF30_nlo_as_0118","PDF=  260073 NNPDF30_nlo_as_0118":74,
-        "PLACEHOLDER75":"PDF=  260074 NNPDF30_nlo_as_0118","PDF=  260074 NNPDF30_nlo_as_0118":75,
-        "PLACEHOLDER76":"PDF=  260075 NNPDF30_nlo_as_0118","PDF=  260075 NNPDF30_nlo_as_0118":76,
-        "PLACEHOLDER77":"PDF=  260076 NNPDF30_nlo_as_0118","PDF=  260076 NNPDF30_nlo_as_0118":77,
-        "PLACEHOLDER78":"PDF=  260077 NNPDF30_nlo_as_0118","PDF=  260077 NNPDF30_nlo_as_0118":78,
-        "PLACEHOLDER79":"PDF=  260078 NNPDF30_nlo_as_0118","PDF=  260078 NNPDF30_nlo_as_0118":79,
-        "PLACEHOLDER80":"PDF=  260079 NNPDF30_nlo_as_0118","PDF=  260079 NNPDF30_nlo_as_0118":80,
-        "PLACEHOLDER81":"PDF=  260080 NNPDF30_nlo_as_0118","PDF=  260080 NNPDF30_nlo_as_0118":81,
-        "PLACEHOLDER82":"PDF=  260081 NNPDF30_nlo_as_0118","PDF=  260081 NNPDF30_nlo_as_0118":82,
-        "PLACEHOLDER83":"PDF=  260082 NNPDF30_nlo_as_0118","PDF=  260082 NNPDF30_nlo_as_0118":83,
-        "PLACEHOLDER84":"PDF=  260083 NNPDF30_nlo_as_0118","PDF=  260083 NNPDF30_nlo_as_0118":84,
-        "PLACEHOLDER85":"PDF=  260084 NNPDF30_nlo_as_0118","PDF=  260084 NNPDF30_nlo_as_0118":85,
-        "PLACEHOLDER86":"PDF=  260085 NNPDF30_nlo_as_0118","PDF=  260085 NNPDF30_nlo_as_0118":86,
-        "PLACEHOLDER87":"PDF=  260086 NNPDF30_nlo_as_0118","PDF=  260086 NNPDF30_nlo_as_0118":87,
-        "PLACEHOLDER88":"PDF=  260087 NNPDF30_nlo_as_0118","PDF=  260087 NNPDF30_nlo_as_0118":88,
-        "PLACEHOLDER89":"PDF=  260088 NNPDF30_nlo_as_0118","PDF=  260088 NNPDF30_nlo_as_0118":89,
-        "PLACEHOLDER90":"PDF=  260089 NNPDF30_nlo_as_0118","PDF=  260089 NNPDF30_nlo_as_0118":90,
-        "PLACEHOLDER91":"PDF=  260090 NNPDF30_nlo_as_0118","PDF=  260090 NNPDF30_nlo_as_0118":91,
-        "PLACEHOLDER92":"PDF=  260091 NNPDF30_nlo_as_0118","PDF=  260091 NNPDF30_nlo_as_0118":92,
-        "PLACEHOLDER93":"PDF=  260092 NNPDF30_nlo_as_0118","PDF=  260092 NNPDF30_nlo_as_0118":93,
-        "PLACEHOLDER94":"PDF=  260093 NNPDF30_nlo_as_0118","PDF=  260093 NNPDF30_nlo_as_0118":94,
-        "PLACEHOLDER95":"PDF=  260094 NNPDF30_nlo_as_0118","PDF=  260094 NNPDF30_nlo_as_0118":95,
-        "PLACEHOLDER96":"PDF=  260095 NNPDF30_nlo_as_0118","PDF=  260095 NNPDF30_nlo_as_0118":96,
-        "PLACEHOLDER97":"PDF=  260096 NNPDF30_nlo_as_0118","PDF=  260096 NNPDF30_nlo_as_0118":97,
-        "PLACEHOLDER98":"PDF=  260097 NNPDF30_nlo_as_0118","PDF=  260097 NNPDF30_nlo_as_0118":98,
-        "PLACEHOLDER99":"PDF=  260098 NNPDF30_nlo_as_0118","PDF=  260098 NNPDF30_nlo_as_0118":99,
-        "PLACEHOLDER100":"PDF=  260099 NNPDF30_nlo_as_0118","PDF=  260099 NNPDF30_nlo_as_0118":100,
-        "PLACEHOLDER101":"PDF=  260100 NNPDF30_nlo_as_0118","PDF=  260100 NNPDF30_nlo_as_0118":101,
-        "PLACEHOLDER102":"dyn=  10 muR=0.10000E+01 muF=0.10000E+01","dyn=  10 muR=0.10000E+01 muF=0.10000E+01":102,
-        "scale_muF_up":"dyn=  10 muR=0.10000E+01 muF=0.20000E+01","dyn=  10 muR=0.10000E+01 muF=0.20000E+01":103,
-        "scale_muF_down":"dyn=  10 muR=0.10000E+01 muF=0.50000E+00","dyn=  10 muR=0.10000E+01 muF=0.50000E+00":104,
-        "scale_muR_up":"dyn=  10 muR=0.20000E+01 muF=0.10000E+01","dyn=  10 muR=0.20000E+01 muF=0.10000E+01":105,
-        "PLACEHOLDER106":"dyn=  10 muR=0.20000E+01 muF=0.20000E+01","dyn=  10 muR=0.20000E+01 muF=0.20000E+01":106,
-        "PLACEHOLDER107":"dyn=  10 muR=0.20000E+01 muF=0.50000E+00","dyn=  10 muR=0.20000E+01 muF=0.50000E+00":107,
-        "scale_muR_down":"dyn=  10 muR=0.50000E+00 muF=0.10000E+01","dyn=  10 muR=0.50000E+00 muF=0.10000E+01":108,
-        "PLACEHOLDER109":"dyn=  10 muR=0.50000E+00 muF=0.20000E+01","dyn=  10 muR=0.50000E+00 muF=0.20000E+01":109,
-        "PLACEHOLDER110":"dyn=  10 muR=0.50000E+00 muF=0.50000E+00","dyn=  10 muR=0.50000E+00 muF=0.50000E+00":110,
-        },
-601491:{
-        "nominal":"Default","Default":0,
-        "PLACEHOLDER1":" nominal "," nominal ":1,
-        "scale_muF_up":" muR = 1.0, muF = 2.0 "," muR = 1.0, muF = 2.0 ":2,
-        "scale_muF_down":" muR = 1.0, muF = 0.5 "," muR = 1.0, muF = 0.5 ":3,
-        "scale_muR_up":" muR = 2.0, muF = 1.0 "," muR = 2.0, muF = 1.0 ":4,
-        "scale_muR_down":" muR = 0.5, muF = 1.0 "," muR = 0.5, muF = 1.0 ":5,
-        "PLACEHOLDER6":" muR = 0.5, muF = 0.5 "," muR = 0.5, muF = 0.5 ":6,
-        "PLACEHOLDER7":" muR = 2.0, muF = 2.0 "," muR = 2.0, muF = 2.0 ":7,
-        "PLACEHOLDER8":" muR = 2.0, muF = 0.5 "," muR = 2.0, muF = 0.5 ":8,
-        "PLACEHOLDER9":" muR = 0.5, muF = 2.0 "," muR = 0.5, muF = 2.0 ":9,
-        "PLACEHOLDER10":" PDF set = 25200 "," PDF set = 25200 ":10,
-        "PLACEHOLDER11":" PDF set = 13165 "," PDF set = 13165 ":11,
-        "PLACEHOLDER12":" PDF set = 90900 "," PDF set = 90900 ":12,
-        "PLACEHOLDER13":" PDF set = 265000 "," PDF set = 265000 ":13,
-        "PLACEHOLDER14":" PDF set = 266000 "," PDF set = 266000 ":14,
-        "PLACEHOLDER15":" PDF set = 303400 "," PDF set = 303400 ":15,
-        "PLACEHOLDER16":" PDF set = 260001 "," PDF set = 260001 ":16,
-        "PLACEHOLDER17":" PDF set = 260002 "," PDF set = 260002 ":17,
-        "PLACEHOLDER18":" PDF set = 260003 "," PDF set = 260003 ":18,
-        "PLACEHOLDER19":" PDF set = 260004 "," PDF set = 260004 ":19,
-        "PLACEHOLDER20":" PDF set = 260005 "," PDF set = 260005 ":20,
-        "PLACEHOLDER21":" PDF set = 260006 "," PDF set = 260006 ":21,
-        "PLACEHOLDER22":" PDF set = 260007 "," PDF set = 260007 ":22,
-        "PLACEHOLDER23":" PDF set = 260008 "," PDF set = 260008 ":23,
-        "PLACEHOLDER24":" PDF set = 260009 "," PDF set = 260009 ":24,
-        "PLACEHOLDER25":" PDF set = 260010 "," PDF set = 260010 ":25,
-        "PLACEHOLDER26":" PDF set = 260011 "," PDF set = 260011 ":26,
-        "PLACEHOLDER27":" PDF set = 260012 "," PDF set = 260012 ":27,
-        "PLACEHOLDER28":" PDF set = 260013 "," PDF set = 260013 ":28,
-        "PLACEHOLDER29":" PDF set = 260014 "," PDF set = 260014 ":29,
-        "PLACEHOLDER30":" PDF set = 260015 "," PDF set = 260015 ":30,
-        "PLACEHOLDER31":" PDF set = 260016 "," PDF set = 260016 ":31,
-        "PLACEHOLDER32":" PDF set = 260017 "," PDF set = 260017 ":32,
-        "PLACEHOLDER33":" PDF set = 260018 "," PDF set = 260018 ":33,
-        "PLACEHOLDER34":" PDF set = 260019 "," PDF set = 260019 ":34,
-        "PLACEHOLDER35":" PDF set = 260020 "," PDF set = 260020 ":35,
-        "PLACEHOLDER36":" PDF set = 260021 "," PDF set = 260021 ":36,
-        "PLACEHOLDER37":" PDF set = 260022 "," PDF set = 260022 ":37,
-        "PLACEHOLDER38":" PDF set = 260023 "," PDF set = 260023 ":38,
-        "PLACEHOLDER39":" PDF set = 260024 "," PDF set = 260024 ":39,
-        "PLACEHOLDER40":" PDF set = 260025 "," PDF set = 260025 ":40,
-        "PLACEHOLDER41":" PDF set = 260026 "," PDF set = 260026 ":41,
-        "PLACEHOLDER42":" PDF set = 260027 "," PDF set = 260027 ":42,
-        "PLACEHOLDER43":" PDF set = 260028 "," PDF set = 260028 ":43,
-        "PLACEHOLDER44":" PDF set = 260029 "," PDF set = 260029 ":44,
-        "PLACEHOLDER45":" PDF set = 260030 "," PDF set = 260030 ":45,
-        "PLACEHOLDER46":" PDF set = 260031 "," PDF set = 260031 ":46,
-        "PLACEHOLDER47":" PDF set = 260032 "," PDF set = 260032 ":47,
-        "PLACEHOLDER48":" PDF set = 260033 "," PDF set = 260033 ":48,
-        "PLACEHOLDER49":" PDF set = 260034 "," PDF set = 260034 ":49,
-        "PLACEHOLDER50":" PDF set = 260035 "," PDF set = 260035 ":50,
-        "PLACEHOLDER51":" PDF set = 260036 "," PDF set = 260036 ":51,
-        "PLACEHOLDER52":" PDF set = 260037 "," PDF set = 260037 ":52,
-        "PLACEHOLDER53":" PDF set = 260038 "," PDF set = 260038 ":53,
-        "PLACEHOLDER54":" PDF set = 260039 "," PDF set = 260039 ":54,
-        "PLACEHOLDER55":" PDF set = 260040 "," PDF set = 260040 ":55,
-        "PLACEHOLDER56":" PDF set = 260041 "," PDF set = 260041 ":56,
-        "PLACEHOLDER57":" PDF set = 260042 "," PDF set = 260042 ":57,
-        "PLACEHOLDER58":" PDF set = 260043 "," PDF set = 260043 ":58,
-        "PLACEHOLDER59":" PDF set = 260044 "," PDF set = 260044 ":59,
-        "PLACEHOLDER60":" PDF set = 260045 "," PDF set = 260045 ":60,
-        "PLACEHOLDER61":" PDF set = 260046 "," PDF set = 260046 ":61,
-        "PLACEHOLDER62":" PDF set = 260047 "," PDF set = 260047 ":62,
-        "PLACEHOLDER63":" PDF set = 260048 "," PDF set = 260048 ":63,
-        "PLACEHOLDER64":" PDF set = 260049 "," PDF set = 260049 ":64,
-        "PLACEHOLDER65":" PDF set = 260050 "," PDF set = 260050 ":65,
-        "PLACEHOLDER66":" PDF set = 260051 "," PDF set = 260051 ":66,
-        "PLACEHOLDER67":" PDF set = 260052 "," PDF set = 260052 ":67,
-        "PLACEHOLDER68":" PDF set = 260053 "," PDF set = 260053 ":68,
-        "PLACEHOLDER69":" PDF set = 260054 "," PDF set = 260054 ":69,
-        "PLACEHOLDER70":" PDF set = 260055 "," PDF set = 260055 ":70,
-        "PLACEHOLDER71":" PDF set = 260056 "," PDF set = 260056 ":71,
-        "PLACEHOLDER72":" PDF set = 260057 "," PDF set = 260057 ":72,
-        "PLACEHOLDER73":" PDF set = 260058 "," PDF set = 260058 ":73,
-        "PLACEHOLDER74":" PDF set = 260059 "," PDF set = 260059 ":74,
-        "PLACEHOLDER75":" PDF set = 260060 "," PDF set = 260060 ":75,
-        "PLACEHOLDER76":" PDF set = 260061 "," PDF set = 260061 ":76,
-        "PLACEHOLDER77":" PDF set = 260062 "," PDF set = 260062 ":77,
-        "PLACEHOLDER78":" PDF set = 260063 "," PDF set = 260063 ":78,
-        "PLACEHOLDER79":" PDF set = 260064 "," PDF set = 260064 ":79,
-        "PLACEHOLDER80":" PDF set = 260065 "," PDF set = 260065 ":80,
-        "PLACEHOLDER81":" PDF set = 260066 "," PDF set = 260066 ":81,
-        "PLACEHOLDER82":" PDF set = 260067 "," PDF set = 260067 ":82,
-        "PLACEHOLDER83":" PDF set = 260068 "," PDF set = 260068 ":83,
-        "PLACEHOLDER84":" PDF set = 260069 "," PDF set = 260069 ":84,
-        "PLACEHOLDER85":" PDF set = 260070 "," PDF set = 260070 ":85,
-        "PLACEHOLDER86":" PDF set = 260071 "," PDF set = 260071 ":86,
-        "PLACEHOLDER87":" PDF set = 260072 "," PDF set = 260072 ":87,
-        "PLACEHOLDER88":" PDF set = 260073 "," PDF set = 260073 ":88,
-        "PLACEHOLDER89":" PDF set = 260074 "," PDF set = 260074 ":89,
-        "PLACEHOLDER90":" PDF set = 260075 "," PDF set = 260075 ":90,
-        "PLACEHOLDER91":" PDF set = 260076 "," PDF set = 260076 ":91,
-        "PLACEHOLDER92":" PDF set = 260077 "," PDF set = 260077 ":92,
-        "PLACEHOLDER93":" PDF set = 260078 "," PDF set = 260078 ":93,
-        "PLACEHOLDER94":" PDF set = 260079 "," PDF set = 260079 ":94,
-        "PLACEHOLDER95":" PDF set = 260080 "," PDF set = 260080 ":95,
-        "PLACEHOLDER96":" PDF set = 260081 "," PDF set = 260081 ":96,
-        "PLACEHOLDER97":" PDF set = 260082 "," PDF set = 260082 ":97,
-        "PLACEHOLDER98":" PDF set = 260083 "," PDF set = 260083 ":98,
-        "PLACEHOLDER99":" PDF set = 260084 "," PDF set = 260084 ":99,
-        "PLACEHOLDER100":" PDF set = 260085 "," PDF set = 260085 ":100,
-        "PLACEHOLDER101":" PDF set = 260086 "," PDF set = 260086 ":101,
-        "PLACEHOLDER102":" PDF set = 260087 "," PDF set = 260087 ":102,
-        "PLACEHOLDER103":" PDF set = 260088 "," PDF set = 260088 ":103,
-        "PLACEHOLDER104":" PDF set = 260089 "," PDF set = 260089 ":104,
-        "PLACEHOLDER105":" PDF set = 260090 "," PDF set = 260090 ":105,
-        "PLACEHOLDER106":" PDF set = 260091 "," PDF set = 260091 ":106,
-        "PLACEHOLDER107":" PDF set = 260092 "," PDF set = 260092 ":107,
-        "PLACEHOLDER108":" PDF set = 260093 "," PDF set = 260093 ":108,
-        "PLACEHOLDER109":" PDF set = 260094 "," PDF set = 260094 ":109,
-        "PLACEHOLDER110":" PDF set = 260095 "," PDF set = 260095 ":110,
-        "PLACEHOLDER111":" PDF set = 260096 "," PDF set = 260096 ":111,
-        "PLACEHOLDER112":" PDF set = 260097 "," PDF set = 260097 ":112,
-        "PLACEHOLDER113":" PDF set = 260098 "," PDF set = 260098 ":113,
-        "PLACEHOLDER114":" PDF set = 260099 "," PDF set = 260099 ":114,
-        "PLACEHOLDER115":" PDF set = 260100 "," PDF set = 260100 ":115,
-        "PLACEHOLDER116":" PDF set = 90901 "," PDF set = 90901 ":116,
-        "PLACEHOLDER117":" PDF set = 90902 "," PDF set = 90902 ":117,
-        "PLACEHOLDER118":" PDF set = 90903 "," PDF set = 90903 ":118,
-        "PLACEHOLDER119":" PDF set = 90904 "," PDF set = 90904 ":119,
-        "PLACEHOLDER120":" PDF set = 90905 "," PDF set = 90905 ":120,
-        "PLACEHOLDER121":" PDF set = 90906 "," PDF set = 90906 ":121,
-        "PLACEHOLDER122":" PDF set = 90907 "," PDF set = 90907 ":122,
-        "PLACEHOLDER123":" PDF set = 90908 "," PDF set = 90908 ":123,
-        "PLACEHOLDER124":" PDF set = 90909 "," PDF set = 90909 ":124,
-        "PLACEHOLDER125":" PDF set = 90910 "," PDF set = 90910 ":125,
-        "PLACEHOLDER126":" PDF set = 90911 "," PDF set = 90911 ":126,
-        "PLACEHOLDER127":" PDF set = 90912 "," PDF set = 90912 ":127,
-        "PLACEHOLDER128":" PDF set = 90913 "," PDF set = 90913 ":128,
-        "PLACEHOLDER129":" PDF set = 90914 "," PDF set = 90914 ":129,
-        "PLACEHOLDER130":" PDF set = 90915 "," PDF set = 90915 ":130,
-        "PLACEHOLDER131":" PDF set = 90916 "," PDF set = 90916 ":131,
-        "PLACEHOLDER132":" PDF set = 90917 "," PDF set = 90917 ":132,
-        "PLACEHOLDER133":" PDF set = 90918 "," PDF set = 90918 ":133,
-        "PLACEHOLDER134":" PDF set = 90919 "," PDF set = 90919 ":134,
-        "PLACEHOLDER135":" PDF set = 90920 "," PDF set = 90920 ":135,
-        "PLACEHOLDER136":" PDF set = 90921 "," PDF set = 90921 ":136,
-        "PLACEHOLDER137":" PDF set = 90922 "," PDF set = 90922 ":137,
-        "PLACEHOLDER138":" PDF set = 90923 "," PDF set = 90923 ":138,
-        "PLACEHOLDER139":" PDF set = 90924 "," PDF set = 90924 ":139,
-        "PLACEHOLDER140":" PDF set = 90925 "," PDF set = 90925 ":140,
-        "PLACEHOLDER141":" PDF set = 90926 "," PDF set = 90926 ":141,
-        "PLACEHOLDER142":" PDF set = 90927 "," PDF set = 90927 ":142,
-        "PLACEHOLDER143":" PDF set = 90928 "," PDF set = 90928 ":143,
-        "PLACEHOLDER144":" PDF set = 90929 "," PDF set = 90929 ":144,
-        "PLACEHOLDER145":" PDF set = 90930 "," PDF set = 90930 ":145,
-        "PLACEHOLDER146":" 2muF_MMHT "," 2muF_MMHT ":146,
-        "PLACEHOLDER147":" 0p5muF_MMHT "," 0p5muF_MMHT ":147,
-        "PLACEHOLDER148":" 2muR_MMHT "," 2muR_MMHT ":148,
-        "PLACEHOLDER149":" 0p5muR_MMHT "," 0p5muR_MMHT ":149,
-        "PLACEHOLDER150":" 0p5muF_0p5muR_MMHT "," 0p5muF_0p5muR_MMHT ":150,
-        "PLACEHOLDER151":" 2muF_2muR_MMHT "," 2muF_2muR_MMHT ":151,
-        "PLACEHOLDER152":" 0p5muF_2muR_MMHT "," 0p5muF_2muR_MMHT ":152,
-        "PLACEHOLDER153":" 2muF_0p5muR_MMHT "," 2muF_0p5muR_MMHT ":153,
-        "PLACEHOLDER154":" 2muF_CT14 "," 2muF_CT14 ":154,
-        "PLACEHOLDER155":" 0p5muF_CT14 "," 0p5muF_CT14 ":155,
-        "PLACEHOLDER156":" 2muR_CT14 "," 2muR_CT14 ":156,
-        "PLACEHOLDER157":" 0p5muR_CT14 "," 0p5muR_CT14 ":157,
-        "PLACEHOLDER158":" 0p5muF_0p5muR_CT14 "," 0p5muF_0p5muR_CT14 ":158,
-        "PLACEHOLDER159":" 2muF_2muR_CT14 "," 2muF_2muR_CT14 ":159,
-        "PLACEHOLDER160":" 0p5muF_2muR_CT14 "," 0p5muF_2muR_CT14 ":160,
-        "PLACEHOLDER161":" 2muF_0p5muR_CT14 "," 2muF_0p5muR_CT14 ":161,
-        "PLACEHOLDER162":" 2muF_PDF4LHC15_NLO_30 "," 2muF_PDF4LHC15_NLO_30 ":162,
-        "PLACEHOLDER163":" 0p5muF_PDF4LHC15_NLO_30 "," 0p5muF_PDF4LHC15_NLO_30 ":163,
-        "PLACEHOLDER164":" 2muR_PDF4LHC15_NLO_30 "," 2muR_PDF4LHC15_NLO_30 ":164,
-        "PLACEHOLDER165":" 0p5muR_PDF4LHC15_NLO_30 "," 0p5muR_PDF4LHC15_NLO_30 ":165,
-        "PLACEHOLDER166":" 0p5muF_0p5muR_PDF4LHC15_NLO_30 "," 0p5muF_0p5muR_PDF4LHC15_NLO_30 ":166,
-        "PLACEHOLDER167":" 2muF_2muR_PDF4LHC15_NLO_30 "," 2muF_2muR_PDF4LHC15_NLO_30 ":167,
-        "PLACEHOLDER168":" 0p5muF_2muR_PDF4LHC15_NLO_30 "," 0p5muF_2muR_PDF4LHC15_NLO_30 ":168,
-        "PLACEHOLDER169":" 2muF_0p5muR_PDF4LHC15_NLO_30 "," 2muF_0p5muR_PDF4LHC15_NLO_30 ":169,
-        "PLACEHOLDER170":" 2muF_NNPDF_NLO_0117 "," 2muF_NNPDF_NLO_0117 ":170,
-        "PLACEHOLDER171":" 0p5muF_NNPDF_NLO_0117 "," 0p5muF_NNPDF_NLO_0117 ":171,
-        "PLACEHOLDER172":" 2muR_NNPDF_NLO_0117 "," 2muR_NNPDF_NLO_0117 ":172,
-        "PLACEHOLDER173":" 0p5muR_NNPDF_0117 "," 0p5muR_NNPDF_0117 ":173,
-        "PLACEHOLDER174":" 0p5muF_0p5muR_NNPDF_NLO_0117 "," 0p5muF_0p5muR_NNPDF_NLO_0117 ":174,
-        "PLACEHOLDER175":" 2muF_2muR_NNPDF_NLO_0117 "," 2muF_2muR_NNPDF_NLO_0117 ":175,
-        "PLACEHOLDER176":" 0p5muF_2muR_NNPDF_NLO_0117 "," 0p5muF_2muR_NNPDF_NLO_0117 ":176,
-        "PLACEHOLDER177":" 2muF_0p5muR_NNPDF_NLO_0117 "," 2muF_0p5muR_NNPDF_NLO_0117 ":177,
-        "PLACEHOLDER178":" 2muF_NNPDF_NLO_0119 "," 2muF_NNPDF_NLO_0119 ":178,
-        "PLACEHOLDER179":" 0p5muF_NNPDF_NLO_0119 "," 0p5muF_NNPDF_NLO_0119 ":179,
-        "PLACEHOLDER180":" 2muR_NNPDF_NLO_0119 "," 2muR_NNPDF_NLO_0119 ":180,
-        "PLACEHOLDER181":" 0p5muR_NNPDF_NLO_0119 "," 0p5muR_NNPDF_NLO_0119 ":181,
-        "PLACEHOLDER182":" 0p5muF_0p5muR_NNPDF_NLO_0119 "," 0p5muF_0p5muR_NNPDF_NLO_0119 ":182,
-        "PLACEHOLDER183":" 2muF_2muR_NNPDF_NLO_0119 "," 2muF_2muR_NNPDF_NLO_0119 ":183,
-        "PLACEHOLDER184":" 0p5muF_2muR_NNPDF_NLO_0119 "," 0p5muF_2muR_NNPDF_NLO_0119 ":184,
-        "PLACEHOLDER185":" 2muF_0p5muR_NNPDF_NLO_0119 "," 2muF_0p5muR_NNPDF_NLO_0119 ":185,
-        "PLACEHOLDER186":" 2muF_NNPDF31_NLO_0118 "," 2muF_NNPDF31_NLO_0118 ":186,
-        "PLACEHOLDER187":" 0p5muF_NNPDF31_NLO_0118 "," 0p5muF_NNPDF31_NLO_0118 ":187,
-        "PLACEHOLDER188":" 2muR_NNPDF31_NLO_0118 "," 2muR_NNPDF31_NLO_0118 ":188,
-        "PLACEHOLDER189":" 0p5muR_NNPDF31_NLO_0118 "," 0p5muR_NNPDF31_NLO_0118 ":189,
-        "PLACEHOLDER190":" 0p5muF_0p5muR_NNPDF31_NLO_0118 "," 0p5muF_0p5muR_NNPDF31_NLO_0118 ":190,
-        "PLACEHOLDER191":" 2muF_2muR_NNPDF31_NLO_0118 "," 2muF_2muR_NNPDF31_NLO_0118 ":191,
-        "PLACEHOLDER192":" 0p5muF_2muR_NNPDF31_NLO_0118 "," 0p5muF_2muR_NNPDF31_NLO_0118 ":192,
-        "PLACEHOLDER193":" 2muF_0p5muR_NNPDF31_NLO_0118 "," 2muF_0p5muR_NNPDF31_NLO_0118 ":193,
-        "isr_alphaS_Var3cUp":"Var3cUp","Var3cUp":194,
-        "isr_alphaS_Var3cDown":"Var3cDown","Var3cDown":195,
-        "PLACEHOLDER196":"isr:muRfac=2.0_fsr:muRfac=2.0","isr:muRfac=2.0_fsr:muRfac=2.0":196,
-        "PLACEHOLDER197":"isr:muRfac=2.0_fsr:muRfac=1.0","isr:muRfac=2.0_fsr:muRfac=1.0":197,
-        "PLACEHOLDER198":"isr:muRfac=2.0_fsr:muRfac=0.5","isr:muRfac=2.0_fsr:muRfac=0.5":198,
-        "fsr_muR_up":"isr:muRfac=1.0_fsr:muRfac=2.0","isr:muRfac=1.0_fsr:muRfac=2.0":199,
-        "fsr_muR_down":"isr:muRfac=1.0_fsr:muRfac=0.5","isr:muRfac=1.0_fsr:muRfac=0.5":200,
-        "PLACEHOLDER201":"isr:muRfac=0.5_fsr:muRfac=2.0","isr:muRfac=0.5_fsr:muRfac=2.0":201,
-        "PLACEHOLDER202":"isr:muRfac=0.5_fsr:muRfac=1.0","isr:muRfac=0.5_fsr:muRfac=1.0":202,
-        "PLACEHOLDER203":"isr:muRfac=0.5_fsr:muRfac=0.5","isr:muRfac=0.5_fsr:muRfac=0.5":203,
-        "PLACEHOLDER204":"isr:muRfac=1.75_fsr:muRfac=1.0","isr:muRfac=1.75_fsr:muRfac=1.0":204,
-        "PLACEHOLDER205":"isr:muRfac=1.5_fsr:muRfac=1.0","isr:muRfac=1.5_fsr:muRfac=1.0":205,
-        "PLACEHOLDER206":"isr:muRfac=1.25_fsr:muRfac=1.0","isr:muRfac=1.25_fsr:muRfac=1.0":206,
-        "PLACEHOLDER207":"isr:muRfac=0.625_fsr:muRfac=1.0","isr:muRfac=0.625_fsr:muRfac=1.0":207,
-        "PLACEHOLDER208":"isr:muRfac=0.75_fsr:muRfac=1.0","isr:muRfac=0.75_fsr:muRfac=1.0":208,
-        "PLACEHOLDER209":"isr:muRfac=0.875_fsr:muRfac=1.0","isr:muRfac=0.875_fsr:muRfac=1.0":209,
-        "PLACEHOLDER210":"isr:muRfac=1.0_fsr:muRfac=1.75","isr:muRfac=1.0_fsr:muRfac=1.75":210,
-        "PLACEHOLDER211":"isr:muRfac=1.0_fsr:muRfac=1.5","isr:muRfac=1.0_fsr:muRfac=1.5":211,
-        "PLACEHOLDER212":"isr:muRfac=1.0_fsr:muRfac=1.25","isr:muRfac=1.0_fsr:muRfac=1.25":212,
-        "PLACEHOLDER213":"isr:muRfac=1.0_fsr:muRfac=0.625","isr:muRfac=1.0_fsr:muRfac=0.625":213,
-        "PLACEHOLDER214":"isr:muRfac=1.0_fsr:muRfac=0.75","isr:muRfac=1.0_fsr:muRfac=0.75":214,
-        "PLACEHOLDER215":"isr:muRfac=1.0_fsr:muRfac=0.875","isr:muRfac=1.0_fsr:muRfac=0.875":215,
-        "PLACEHOLDER216":"hardHi","hardHi":216,
-        "PLACEHOLDER217":"hardLo","hardLo":217,
-        "PLACEHOLDER218":"isr:PDF:plus","isr:PDF:plus":218,
-        "PLACEHOLDER219":"isr:PDF:minus","isr:PDF:minus":219,
-        "PLACEHOLDER220":"AUX_bare_not_for_analyses","AUX_bare_not_for_analyses":220,
-        },
-601492:{
-        "nominal":"Default","Default":0,
-        "PLACEHOLDER1":" nominal "," nominal ":1,
-        "scale_muF_up":" muR = 1.0, muF = 2.0 "," muR = 1.0, muF = 2.0 ":2,
-        "scale_muF_down":" muR = 1.0, muF = 0.5 "," muR = 1.0, muF = 0.5 ":3,
-        "scale_muR_up":" muR = 2.0, muF = 1.0 "," muR = 2.0, muF = 1.0 ":4,
-        "scale_muR_down":" muR = 0.5, muF = 1.0 "," muR = 0.5, muF = 1.0 ":5,
-        "PLACEHOLDER6":" muR = 0.5, muF = 0.5 "," muR = 0.5, muF = 0.5 ":6,
-        "PLACEHOLDER7":" muR = 2.0, muF = 2.0 "," muR = 2.0, muF = 2.0 ":7,
-        "PLACEHOLDER8":" muR = 2.0, muF = 0.5 "," muR = 2.0, muF = 0.5 ":8,
-        "PLACEHOLDER9":" muR = 0.5, muF = 2.0 "," muR = 0.5, muF = 2.0 ":9,
-        "PLACEHOLDER10":" PDF set = 25200 "," PDF set = 25200 ":10,
-        "PLACEHOLDER11":" PDF set = 13165 "," PDF set = 13165 ":11,
-        "PLACEHOLDER12":" PDF set = 90900 "," PDF set = 90900 ":12,
-        "PLACEHOLDER13":" PDF set = 265000 "," PDF set = 265000 ":13,
-        "PLACEHOLDER14":" PDF set = 266000 "," PDF set = 266000 ":14,
-        "PLACEHOLDER15":" PDF set = 303400 "," PDF set = 303400 ":15,
-        "PLACEHOLDER16":" PDF set = 260001 "," PDF set = 260001 ":16,
-        "PLACEHOLDER17":" PDF set = 260002 "," PDF set = 260002 ":17,
-        "PLACEHOLDER18":" PDF set = 260003 "," PDF set = 260003 ":18,
-        "PLACEHOLDER19":" PDF set = 260004 "," PDF set = 260004 ":19,
-        "PLACEHOLDER20":" PDF set = 260005 "," PDF set = 260005 ":20,
-        "PLACEHOLDER21":" PDF set = 260006 "," PDF set = 260006 ":21,
-        "PLACEHOLDER22":" PDF set = 260007 "," PDF set = 260007 ":22,
-        "PLACEHOLDER23":" PDF set = 260008 "," PDF set = 260008 ":23,
-        "PLACEHOLDER24":" PDF set = 260009 "," PDF set = 260009 ":24,
-        "PLACEHOLDER25":" PDF set = 260010 "," PDF set = 260010 ":25,
-        "PLACEHOLDER26":" PDF set = 260011 "," PDF set = 260011 ":26,
-        "PLACEHOLDER27":" PDF set = 260012 "," PDF set = 260012 ":27,
-        "PLACEHOLDER28":" PDF set = 260013 "," PDF set = 260013 ":28,
-        "PLACEHOLDER29":" PDF set = 260014 "," PDF set = 260014 ":29,
-        "PLACEHOLDER30":" PDF set = 260015 "," PDF set = 260015 ":30,
-        "PLACEHOLDER31":" PDF set = 260016 "," PDF set = 260016 ":31,
-        "PLACEHOLDER32":" PDF set = 260017 "," PDF set = 260017 ":32,
-        "PLACEHOLDER33":" PDF set = 260018 "," PDF set = 260018 ":33,
-        "PLACEHOLDER34":" PDF set = 260019 "," PDF set = 260019 ":34,
-        "PLACEHOLDER35":" PDF set = 260020 "," PDF set = 260020 ":35,
-        "PLACEHOLDER36":" PDF set = 260021 "," PDF set = 260021 ":36,
-        "PLACEHOLDER37":" PDF set = 260022 "," PDF set = 260022 ":37,
-        "PLACEHOLDER38":" PDF set = 260023 "," PDF set = 260023 ":38,
-        "PLACEHOLDER39":" PDF set = 260024 "," PDF set = 260024 ":39,
-        "PLACEHOLDER40":" PDF set = 260025 "," PDF set = 260025 ":40,
-        "PLACEHOLDER41":" PDF set = 260026 "," PDF set = 260026 ":41,
-        "PLACEHOLDER42":" PDF set = 260027 "," PDF set = 260027 ":42,
-        "PLACEHOLDER43":" PDF set = 260028 "," PDF set = 260028 ":43,
-        "PLACEHOLDER44":" PDF set = 260029 "," PDF set = 260029 ":44,
-        "PLACEHOLDER45":" PDF set = 260030 "," PDF set = 260030 ":45,
-        "PLACEHOLDER46":" PDF set = 260031 "," PDF set = 260031 ":46,
-        "PLACEHOLDER47":" PDF set = 260032 "," PDF set = 260032 ":47,
-        "PLACEHOLDER48":" PDF set = 260033 "," PDF set = 260033 ":48,
-        "PLACEHOLDER49":" PDF set = 260034 "," PDF set = 260034 ":49,
-        "PLACEHOLDER50":" PDF set = 260035 "," PDF set = 260035 ":50,
-        "PLACEHOLDER51":" PDF set = 260036 "," PDF set = 260036 ":51,
-        "PLACEHOLDER52":" PDF set = 260037 "," PDF set = 260037 ":52,
-        "PLACEHOLDER53":" PDF set = 260038 "," PDF set = 260038 ":53,
-        "PLACEHOLDER54":" PDF set = 260039 "," PDF set = 260039 ":54,
-        "PLACEHOLDER55":" PDF set = 260040 "," PDF set = 260040 ":55,
-        "PLACEHOLDER56":" PDF set = 260041 "," PDF set = 260041 ":56,
-        "PLACEHOLDER57":" PDF set = 260042 "," PDF set = 260042 ":57,
-        "PLACEHOLDER58":" PDF set = 260043 "," PDF set = 260043 ":58,
-        "PLACEHOLDER59":" PDF set = 260044 "," PDF set = 260044 ":59,
-        "PLACEHOLDER60":" PDF set = 260045 "," PDF set = 260045 ":60,
-        "PLACEHOLDER61":" PDF set = 260046 "," PDF set = 260046 ":61,
-        "PLACEHOLDER62":" PDF set = 260047 "," PDF set = 260047 ":62,
-        "PLACEHOLDER63":" PDF set = 260048 "," PDF set = 260048 ":63,
-        "PLACEHOLDER64":" PDF set = 260049 "," PDF set = 260049 ":64,
-        "PLACEHOLDER65":" PDF set = 260050 "," PDF set = 260050 ":65,
-        "PLACEHOLDER66":" PDF set = 260051 "," PDF set = 260051 ":66,
-        "PLACEHOLDER67":" PDF set = 260052 "," PDF set = 260052 ":67,
-        "PLACEHOLDER68":" PDF set = 260053 "," PDF set = 260053 ":68,
-        "PLACEHOLDER69":" PDF set = 260054 "," PDF set = 260054 ":69,
-        "PLACEHOLDER70":" PDF set = 260055 "," PDF set = 260055 ":70,
-        "PLACEHOLDER71":" PDF set = 260056 "," PDF set = 260056 ":71,
-        "PLACEHOLDER72":" PDF set = 260057 "," PDF set = 260057 ":72,
-        "PLACEHOLDER73":" PDF set = 260058 "," PDF set = 260058 ":73,
-        "PLACEHOLDER74":" PDF set = 260059 "," PDF set = 260059 ":74,
-        "PLACEHOLDER75":" PDF set = 260060 "," PDF set = 260060 ":75,
-        "PLACEHOLDER76":" PDF set = 260061 "," PDF set = 260061 ":76,
-        "PLACEHOLDER77":" PDF set = 260062 "," PDF set = 260062 ":77,
-        "PLACEHOLDER78":" PDF set = 260063 "," PDF set = 260063 ":78,
-        "PLACEHOLDER79":" PDF set = 260064 "," PDF set = 260064 ":79,
-        "PLACEHOLDER80":" PDF set = 260065 "," PDF set = 260065 ":80,
-        "PLACEHOLDER81":" PDF set = 260066 "," PDF set = 260066 ":81,
-        "PLACEHOLDER82":" PDF set = 260067 "," PDF set = 260067 ":82,
-        "PLACEHOLDER83":" PDF set = 260068 "," PDF set = 260068 ":83,
-        "PLACEHOLDER84":" PDF set = 260069 "," PDF set = 260069 ":84,
-        "PLACEHOLDER85":" PDF set = 260070 "," PDF set = 260070 ":85,
-        "PLACEHOLDER86":" PDF set = 260071 "," PDF set = 260071 ":86,
-        "PLACEHOLDER87":" PDF set = 260072 "," PDF set = 260072 ":87,
-        "PLACEHOLDER88":" PDF set = 260073 "," PDF set = 260073 ":88,
-        "PLACEHOLDER89":" PDF set = 260074 "," PDF set = 260074 ":89,
-        "PLACEHOLDER90":" PDF set = 260075 "," PDF set = 260075 ":90,
-        "PLACEHOLDER91":" PDF set = 260076 "," PDF set = 260076 ":91,
-        "PLACEHOLDER92":" PDF set = 260077 "," PDF set = 260077 ":92,
-        "PLACEHOLDER93":" PDF set = 260078 "," PDF set = 260078 ":93,
-        "PLACEHOLDER94":" PDF set = 260079 "," PDF set = 260079 ":94,
-        "PLACEHOLDER95":" PDF set = 260080 "," PDF set = 260080 ":95,
-        "PLACEHOLDER96":" PDF set = 260081 "," PDF set = 260081 ":96,
-        "PLACEHOLDER97":" PDF set = 260082 "," PDF set = 260082 ":97,
-        "PLACEHOLDER98":" PDF set = 260083 "," PDF set = 260083 ":98,
-        "PLACEHOLDER99":" PDF set = 260084 "," PDF set = 260084 ":99,
-        "PLACEHOLDER100":" PDF set = 260085 "," PDF set = 260085 ":100,
-        "PLACEHOLDER101":" PDF set = 260086 "," PDF set = 260086 ":101,
-        "PLACEHOLDER102":" PDF set = 260087 "," PDF set = 260087 ":102,
-        "PLACEHOLDER103":" PDF set = 260088 "," PDF set = 260088 ":103,
-        "PLACEHOLDER104":" PDF set = 260089 "," PDF set = 260089 ":104,
-        "PLACEHOLDER105":" PDF set = 260090 "," PDF set = 260090 ":105,
-        "PLACEHOLDER106":" PDF set = 260091 "," PDF set = 260091 ":106,
-        "PLACEHOLDER107":" PDF set = 260092 "," PDF set = 260092 ":107,
-        "PLACEHOLDER108":" PDF set = 260093 "," PDF set = 260093 ":108,
-        "PLACEHOLDER109":" PDF set = 260094 "," PDF set = 260094 ":109,
-        "PLACEHOLDER110":" PDF set = 260095 "," PDF set = 260095 ":110,
-        "PLACEHOLDER111":" PDF set = 260096 "," PDF set = 260096 ":111,
-        "PLACEHOLDER112":" PDF set = 260097 "," PDF set = 260097 ":112,
-        "PLACEHOLDER113":" PDF set = 260098 "," PDF set = 260098 ":113,
-        "PLACEHOLDER114":" PDF set = 260099 "," PDF set = 260099 ":114,
-        "PLACEHOLDER115":" PDF set = 260100 "," PDF set = 260100 ":115,
-        "PLACEHOLDER116":" PDF set = 90901 "," PDF set = 90901 ":116,
-        "PLACEHOLDER117":" PDF set = 90902 "," PDF set = 90902 ":117,
-        "PLACEHOLDER118":" PDF set = 90903 "," PDF set = 90903 ":118,
-        "PLACEHOLDER119":" PDF set = 90904 "," PDF set = 90904 ":119,
-        "PLACEHOLDER120":" PDF set = 90905 "," PDF set = 90905 ":120,
-        "PLACEHOLDER121":" PDF set = 90906 "," PDF set = 90906 ":121,
-        "PLACEHOLDER122":" PDF set = 90907 "," PDF set = 90907 ":122,
-        "PLACEHOLDER123":" PDF set = 90908 "," PDF set = 90908 ":123,
-        "PLACEHOLDER124":" PDF set = 90909 "," PDF set = 90909 ":124,
-        "PLACEHOLDER125":" PDF set = 90910 "," PDF set = 90910 ":125,
-        "PLACEHOLDER126":" PDF set = 90911 "," PDF set = 90911 ":126,
-        "PLACEHOLDER127":" PDF set = 90912 "," PDF set = 90912 ":127,
-        "PLACEHOLDER128":" PDF set = 90913 "," PDF set = 90913 ":128,
-        "PLACEHOLDER129":" PDF set = 90914 "," PDF set = 90914 ":129,
-        "PLACEHOLDER130":" PDF set = 90915 "," PDF set = 90915 ":130,
-        "PLACEHOLDER131":" PDF set = 90916 "," PDF set = 90916 ":131,
-        "PLACEHOLDER132":" PDF set = 90917 "," PDF set = 90917 ":132,
-        "PLACEHOLDER133":" PDF set = 90918 "," PDF set = 90918 ":133,
-        "PLACEHOLDER134":" PDF set = 90919 "," PDF set = 90919 ":134,
-        "PLACEHOLDER135":" PDF set = 90920 "," PDF set = 90920 ":135,
-        "PLACEHOLDER136":" PDF set = 90921 "," PDF set = 90921 ":136,
-        "PLACEHOLDER137":" PDF set = 90922 "," PDF set = 90922 ":137,
-        "PLACEHOLDER138":" PDF set = 90923 "," PDF set = 90923 ":138,
-        "PLACEHOLDER139":" PDF set = 90924 "," PDF set = 90924 ":139,
-        "PLACEHOLDER140":" PDF set = 90925 "," PDF set = 90925 ":140,
-        "PLACEHOLDER141":" PDF set = 90926 "," PDF set = 90926 ":141,
-        "PLACEHOLDER142":" PDF set = 90927 "," PDF set = 90927 ":142,
-        "PLACEHOLDER143":" PDF set = 90928 "," PDF set = 90928 ":143,
-        "PLACEHOLDER144":" PDF set = 90929 "," PDF set = 90929 ":144,
-        "PLACEHOLDER145":" PDF set = 90930 "," PDF set = 90930 ":145,
-        "PLACEHOLDER146":" 2muF_MMHT "," 2muF_MMHT ":146,
-        "PLACEHOLDER147":" 0p5muF_MMHT "," 0p5muF_MMHT ":147,
-        "PLACEHOLDER148":" 2muR_MMHT "," 2muR_MMHT ":148,
-        "PLACEHOLDER149":" 0p5muR_MMHT "," 0p5muR_MMHT ":149,
-        "PLACEHOLDER150":" 0p5muF_0p5muR_MMHT "," 0p5muF_0p5muR_MMHT ":150,
-        "PLACEHOLDER151":" 2muF_2muR_MMHT "," 2muF_2muR_MMHT ":151,
-        "PLACEHOLDER152":" 0p5muF_2muR_MMHT "," 0p5muF_2muR_MMHT ":152,
-        "PLACEHOLDER153":" 2muF_0p5muR_MMHT "," 2muF_0p5muR_MMHT ":153,
-        "PLACEHOLDER154":" 2muF_CT14 "," 2muF_CT14 ":154,
-        "PLACEHOLDER155":" 0p5muF_CT14 "," 0p5muF_CT14 ":155,
-        "PLACEHOLDER156":" 2muR_CT14 "," 2muR_CT14 ":156,
-        "PLACEHOLDER157":" 0p5muR_CT14 "," 0p5muR_CT14 ":157,
-        "PLACEHOLDER158":" 0p5muF_0p5muR_CT14 "," 0p5muF_0p5muR_CT14 ":158,
-        "PLACEHOLDER159":" 2muF_2muR_CT14 "," 2muF_2muR_CT14 ":159,
-        "PLACEHOLDER160":" 0p5muF_2muR_CT14 "," 0p5muF_2muR_CT14 ":160,
-        "PLACEHOLDER161":" 2muF_0p5muR_CT14 "," 2muF_0p5muR_CT14 ":161,
-        "PLACEHOLDER162":" 2muF_PDF4LHC15_NLO_30 "," 2muF_PDF4LHC15_NLO_30 ":162,
-        "PLACEHOLDER163":" 0p5muF_PDF4LHC15_NLO_30 "," 0p5muF_PDF4LHC15_NLO_30 ":163,
-        "PLACEHOLDER164":" 2muR_PDF4LHC15_NLO_30 "," 2muR_PDF4LHC15_NLO_30 ":164,
-        "PLACEHOLDER165":" 0p5muR_PDF4LHC15_NLO_30 "," 0p5muR_PDF4LHC15_NLO_30 ":165,
-        "PLACEHOLDER166":" 0p5muF_0p5muR_PDF4LHC15_NLO_30 "," 0p5muF_0p5muR_PDF4LHC15_NLO_30 ":166,
-        "PLACEHOLDER167":" 2muF_2muR_PDF4LHC15_NLO_30 "," 2muF_2muR_PDF4LHC15_NLO_30 ":167,
-        "PLACEHOLDER168":" 0p5muF_2muR_PDF4LHC15_NLO_30 "," 0p5muF_2muR_PDF4LHC15_NLO_30 ":168,
-        "PLACEHOLDER169":" 2muF_0p5muR_PDF4LHC15_NLO_30 "," 2muF_0p5muR_PDF4LHC15_NLO_30 ":169,
-        "PLACEHOLDER170":" 2muF_NNPDF_NLO_0117 "," 2muF_NNPDF_NLO_0117 ":170,
-        "PLACEHOLDER171":" 0p5muF_NNPDF_NLO_0117 "," 0p5muF_NNPDF_NLO_0117 ":171,
-        "PLACEHOLDER172":" 2muR_NNPDF_NLO_0117 "," 2muR_NNPDF_NLO_0117 ":172,
-        "PLACEHOLDER173":" 0p5muR_NNPDF_0117 "," 0p5muR_NNPDF_0117 ":173,
-        "PLACEHOLDER174":" 0p5muF_0p5muR_NNPDF_NLO_0117 "," 0p5muF_0p5muR_NNPDF_NLO_0117 ":174,
-        "PLACEHOLDER175":" 2muF_2muR_NNPDF_NLO_0117 "," 2muF_2muR_NNPDF_NLO_0117 ":175,
-        "PLACEHOLDER176":" 0p5muF_2muR_NNPDF_NLO_0117 "," 0p5muF_2muR_NNPDF_NLO_0117 ":176,
-        "PLACEHOLDER177":" 2muF_0p5muR_NNPDF_NLO_0117 "," 2muF_0p5muR_NNPDF_NLO_0117 ":177,
-        "PLACEHOLDER178":" 2muF_NNPDF_NLO_0119 "," 2muF_NNPDF_NLO_0119 ":178,
-        "PLACEHOLDER179":" 0p5muF_NNPDF_NLO_0119 "," 0p5muF_NNPDF_NLO_0119 ":179,
-        "PLACEHOLDER180":" 2muR_NNPDF_NLO_0119 "," 2muR_NNPDF_NLO_0119 ":180,
-        "PLACEHOLDER181":" 0p5muR_NNPDF_NLO_0119 "," 0p5muR_NNPDF_NLO_0119 ":181,
-        "PLACEHOLDER182":" 0p5muF_0p5muR_NNPDF_NLO_0119 "," 0p5muF_0p5muR_NNPDF_NLO_0119 ":182,
-        "PLACEHOLDER183":" 2muF_2muR_NNPDF_NLO_0119 "," 2muF_2muR_NNPDF_NLO_0119 ":183,
-        "PLACEHOLDER184":" 0p5muF_2muR_NNPDF_NLO_0119 "," 0p5muF_2muR_NNPDF_NLO_0119 ":184,
-        "PLACEHOLDER185":" 2muF_0p5muR_NNPDF_NLO_0119 "," 2muF_0p5muR_NNPDF_NLO_0119 ":185,
-        "PLACEHOLDER186":" 2muF_NNPDF31_NLO_0118 "," 2muF_NNPDF31_NLO_0118 ":186,
-        "PLACEHOLDER187":" 0p5muF_NNPDF31_NLO_0118 "," 0p5muF_NNPDF31_NLO_0118 ":187,
-        "PLACEHOLDER188":" 2muR_NNPDF31_NLO_0118 "," 2muR_NNPDF31_NLO_0118 ":188,
-        "PLACEHOLDER189":" 0p5muR_NNPDF31_NLO_0118 "," 0p5muR_NNPDF31_NLO_0118 ":189,
-        "PLACEHOLDER190":" 0p5muF_0p5muR_NNPDF31_NLO_0118 "," 0p5muF_0p5muR_NNPDF31_NLO_0118 ":190,
-        "PLACEHOLDER191":" 2muF_2muR_NNPDF31_NLO_0118 "," 2muF_2muR_NNPDF31_NLO_0118 ":191,
-        "PLACEHOLDER192":" 0p5muF_2muR_NNPDF31_NLO_0118 "," 0p5muF_2muR_NNPDF31_NLO_0118 ":192,
-        "PLACEHOLDER193":" 2muF_0p5muR_NNPDF31_NLO_0118 "," 2muF_0p5muR_NNPDF31_NLO_0118 ":193,
-        "isr_alphaS_Var3cUp":"Var3cUp","Var3cUp":194,
-        "isr_alphaS_Var3cDown":"Var3cDown","Var3cDown":195,
-        "PLACEHOLDER196":"isr:muRfac=2.0_fsr:muRfac=2.0","isr:muRfac=2.0_fsr:muRfac=2.0":196,
-        "PLACEHOLDER197":"isr:muRfac=2.0_fsr:muRfac=1.0","isr:muRfac=2.0_fsr:muRfac=1.0":197,
-        "PLACEHOLDER198":"isr:muRfac=2.0_fsr:muRfac=0.5","isr:muRfac=2.0_fsr:muRfac=0.5":198,
-        "fsr_muR_up":"isr:muRfac=1.0_fsr:muRfac=2.0","isr:muRfac=1.0_fsr:muRfac=2.0":199,
-        "fsr_muR_down":"isr:muRfac=1.0_fsr:muRfac=0.5","isr:muRfac=1.0_fsr:muRfac=0.5":200,
-        "PLACEHOLDER201":"isr:muRfac=0.5_fsr:muRfac=2.0","isr:muRfac=0.5_fsr:muRfac=2.0":201,
-        "PLACEHOLDER202":"isr:muRfac=0.5_fsr:muRfac=1.0","isr:muRfac=0.5_fsr:muRfac=1.0":202,
-        "PLACEHOLDER203":"isr:muRfac=0.5_fsr:muRfac=0.5","isr:muRfac=0.5_fsr:muRfac=0.5":203,
-        "PLACEHOLDER204":"isr:muRfac=1.75_fsr:muRfac=1.0","isr:muRfac=1.75_fsr:muRfac=1.0":204,
-        "PLACEHOLDER205":"isr:muRfac=1.5_fsr:muRfac=1.0","isr:muRfac=1.5_fsr:muRfac=1.0":205,
-        "PLACEHOLDER206":"isr:muRfac=1.25_fsr:muRfac=1.0","isr:muRfac=1.25_fsr:muRfac=1.0":206,
-        "PLACEHOLDER207":"isr:muRfac=0.625_fsr:muRfac=1.0","isr:muRfac=0.625_fsr:muRfac=1.0":207,
-        "PLACEHOLDER208":"isr:muRfac=0.75_fsr:muRfac=1.0","isr:muRfac=0.75_fsr:muRfac=1.0":208,
-        "PLACEHOLDER209":"isr:muRfac=0.875_fsr:muRfac=1.0","isr:muRfac=0.875_fsr:muRfac=1.0":209,
-        "PLACEHOLDER210":"isr:muRfac=1.0_fsr:muRfac=1.75","isr:muRfac=1.0_fsr:muRfac=1.75":210,
-        "PLACEHOLDER211":"isr:muRfac=1.0_fsr:muRfac=1.5","isr:muRfac=1.0_fsr:muRfac=1.5":211,
-        "PLACEHOLDER212":"isr:muRfac=1.0_fsr:muRfac=1.25","isr:muRfac=1.0_fsr:muRfac=1.25":212,
-        "PLACEHOLDER213":"isr:muRfac=1.0_fsr:muRfac=0.625","isr:muRfac=1.0_fsr:muRfac=0.625":213,
-        "PLACEHOLDER214":"isr:muRfac=1.0_fsr:muRfac=0.75","isr:muRfac=1.0_fsr:muRfac=0.75":214,
-        "PLACEHOLDER215":"isr:muRfac=1.0_fsr:muRfac=0.875","isr:muRfac=1.0_fsr:muRfac=0.875":215,
-        "PLACEHOLDER216":"hardHi","hardHi":216,
-        "PLACEHOLDER217":"hardLo","hardLo":217,
-        "PLACEHOLDER218":"isr:PDF:plus","isr:PDF:plus":218,
-        "PLACEHOLDER219":"isr:PDF:minus","isr:PDF:minus":219,
-        "PLACEHOLDER220":"AUX_bare_not_for_analyses","AUX_bare_not_for_analyses":220,
-        },
-601497:{
-        "nominal":"Default","Default":0,
-        "PLACEHOLDER1":" nominal "," nominal ":1,
-        "scale_muF_up":" muR = 1.0, muF = 2.0 "," muR = 1.0, muF = 2.0 ":2,
-        "scale_muF_down":" muR = 1.0, muF = 0.5 "," muR = 1.0, muF = 0.5 ":3,
-        "scale_muR_up":" muR = 2.0, muF = 1.0 "," muR = 2.0, muF = 1.0 ":4,
-        "scale_muR_down":" muR = 0.5, muF = 1.0 "," muR = 0.5, muF = 1.0 ":5,
-        "PLACEHOLDER6":" muR = 0.5, muF = 0.5 "," muR = 0.5, muF = 0.5 ":6,
-        "PLACEHOLDER7":" muR = 2.0, muF = 2.0 "," muR = 2.0, muF = 2.0 ":7,
-        "PLACEHOLDER8":" muR = 2.0, muF = 0.5 "," muR = 2.0, muF = 0.5 ":8,
-        "PLACEHOLDER9":" muR = 0.5, muF = 2.0 "," muR = 0.5, muF = 2.0 ":9,
-        "PLACEHOLDER10":" PDF set = 25200 "," PDF set = 25200 ":10,
-        "PLACEHOLDER11":" PDF set = 13165 "," PDF set = 13165 ":11,
-        "PLACEHOLDER12":" PDF set = 90900 "," PDF set = 90900 ":12,
-        "PLACEHOLDER13":" PDF set = 265000 "," PDF set = 265000 ":13,
-        "PLACEHOLDER14":" PDF set = 266000 "," PDF set = 266000 ":14,
-        "PLACEHOLDER15":" PDF set = 303400 "," PDF set = 303400 ":15,
-        "PLACEHOLDER16":" PDF set = 260001 "," PDF set = 260001 ":16,
-        "PLACEHOLDER17":" PDF set = 260002 "," PDF set = 260002 ":17,
-        "PLACEHOLDER18":" PDF set = 260003 "," PDF set = 260003 ":18,
-        "PLACEHOLDER19":" PDF set = 260004 "," PDF set = 260004 ":19,
-        "PLACEHOLDER20":" PDF set = 260005 "," PDF set = 260005 ":20,
-        "PLACEHOLDER21":" PDF set = 260006 "," PDF set = 260006 ":21,
-        "PLACEHOLDER22":" PDF set = 260007 "," PDF set = 260007 ":22,
-        "PLACEHOLDER23":" PDF set = 260008 "," PDF set = 260008 ":23,
-        "PLACEHOLDER24":" PDF set = 260009 "," PDF set = 260009 ":24,
-        "PLACEHOLDER25":" PDF set = 260010 "," PDF set = 260010 ":25,
-        "PLACEHOLDER26":" PDF set = 260011 "," PDF set = 260011 ":26,
-        "PLACEHOLDER27":" PDF set = 260012 "," PDF set = 260012 ":27,
-        "PLACEHOLDER28":" PDF set = 260013 "," PDF set = 260013 ":28,
-        "PLACEHOLDER29":" PDF set = 260014 "," PDF set = 260014 ":29,
-        "PLACEHOLDER30":" PDF set = 260015 "," PDF set = 260015 ":30,
-        "PLACEHOLDER31":" PDF set = 260016 "," PDF set = 260016 ":31,
-        "PLACEHOLDER32":" PDF set = 260017 "," PDF set = 260017 ":32,
-        "PLACEHOLDER33":" PDF set = 260018 "," PDF set = 260018 ":33,
-        "PLACEHOLDER34":" PDF set = 260019 "," PDF set = 260019 ":34,
-        "PLACEHOLDER35":" PDF set = 260020 "," PDF set = 260020 ":35,
-        "PLACEHOLDER36":" PDF set = 260021 "," PDF set = 260021 ":36,
-        "PLACEHOLDER37":" PDF set = 260022 "," PDF set = 260022 ":37,
-        "PLACEHOLDER38":" PDF set = 260023 "," PDF set = 260023 ":38,
-        "PLACEHOLDER39":" PDF set = 260024 "," PDF set = 260024 ":39,
-        "PLACEHOLDER40":" PDF set = 260025 "," PDF set = 260025 ":40,
-        "PLACEHOLDER41":" PDF set = 260026 "," PDF set = 260026 ":41,
-        "PLACEHOLDER42":" PDF set = 260027 "," PDF set = 260027 ":42,
-        "PLACEHOLDER43":" PDF set = 260028 "," PDF set = 260028 ":43,
-        "PLACEHOLDER44":" PDF set = 260029 "," PDF set = 260029 ":44,
-        "PLACEHOLDER45":" PDF set = 260030 "," PDF set = 260030 ":45,
-        "PLACEHOLDER46":" PDF set = 260031 "," PDF set = 260031 ":46,
-        "PLACEHOLDER47":" PDF set = 260032 "," PDF set = 260032 ":47,
-        "PLACEHOLDER48":" PDF set = 260033 "," PDF set = 260033 ":48,
-        "PLACEHOLDER49":" PDF set = 260034 "," PDF set = 260034 ":49,
-        "PLACEHOLDER50":" PDF set = 260035 "," PDF set = 260035 ":50,
-        "PLACEHOLDER51":" PDF set = 260036 "," PDF set = 260036 ":51,
-        "PLACEHOLDER52":" PDF set = 260037 "," PDF set = 260037 ":52,
-        "PLACEHOLDER53":" PDF set = 260038 "," PDF set = 260038 ":53,
-        "PLACEHOLDER54":" PDF set = 260039 "," PDF set = 260039 ":54,
-        "PLACEHOLDER55":" PDF set = 260040 "," PDF set = 260040 ":55,
-        "PLACEHOLDER56":" PDF set = 260041 "," PDF set = 260041 ":56,
-        "PLACEHOLDER57":" PDF set = 260042 "," PDF set = 260042 ":57,
-        "PLACEHOLDER58":" PDF set = 260043 "," PDF set = 260043 ":58,
-        "PLACEHOLDER59":" PDF set = 260044 "," PDF set = 260044 ":59,
-        "PLACEHOLDER60":" PDF set = 260045 "," PDF set = 260045 ":60,
-        "PLACEHOLDER61":" PDF set = 260046 "," PDF set = 260046 ":61,
-        "PLACEHOLDER62":" PDF set = 260047 "," PDF set = 260047 ":62,
-        "PLACEHOLDER63":" PDF set = 260048 "," PDF set = 260048 ":63,
-        "PLACEHOLDER64":" PDF set = 260049 "," PDF set = 260049 ":64,
-        "PLACEHOLDER65":" PDF set = 260050 "," PDF set = 260050 ":65,
-        "PLACEHOLDER66":" PDF set = 260051 "," PDF set = 260051 ":66,
-        "PLACEHOLDER67":" PDF set = 260052 "," PDF set = 260052 ":67,
-        "PLACEHOLDER68":" PDF set = 260053 "," PDF set = 260053 ":68,
-        "PLACEHOLDER69":" PDF set = 260054 "," PDF set = 260054 ":69,
-        "PLACEHOLDER70":" PDF set = 260055 "," PDF set = 260055 ":70,
-        "PLACEHOLDER71":" PDF set = 260056 "," PDF set = 260056 ":71,
-        "PLACEHOLDER72":" PDF set = 260057 "," PDF set = 260057 ":72,
-        "PLACEHOLDER73":" PDF set = 260058 "," PDF set = 260058 ":73,
-        "PLACEHOLDER74":" PDF set = 260059 "," PDF set = 260059 ":74,
-        "PLACEHOLDER75":" PDF set = 260060 "," PDF set = 260060 ":75,
-        "PLACEHOLDER76":" PDF set = 260061 "," PDF set = 260061 ":76,
-        "PLACEHOLDER77":" PDF set = 260062 "," PDF set = 260062 ":77,
-        "PLACEHOLDER78":" PDF set = 260063 "," PDF set = 260063 ":78,
-        "PLACEHOLDER79":" PDF set = 260064 "," PDF set = 260064 ":79,
-        "PLACEHOLDER80":" PDF set = 260065 "," PDF set = 260065 ":80,
-        "PLACEHOLDER81":" PDF set = 260066 "," PDF set = 260066 ":81,
-        "PLACEHOLDER82":" PDF set = 260067 "," PDF set = 260067 ":82,
-        "PLACEHOLDER83":" PDF set = 260068 "," PDF set = 260068 ":83,
-        "PLACEHOLDER84":" PDF set = 260069 "," PDF set = 260069 ":84,
-        "PLACEHOLDER85":" PDF set = 260070 "," PDF set = 260070 ":85,
-        "PLACEHOLDER86":" PDF set = 260071 "," PDF set = 260071 ":86,
-        "PLACEHOLDER87":" PDF set = 260072 "," PDF set = 260072 ":87,
-        "PLACEHOLDER88":" PDF set = 260073 "," PDF set = 260073 ":88,
-        "PLACEHOLDER89":" PDF set = 260074 "," PDF set = 260074 ":89,
-        "PLACEHOLDER90":" PDF set = 260075 "," PDF set = 260075 ":90,
-        "PLACEHOLDER91":" PDF set = 260076 "," PDF set = 260076 ":91,
-        "PLACEHOLDER92":" PDF set = 260077 "," PDF set = 260077 ":92,
-        "PLACEHOLDER93":" PDF set = 260078 "," PDF set = 260078 ":93,
-        "PLACEHOLDER94":" PDF set = 260079 "," PDF set = 260079 ":94,
-        "PLACEHOLDER95":" PDF set = 260080 "," PDF set = 260080 ":95,
-        "PLACEHOLDER96":" PDF set = 260081 "," PDF set = 260081 ":96,
-        "PLACEHOLDER97":" PDF set = 260082 "," PDF set = 260082 ":97,
-        "PLACEHOLDER98":" PDF set = 260083 "," PDF set = 260083 ":98,
-        "PLACEHOLDER99":" PDF set = 260084 "," PDF set = 260084 ":99,
-        "PLACEHOLDER100":" PDF set = 260085 "," PDF set = 260085 ":100,
-        "PLACEHOLDER101":" PDF set = 260086 "," PDF set = 260086 ":101,
-        "PLACEHOLDER102":" PDF set = 260087 "," PDF set = 260087 ":102,
-        "PLACEHOLDER103":" PDF set = 260088 "," PDF set = 260088 ":103,
-        "PLACEHOLDER104":" PDF set = 260089 "," PDF set = 260089 ":104,
-        "PLACEHOLDER105":" PDF set = 260090 "," PDF set = 260090 ":105,
-        "PLACEHOLDER106":" PDF set = 260091 "," PDF set = 260091 ":106,
-        "PLACEHOLDER107":" PDF set = 260092 "," PDF set = 260092 ":107,
-        "PLACEHOLDER108":" PDF set = 260093 "," PDF set = 260093 ":108,
-        "PLACEHOLDER109":" PDF set = 260094 "," PDF set = 260094 ":109,
-        "PLACEHOLDER110":" PDF set = 260095 "," PDF set = 260095 ":110,
-        "PLACEHOLDER111":" PDF set = 260096 "," PDF set = 260096 ":111,
-        "PLACEHOLDER112":" PDF set = 260097 "," PDF set = 260097 ":112,
-        "PLACEHOLDER113":" PDF set = 260098 "," PDF set = 260098 ":113,
-        "PLACEHOLDER114":" PDF set = 260099 "," PDF set = 260099 ":114,
-        "PLACEHOLDER115":" PDF set = 260100 "," PDF set = 260100 ":115,
-        "PLACEHOLDER116":" PDF set = 90901 "," PDF set = 90901 ":116,
-        "PLACEHOLDER117":" PDF set = 90902 "," PDF set = 90902 ":117,
-        "PLACEHOLDER118":" PDF set = 90903 "," PDF set = 90903 ":118,
-        "PLACEHOLDER119":" PDF set = 90904 "," PDF set = 90904 ":119,
-        "PLACEHOLDER120":" PDF set = 90905 "," PDF set = 90905 ":120,
-        "PLACEHOLDER121":" PDF set = 90906 "," PDF set = 90906 ":121,
-        "PLACEHOLDER122":" PDF set = 90907 "," PDF set = 90907 ":122,
-        "PLACEHOLDER123":" PDF set = 90908 "," PDF set = 90908 ":123,
-        "PLACEHOLDER124":" PDF set = 90909 "," PDF set = 90909 ":124,
-        "PLACEHOLDER125":" PDF set = 90910 "," PDF set = 90910 ":125,
-        "PLACEHOLDER126":" PDF set = 90911 "," PDF set = 90911 ":126,
-        "PLACEHOLDER127":" PDF set = 90912 "," PDF set = 90912 ":127,
-        "PLACEHOLDER128":" PDF set = 90913 "," PDF set = 90913 ":128,
-        "PLACEHOLDER129":" PDF set = 90914 "," PDF set = 90914 ":129,
-        "PLACEHOLDER130":" PDF set = 90915 "," PDF set = 90915 ":130,
-        "PLACEHOLDER131":" PDF set = 90916 "," PDF set = 90916 ":131,
-        "PLACEHOLDER132":" PDF set = 90917 "," PDF set = 90917 ":132,
-        "PLACEHOLDER133":" PDF set = 90918 "," PDF set = 90918 ":133,
-        "PLACEHOLDER134":" PDF set = 90919 "," PDF set = 90919 ":134,
-        "PLACEHOLDER135":" PDF set = 90920 "," PDF set = 90920 ":135,
-        "PLACEHOLDER136":" PDF set = 90921 "," PDF set = 90921 ":136,
-        "PLACEHOLDER137":" PDF set = 90922 "," PDF set = 90922 ":137,
-        "PLACEHOLDER138":" PDF set = 90923 "," PDF set = 90923 ":138,
-        "PLACEHOLDER139":" PDF set = 90924 "," PDF set = 90924 ":139,
-        "PLACEHOLDER140":" PDF set = 90925 "," PDF set = 90925 ":140,
-        "PLACEHOLDER141":" PDF set = 90926 "," PDF set = 90926 ":141,
-        "PLACEHOLDER142":" PDF set = 90927 "," PDF set = 90927 ":142,
-        "PLACEHOLDER143":" PDF set = 90928 "," PDF set = 90928 ":143,
-        "PLACEHOLDER144":" PDF set = 90929 "," PDF set = 90929 ":144,
-        "PLACEHOLDER145":" PDF set = 90930 "," PDF set = 90930 ":145,
-        "PLACEHOLDER146":" 2muF_MMHT "," 2muF_MMHT ":146,
-        "PLACEHOLDER147":" 0p5muF_MMHT "," 0p5muF_MMHT ":147,
-        "PLACEHOLDER148":" 2muR_MMHT "," 2muR_MMHT ":148,
-        "PLACEHOLDER149":" 0p5muR_MMHT "," 0p5muR_MMHT ":149,
-        "PLACEHOLDER150":" 0p5muF_0p5muR_MMHT "," 0p5muF_0p5muR_MMHT ":150,
-        "PLACEHOLDER151":" 2muF_2muR_MMHT "," 2muF_2muR_MMHT ":151,
-        "PLACEHOLDER152":" 0p5muF_2muR_MMHT "," 0p5muF_2muR_MMHT ":152,
-        "PLACEHOLDER153":" 2muF_0p5muR_MMHT "," 2muF_0p5muR_MMHT ":153,
-        "PLACEHOLDER154":" 2muF_CT14 "," 2muF_CT14 ":154,
-        "PLACEHOLDER155":" 0p5muF_CT14 "," 0p5muF_CT14 ":155,
-        "PLACEHOLDER156":" 2muR_CT14 "," 2muR_CT14 ":156,
-        "PLACEHOLDER157":" 0p5muR_CT14 "," 0p5muR_CT14 ":157,
-        "PLACEHOLDER158":" 0p5muF_0p5muR_CT14 "," 0p5muF_0p5muR_CT14 ":158,
-        "PLACEHOLDER159":" 2muF_2muR_CT14 "," 2muF_2muR_CT14 ":159,
-        "PLACEHOLDER160":" 0p5muF_2muR_CT14 "," 0p5muF_2muR_CT14 ":160,
-        "PLACEHOLDER161":" 2muF_0p5muR_CT14 "," 2muF_0p5muR_CT14 ":161,
-        "PLACEHOLDER162":" 2muF_PDF4LHC15_NLO_30 "," 2muF_PDF4LHC15_NLO_30 ":162,
-        "PLACEHOLDER163":" 0p5muF_PDF4LHC15_NLO_30 "," 0p5muF_PDF4LHC15_NLO_30 ":163,
-        "PLACEHOLDER164":" 2muR_PDF4LHC15_NLO_30 "," 2muR_PDF4LHC15_NLO_30 ":164,
-        "PLACEHOLDER165":" 0p5muR_PDF4LHC15_NLO_30 "," 0p5muR_PDF4LHC15_NLO_30 ":165,
-        "PLACEHOLDER166":" 0p5muF_0p5muR_PDF4LHC15_NLO_30 "," 0p5muF_0p5muR_PDF4LHC15_NLO_30 ":166,
-        "PLACEHOLDER167":" 2muF_2muR_PDF4LHC15_NLO_30 "," 2muF_2muR_PDF4LHC15_NLO_30 ":167,
-        "PLACEHOLDER168":" 0p5muF_2muR_PDF4LHC15_NLO_30 "," 0p5muF_2muR_PDF4LHC15_NLO_30 ":168,
-        "PLACEHOLDER169":" 2muF_0p5muR_PDF4LHC15_NLO_30 "," 2muF_0p5muR_PDF4LHC15_NLO_30 ":169,
-        "PLACEHOLDER170":" 2muF_NNPDF_NLO_0117 "," 2muF_NNPDF_NLO_0117 ":170,
-        "PLACEHOLDER171":" 0p5muF_NNPDF_NLO_0117 "," 0p5muF_NNPDF_NLO_0117 ":171,
-        "PLACEHOLDER172":" 2muR_NNPDF_NLO_0117 "," 2muR_NNPDF_NLO_0117 ":172,
-        "PLACEHOLDER173":" 0p5muR_NNPDF_0117 "," 0p5muR_NNPDF_0117 ":173,
-        "PLACEHOLDER174":" 0p5muF_0p5muR_NNPDF_NLO_0117 "," 0p5muF_0p5muR_NNPDF_NLO_0117 ":174,
-        "PLACEHOLDER175":" 2muF_2muR_NNPDF_NLO_0117 "," 2muF_2muR_NNPDF_NLO_0117 ":175,
-        "PLACEHOLDER176":" 0p5muF_2muR_NNPDF_NLO_0117 "," 0p5muF_2muR_NNPDF_NLO_0117 ":176,
-        "PLACEHOLDER177":" 2muF_0p5muR_NNPDF_NLO_0117 "," 2muF_0p5muR_NNPDF_NLO_0117 ":177,
-        "PLACEHOLDER178":" 2muF_NNPDF_NLO_0119 "," 2muF_NNPDF_NLO_0119 ":178,
-        "PLACEHOLDER179":" 0p5muF_NNPDF_NLO_0119 "," 0p5muF_NNPDF_NLO_0119 ":179,
-        "PLACEHOLDER180":" 2muR_NNPDF_NLO_0119 "," 2muR_NNPDF_NLO_0119 ":180,
-        "PLACEHOLDER181":" 0p5muR_NNPDF_NLO_0119 "," 0p5muR_NNPDF_NLO_0119 ":181,
-        "PLACEHOLDER182":" 0p5muF_0p5muR_NNPDF_NLO_0119 "," 0p5muF_0p5muR_NNPDF_NLO_0119 ":182,
-        "PLACEHOLDER183":" 2muF_2muR_NNPDF_NLO_0119 "," 2muF_2muR_NNPDF_NLO_0119 ":183,
-        "PLACEHOLDER184":" 0p5muF_2muR_NNPDF_NLO_0119 "," 0p5muF_2muR_NNPDF_NLO_0119 ":184,
-        "PLACEHOLDER185":" 2muF_0p5muR_NNPDF_NLO_0119 "," 2muF_0p5muR_NNPDF_NLO_0119 ":185,
-        "PLACEHOLDER186":" 2muF_NNPDF31_NLO_0118 "," 2muF_NNPDF31_NLO_0118 ":186,
-        "PLACEHOLDER187":" 0p5muF_NNPDF31_NLO_0118 "," 0p5muF_NNPDF31_NLO_0118 ":187,
-        "PLACEHOLDER188":" 2muR_NNPDF31_NLO_0118 "," 2muR_NNPDF31_NLO_0118 ":188,
-        "PLACEHOLDER189":" 0p5muR_NNPDF31_NLO_0118 "," 0p5muR_NNPDF31_NLO_0118 ":189,
-        "PLACEHOLDER190":" 0p5muF_0p5muR_NNPDF31_NLO_0118 "," 0p5muF_0p5muR_NNPDF31_NLO_0118 ":190,
-        "PLACEHOLDER191":" 2muF_2muR_NNPDF31_NLO_0118 "," 2muF_2muR_NNPDF31_NLO_0118 ":191,
-        "PLACEHOLDER192":" 0p5muF_2muR_NNPDF31_NLO_0118 "," 0p5muF_2muR_NNPDF31_NLO_0118 ":192,
-        "PLACEHOLDER193":" 2muF_0p5muR_NNPDF31_NLO_0118 "," 2muF_0p5muR_NNPDF31_NLO_0118 ":193,
-        "isr_alphaS_Var3cUp":"Var3cUp","Var3cUp":194,
-        "isr_alphaS_Var3cDown":"Var3cDown","Var3cDown":195,
-        "PLACEHOLDER196":"isr:muRfac=2.0_fsr:muRfac=2.0","isr:muRfac=2.0_fsr:muRfac=2.0":196,
-        "PLACEHOLDER197":"isr:muRfac=2.0_fsr:muRfac=1.0","isr:muRfac=2.0_fsr:muRfac=1.0":197,
-        "PLACEHOLDER198":"isr:muRfac=2.0_fsr:muRfac=0.5","isr:muRfac=2.0_fsr:muRfac=0.5":198,
-        "fsr_muR_up":"isr:muRfac=1.0_fsr:muRfac=2.0","isr:muRfac=1.0_fsr:muRfac=2.0":199,
-        "fsr_muR_down":"isr:muRfac=1.0_fsr:muRfac=0.5","isr:muRfac=1.0_fsr:muRfac=0.5":200,
-        "PLACEHOLDER201":"isr:muRfac=0.5_fsr:muRfac=2.0","isr:muRfac=0.5_fsr:muRfac=2.0":201,
-        "PLACEHOLDER202":"isr:muRfac=0.5_fsr:muRfac=1.0","isr:muRfac=0.5_fsr:muRfac=1.0":202,
-        "PLACEHOLDER203":"isr:muRfac=0.5_fsr:muRfac=0.5","isr:muRfac=0.5_fsr:muRfac=0.5":203,
-        "PLACEHOLDER204":"isr:muRfac=1.75_fsr:muRfac=1.0","isr:muRfac=1.75_fsr:muRfac=1.0":204,
-        "PLACEHOLDER205":"isr:muRfac=1.5_fsr:muRfac=1.0","isr:muRfac=1.5_fsr:muRfac=1.0":205,
-        "PLACEHOLDER206":"isr:muRfac=1.25_fsr:muRfac=1.0","isr:muRfac=1.25_fsr:muRfac=1.0":206,
-        "PLACEHOLDER207":"isr:muRfac=0.625_fsr:muRfac=1.0","isr:muRfac=0.625_fsr:muRfac=1.0":207,
-        "PLACEHOLDER208":"isr:muRfac=0.75_fsr:muRfac=1.0","isr:muRfac=0.75_fsr:muRfac=1.0":208,
-        "PLACEHOLDER209":"isr:muRfac=0.875_fsr:muRfac=1.0","isr:muRfac=0.875_fsr:muRfac=1.0":209,
-        "PLACEHOLDER210":"isr:muRfac=1.0_fsr:muRfac=1.75","isr:muRfac=1.0_fsr:muRfac=1.75":210,
-        "PLACEHOLDER211":"isr:muRfac=1.0_fsr:muRfac=1.5","isr:muRfac=1.0_fsr:muRfac=1.5":211,
-        "PLACEHOLDER212":"isr:muRfac=1.0_fsr:muRfac=1.25","isr:muRfac=1.0_fsr:muRfac=1.25":212,
-        "PLACEHOLDER213":"isr:muRfac=1.0_fsr:muRfac=0.625","isr:muRfac=1.0_fsr:muRfac=0.625":213,
-        "PLACEHOLDER214":"isr:muRfac=1.0_fsr:muRfac=0.75","isr:muRfac=1.0_fsr:muRfac=0.75":214,
-        "PLACEHOLDER215":"isr:muRfac=1.0_fsr:muRfac=0.875","isr:muRfac=1.0_fsr:muRfac=0.875":215,
-        "PLACEHOLDER216":"hardHi","hardHi":216,
-        "PLACEHOLDER217":"hardLo","hardLo":217,
-        "PLACEHOLDER218":"isr:PDF:plus","isr:PDF:plus":218,
-        "PLACEHOLDER219":"isr:PDF:minus","isr:PDF:minus":219,
-        "PLACEHOLDER220":"AUX_bare_not_for_analyses","AUX_bare_not_for_analyses":220,
-        },
-601498:{
-        "nominal":"Default","Default":0,
-        "PLACEHOLDER1":" nominal "," nominal ":1,
-        "scale_muF_up":" muR = 1.0, muF = 2.0 "," muR = 1.0, muF = 2.0 ":2,
-        "scale_muF_down":" muR = 1.0, muF = 0.5 "," muR = 1.0, muF = 0.5 ":3,
-        "scale_muR_up":" muR = 2.0, muF = 1.0 "," muR = 2.0, muF = 1.0 ":4,
-        "scale_muR_down":" muR = 0.5, muF = 1.0 "," muR = 0.5, muF = 1.0 ":5,
-        "PLACEHOLDER6":" muR = 0.5, muF = 0.5 "," muR = 0.5, muF = 0.5 ":6,
-        "PLACEHOLDER7":" muR = 2.0, muF = 2.0 "," muR = 2.0, muF = 2.0 ":7,
-        "PLACEHOLDER8":" muR = 2.0, muF = 0.5 "," muR = 2.0, muF = 0.5 ":8,
-        "PLACEHOLDER9":" muR = 0.5, muF = 2.0 "," muR = 0.5, muF = 2.0 ":9,
-        "PLACEHOLDER10":" PDF set = 25200 "," PDF set = 25200 ":10,
-        "PLACEHOLDER11":" PDF set = 13165 "," PDF set = 13165 ":11,
-        "PLACEHOLDER12":" PDF set = 90900 "," PDF set = 90900 ":12,
-        "PLACEHOLDER13":" PDF set = 265000 "," PDF set = 265000 ":13,
-        "PLACEHOLDER14":" PDF set = 266000 "," PDF set = 266000 ":14,
-        "PLACEHOLDER15":" PDF set = 303400 "," PDF set = 303400 ":15,
-        "PLACEHOLDER16":" PDF set = 260001 "," PDF set = 260001 ":16,
-        "PLACEHOLDER17":" PDF set = 260002 "," PDF set = 260002 ":17,
-        "PLACEHOLDER18":" PDF set = 260003 "," PDF set = 260003 ":18,
-        "PLACEHOLDER19":" PDF set = 260004 "," PDF set = 260004 ":19,
-        "PLACEHOLDER20":" PDF set = 260005 "," PDF set = 260005 ":20,
-        "PLACEHOLDER21":" PDF set = 260006 "," PDF set = 260006 ":21,
-        "PLACEHOLDER22":" PDF set = 260007 "," PDF set = 260007 ":22,
-        "PLACEHOLDER23":" PDF set = 260008 "," PDF set = 260008 ":23,
-        "PLACEHOLDER24":" PDF set = 260009 "," PDF set = 260009 ":24,
-        "PLACEHOLDER25":" PDF set = 260010 "," PDF set = 260010 ":25,
-        "PLACEHOLDER26":" PDF set = 260011 "," PDF set = 260011 ":26,
-        "PLACEHOLDER27":" PDF set = 260012 "," PDF set = 260012 ":27,
-        "PLACEHOLDER28":" PDF set = 260013 "," PDF set = 260013 ":28,
-        "PLACEHOLDER29":" PDF set = 260014 "," PDF set = 260014 ":29,
-        "PLACEHOLDER30":" PDF set = 260015 "," PDF set = 260015 ":30,
-        "PLACEHOLDER31":" PDF set = 260016 "," PDF set = 260016 ":31,
-        "PLACEHOLDER32":" PDF set = 260017 "," PDF set = 260017 ":32,
-        "PLACEHOLDER33":" PDF set = 260018 "," PDF set = 260018 ":33,
-        "PLACEHOLDER34":" PDF set = 260019 "," PDF set = 260019 ":34,
-        "PLACEHOLDER35":" PDF set = 260020 "," PDF set = 260020 ":35,
-        "PLACEHOLDER36":" PDF set = 260021 "," PDF set = 260021 ":36,
-        "PLACEHOLDER37":" PDF set = 260022 "," PDF set = 260022 ":37,
-        "PLACEHOLDER38":" PDF set = 260023 "," PDF set = 260023 ":38,
-        "PLACEHOLDER39":" PDF set = 260024 "," PDF set = 260024 ":39,
-        "PLACEHOLDER40":" PDF set = 260025 "," PDF set = 260025 ":40,
-        "PLACEHOLDER41":" PDF set = 260026 "," PDF set = 260026 ":41,
-        "PLACEHOLDER42":" PDF set = 260027 "," PDF set = 260027 ":42,
-        "PLACEHOLDER43":" PDF set = 260028 "," PDF set = 260028 ":43,
-        "PLACEHOLDER44":" PDF set = 260029 "," PDF set = 260029 ":44,
-        "PLACEHOLDER45":" PDF set = 260030 "," PDF set = 260030 ":45,
-        "PLACEHOLDER46":" PDF set = 260031 "," PDF set = 260031 ":46,
-        "PLACEHOLDER47":" PDF set = 260032 "," PDF set = 260032 ":47,
-        "PLACEHOLDER48":" PDF set = 260033 "," PDF set = 260033 ":48,
-        "PLACEHOLDER49":" PDF set = 260034 "," PDF set = 260034 ":49,
-        "PLACEHOLDER50":" PDF set = 260035 "," PDF set = 260035 ":50,
-        "PLACEHOLDER51":" PDF set = 260036 "," PDF set = 260036 ":51,
-        "PLACEHOLDER52":" PDF set = 260037 "," PDF set = 260037 ":52,
-        "PLACEHOLDER53":" PDF set = 260038 "," PDF set = 260038 ":53,
-        "PLACEHOLDER54":" PDF set = 260039 "," PDF set = 260039 ":54,
-        "PLACEHOLDER55":" PDF set = 260040 "," PDF set = 260040 ":55,
-        "PLACEHOLDER56":" PDF set = 260041 "," PDF set = 260041 ":56,
-        "PLACEHOLDER57":" PDF set = 260042 "," PDF set = 260042 ":57,
-        "PLACEHOLDER58":" PDF set = 260043 "," PDF set = 260043 ":58,
-        "PLACEHOLDER59":" PDF set = 260044 "," PDF set = 260044 ":59,
-        "PLACEHOLDER60":" PDF set = 260045 "," PDF set = 260045 ":60,
-        "PLACEHOLDER61":" PDF set = 260046 "," PDF set = 260046 ":61,
-        "PLACEHOLDER62":" PDF set = 260047 "," PDF set = 260047 ":62,
-        "PLACEHOLDER63":" PDF set = 260048 "," PDF set = 260048 ":63,
-        "PLACEHOLDER64":" PDF set = 260049 "," PDF set = 260049 ":64,
-        "PLACEHOLDER65":" PDF set = 260050 "," PDF set = 260050 ":65,
-        "PLACEHOLDER66":" PDF set = 260051 "," PDF set = 260051 ":66,
-        "PLACEHOLDER67":" PDF set = 260052 "," PDF set = 260052 ":67,
-        "PLACEHOLDER68":" PDF set = 260053 "," PDF set = 260053 ":68,
-        "PLACEHOLDER69":" PDF set = 260054 "," PDF set = 260054 ":69,
-        "PLACEHOLDER70":" PDF set = 260055 "," PDF set = 260055 ":70,
-        "PLACEHOLDER71":" PDF set = 260056 "," PDF set = 260056 ":71,
-        "PLACEHOLDER72":" PDF set = 260057 "," PDF set = 260057 ":72,
-        "PLACEHOLDER73":" PDF set = 260058 "," PDF set = 260058 ":73,
-        "PLACEHOLDER74":" PDF set = 260059 "," PDF set = 260059 ":74,
-        "PLACEHOLDER75":" PDF set = 260060 "," PDF set = 260060 ":75,
-        "PLACEHOLDER76":" PDF set = 260061 "," PDF set = 260061 ":76,
-        "PLACEHOLDER77":" PDF set = 260062 "," PDF set = 260062 ":77,
-        "PLACEHOLDER78":" PDF set = 260063 "," PDF set = 260063 ":78,
-        "PLACEHOLDER79":" PDF set = 260064 "," PDF set = 260064 ":79,
-        "PLACEHOLDER80":" PDF set = 260065 "," PDF set = 260065 ":80,
-        "PLACEHOLDER81":" PDF set = 260066 "," PDF set = 260066 ":81,
-        "PLACEHOLDER82":" PDF set = 260067 "," PDF set = 260067 ":82,
-        "PLACEHOLDER83":" PDF set = 260068 "," PDF set = 260068 ":83,
-        "PLACEHOLDER84":" PDF set = 260069 "," PDF set = 260069 ":84,
-        "PLACEHOLDER85":" PDF set = 260070 "," PDF set = 260070 ":85,
-        "PLACEHOLDER86":" PDF set = 260071 "," PDF set = 260071 ":86,
-        "PLACEHOLDER87":" PDF set = 260072 "," PDF set = 260072 ":87,
-        "PLACEHOLDER88":" PDF set = 260073 "," PDF set = 260073 ":88,
-        "PLACEHOLDER89":" PDF set = 260074 "," PDF set = 260074 ":89,
-        "PLACEHOLDER90":" PDF set = 260075 "," PDF set = 260075 ":90,
-        "PLACEHOLDER91":" PDF set = 260076 "," PDF set = 260076 ":91,
-        "PLACEHOLDER92":" PDF set = 260077 "," PDF set = 260077 ":92,
-        "PLACEHOLDER93":" PDF set = 260078 "," PDF set = 260078 ":93,
-        "PLACEHOLDER94":" PDF set = 260079 "," PDF set = 260079 ":94,
-        "PLACEHOLDER95":" PDF set = 260080 "," PDF set = 260080 ":95,
-        "PLACEHOLDER96":" PDF set = 260081 "," PDF set = 260081 ":96,
-        "PLACEHOLDER97":" PDF set = 260082 "," PDF set = 260082 ":97,
-        "PLACEHOLDER98":" PDF set = 260083 "," PDF set = 260083 ":98,
-        "PLACEHOLDER99":" PDF set = 260084 "," PDF set = 260084 ":99,
-        "PLACEHOLDER100":" PDF set = 260085 "," PDF set = 260085 ":100,
-        "PLACEHOLDER101":" PDF set = 260086 "," PDF set = 260086 ":101,
-        "PLACEHOLDER102":" PDF set = 260087 "," PDF set = 260087 ":102,
-        "PLACEHOLDER103":" PDF set = 260088 "," PDF set = 260088 ":103,
-        "PLACEHOLDER104":" PDF set = 260089 "," PDF set = 260089 ":104,
-        "PLACEHOLDER105":" PDF set = 260090 "," PDF set = 260090 ":105,
-        "PLACEHOLDER106":" PDF set = 260091 "," PDF set = 260091 ":106,
-        "PLACEHOLDER107":" PDF set = 260092 "," PDF set = 260092 ":107,
-        "PLACEHOLDER108":" PDF set = 260093 "," PDF set = 260093 ":108,
-        "PLACEHOLDER109":" PDF set = 260094 "," PDF set = 260094 ":109,
-        "PLACEHOLDER110":" PDF set = 260095 "," PDF set = 260095 ":110,
-        "PLACEHOLDER111":" PDF set = 260096 "," PDF set = 260096 ":111,
-        "PLACEHOLDER112":" PDF set = 260097 "," PDF set = 260097 ":112,
-        "PLACEHOLDER113":" PDF set = 260098 "," PDF set = 260098 ":113,
-        "PLACEHOLDER114":" PDF set = 260099 "," PDF set = 260099 ":114,
-        "PLACEHOLDER115":" PDF set = 260100 "," PDF set = 260100 ":115,
-        "PLACEHOLDER116":" PDF set = 90901 "," PDF set = 90901 ":116,
-        "PLACEHOLDER117":" PDF set = 90902 "," PDF set = 90902 ":117,
-        "PLACEHOLDER118":" PDF set = 90903 "," PDF set = 90903 ":118,
-        "PLACEHOLDER119":" PDF set = 90904 "," PDF set = 90904 ":119,
-        "PLACEHOLDER120":" PDF set = 90905 "," PDF set = 90905 ":120,
-        "PLACEHOLDER121":" PDF set = 90906 "," PDF set = 90906 ":121,
-        "PLACEHOLDER122":" PDF set = 90907 "," PDF set = 90907 ":122,
-        "PLACEHOLDER123":" PDF set = 90908 "," PDF set = 90908 ":123,
-        "PLACEHOLDER124":" PDF set = 90909 "," PDF set = 90909 ":124,
-        "PLACEHOLDER125":" PDF set = 90910 "," PDF set = 90910 ":125,
-        "PLACEHOLDER126":" PDF set = 90911 "," PDF set = 90911 ":126,
-        "PLACEHOLDER127":" PDF set = 90912 "," PDF set = 90912 ":127,
-        "PLACEHOLDER128":" PDF set = 90913 "," PDF set = 90913 ":128,
-        "PLACEHOLDER129":" PDF set = 90914 "," PDF set = 90914 ":129,
-        "PLACEHOLDER130":" PDF set = 90915 "," PDF set = 90915 ":130,
-        "PLACEHOLDER131":" PDF set = 90916 "," PDF set = 90916 ":131,
-        "PLACEHOLDER132":" PDF set = 90917 "," PDF set = 90917 ":132,
-        "PLACEHOLDER133":" PDF set = 90918 "," PDF set = 90918 ":133,
-        "PLACEHOLDER134":" PDF set = 90919 "," PDF set = 90919 ":134,
-        "PLACEHOLDER135":" PDF set = 90920 "," PDF set = 90920 ":135,
-        "PLACEHOLDER136":" PDF set = 90921 "," PDF set = 90921 ":136,
-        "PLACEHOLDER137":" PDF set = 90922 "," PDF set = 90922 ":137,
-        "PLACEHOLDER138":" PDF set = 90923 "," PDF set = 90923 ":138,
-        "PLACEHOLDER139":" PDF set = 90924 "," PDF set = 90924 ":139,
-        "PLACEHOLDER140":" PDF set = 90925 "," PDF set = 90925 ":140,
-        "PLACEHOLDER141":" PDF set = 90926 "," PDF set = 90926 ":141,
-        "PLACEHOLDER142":" PDF set = 90927 "," PDF set = 90927 ":142,
-        "PLACEHOLDER143":" PDF set = 90928 "," PDF set = 90928 ":143,
-        "PLACEHOLDER144":" PDF set = 90929 "," PDF set = 90929 ":144,
-        "PLACEHOLDER145":" PDF set = 90930 "," PDF set = 90930 ":145,
-        "PLACEHOLDER146":" 2muF_MMHT "," 2muF_MMHT ":146,
-        "PLACEHOLDER147":" 0p5muF_MMHT "," 0p5muF_MMHT ":147,
-        "PLACEHOLDER148":" 2muR_MMHT "," 2muR_MMHT ":148,
-        "PLACEHOLDER149":" 0p5muR_MMHT "," 0p5muR_MMHT ":149,
-        "PLACEHOLDER150":" 0p5muF_0p5muR_MMHT "," 0p5muF_0p5muR_MMHT ":150,
-        "PLACEHOLDER151":" 2muF_2muR_MMHT "," 2muF_2muR_MMHT ":151,
-        "PLACEHOLDER152":" 0p5muF_2muR_MMHT "," 0p5muF_2muR_MMHT ":152,
-        "PLACEHOLDER153":" 2muF_0p5muR_MMHT "," 2muF_0p5muR_MMHT ":153,
-        "PLACEHOLDER154":" 2muF_CT14 "," 2muF_CT14 ":154,
-        "PLACEHOLDER155":" 0p5muF_CT14 "," 0p5muF_CT14 ":155,
-        "PLACEHOLDER156":" 2muR_CT14 "," 2muR_CT14 ":156,
-        "PLACEHOLDER157":" 0p5muR_CT14 "," 0p5muR_CT14 ":157,
-        "PLACEHOLDER158":" 0p5muF_0p5muR_CT14 "," 0p5muF_0p5muR_CT14 ":158,
-        "PLACEHOLDER159":" 2muF_2muR_CT14 "," 2muF_2muR_CT14 ":159,
-        "PLACEHOLDER160":" 0p5muF_2muR_CT14 "," 0p5muF_2muR_CT14 ":160,
-        "PLACEHOLDER161":" 2muF_0p5muR_CT14 "," 2muF_0p5muR_CT14 ":161,
-        "PLACEHOLDER162":" 2muF_PDF4LHC15_NLO_30 "," 2muF_PDF4LHC15_NLO_30 ":162,
-        "PLACEHOLDER163":" 0p5muF_PDF4LHC15_NLO_30 "," 0p5muF_PDF4LHC15_NLO_30 ":163,
-        "PLACEHOLDER164":" 2muR_PDF4LHC15_NLO_30 "," 2muR_PDF4LHC15_NLO_30 ":164,
-        "PLACEHOLDER165":" 0p5muR_PDF4LHC15_NLO_30 "," 0p5muR_PDF4LHC15_NLO_30 ":165,
-        "PLACEHOLDER166":" 0p5muF_0p5muR_PDF4LHC15_NLO_30 "," 0p5muF_0p5muR_PDF4LHC15_NLO_30 ":166,
-        "PLACEHOLDER167":" 2muF_2muR_PDF4LHC15_NLO_30 "," 2muF_2muR_PDF4LHC15_NLO_30 ":167,
-        "PLACEHOLDER168":" 0p5muF_2muR_PDF4LHC15_NLO_30 "," 0p5muF_2muR_PDF4LHC15_NLO_30 ":168,
-        "PLACEHOLDER169":" 2muF_0p5muR_PDF4LHC15_NLO_30 "," 2muF_0p5muR_PDF4LHC15_NLO_30 ":169,
-        "PLACEHOLDER170":" 2muF_NNPDF_NLO_0117 "," 2muF_NNPDF_NLO_0117 ":170,
-        "PLACEHOLDER171":" 0p5muF_NNPDF_NLO_0117 "," 0p5muF_NNPDF_NLO_0117 ":171,
-        "PLACEHOLDER172":" 2muR_NNPDF_NLO_0117 "," 2muR_NNPDF_NLO_0117 ":172,
-        "PLACEHOLDER173":" 0p5muR_NNPDF_0117 "," 0p5muR_NNPDF_0117 ":173,
-        "PLACEHOLDER174":" 0p5muF_0p5muR_NNPDF_NLO_0117 "," 0p5muF_0p5muR_NNPDF_NLO_0117 ":174,
-        "PLACEHOLDER175":" 2muF_2muR_NNPDF_NLO_0117 "," 2muF_2muR_NNPDF_NLO_0117 ":175,
-        "PLACEHOLDER176":" 0p5muF_2muR_NNPDF_NLO_0117 "," 0p5muF_2muR_NNPDF_NLO_0117 ":176,
-        "PLACEHOLDER177":" 2muF_0p5muR_NNPDF_NLO_0117 "," 2muF_0p5muR_NNPDF_NLO_0117 ":177,
-        "PLACEHOLDER178":" 2muF_NNPDF_NLO_0119 "," 2muF_NNPDF_NLO_0119 ":178,
-        "PLACEHOLDER179":" 0p5muF_NNPDF_NLO_0119 "," 0p5muF_NNPDF_NLO_0119 ":179,
-        "PLACEHOLDER180":" 2muR_NNPDF_NLO_0119 "," 2muR_NNPDF_NLO_0119 ":180,
-        "PLACEHOLDER181":" 0p5muR_NNPDF_NLO_0119 "," 0p5muR_NNPDF_NLO_0119 ":181,
-        "PLACEHOLDER182":" 0p5muF_0p5muR_NNPDF_NLO_0119 "," 0p5muF_0p5muR_NNPDF_NLO_0119 ":182,
-        "PLACEHOLDER183":" 2muF_2muR_NNPDF_NLO_0119 "," 2muF_2muR_NNPDF_NLO_0119 ":183,
-        "PLACEHOLDER184":" 0p5muF_2muR_NNPDF_NLO_0119 "," 0p5muF_2muR_NNPDF_NLO_0119 ":184,
-        "PLACEHOLDER185":" 2muF_0p5muR_NNPDF_NLO_0119 "," 2muF_0p5muR_NNPDF_NLO_0119 ":185,
-        "PLACEHOLDER186":" 2muF_NNPDF31_NLO_0118 "," 2muF_NNPDF31_NLO_0118 ":186,
-        "PLACEHOLDER187":" 0p5muF_NNPDF31_NLO_0118 "," 0p5muF_NNPDF31_NLO_0118 ":187,
-        "PLACEHOLDER188":" 2muR_NNPDF31_NLO_0118 "," 2muR_NNPDF31_NLO_0118 ":188,
-        "PLACEHOLDER189":" 0p5muR_NNPDF31_NLO_0118 "," 0p5muR_NNPDF31_NLO_0118 ":189,
-        "PLACEHOLDER190":" 0p5muF_0p5muR_NNPDF31_NLO_0118 "," 0p5muF_0p5muR_NNPDF31_NLO_0118 ":190,
-        "PLACEHOLDER191":" 2muF_2muR_NNPDF31_NLO_0118 "," 2muF_2muR_NNPDF31_NLO_0118 ":191,
-        "PLACEHOLDER192":" 0p5muF_2muR_NNPDF31_NLO_0118 "," 0p5muF_2muR_NNPDF31_NLO_0118 ":192,
-        "PLACEHOLDER193":" 2muF_0p5muR_NNPDF31_NLO_0118 "," 2muF_0p5muR_NNPDF31_NLO_0118 ":193,
-        "isr_alphaS_Var3cUp":"Var3cUp","Var3cUp":194,
-        "isr_alphaS_Var3cDown":"Var3cDown","Var3cDown":195,
-        "PLACEHOLDER196":"isr:muRfac=2.0_fsr:muRfac=2.0","isr:muRfac=2.0_fsr:muRfac=2.0":196,
-        "PLACEHOLDER197":"isr:muRfac=2.0_fsr:muRfac=1.0","isr:muRfac=2.0_fsr:muRfac=1.0":197,
-        "PLACEHOLDER198":"isr:muRfac=2.0_fsr:muRfac=0.5","isr:muRfac=2.0_fsr:muRfac=0.5":198,
-        "fsr_muR_up":"isr:muRfac=1.0_fsr:muRfac=2.0","isr:muRfac=1.0_fsr:muRfac=2.0":199,
-        "fsr_muR_down":"isr:muRfac=1.0_fsr:muRfac=0.5","isr:muRfac=1.0_fsr:muRfac=0.5":200,
-        "PLACEHOLDER201":"isr:muRfac=0.5_fsr:muRfac=2.0","isr:muRfac=0.5_fsr:muRfac=2.0":201,
-        "PLACEHOLDER202":"isr:muRfac=0.5_fsr:muRfac=1.0","isr:muRfac=0.5_fsr:muRfac=1.0":202,
-        "PLACEHOLDER203":"isr:muRfac=0.5_fsr:muRfac=0.5","isr:muRfac=0.5_fsr:muRfac=0.5":203,
-        "PLACEHOLDER204":"isr:muRfac=1.75_fsr:muRfac=1.0","isr:muRfac=1.75_fsr:muRfac=1.0":204,
-        "PLACEHOLDER205":"isr:muRfac=1.5_fsr:muRfac=1.0","isr:muRfac=1.5_fsr:muRfac=1.0":205,
-        "PLACEHOLDER206":"isr:muRfac=1.25_fsr:muRfac=1.0","isr:muRfac=1.25_fsr:muRfac=1.0":206,
-        "PLACEHOLDER207":"isr:muRfac=0.625_fsr:muRfac=1.0","isr:muRfac=0.625_fsr:muRfac=1.0":207,
-        "PLACEHOLDER208":"isr:muRfac=0.75_fsr:muRfac=1.0","isr:muRfac=0.75_fsr:muRfac=1.0":208,
-        "PLACEHOLDER209":"isr:muRfac=0.875_fsr:muRfac=1.0","isr:muRfac=0.875_fsr:muRfac=1.0":209,
-        "PLACEHOLDER210":"isr:muRfac=1.0_fsr:muRfac=1.75","isr:muRfac=1.0_fsr:muRfac=1.75":210,
-        "PLACEHOLDER211":"isr:muRfac=1.0_fsr:muRfac=1.5","isr:muRfac=1.0_fsr:muRfac=1.5":211,
-        "PLACEHOLDER212":"isr:muRfac=1.0_fsr:muRfac=1.25","isr:muRfac=1.0_fsr:muRfac=1.25":212,
-        "PLACEHOLDER213":"isr:muRfac=1.0_fsr:muRfac=0.625","isr:muRfac=1.0_fsr:muRfac=0.625":213,
-        "PLACEHOLDER214":"isr:muRfac=1.0_fsr:muRfac=0.75","isr:muRfac=1.0_fsr:muRfac=0.75":214,
-        "PLACEHOLDER215":"isr:muRfac=1.0_fsr:muRfac=0.875","isr:muRfac=1.0_fsr:muRfac=0.875":215,
-        "PLACEHOLDER216":"hardHi","hardHi":216,
-        "PLACEHOLDER217":"hardLo","hardLo":217,
-        "PLACEHOLDER218":"isr:PDF:plus","isr:PDF:plus":218,
-        "PLACEHOLDER219":"isr:PDF:minus","isr:PDF:minus":219,
-        "PLACEHOLDER220":"AUX_bare_not_for_analyses","AUX_bare_not_for_analyses":220,
-        },
+    args = parser.parse_args()
 
-}
\ No newline at end of file
+    for fname_vars in args.sumw_variations:
+        fname_index = getWeightIndexFileName(fname_vars)
+        print(f"Write generator weight index to {fname_index}")
+        writeWeightIndex(compileWeightIndex(fname_vars), fname_index)
@@ -1,9 +1,15 @@
+import os
 import time
 import re
+import json
 import h5py
 import ROOT
 
-from mc_weight_variations import dict_systname_varindex
+from mc_weight_variations import loadWeightIndex
+from manifest import describeColumns
+from histbooking import HistogramBooker
+from cutflow import Cutflow, formatCutflow, writeCutflow
+from responses import obsConfig_dict, hasUnitMeV, getBinEdges
 
 import logging
 logging.basicConfig(
@@ -72,8 +78,152 @@ float compute_dR(float rapidity1, float phi1, float rapidity2, float phi2) {
     return std::sqrt(drap*drap+dphi*dphi);
 }
 """)
+
+def declare_sum_weights():
+    # declare the sum weights map
+    ROOT.gInterpreter.Declare('''
+        auto &GetSumWeightsMap() {
+            static std::unordered_map<int, std::unordered_map<std::string, double>> sumwMap;
+            return sumwMap;
+        };
+    ''')
+
+    # https://twiki.cern.ch/twiki/bin/view/AtlasProtected/DataMCForAnalysis
+    ROOT.gInterpreter.Declare('''
+        double GetSumWeights(int mcChannelNumber, int runNumber) {
+            auto subcamp = "";
+            if (276073 <= runNumber and runNumber <= 311481) {
+                subcamp = "mc16a";
+            } else if (325713 <= runNumber and runNumber <= 340453) {
+                subcamp = "mc16d";
+            } else if (348885 <= runNumber and runNumber <= 364292) {
+                subcamp = "mc16e";
+            }
+
+            auto &sumwMap = GetSumWeightsMap();
+            return sumwMap[mcChannelNumber][subcamp];
+        }
+    ''')
+######
+
 ######
+# Read-ahead control
+class ExpressionRecorder():
+    """
+    Thin wrapper of an RDataFrame node that records the expressions passed to
+    Define and Filter, so that the input branches used by the graph are known
+    """
+    def __init__(self, node, expressions=None):
+        self.node = node
+        self.expressions = [] if expressions is None else expressions
+
+    def Define(self, name, expression):
+        self.expressions.append(expression)
+        return ExpressionRecorder(self.node.Define(name, expression), self.expressions)
+
+    def Filter(self, expression, *args):
+        self.expressions.append(expression)
+        return ExpressionRecorder(self.node.Filter(expression, *args), self.expressions)
+
+    def Range(self, *args):
+        return ExpressionRecorder(self.node.Range(*args), self.expressions)
+
+    def __getattr__(self, name):
+        return getattr(self.node, name)
+
+def getUsedBranches(tree, expressions, columns=[], friend_alias=None):
+    """
+    Names of the branches of tree that appear in the expressions or columns
+    If friend_alias is provided, the tree is a friend and may be referred to as <friend_alias>.<branch>
+    """
+    tokens = set(columns)
+    for expr in expressions:
+        tokens.update(re.findall(r'[A-Za-z_]\w*(?:\.\w+)?', expr))
+
+    branches = set()
+    for tok in tokens:
+        if '.' in tok:
+            alias, bname = tok.split('.', 1)
+            if friend_alias is None or alias != friend_alias:
+                continue
+        else:
+            bname = tok
+
+        if tree.GetBranch(bname):
+            branches.add(bname)
+
+    return sorted(branches)
+
+def configureTreeCache(tree, branches, cacheSize):
+    """
+    Set the TTreeCache size and train it on the given branches
+    """
+    tree.SetCacheSize(int(cacheSize))
+    for bname in branches:
+        tree.AddBranchToCache(bname, True)
+    tree.StopCacheLearningPhase()
+    logger.debug(f"TTreeCache of {tree.GetName()}: {cacheSize/1024**2:.0f} MB, {len(branches)} branches")
+
+ROOT.gInterpreter.Declare("""
+class AsyncOpenNext : public TObject {
+public:
+    AsyncOpenNext(TChain *chain, int nahead) : fChain(chain), fAhead(nahead), fOpened(-1) {}
+    // called by the chain whenever it moves on to a new file
+    Bool_t Notify() override {
+        auto files = fChain->GetListOfFiles();
+        int current = fChain->GetTreeNumber();
+        for (int i = std::max(current+1, fOpened+1); i <= current+fAhead && i < files->GetEntries(); ++i) {
+            TString fname = files->At(i)->GetTitle();
+            if (fname.Contains("://")) TFile::AsyncOpen(fname);
+            fOpened = i;
+        }
+        return kTRUE;
+    }
+private:
+    TChain *fChain;
+    int fAhead;
+    int fOpened;
+};
+""")
 
+def enablePrefetching(chains, nahead=1):
+    """
+    Prefetch baskets in a separate thread and, whenever a chain moves on to a new
+    file, open the next nahead remote files of the chain asynchronously
+
+    Return the notifiers, which have to be kept alive as long as the chains are read
+    """
+    ROOT.gEnv.SetValue("TFile.AsyncPrefetching", 1)
+
+    notifiers = []
+    for chain in chains:
+        notifier = ROOT.AsyncOpenNext(chain, nahead)
+        chain.SetNotify(notifier)
+        notifiers.append(notifier)
+
+    return notifiers
+
+def getReadStats(trees, inputFiles):
+    """
+    Bytes read from the input files compared with the bytes in the files
+    """
+    stats = {
+        'bytes_read': ROOT.TFile.GetFileBytesRead(),
+        'read_calls': ROOT.TFile.GetFileReadCalls(),
+        'bytes_trees': sum(t.GetZipBytes() for t in trees),
+        'bytes_files': sum(os.path.getsize(f) for f in inputFiles if os.path.isfile(f))
+    }
+
+    return stats
+
+def reportReadStats(stats):
+    logger.info(f"Bytes read: {stats['bytes_read']/1024**2:.1f} MB in {stats['read_calls']} calls")
+    if stats['bytes_trees'] > 0:
+        logger.info(f"Bytes in the trees: {stats['bytes_trees']/1024**2:.1f} MB ({stats['bytes_read']/stats['bytes_trees']*100:.1f}% read)")
+    if stats['bytes_files'] > 0:
+        logger.info(f"Bytes in the local input files: {stats['bytes_files']/1024**2:.1f} MB")
+
+######
 def define_extra_variables(rdf, prefix_thad, prefix_tlep, prefix_ttbar, compute_energy=True):
 
     # energy
@@ -186,7 +336,7 @@ def define_weight_variations(rdf, weight_component):
 
     return rdf
 
-def define_generator_weights(rdf, treename=None):
+def define_generator_weights(rdf, weight_index_file, treename=None, aliases_only=True):
     branch_name = "mc_generator_weights" if treename is None else f"{treename}.mc_generator_weights"
 
     if not rdf.HasColumn(branch_name):
@@ -198,27 +348,23 @@ def define_generator_weights(rdf, treename=None):
     # check if all events have the same dsid
     if dsid != rdf.Max('mcChannelNumber').GetValue():
         raise RuntimeError("Events in the samples are of mixed DSIDs! Cannot make branches for the generator weight variations at the moment.")
+    dsid = int(dsid)
 
-    # check if dsid is available in dict_systname_varindex
-    if not dsid in dict_systname_varindex:
+    # load the compiled weight index for this dsid only
+    if weight_index_file is None:
+        raise RuntimeError("No generator weight index file provided!")
+    index_d = loadWeightIndex(weight_index_file, [dsid])
+    if not dsid in index_d:
         raise RuntimeError(f"DSID {dsid} not in the weight variation dictionary!")
 
-    varindex_dsid_d = dict_systname_varindex[dsid]
-
-    for varname, wname in varindex_dsid_d.items():
-        # skip if PLACEHOLDER
-        if "PLACEHOLDER" in varname:
-            continue
-
-        if isinstance(wname, int):
-            # Skip for now if wname is an integer
-            # In this canse varname is the string extracted from the sumWeight files and may not be a valid c++ variable name for calling RDataFrame::Define
-            continue
-        else:
-            # Use wname to look up the weight index
-            windex = varindex_dsid_d[wname]
+    names = index_d[dsid]['names']
+    indices = index_d[dsid]['index']
+    if aliases_only:
+        # only the generator weights with an alias
+        names = names[:index_d[dsid]['aliased']]
 
-            rdf = rdf.Define(f"mc_generator_weights_{varname}", f"{branch_name}[{windex}]")
+    for varname, windex in zip(names, indices):
+        rdf = rdf.Define(f"mc_generator_weights_{varname}", f"{branch_name}[{windex}]")
 
     return rdf
 
@@ -264,6 +410,116 @@ def SelectColumns(rdf, recoAlgo=None, truthLevel=None, include_dR=False, include
     else:
         return columns
 
+def get_truth_steps(truthLevel):
+    # cutflow steps of the truth-level selection: (step name, selection)
+    if truthLevel == "parton":
+        return [
+            ('isSemiLeptonic', 'isSemiLeptonic'),
+            ('truth_not_nan', '!TMath::IsNaN(MC_thad_afterFSR_y)'),
+            ('pass_truth', 'pass_truth')
+            ]
+    else:
+        return [('pass_truth', 'pass_truth')]
+
+def load_histogram_config(histConfig):
+    """
+    Observables to be histogrammed: observable -> {'reco': variable, 'truth': variable, 'bins': bin edges}
+    histConfig: dict or JSON file. Entries are either as in obsConfig_dict of
+    test/debugResponse.py, optionally with 'bins_truth', or only the bins as in the binning
+    configs, in which case the variable names are taken from responses.obsConfig_dict.
+    Multi-dimensional binnings are skipped.
+    """
+    if isinstance(histConfig, str):
+        with open(histConfig) as f:
+            histConfig = json.load(f)
+
+    config = {}
+    for ob, entry in histConfig.items():
+        if isinstance(entry, dict) and 'bins' in entry:
+            cfg = dict(obsConfig_dict.get(ob, {}), **entry)
+        elif isinstance(entry, dict) and 'axis' in entry:
+            logger.debug(f"Skip multi-dimensional observable {ob}")
+            continue
+        elif ob in obsConfig_dict:
+            cfg = dict(obsConfig_dict[ob], bins=entry)
+        else:
+            logger.debug(f"Observable {ob} is not in obsConfig_dict. Skip...")
+            continue
+
+        if not 'reco' in cfg or not 'truth' in cfg:
+            logger.warning(f"No variable names for observable {ob}. Skip...")
+            continue
+
+        cfg['bins'] = getBinEdges(cfg['bins']).tolist()
+        cfg['bins_truth'] = getBinEdges(cfg['bins_truth']).tolist() if 'bins_truth' in cfg else cfg['bins']
+        config[ob] = cfg
+
+    return config
+
+def get_observable_expression(observable, variable):
+    # expression of the observable in GeV
+    expr = f"{variable}/1000." if hasUnitMeV(variable) else variable
+    if observable.endswith('_abs'):
+        expr = f"std::abs({expr})"
+    return expr
+
+def book_histograms(booker, histConfig, reco=True, truth=True):
+    """
+    Book the standard histograms of the observables in histConfig, named as in responses.py:
+      h_<ob>_reco:                 reco-level events, weighted by normalized_weight
+      h_<ob>_truth:                events passing the truth selection, weighted by normalized_weight_mc
+      h2d_<ob>_response:           events passing the reco and truth selections, weighted by normalized_weight
+      h2d_<ob>_response_mcweight:  same, weighted by normalized_weight_mc
+    Observables whose variables are not in the data frame are skipped.
+    """
+    def has_columns(*variables):
+        return all(booker.rdf.HasColumn(v) for v in variables)
+
+    for ob, cfg in histConfig.items():
+        vreco, vtruth = cfg['reco'], cfg['truth']
+        xreco = get_observable_expression(ob, vreco)
+        xtruth = get_observable_expression(ob, vtruth)
+
+        if reco and not has_columns(vreco, 'normalized_weight'):
+            logger.warning(f"Cannot book reco-level histograms of {ob}: missing column {vreco} or normalized_weight")
+            reco_ok = False
+        else:
+            reco_ok = reco
+
+        truth_ok = truth and has_columns(vtruth, 'pass_truth', 'normalized_weight_mc')
+        if truth and not truth_ok:
+            logger.warning(f"Cannot book truth-level histograms of {ob}: missing column {vtruth}, pass_truth or normalized_weight_mc")
+
+        if reco_ok:
+            booker.book1D(f"h_{ob}_reco", xreco, cfg['bins'], weight='normalized_weight', xtitle=vreco)
+
+        if truth_ok:
+            booker.book1D(f"h_{ob}_truth", xtruth, cfg['bins_truth'], selection='pass_truth', weight='normalized_weight_mc', xtitle=vtruth)
+
+        if reco_ok and truth_ok:
+            for hname, weight in [('response', 'normalized_weight'), ('response_mcweight', 'normalized_weight_mc')]:
+                booker.book2D(f"h2d_{ob}_{hname}", xreco, xtruth, cfg['bins'], cfg['bins_truth'], selection='pass_truth', weight=weight, xtitle=vreco, ytitle=vtruth)
+
+def write_histograms(results, foutname):
+    """
+    Write the histograms to foutname. Histograms with the same name are added up.
+    """
+    summed = {}
+    for res in results:
+        for (directory, hname), h in res.items():
+            if hname in summed:
+                summed[hname].Add(h)
+            else:
+                summed[hname] = h.Clone(hname)
+                summed[hname].SetDirectory(0)
+
+    fout = ROOT.TFile.Open(foutname, 'recreate')
+    for hname, h in summed.items():
+        h.Write(hname)
+    fout.Close()
+
+    return sorted(summed)
+
 class NtupleRDF():
     def __init__(
         self,
@@ -271,10 +527,13 @@ class NtupleRDF():
         inputFiles_reco,
         inputFiles_truth = [],
         sumWeights_dict = None,
+        genWeightsIndex = None, # compiled generator weight index file
         recoAlgo = 'klfitter', # ttbar reconstruction algorithm
         truthLevel ='parton',
         treename = 'nominal',
         treename_truth = 'nominal',
+        cacheSize = None, # TTreeCache size in bytes. Use ROOT's default if None
+        prefetch = False, # prefetch baskets and open remote files asynchronously
         verbose = False
         ):
 
@@ -286,6 +545,10 @@ class NtupleRDF():
         self.truthLevel = truthLevel
         self.recoAlgo = recoAlgo
         self.sumWeights_d = sumWeights_dict
+        self.genWeightsIndex = genWeightsIndex
+        self.cacheSize = cacheSize
+
+        self.inputFiles = list(inputFiles_reco) + list(inputFiles_truth)
 
         logger.info("Read reco-level trees")
         self.tree_reco = ROOT.TChain(treename)
@@ -308,6 +571,11 @@ class NtupleRDF():
         else:
             self.tree_truth = None
 
+        self.prefetchers = []
+        if prefetch:
+            logger.info("Enable asynchronous prefetching")
+            self.prefetchers = enablePrefetching([self.tree_reco] + ([self.tree_truth] if self.tree_truth else []))
+
         # output file name
         if self.tree_truth:
             self.foutname = f"{outputName}_{recoAlgo}_{truthLevel}_ljets"
@@ -320,8 +588,15 @@ class NtupleRDF():
         saveUnmatchedReco=True,
         saveUnmatchedTruth=True,
         include_dR = False,
-        include_gen_weights = False
+        include_gen_weights = False,
+        all_gen_weights = False,
+        histConfig = None
         ):
+        """
+        histConfig: dict or JSON file of the observables to be histogrammed in
+        the same event loops as the arrays (see load_histogram_config). The histograms
+        are written to <output name>_histograms.root
+        """
         logger.info("Start processing mini-ntuples")
 
         if maxevents is None:
@@ -347,13 +622,26 @@ class NtupleRDF():
             tstop = time.time()
             logger.info(f"Building truth tree index took {tstop-tstart:.2f} seconds")
 
+        # output file name -> summary for the manifest
+        self.outputs = {}
+        event_counts = {}
+
+        if histConfig is not None:
+            histConfig = load_histogram_config(histConfig)
+            logger.info(f"Observables to be histogrammed: {list(histConfig)}")
+        hist_results = []
+
         logger.info("Construct RDataFrame from TTree")
         df = ROOT.RDataFrame(self.tree_reco)
-        logger.info(f"Total number of events: {df.Count().GetValue()}")
+        event_counts['total'] = self.tree_reco.GetEntries()
+        logger.info(f"Total number of events: {event_counts['total']}")
 
         # Add progress bar
         ROOT.RDF.Experimental.AddProgressBar(df)
 
+        # keep track of the expressions to know which branches are read
+        df = ExpressionRecorder(df)
+
         if maxevents is not None:
             df = df.Range(maxevents)
 
@@ -365,12 +653,6 @@ class NtupleRDF():
         reco_cuts = "el_n+mu_n==1 && jet_n>=4 && bjet_n>=2"
 
         df = df.Define("pass_reco", reco_cuts)
-        df = df.Filter('pass_reco')
-        logger.info(f"Number of events after reco cuts: {df.Count().GetValue()}")
-
-        ###
-        # extra variables
-        df = define_extra_variables(df, *getPrefixReco(self.recoAlgo), compute_energy=True)
 
         ###
         # normalized event weights
@@ -387,41 +669,32 @@ class NtupleRDF():
             # Sum weights
             logger.debug("Sum weights")
 
-            logger.debug("Declaring function GetSumWeights...")
-            # declare the sum weights map
-            ROOT.gInterpreter.Declare('''
-                auto &GetSumWeightsMap() {
-                    static std::unordered_map<int, std::unordered_map<std::string, double>> sumwMap;
-                    return sumwMap;
-                };
-            ''')
+            # declare once per process so that several NtupleRDF can run in sequence
+            if not hasattr(ROOT, 'GetSumWeights'):
+                logger.debug("Declaring function GetSumWeights...")
+                declare_sum_weights()
+
             # fill the sum weights map from self.sumWeights_d
             sumwMap = ROOT.GetSumWeightsMap()
+            sumwMap.clear()
             for dsid in self.sumWeights_d:
                 sumwMap[dsid] = self.sumWeights_d[dsid]
 
-            # https://twiki.cern.ch/twiki/bin/view/AtlasProtected/DataMCForAnalysis
-            ROOT.gInterpreter.Declare('''
-                double GetSumWeights(int mcChannelNumber, int runNumber) {
-                    auto subcamp = "";
-                    if (276073 <= runNumber and runNumber <= 311481) {
-                        subcamp = "mc16a";
-                    } else if (325713 <= runNumber and runNumber <= 340453) {
-                        subcamp = "mc16d";
-                    } else if (348885 <= runNumber and runNumber <= 364292) {
-                        subcamp = "mc16e";
-                    }
-
-                    auto &sumwMap = GetSumWeightsMap();
-                    return sumwMap[mcChannelNumber][subcamp];
-                }
-            ''')
-            logger.debug("...done!")
-
             df = df \
                 .Define("sum_weights", "GetSumWeights(mcChannelNumber,runNumber)") \
                 .Define("normalized_weight", "totalWeight_nominal*xs_times_lumi/sum_weights")
 
+        # raw and weighted counts at each selection step, filled in the event loop of AsNumpy
+        cutflow = Cutflow('normalized_weight')
+        df = cutflow.book(df, 'processed')
+
+        df = df.Filter('pass_reco')
+        df = cutflow.book(df, 'pass_reco')
+
+        ###
+        # extra variables
+        df = define_extra_variables(df, *getPrefixReco(self.recoAlgo), compute_energy=True)
+
         # event weight systematic variations
         df = define_weight_variations(df, "weight_bTagSF_DL1r_70")
         df = define_weight_variations(df, "weight_jvt")
@@ -430,7 +703,7 @@ class NtupleRDF():
 
         if include_gen_weights:
             try:
-                df = define_generator_weights(df)
+                df = define_generator_weights(df, self.genWeightsIndex, aliases_only=not all_gen_weights)
             except RuntimeError as e:
                 logger.warning(f"Failed to add generator weight variations: {e}")
 
@@ -454,9 +727,10 @@ class NtupleRDF():
             else:
                 raise RuntimeError(f"Unknown truth level: {self.truthLevel}")
 
+            cutflow.bookSteps(df, [('isMatched', 'isMatched')] + get_truth_steps(self.truthLevel))
+
             if not saveUnmatchedReco:
                 df = df.Filter("isMatched")
-                logger.info(f"Number of truth matched events: {df.Count().GetValue()}")
 
             # compute extra variableas for truth level
             df = define_extra_variables(df, *getPrefixTruth(self.truthLevel), compute_energy=self.truthLevel!='parton')
@@ -474,16 +748,48 @@ class NtupleRDF():
         logger.info("Columns to be stored:")
         logger.info(f"{cols}")
 
+        if histConfig:
+            # booked before the event loop of AsNumpy, which fills them as well
+            booker = HistogramBooker.fromDataFrame(df)
+            book_histograms(booker, histConfig, reco=True, truth=self.tree_truth is not None)
+            booker.book()
+
+        if self.cacheSize is not None:
+            # train the TTreeCache on the branches read by the graph
+            configureTreeCache(self.tree_reco, getUsedBranches(self.tree_reco, df.expressions, cols), self.cacheSize)
+            if self.tree_truth:
+                configureTreeCache(self.tree_truth, getUsedBranches(self.tree_truth, df.expressions, cols, self.truthLevel), self.cacheSize)
+
         logger.info("Save as numpy arrays")
         arrays_d = df.AsNumpy(cols)
+
+        if histConfig:
+            hist_results.append(booker.run())
+
         tstop = time.time()
         logger.info(f"Total processing time: {tstop-tstart:.2f} seconds")
 
+        cutflow_reco = cutflow.getResults()
+        logger.info(f"Cutflow:\n{formatCutflow(cutflow_reco)}")
+        event_counts.update((c['step'], c['events']) for c in cutflow_reco)
+
+        self.readStats = getReadStats([self.tree_reco] + ([self.tree_truth] if self.tree_truth else []), self.inputFiles)
+        reportReadStats(self.readStats)
+
         logger.info(f"Create output file: {self.foutname}.h5")
         with h5py.File(f"{self.foutname}.h5", "w") as file_arr:
             for vname in arrays_d:
                 logger.debug(vname)
                 file_arr.create_dataset(vname, data=arrays_d[vname])
+            writeCutflow(file_arr, cutflow_reco)
+
+        event_counts['stored'] = len(arrays_d[cols[0]]) if cols else 0
+        self.outputs[f"{self.foutname}.h5"] = {
+            'columns': describeColumns(arrays_d),
+            'event_counts': event_counts,
+            'cutflow': cutflow_reco,
+            'timing': {'processing': tstop-tstart, 'writing': time.time()-tstop},
+            }
 
         ####
         if saveUnmatchedTruth and self.tree_truth:
@@ -497,21 +803,32 @@ class NtupleRDF():
 
             logger.info(f"Construct RDataFrame from {self.truthLevel}-level TTree")
             df_truth = ROOT.RDataFrame(self.tree_truth)
-            logger.info(f"Total number of events: {df_truth.Count().GetValue()}")
+            event_counts_t = {'total': self.tree_truth.GetEntries()}
+            logger.info(f"Total number of events: {event_counts_t['total']}")
 
             # Add progress bar
             ROOT.RDF.Experimental.AddProgressBar(df_truth)
 
+            df_truth = ExpressionRecorder(df_truth)
+
             if maxevents is not None:
                 df_truth = df_truth.Range(maxevents)
 
             tstart_t = time.time()
 
+            df_truth = df_truth \
+                .Define("sum_weights", "GetSumWeights(mcChannelNumber,runNumber)") \
+                .Define("normalized_weight_mc", "weight_mc*xs_times_lumi/sum_weights")
+
+            cutflow_t = Cutflow('normalized_weight_mc')
+            df_truth = cutflow_t.book(df_truth, 'processed')
+
             # event selection flags
             df_truth = df_truth.Define("isMatched", "runNumber==reco.runNumber && eventNumber==reco.eventNumber")
 
             # save only the events that do not match to reco level by event ID
             df_truth = df_truth.Filter("!isMatched")
+            df_truth = cutflow_t.book(df_truth, 'unmatched')
 
             if self.truthLevel == "parton":
                 df_truth = df_truth.Define("isSemiLeptonic", isSemiLeptonic)
@@ -519,29 +836,62 @@ class NtupleRDF():
             else:
                 df_truth = df_truth.Define("pass_truth", "passedPL")
 
+            cutflow_t.bookSteps(df_truth, get_truth_steps(self.truthLevel))
+
             # extra variables
             df_truth = define_extra_variables(df_truth, *getPrefixTruth(self.truthLevel), compute_energy=self.truthLevel!='parton')
 
             if include_gen_weights:
                 try:
-                    df_truth = define_generator_weights(df_truth)
+                    df_truth = define_generator_weights(df_truth, self.genWeightsIndex, aliases_only=not all_gen_weights)
                 except RuntimeError as e:
                     logger.warning(f"Failed to add generator weight variations: {e}")
 
-            df_truth = df_truth \
-                .Define("sum_weights", "GetSumWeights(mcChannelNumber,runNumber)") \
-                .Define("normalized_weight_mc", "weight_mc*xs_times_lumi/sum_weights")
-
             # save as numpy arrays
             cols_truth = SelectColumns(df_truth, truthLevel=self.truthLevel, include_gen_weights=include_gen_weights)
             logger.info("Columns to be stored:")
             logger.info(f"{cols_truth}")
+
+            if histConfig:
+                booker_t = HistogramBooker.fromDataFrame(df_truth)
+                book_histograms(booker_t, histConfig, reco=False, truth=True)
+                booker_t.book()
+
+            if self.cacheSize is not None:
+                configureTreeCache(self.tree_truth, getUsedBranches(self.tree_truth, df_truth.expressions, cols_truth), self.cacheSize)
+                configureTreeCache(self.tree_reco, getUsedBranches(self.tree_reco, df_truth.expressions, cols_truth, "reco"), self.cacheSize)
+
             arrays_umt_d = df_truth.AsNumpy(cols_truth)
+
+            if histConfig:
+                hist_results.append(booker_t.run())
+
             tstop_t= time.time()
             logger.info(f"Total processing time: {tstop_t-tstart_t:.2f} seconds")
 
+            cutflow_truth = cutflow_t.getResults()
+            logger.info(f"Cutflow:\n{formatCutflow(cutflow_truth)}")
+            event_counts_t.update((c['step'], c['events']) for c in cutflow_truth)
+
             logger.info(f"Create output file: {self.foutname}_unmatched_truth.h5")
             with h5py.File(f"{self.foutname}_unmatched_truth.h5", "w")as file_arr_umt:
                 for vname in arrays_umt_d:
                     logger.debug(vname)
                     file_arr_umt.create_dataset(vname, data=arrays_umt_d[vname])
+                writeCutflow(file_arr_umt, cutflow_truth)
+
+            event_counts_t['stored'] = len(arrays_umt_d[cols_truth[0]]) if cols_truth else 0
+            self.outputs[f"{self.foutname}_unmatched_truth.h5"] = {
+                'columns': describeColumns(arrays_umt_d),
+                'event_counts': event_counts_t,
+                'cutflow': cutflow_truth,
+                'timing': {'processing': tstop_t-tstart_t, 'writing': time.time()-tstop_t},
+                }
+
+        ####
+        if hist_results:
+            fname_hists = f"{self.foutname}_histograms.root"
+            logger.info(f"Create histogram file: {fname_hists}")
+            hnames = write_histograms(hist_results, fname_hists)
+            logger.debug(f"{hnames}")
+            self.outputs[f"{self.foutname}.h5"]['histograms'] = os.path.basename(fname_hists)
@@ -0,0 +1,390 @@
+"""
+Lazy, column-selective reading of the HDF5 outputs of a production
+
+The outputs of the jobs are indexed once by sample, systematic, era and tree:
+  <topdir>/<sample>/<syst>/<era>/<name>_<ARRAYID>_..._ljets[_unmatched_truth].h5
+  <topdir>/obs|fakes/<year>/<name>_<ARRAYID>_..._ljets.h5   (syst 'nominal', era <year>)
+together with the column layout of each file, i.e. the offset, dtype and length
+of every column (see h5columns.py). The index is cached in
+<topdir>/.outputs.index.json, or in ~/.cache/ntuplerTT if topdir is not
+writable, and only the files that are new or changed since are opened again.
+
+Loading columns returns a LazyColumns object: nothing is read until a column is
+accessed, and then only that column of the selected files. Contiguous columns
+are read from memory-mapped files; the others with h5py. A row selection is
+evaluated chunk by chunk on its own columns and only the selected rows of the
+requested columns are kept.
+
+  reader = OutputReader('<output_dir>')
+  arrays = reader.load(['normalized_weight', 'PseudoTop_Reco_ttbar_m'], samples=['ttbar'], eras=['mc16a'],
+                       selection=lambda a: a['PseudoTop_Reco_ttbar_m'] > 300)
+  for syst, arrs in arrays.split('syst').items():
+      print(syst, arrs['normalized_weight'].sum())
+"""
+import os
+import re
+import json
+import mmap
+import time
+import fnmatch
+
+import numpy as np
+import h5py
+
+from h5columns import getColumnLayout, isMappable, mapColumn
+from tarreader import getCachedIndexName
+
+import logging
+logger = logging.getLogger(__name__)
+
+index_name = '.outputs.index.json'
+
+def parseOutputPath(relpath):
+    """
+    Sample, systematic, era and tree ('reco' or 'truth') of a job output from its path relative to the top directory.
+    None if the path is not that of a job output.
+    """
+    parts = relpath.split(os.sep)
+    if len(parts) == 4:
+        sample, syst, era, fname = parts
+    elif len(parts) == 3:
+        # data and data-driven backgrounds
+        sample, era, fname = parts
+        syst = 'nominal'
+    else:
+        return None
+
+    if re.match(r'^.+_\d+_.+\.h5$', fname) is None:
+        return None
+
+    tree = 'truth' if fname.endswith('_unmatched_truth.h5') else 'reco'
+    return {'sample': sample, 'syst': syst, 'era': era, 'tree': tree}
+
+def openMap(fpath):
+    with open(fpath, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+def readColumn(fpath, column, entry, start=0, stop=None):
+    """
+    Rows [start, stop) of a column of a file. A view of the memory-mapped file if the column is contiguous.
+    """
+    stop = entry['length'] if stop is None else min(stop, entry['length'])
+    if stop <= start:
+        return np.empty(0, dtype=np.dtype(entry['dtype']))
+    if isMappable(entry):
+        return mapColumn(openMap(fpath), entry)[start:stop]
+    with h5py.File(fpath, 'r') as f:
+        return f[column][start:stop]
+
+class LazyColumns():
+    """ Columns of a list of output files, read and concatenated on access
+    ______
+    Arguments
+    files: list of (path, file entry of the index)
+    columns: list of str; column names
+    selection: callable; takes a dictionary of column name -> array of a chunk of
+               rows and returns a boolean mask of the selected rows. None to keep all rows
+    selection_columns: list of str; columns passed to selection
+    chunk_size: int; number of rows per chunk when evaluating the selection
+    """
+    def __init__(self, files, columns, selection=None, selection_columns=[], chunk_size=2**20):
+        self.files = files
+        self.columns = list(columns)
+        self.selection = selection
+        self.selection_columns = list(selection_columns)
+        self.chunk_size = chunk_size
+
+        missing = {}
+        for fpath, entry in files:
+            for c in self.columns + self.selection_columns:
+                if not c in entry['layout']:
+                    missing.setdefault(c, []).append(fpath)
+        if missing:
+            raise KeyError("Columns not found: " + ", ".join(f"{c} in {len(v)} files e.g. {v[0]}" for c, v in missing.items()))
+
+        # path -> boolean mask of the selected rows
+        self._masks = {}
+        # column name -> concatenated array
+        self._arrays = {}
+
+    def __getitem__(self, column):
+        if not column in self.columns:
+            raise KeyError(f"{column} was not loaded")
+        if not column in self._arrays:
+            self._arrays[column] = self._concatenate(column)
+        return self._arrays[column]
+
+    def __contains__(self, column):
+        return column in self.columns
+
+    def __iter__(self):
+        return iter(self.columns)
+
+    def __len__(self):
+        return len(self.columns)
+
+    def keys(self):
+        return list(self.columns)
+
+    def items(self):
+        return [(c, self[c]) for c in self.columns]
+
+    def nrows(self):
+        return sum(self._countRows(fpath, entry) for fpath, entry in self.files)
+
+    def split(self, key):
+        """
+        Dictionary of the value of key ('sample', 'syst', 'era' or 'tree') -> LazyColumns of the files with that value
+        """
+        groups = {}
+        for fpath, entry in self.files:
+            groups.setdefault(entry[key], []).append((fpath, entry))
+
+        split = {}
+        for value, files in groups.items():
+            split[value] = LazyColumns(files, self.columns, self.selection, self.selection_columns, self.chunk_size)
+            split[value]._masks = {fpath: self._masks[fpath] for fpath, _ in files if fpath in self._masks}
+        return split
+
+    def _nevents(self, entry):
+        return next(iter(entry['layout'].values()))['length'] if entry['layout'] else 0
+
+    def _getMask(self, fpath, entry):
+        if self.selection is None:
+            return None
+
+        if not fpath in self._masks:
+            n = self._nevents(entry)
+            mask = np.empty(n, dtype=bool)
+            for start in range(0, n, self.chunk_size):
+                chunk = {c: readColumn(fpath, c, entry['layout'][c], start, start+self.chunk_size) for c in self.selection_columns}
+                mask[start:start+self.chunk_size] = self.selection(chunk)
+            self._masks[fpath] = mask
+
+        return self._masks[fpath]
+
+    def _countRows(self, fpath, entry):
+        mask = self._getMask(fpath, entry)
+        return self._nevents(entry) if mask is None else int(np.count_nonzero(mask))
+
+    def _concatenate(self, column):
+        if not self.files:
+            return np.empty(0)
+
+        dtype = np.dtype(self.files[0][1]['layout'][column]['dtype'])
+
+        if len(self.files) == 1 and self.selection is None:
+            fpath, entry = self.files[0]
+            return readColumn(fpath, column, entry['layout'][column])
+
+        sizes = [self._countRows(fpath, entry) for fpath, entry in self.files]
+        out = np.empty(sum(sizes), dtype=dtype)
+        pos = 0
+        for (fpath, entry), size in zip(self.files, sizes):
+            if size == 0:
+                continue
+            arr = readColumn(fpath, column, entry['layout'][column])
+            mask = self._getMask(fpath, entry)
+            out[pos:pos+size] = arr if mask is None else arr[mask]
+            pos += size
+            # release the mapping of the file
+            del arr
+
+        return out
+
+    def iterChunks(self, chunk_size=None):
+        """
+        Iterate over dictionaries of column name -> array of the selected rows of chunks of
+        at most chunk_size rows of each file, without concatenating the files
+        """
+        chunk_size = chunk_size or self.chunk_size
+        for fpath, entry in self.files:
+            mask = self._getMask(fpath, entry)
+            for start in range(0, self._nevents(entry), chunk_size):
+                stop = start + chunk_size
+                chunk = {c: readColumn(fpath, c, entry['layout'][c], start, stop) for c in self.columns}
+                if mask is not None:
+                    chunk = {c: arr[mask[start:stop]] for c, arr in chunk.items()}
+                yield chunk
+
+class OutputReader():
+    """ Index of the HDF5 outputs under a production directory
+    ______
+    Arguments
+    topdir: str; top directory of the outputs
+    fname_index: str; index file. Default: <topdir>/.outputs.index.json
+    """
+    def __init__(self, topdir, fname_index=None):
+        self.topdir = os.path.expanduser(topdir)
+        self.fname_index = fname_index or os.path.join(self.topdir, index_name)
+
+        # path relative to topdir -> {'size', 'mtime', 'sample', 'syst', 'era', 'tree', 'layout'}
+        self.index = {}
+        self.refresh()
+
+    def _readIndex(self):
+        for fname in [self.fname_index, getCachedIndexName(self.topdir.rstrip(os.sep))]:
+            try:
+                with open(fname) as f:
+                    return json.load(f)['files']
+            except (OSError, ValueError, KeyError):
+                continue
+        return {}
+
+    def _writeIndex(self):
+        content = {'topdir': os.path.abspath(self.topdir), 'files': self.index}
+        for fname in [self.fname_index, getCachedIndexName(self.topdir.rstrip(os.sep))]:
+            try:
+                os.makedirs(os.path.dirname(fname), exist_ok=True)
+                ftmp = f"{fname}.{os.getpid()}.tmp"
+                with open(ftmp, 'w') as f:
+                    json.dump(content, f)
+                os.replace(ftmp, fname)
+                return fname
+            except OSError:
+                continue
+        logger.warning(f"Could not write the index of {self.topdir}")
+        return None
+
+    def refresh(self):
+        """
+        Bring the index up to date with the outputs under topdir. Only new or changed files are opened.
+        """
+        tstart = time.time()
+        cached = self._readIndex()
+        index = {}
+        nupdated = 0
+
+        for dirpath, dirnames, fnames in os.walk(self.topdir):
+            dirnames[:] = sorted(d for d in dirnames if not d.startswith('.'))
+            for fname in sorted(fnames):
+                relpath = os.path.relpath(os.path.join(dirpath, fname), self.topdir)
+                meta = parseOutputPath(relpath)
+                if meta is None:
+                    continue
+
+                st = os.stat(os.path.join(dirpath, fname))
+                entry = cached.get(relpath)
+                if entry is None or entry['size'] != st.st_size or entry['mtime'] != st.st_mtime_ns:
+                    try:
+                        with h5py.File(os.path.join(dirpath, fname), 'r') as f:
+                            layout = getColumnLayout(f)
+                    except OSError as e:
+                        logger.warning(f"Cannot read {relpath}: {e}")
+                        continue
+                    entry = {'size': st.st_size, 'mtime': st.st_mtime_ns, **meta, 'layout': layout}
+                    nupdated += 1
+
+                index[relpath] = entry
+
+        changed = nupdated > 0 or index.keys() != cached.keys()
+        self.index = index
+        if changed:
+            self._writeIndex()
+
+        logger.debug(f"Indexed {len(index)} outputs ({nupdated} new or changed) in {time.time()-tstart:.2f} s")
+
+    def select(self, samples=None, systematics=None, eras=None, truth=False, pattern=None):
+        """
+        List of (path, file entry) of the outputs of the samples, systematics and eras
+        (all if None), of the unmatched truth tree if truth is True or else the reco tree,
+        and whose relative path matches the glob pattern if provided
+        """
+        selected = []
+        for relpath, entry in self.index.items():
+            if samples and not entry['sample'] in samples:
+                continue
+            if systematics and not entry['syst'] in systematics:
+                continue
+            if eras and not entry['era'] in eras:
+                continue
+            if entry['tree'] != ('truth' if truth else 'reco'):
+                continue
+            if pattern and not fnmatch.fnmatch(relpath, pattern):
+                continue
+            selected.append((os.path.join(self.topdir, relpath), entry))
+
+        return selected
+
+    def getValues(self, key):
+        """
+        Sorted values of key ('sample', 'syst', 'era' or 'tree') in the index
+        """
+        return sorted(set(entry[key] for entry in self.index.values()))
+
+    def getColumns(self, files):
+        """
+        Columns found in all of the files
+        """
+        columns = None
+        for _, entry in files:
+            columns = set(entry['layout']) if columns is None else columns & set(entry['layout'])
+        return sorted(columns or [])
+
+    def load(
+        self,
+        columns,
+        samples = None,
+        systematics = None,
+        eras = None,
+        truth = False,
+        pattern = None,
+        selection = None,
+        selection_columns = [],
+        chunk_size = 2**20
+        ):
+        """ Columns of the selected outputs
+        ______
+        Arguments
+        columns: list of str; columns to load
+        samples, systematics, eras: list of str; all if None
+        truth: bool; if True, load the unmatched truth outputs instead of the reco-level ones
+        pattern: str; glob pattern of the relative paths of the outputs
+        selection: callable; takes a dictionary of column name -> array and returns a boolean mask of the rows to keep
+        selection_columns: list of str; columns used by selection
+        chunk_size: int; number of rows per chunk when evaluating the selection
+
+        Return
+        LazyColumns
+        """
+        files = self.select(samples, systematics, eras, truth, pattern)
+        return LazyColumns(files, columns, selection, selection_columns, chunk_size)
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Index the HDF5 outputs of a production and read columns of them")
+
+    parser.add_argument("topdir", type=str,
+                        help="Top directory of the outputs")
+    parser.add_argument("-s", "--samples", nargs='+', type=str,
+                        help="Samples. All if not provided")
+    parser.add_argument("-y", "--systematics", nargs='+', type=str,
+                        help="Systematics. All if not provided")
+    parser.add_argument("-e", "--eras", nargs='+', type=str,
+                        help="Subcampaigns or years. All if not provided")
+    parser.add_argument("-t", "--truth", action='store_true',
+                        help="If True, read the unmatched truth outputs instead of the reco-level ones")
+    parser.add_argument("-c", "--columns", nargs='+', type=str,
+                        help="Columns to read. If not provided, list the columns common to the selected outputs")
+    parser.add_argument("-v", "--verbose", action='store_true',
+                        help="If True, set logging level to DEBUG, otherwise INFO")
+
+    args = parser.parse_args()
+
+    logging.basicConfig(format='%(asctime)s %(levelname)-7s %(name)-10s %(message)s')
+    logger.setLevel(logging.DEBUG if args.verbose else logging.INFO)
+
+    reader = OutputReader(args.topdir)
+    files = reader.select(args.samples, args.systematics, args.eras, args.truth)
+    logger.info(f"Selected {len(files)} of {len(reader.index)} outputs")
+
+    if not args.columns:
+        for c in reader.getColumns(files):
+            print(c)
+    else:
+        tstart = time.time()
+        arrays = reader.load(args.columns, args.samples, args.systematics, args.eras, args.truth)
+        for syst, arrs in arrays.split('syst').items():
+            print(f"{syst}: " + ", ".join(f"{c} {arr.dtype} {len(arr)} sum {arr.sum():.6g}" for c, arr in arrs.items()))
+        logger.info(f"Read {len(args.columns)} columns of {len(files)} outputs in {(time.time()-tstart)*1000:.1f} ms")
@@ -0,0 +1,275 @@
+"""
+Resolve dataset replicas via Rucio with a shared client, batched queries and an on-disk cache
+"""
+import os
+import time
+import json
+import hashlib
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+def did_str2dict(did, scope=None):
+    """
+    Convert a DID string to a dictionary with keys 'scope' and 'name'
+    """
+    dlist = did.split(':')
+    if len(dlist) == 2:
+        if scope is not None:
+            print("WARNING: overwrite dataset scope!")
+            dlist[0] = scope
+        return {'scope': dlist[0], 'name': dlist[1]}
+    elif len(dlist) == 1:
+        if scope is not None:
+            return {'scope': scope, 'name': did}
+        else:
+            # try guessing the scope if the DID starts with 'user.<username>'
+            if did.startswith('user.'):
+                scope = '.'.join(did.split('.')[:2])
+                return {'scope': scope, 'name': did}
+
+    raise RuntimeError("Failed to get the scope of dataset {}".format(did))
+
+def did_dict2str(did_d):
+    return f"{did_d['scope']}:{did_d['name']}"
+
+def getLocalDataPath(file_path):
+    """
+    Translate a file path at the local site to a path on the local disk (Cedar)
+    """
+    return subprocess.check_output(['getLocalDataPath', 'echo', file_path]).decode('utf-8').strip('\n')
+
+class ReplicaCache():
+    """
+    On-disk cache of replica answers, one JSON file per query key
+    """
+    def __init__(self, cache_dir, ttl=86400):
+        self.cache_dir = os.path.expanduser(cache_dir)
+        self.ttl = ttl # seconds
+
+    def _path(self, key):
+        h = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{h}.json")
+
+    def get(self, key):
+        fpath = self._path(key)
+        try:
+            with open(fpath) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if entry.get('key') != key or time.time() - entry.get('time', 0) > self.ttl:
+            return None
+
+        return entry['files'], entry['sizes']
+
+    def put(self, key, files, sizes):
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+        fpath = self._path(key)
+        # write to a temporary file first so concurrent readers never see a partial entry
+        ftmp = f"{fpath}.{os.getpid()}.tmp"
+        with open(ftmp, 'w') as f:
+            json.dump({'key': key, 'time': time.time(), 'files': files, 'sizes': sizes}, f)
+        os.replace(ftmp, fpath)
+
+class ReplicaResolver():
+    """
+    Resolve DIDs to file paths and sizes
+
+    client: object with a Rucio-like list_replicas(dids, schemes) method.
+            If None, a rucio.client.Client is created on first use and shared.
+    localSite: str; name of the local RSE
+    local_path_func: callable to translate a path at the local site to a local disk path
+    cache_dir: str; directory for the on-disk cache. No caching if None
+    ttl: float; lifetime of the cached replica answers in seconds
+    max_workers: int; number of threads for the per-file local path lookups
+    batch_size: int; max number of DIDs per list_replicas call
+    """
+    def __init__(
+        self,
+        client = None,
+        localSite = 'CA-SFU-T2_LOCALGROUPDISK',
+        local_path_func = getLocalDataPath,
+        cache_dir = '~/.cache/ntuplerTT/replicas',
+        ttl = 86400,
+        max_workers = 16,
+        batch_size = 100
+        ):
+
+        self._client = client
+        self.localSite = localSite
+        self.local_path_func = local_path_func
+        self.cache = ReplicaCache(cache_dir, ttl) if cache_dir else None
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+
+        # in-memory copy of the answers
+        self._resolved = {}
+
+    @property
+    def client(self):
+        if self._client is None:
+            import rucio.client
+            self._client = rucio.client.Client()
+        return self._client
+
+    def _key(self, did, getLocalPath, localSite):
+        return f"{did}|{localSite}|{int(getLocalPath)}"
+
+    def _pick_path(self, replica, localSite):
+        if localSite in replica['rses'].keys():
+            # the data file is available at local site
+            return replica['rses'][localSite][0], True
+        elif replica['pfns']:
+            # the data file is not available at the local site
+            # access the file via xrootd, pick the one with the highest priority
+            return max(replica['pfns'].items(), key=lambda pfns:pfns[1]['priority'])[0], False
+        else:
+            return '', False
+
+    def _query(self, dids, localSite):
+        """
+        Query replicas of a batch of DIDs in one call
+
+        Return a dictionary: did -> list of (file_path, is_local, size)
+        """
+        did_dicts = [did_str2dict(d) for d in dids]
+        did_names = {did_dict2str(dd): d for dd, d in zip(did_dicts, dids)}
+
+        results = {d: [] for d in dids}
+
+        # the parent datasets ('scope:name') of each file are only returned with resolve_parents
+        replicas = self.client.list_replicas(did_dicts, schemes=['root'], resolve_parents=True)
+        for replica in replicas:
+            file_path, is_local = self._pick_path(replica, localSite)
+            if not file_path:
+                continue
+
+            # attribute the file to its parent dataset
+            parents = [did_names[p] for p in replica.get('parents', []) if p in did_names]
+            if not parents:
+                if len(dids) == 1:
+                    parents = dids
+                else:
+                    # cannot tell which DID the file belongs to
+                    raise RuntimeError("Replica without parent information in a batched query")
+
+            for p in parents:
+                results[p].append((file_path, is_local, replica['bytes']))
+
+        return results
+
+    def _query_batched(self, dids, localSite):
+        results = {}
+        for i in range(0, len(dids), self.batch_size):
+            batch = dids[i:i+self.batch_size]
+            try:
+                results.update(self._query(batch, localSite))
+            except RuntimeError:
+                # fall back to one query per DID
+                for d in batch:
+                    results.update(self._query([d], localSite))
+        return results
+
+    def _translate(self, paths):
+        def translate(p):
+            try:
+                return self.local_path_func(p)
+            except Exception:
+                print("Failed to get local file paths")
+                return p
+
+        if len(paths) < 2 or self.max_workers < 2:
+            return [translate(p) for p in paths]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(translate, paths))
+
+    def resolve(self, dids, getLocalPath=False, localSite=None):
+        """ Resolve DIDs to file paths and sizes
+        ______
+        Arguments
+        dids: str or a list of str; dataset identifiers
+        getLocalPath: bool; if True, translate paths at the local site to local disk paths
+        localSite: str; name of the local RSE. Default: the one of the resolver
+
+        Return
+        A dictionary: did -> (list of file paths, list of file sizes in bytes)
+        """
+        if not isinstance(dids, list):
+            dids = [dids]
+
+        localSite = localSite or self.localSite
+
+        answers = {}
+        missing = []
+
+        for did in dids:
+            key = self._key(did, getLocalPath, localSite)
+            if key in self._resolved:
+                answers[did] = self._resolved[key]
+                continue
+
+            cached = self.cache.get(key) if self.cache else None
+            if cached is not None:
+                self._resolved[key] = answers[did] = cached
+            elif not did in missing:
+                missing.append(did)
+
+        if missing:
+            results = self._query_batched(missing, localSite)
+
+            if getLocalPath:
+                # translate all local files at once
+                local_paths = [p for did in missing for p, is_local, _ in results[did] if is_local]
+                translated = dict(zip(local_paths, self._translate(local_paths)))
+            else:
+                translated = {}
+
+            for did in missing:
+                files = [translated.get(p, p) if is_local else p for p, is_local, _ in results[did]]
+                sizes = [s for _, _, s in results[did]]
+
+                key = self._key(did, getLocalPath, localSite)
+                self._resolved[key] = answers[did] = (files, sizes)
+                if self.cache and files:
+                    self.cache.put(key, files, sizes)
+
+        return answers
+
+    def listFiles(self, dids, getLocalPath=False, localSite=None):
+        """
+        Same as resolve() but concatenate the files of all DIDs
+        """
+        if not isinstance(dids, list):
+            dids = [dids]
+
+        answers = self.resolve(dids, getLocalPath, localSite)
+
+        filelist, sizelist = [], []
+        for did in dids:
+            filelist += answers[did][0]
+            sizelist += answers[did][1]
+
+        return filelist, sizelist
+
+_shared_resolver = None
+
+def getReplicaResolver(**kwargs):
+    """
+    Return the replica resolver shared within the process.
+    A new one is created if keyword arguments are provided.
+    """
+    global _shared_resolver
+    if _shared_resolver is None or kwargs:
+        _shared_resolver = ReplicaResolver(**kwargs)
+    return _shared_resolver
+
+def setReplicaResolver(resolver):
+    """
+    Replace the shared replica resolver e.g. with one using a stub client
+    """
+    global _shared_resolver
+    _shared_resolver = resolver
@@ -0,0 +1,301 @@
+"""
+Predict the peak memory and walltime of processMiniNtuples.py jobs
+
+The prediction is based on the number of input entries (estimated from the
+input file sizes), the number of output columns and which outputs are enabled.
+The coefficients can be calibrated from the manifests of previous runs:
+  python python/resources.py <job_directories or jobfiles.yaml> -o <resource_model.json>
+"""
+import os
+import re
+import json
+import glob
+import statistics
+
+# Widths of the vector weight branches that are flattened into one column per element
+default_vector_weight_widths = {
+    'weight_bTagSF_DL1r_70_eigenvars_B_up': 45,
+    'weight_bTagSF_DL1r_70_eigenvars_B_down': 45,
+    'weight_bTagSF_DL1r_70_eigenvars_C_up': 20,
+    'weight_bTagSF_DL1r_70_eigenvars_C_down': 20,
+    'weight_bTagSF_DL1r_70_eigenvars_Light_up': 20,
+    'weight_bTagSF_DL1r_70_eigenvars_Light_down': 20,
+}
+
+# Number of flat output columns other than the vector weights
+default_column_counts = {
+    'reco': 80, # event info, scalar weights and reco-level kinematics
+    'truth': 40, # truth-level kinematics and flags
+    'dR': 6,
+    'gen_weights_aliased': 40,
+    'gen_weights_all': 200,
+}
+
+def getOutputOptions(extra_args='', truth_level=''):
+    """
+    Output options of processMiniNtuples.py from its command line arguments
+    """
+    args = extra_args.split()
+    return {
+        'truth_level': truth_level,
+        'save_unmatched': '-u' in args or '--save-unmatched' in args,
+        'gen_weights': '-g' in args or '--generator-weights' in args or '--all-generator-weights' in args,
+        'all_gen_weights': '--all-generator-weights' in args,
+    }
+
+def getOptionsKey(options):
+    return f"{options.get('truth_level') or 'reco'}|{int(bool(options.get('gen_weights')))}|{int(bool(options.get('all_gen_weights')))}"
+
+class ResourceModel():
+    """
+    Linear model of the job resources
+
+      entries = input_bytes / bytes_per_entry
+      memory [MB] = mem_base + mem_per_value * entries * ncolumns
+      walltime [s] = time_base + time_per_entry * entries
+    """
+    defaults = {
+        'bytes_per_entry': 2000.,
+        'mem_base': 1500.,
+        'mem_per_value': 3.0e-5, # about 4 copies of an 8-byte value in MB
+        'time_base': 600.,
+        'time_per_entry': 1.0e-3,
+    }
+
+    def __init__(self, filename=None, **coefficients):
+        self.coefficients = dict(self.defaults)
+        # option key -> number of output columns observed in previous runs
+        self.columns = {}
+        self.vector_weight_widths = dict(default_vector_weight_widths)
+
+        if filename and os.path.isfile(filename):
+            with open(filename) as f:
+                model = json.load(f)
+            self.coefficients.update(model.get('coefficients', {}))
+            self.columns.update(model.get('columns', {}))
+            self.vector_weight_widths.update(model.get('vector_weight_widths', {}))
+
+        self.coefficients.update(coefficients)
+
+    def save(self, filename):
+        with open(filename, 'w') as f:
+            json.dump({
+                'coefficients': self.coefficients,
+                'columns': self.columns,
+                'vector_weight_widths': self.vector_weight_widths
+                }, f, indent=2)
+
+    def estimateColumns(self, options):
+        """
+        Number of output columns of the reco (and truth) output and of the unmatched truth output
+        """
+        key = getOptionsKey(options)
+        if key in self.columns:
+            ncols, ncols_umt = self.columns[key]
+        else:
+            ncols = default_column_counts['reco'] + sum(self.vector_weight_widths.values())
+            ncols_umt = 0
+
+            if options.get('truth_level'):
+                ncols_truth = default_column_counts['truth']
+                if options.get('all_gen_weights'):
+                    ncols_truth += default_column_counts['gen_weights_all']
+                elif options.get('gen_weights'):
+                    ncols_truth += default_column_counts['gen_weights_aliased']
+
+                ncols += ncols_truth + default_column_counts['dR']
+                ncols_umt = ncols_truth + 10 # event info and weights
+
+        if not options.get('save_unmatched'):
+            ncols_umt = 0
+
+        return ncols, ncols_umt
+
+    def predict(self, input_bytes, options):
+        """ Predict the resources of one job
+        ______
+        Arguments
+        input_bytes: int; total size of the reco-level input files
+        options: dict; output options as returned by getOutputOptions
+
+        Return
+        peak memory in MB, walltime in seconds
+        """
+        c = self.coefficients
+        entries = input_bytes / c['bytes_per_entry']
+        ncols, ncols_umt = self.estimateColumns(options)
+
+        # assume the unmatched truth events are about as many as the reco events
+        memory = c['mem_base'] + c['mem_per_value'] * entries * (ncols + ncols_umt)
+
+        walltime = c['time_base'] + c['time_per_entry'] * entries
+        if options.get('save_unmatched'):
+            # a second event loop over the truth trees
+            walltime += c['time_per_entry'] * entries
+
+        return memory, walltime
+
+    def predictRequest(self, input_bytes_list, options, mem_margin=1.3, time_margin=1.5, min_mem=2, max_mem=64, min_time=3600, max_time=48*3600):
+        """
+        Memory (GB) and walltime (seconds) to request for an array job: the largest
+        prediction of all tasks with a safety margin, within the limits
+        """
+        predictions = [self.predict(b, options) for b in input_bytes_list]
+        memory = max(p[0] for p in predictions) * mem_margin / 1024
+        walltime = max(p[1] for p in predictions) * time_margin
+
+        memory = int(min(max(-(-memory//1), min_mem), max_mem))
+        walltime = int(min(max(walltime, min_time), max_time))
+
+        return memory, walltime
+
+    def calibrate(self, records, min_records=3):
+        """ Update the coefficients from the metrics of previous runs
+        ______
+        Arguments
+        records: list of dict with keys 'entries', 'ncolumns', 'peak_memory' (MB),
+                 'walltime' (s), 'options', and optionally 'input_bytes'
+        min_records: int; minimum number of records to update a coefficient
+
+        Medians of the per-job ratios are used to be robust against outliers.
+        """
+        c = self.coefficients
+
+        bpe = [r['input_bytes']/r['entries'] for r in records if r.get('input_bytes') and r['entries'] > 0]
+        if len(bpe) >= min_records:
+            c['bytes_per_entry'] = statistics.median(bpe)
+
+        mpv = [(r['peak_memory']-c['mem_base'])/(r['entries']*r['ncolumns']) for r in records if r.get('peak_memory') and r['entries'] > 0 and r['ncolumns'] > 0]
+        mpv = [x for x in mpv if x > 0]
+        if len(mpv) >= min_records:
+            c['mem_per_value'] = statistics.median(mpv)
+
+        tpe = [(r['walltime']-c['time_base'])/r['entries'] for r in records if r.get('walltime') and r['entries'] > 0]
+        tpe = [x for x in tpe if x > 0]
+        if len(tpe) >= min_records:
+            c['time_per_entry'] = statistics.median(tpe)
+
+        # observed number of columns
+        for r in records:
+            key = getOptionsKey(r['options'])
+            ncols, ncols_umt = self.columns.get(key, (0, 0))
+            self.columns[key] = (max(ncols, r['ncolumns_main']), max(ncols_umt, r['ncolumns_umt']))
+
+        return len(records)
+
+###
+# Metrics of previous runs
+input_sizes_name = 'input_sizes.json'
+
+re_array_index = re.compile(r'_(\d+)_(?:klfitter|pseudotop)_')
+
+def readRunRecords(dirname):
+    """
+    Collect metrics of the jobs in dirname from the manifests of their outputs
+    and the input sizes written by writeJobFile.py
+    """
+    input_sizes = {}
+    fname_sizes = os.path.join(dirname, 'inputs', input_sizes_name)
+    if os.path.isfile(fname_sizes):
+        with open(fname_sizes) as f:
+            input_sizes = json.load(f)
+
+    manifests = {}
+    for fname in glob.glob(os.path.join(dirname, '*.manifest.json')):
+        try:
+            with open(fname) as f:
+                manifests[os.path.basename(fname)] = json.load(f)
+        except (OSError, ValueError):
+            continue
+
+    records = []
+    for fname, m in manifests.items():
+        if '_unmatched_truth' in fname:
+            continue
+
+        fname_umt = fname.replace('_ljets.h5', '_ljets_unmatched_truth.h5')
+        m_umt = manifests.get(fname_umt, {})
+
+        opts = m.get('options', {})
+        options = {
+            'truth_level': 'parton' if opts.get('parton_files') else ('particle' if opts.get('particle_files') else ''),
+            'save_unmatched': bool(opts.get('save_unmatched')),
+            'gen_weights': bool(opts.get('generator_weights') or opts.get('all_generator_weights')),
+            'all_gen_weights': bool(opts.get('all_generator_weights'))
+        }
+
+        ncols = len(m.get('columns', {}))
+        ncols_umt = len(m_umt.get('columns', {}))
+
+        record = {
+            'entries': m.get('event_counts', {}).get('total', 0),
+            'ncolumns': ncols + ncols_umt,
+            'ncolumns_main': ncols,
+            'ncolumns_umt': ncols_umt,
+            # resident memory of the job, not the python heap peak in 'peak_memory'
+            'peak_memory': m.get('max_rss', 0) / 1024**2,
+            'walltime': m.get('timing', {}).get('total'),
+            'options': options
+        }
+
+        mindex = re_array_index.search(fname)
+        if mindex and mindex.group(1) in input_sizes:
+            record['input_bytes'] = input_sizes[mindex.group(1)]
+
+        records.append(record)
+
+    return records
+
+def collectRunRecords(paths):
+    """
+    Collect metrics from job directories or job summary yaml files
+    """
+    dirs = []
+    for p in paths:
+        if os.path.isdir(p):
+            dirs.append(p)
+        elif p.endswith('.yaml') or p.endswith('.yml'):
+            import yaml
+            with open(p) as f:
+                jobs_dict = yaml.load(f, yaml.FullLoader)
+
+            def _dirs(d):
+                for v in d.values():
+                    if isinstance(v, dict):
+                        yield from _dirs(v)
+                    elif v:
+                        yield os.path.dirname(v)
+
+            dirs += list(_dirs(jobs_dict))
+
+    records = []
+    for d in dirs:
+        records += readRunRecords(d)
+
+    return records
+
+if __name__ == "__main__":
+
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+
+    parser.add_argument('paths', nargs='+', type=str,
+                        help="Job directories or job summary yaml files of previous runs")
+    parser.add_argument('-o', '--output', type=str, required=True,
+                        help="Output file name of the calibrated resource model")
+    parser.add_argument('-i', '--input-model', type=str,
+                        help="Resource model to start from. If not provided, start from the defaults")
+
+    args = parser.parse_args()
+
+    model = ResourceModel(args.input_model)
+    records = collectRunRecords(args.paths)
+    print(f"Calibrate the resource model with {len(records)} jobs")
+    model.calibrate(records)
+
+    for k, v in model.coefficients.items():
+        print(f"  {k}: {v:.4g}")
+
+    print(f"Write the resource model to {args.output}")
+    model.save(args.output)
@@ -0,0 +1,622 @@
+"""
+Response matrices, acceptance and efficiency corrections from the HDF5 outputs of NtupleRDF
+
+The outputs <name>_ljets.h5 (events passing the reco selection) and
+<name>_ljets_unmatched_truth.h5 (truth events without a reco match) are read in
+chunks of columns, and the histograms of all observables are filled with
+vectorized bin lookups and weighted bin counts:
+  reco:              pass_reco, weighted by normalized_weight
+  truth:             pass_truth, weighted by normalized_weight_mc (matched and unmatched events)
+  response:          pass_reco && pass_truth, weighted by normalized_weight
+  response_mcweight: pass_reco && pass_truth, weighted by normalized_weight_mc
+  acceptance = projection of response on the reco axis / reco
+  efficiency = projection of response_mcweight on the truth axis / truth
+
+The histograms are numpy arrays that include the underflow and overflow bins as
+in ROOT, and can be written as ROOT histograms or to a npz file.
+
+Weight variations (scale factor variations weight_<component>_* and generator
+weights mc_generator_weights_*) are filled in the same pass: the bin indices of
+an event are computed once, the event weights of all variations form a
+(nevents, nvariations) matrix, and all of them are accumulated with one
+bincount into (nvariations, nbins) arrays. Index 0 is the nominal weight.
+
+Multi-dimensional observables such as ptt_vs_mtt or mtt_vs_ptt_vs_ytt_abs are
+filled in flattened bins (see flattenedHistograms.py), with bin 0 for events
+outside the binning.
+
+  python python/responses.py <sample>_*_ljets.h5 -o responses.root
+"""
+import os
+import json
+import time
+import numpy as np
+import h5py
+
+from flattenedHistograms import FlattenedBinning
+from datasets import getMC16SubCampaign, read_config
+from mc_weight_variations import compileWeightIndex, get_var_index
+
+import logging
+logger = logging.getLogger(__name__)
+
+# Observable configurations
+obsConfig_dict = {
+    "th_pt" : {
+        "reco" : "PseudoTop_Reco_top_had_pt",
+        "truth" : "MC_thad_afterFSR_pt"
+    },
+    "th_y" : {
+        "reco" :  "PseudoTop_Reco_top_had_y",
+        "truth" : "MC_thad_afterFSR_y"
+    },
+    "th_y_abs" : {
+        "reco" :  "PseudoTop_Reco_top_had_y",
+        "truth" : "MC_thad_afterFSR_y"
+    },
+    "th_phi" : {
+        "reco" :  "PseudoTop_Reco_top_had_phi",
+        "truth" : "MC_thad_afterFSR_phi"
+    },
+    "th_e" : {
+        "reco" :  "PseudoTop_Reco_top_had_E",
+        "truth" : "MC_thad_afterFSR_E"
+    },
+    "tl_pt" : {
+        "reco" : "PseudoTop_Reco_top_lep_pt",
+        "truth" : "MC_tlep_afterFSR_pt"
+    },
+    "tl_y" : {
+        "reco" :  "PseudoTop_Reco_top_lep_y",
+        "truth" : "MC_tlep_afterFSR_y"
+    },
+    "tl_y_abs" : {
+        "reco" :  "PseudoTop_Reco_top_lep_y",
+        "truth" : "MC_tlep_afterFSR_y"
+    },
+    "tl_phi" : {
+        "reco" :  "PseudoTop_Reco_top_lep_phi",
+        "truth" : "MC_tlep_afterFSR_phi"
+    },
+    "tl_e" : {
+        "reco" :  "PseudoTop_Reco_top_lep_E",
+        "truth" : "MC_tlep_afterFSR_E"
+    },
+    "mtt": {
+        "reco" : "PseudoTop_Reco_ttbar_m",
+        "truth" : "MC_ttbar_afterFSR_m"
+    },
+    "ptt": {
+        "reco" : "PseudoTop_Reco_ttbar_pt",
+        "truth" : "MC_ttbar_afterFSR_pt"
+    },
+    "ytt": {
+        "reco" : "PseudoTop_Reco_ttbar_y",
+        "truth" : "MC_ttbar_afterFSR_y"
+    },
+    "ytt_abs": {
+        "reco" : "PseudoTop_Reco_ttbar_y",
+        "truth" : "MC_ttbar_afterFSR_y"
+    },
+}
+
+default_observables = ['th_pt', 'th_y', 'th_y_abs', 'tl_pt', 'tl_y', 'tl_y_abs', 'mtt', 'ptt', 'ytt', 'ytt_abs']
+
+def hasUnitMeV(variable_name):
+    # parton-level momenta and masses are in MeV
+    return variable_name.startswith('MC_') and variable_name.rsplit('_', 1)[-1] in ['pt', 'm', 'E', 'pout', 'Ht']
+
+def getBinEdges(bins_cfg):
+    """
+    Bin edges from a binning config entry: a list of edges or a dict with keys 'nbins', 'xmin', 'xmax'
+    """
+    if isinstance(bins_cfg, dict):
+        return np.linspace(bins_cfg['xmin'], bins_cfg['xmax'], bins_cfg['nbins']+1)
+    else:
+        return np.asarray(bins_cfg, dtype=float)
+
+def getBinIndices(values, edges):
+    """
+    Bin indices of values with the underflow bin 0 and the overflow bin len(edges) as in ROOT
+    """
+    return np.searchsorted(edges, values, side='right')
+
+def getObservableComponents(observable):
+    """
+    Observables of each axis of a multi-dimensional observable, from the innermost e.g. ptt_vs_mtt -> [ptt, mtt]
+    """
+    return observable.split('_vs_')
+
+def isConfigured(observable):
+    return all(ob in obsConfig_dict for ob in getObservableComponents(observable))
+
+def getVariableNames(observable, level):
+    return [obsConfig_dict[ob][level] for ob in getObservableComponents(observable)]
+
+def getObservableValues(arrays, observable, level):
+    vname = obsConfig_dict[observable][level]
+    values = arrays[vname]
+    if hasUnitMeV(vname):
+        values = values / 1000. # convert MeV to GeV
+    if observable.endswith('_abs'):
+        values = np.abs(values)
+    return values
+
+def iterChunks(fpaths, columns, chunk_size=2**20, optional_columns=[]):
+    """
+    Iterate over the events of HDF5 files in chunks
+    Yield a dictionary: column name -> numpy array of at most chunk_size events
+    """
+    for fpath in fpaths:
+        with h5py.File(fpath, 'r') as f:
+            missing = [c for c in columns if not c in f]
+            if missing:
+                raise KeyError(f"Columns {missing} not found in {fpath}")
+
+            cols = list(columns) + [c for c in optional_columns if c in f]
+            nevents = len(f[cols[0]]) if cols else 0
+
+            for start in range(0, nevents, chunk_size):
+                stop = min(start + chunk_size, nevents)
+                yield {c: f[c][start:stop] for c in cols}
+
+def getUnmatchedTruthFile(fpath_reco):
+    fpath_truth = os.path.splitext(fpath_reco)[0] + '_unmatched_truth.h5'
+    return fpath_truth if os.path.isfile(fpath_truth) else None
+
+# nominal scale factors whose variations are stored as weight_<component>_*
+weight_components = ['weight_bTagSF_DL1r_70', 'weight_jvt', 'weight_leptonSF', 'weight_pileup']
+
+def getWeightVariations(columns, scale_factors=True, generator_weights=True):
+    """
+    Weight variations available in the columns: list of (variation column, nominal column)
+    The nominal column is the weight component that the variation replaces.
+    """
+    variations = []
+    for col in sorted(columns):
+        if scale_factors:
+            for comp in weight_components:
+                if col.startswith(comp+'_') and comp in columns:
+                    variations.append((col, comp))
+        if generator_weights and col.startswith('mc_generator_weights_') and 'weight_mc' in columns:
+            variations.append((col, 'weight_mc'))
+    return variations
+
+def getSumWeightsScale(arrays, col_var, sumw_variations, weight_index):
+    """
+    Per-event factor that normalizes the generator weight variation col_var with its own sum
+    of weights instead of the nominal one: sum_weights / sum of weights of the variation for
+    the DSID and subcampaign of the event
+    sumw_variations: dict; sum weight variations written by computeSumWeights.py
+    weight_index: dict; compiled generator weight index (see mc_weight_variations.compileWeightIndex)
+    """
+    wname = col_var[len('mc_generator_weights_'):]
+
+    # a few (DSID, run number) pairs in a sample
+    pairs, inverse = np.unique(np.stack([arrays['mcChannelNumber'], arrays['runNumber']], axis=1), axis=0, return_inverse=True)
+    sumw_pairs = np.array([
+        sumw_variations[int(dsid)][getMC16SubCampaign(int(run))][get_var_index(int(dsid), wname, weight_index)]
+        for dsid, run in pairs], dtype=np.float64)
+    sumw_var = sumw_pairs[inverse.ravel()]
+
+    return np.divide(arrays['sum_weights'], sumw_var, out=np.zeros(len(sumw_var)), where=sumw_var!=0)
+
+def getWeightMatrix(arrays, weight_name, variations, scales={}):
+    """
+    Event weights of the nominal and all variations: array of shape (1+nvariations, nevents)
+    A variation whose columns are not in arrays is the nominal weight.
+    scales: dict; variation column -> per-event factor applied to the variation, e.g. from getSumWeightsScale
+    """
+    w_nominal = arrays[weight_name]
+    weights = np.empty((len(variations)+1, len(w_nominal)))
+    weights[0] = w_nominal
+    for i, (col_var, col_nom) in enumerate(variations):
+        if col_var in arrays and col_nom in arrays:
+            np.divide(arrays[col_var], arrays[col_nom], out=weights[i+1], where=arrays[col_nom]!=0)
+            weights[i+1][arrays[col_nom]==0] = 0.
+            weights[i+1] *= w_nominal
+            if col_var in scales:
+                weights[i+1] *= scales[col_var]
+        else:
+            weights[i+1] = w_nominal
+    return weights
+
+class WeightedCounts():
+    """
+    Sums of weights and of squared weights in a flat array of bins for each weight variation:
+    arrays of shape (nvariations, nbins)
+    """
+    def __init__(self, nbins, nvariations=1, max_block_size=2**22):
+        self.values = np.zeros((nvariations, nbins))
+        self.sumw2 = np.zeros((nvariations, nbins))
+        # bound the size of the index array of one bincount
+        self.block_size = max(1, max_block_size // nvariations)
+
+    def fill(self, indices, weights):
+        """
+        indices: array of bin indices of shape (nevents,)
+        weights: array of shape (nevents,) or (nvariations, nevents)
+        """
+        nvars, nbins = self.values.shape
+        weights = weights.reshape(-1, len(indices))
+
+        # flat index of (variation, bin) so that all variations are filled by one scatter-add
+        offsets = np.arange(nvars)[:, np.newaxis] * nbins
+        for start in range(0, len(indices), self.block_size):
+            stop = start + self.block_size
+            idx = (offsets + indices[start:stop]).ravel()
+            w = weights[:, start:stop].ravel()
+            self.values += np.bincount(idx, w, minlength=nvars*nbins).reshape(nvars, nbins)
+            self.sumw2 += np.bincount(idx, w*w, minlength=nvars*nbins).reshape(nvars, nbins)
+
+def divide(numer, denom, err_numer, err_denom):
+    """
+    Ratio of two arrays and its error assuming they are uncorrelated as in TH1::Divide.
+    Bins with zero denominator are set to zero.
+    """
+    ratio = np.divide(numer, denom, out=np.zeros_like(numer), where=denom!=0)
+    err2 = np.divide(err_numer**2 * denom**2 + err_denom**2 * numer**2, denom**4, out=np.zeros_like(numer), where=denom!=0)
+    return ratio, np.sqrt(err2)
+
+class ResponseHistograms():
+    """
+    Histograms of one observable. Arrays include the underflow and overflow bins and
+    have a first axis of weight variations. The response arrays are indexed by
+    [variation, reco bin, truth bin].
+
+    Each event is counted once per weight: reco-weighted events in a grid of
+    (reco bin, truth bin or no truth), and mc-weighted events in a grid of
+    (reco bin or no reco, truth bin). The reco, truth and response histograms are
+    sums over these grids. Events that are not selected go to an extra bin.
+
+    mc_rows maps each variation to a row of the mc weight matrix, so variations
+    that do not change the mc weights, e.g. scale factors, are filled only once.
+    """
+    def __init__(self, observable, bins_reco, bins_truth=None, variations=['nominal'], mc_rows=None):
+        self.observable = observable
+        self.variations = list(variations)
+        if bins_truth is None:
+            bins_truth = bins_reco
+
+        # flattened bins of multi-dimensional observables
+        self.binning_reco, self.binning_truth = None, None
+        if '_vs_' in observable:
+            components = getObservableComponents(observable)
+            self.binning_reco = FlattenedBinning(bins_reco, components)
+            self.binning_truth = FlattenedBinning(bins_truth, components)
+            self.edges_reco = self.binning_reco.getFlatEdges()
+            self.edges_truth = self.binning_truth.getFlatEdges()
+        else:
+            self.edges_reco = getBinEdges(bins_reco)
+            self.edges_truth = getBinEdges(bins_truth)
+
+        self.nreco = len(self.edges_reco) + 1
+        self.ntruth = len(self.edges_truth) + 1
+
+        self.mc_rows = np.arange(len(self.variations)) if mc_rows is None else np.asarray(mc_rows)
+
+        self.counts_reco = WeightedCounts(self.nreco * (self.ntruth+1) + 1, len(self.variations))
+        self.counts_mc = WeightedCounts((self.nreco+1) * self.ntruth + 1, self.mc_rows.max()+1)
+
+    def _getBinIndices(self, arrays, level):
+        binning = self.binning_reco if level == 'reco' else self.binning_truth
+        if binning is None:
+            edges = self.edges_reco if level == 'reco' else self.edges_truth
+            return getBinIndices(getObservableValues(arrays, self.observable, level), edges)
+        else:
+            # events outside the binning (-1) go to bin 0
+            values = [getObservableValues(arrays, ob, level) for ob in getObservableComponents(self.observable)]
+            return binning.findBins(*values) + 1
+
+    def fillReco(self, arrays, sel_reco, sel_truth, weights, weights_mc):
+        """
+        Fill events of the reco-level file
+        weights, weights_mc: weight matrices of the reco-level and mc weights
+        """
+        ireco = self._getBinIndices(arrays, 'reco')
+        itruth = self._getBinIndices(arrays, 'truth')
+
+        # reco-weighted events: truth bin if they pass the truth selection, 'no truth' otherwise
+        key = ireco * (self.ntruth+1) + np.where(sel_truth, itruth, self.ntruth)
+        key[~sel_reco] = self.nreco * (self.ntruth+1)
+        self.counts_reco.fill(key, weights)
+
+        # mc-weighted events: reco bin if they pass the reco selection, 'no reco' otherwise
+        key_mc = np.where(sel_reco, ireco, self.nreco) * self.ntruth + itruth
+        key_mc[~sel_truth] = (self.nreco+1) * self.ntruth
+        self.counts_mc.fill(key_mc, weights_mc)
+
+    def fillTruth(self, arrays, sel_truth, weights_mc):
+        """
+        Fill truth events that are not matched to reco-level events
+        """
+        itruth = self._getBinIndices(arrays, 'truth')
+
+        key_mc = self.nreco * self.ntruth + itruth
+        key_mc[~sel_truth] = (self.nreco+1) * self.ntruth
+        self.counts_mc.fill(key_mc, weights_mc)
+
+    def _getGrid(self, mcweight=False):
+        if mcweight:
+            shape = (-1, self.nreco+1, self.ntruth)
+            values = self.counts_mc.values[self.mc_rows, :-1].reshape(shape)
+            sumw2 = self.counts_mc.sumw2[self.mc_rows, :-1].reshape(shape)
+        else:
+            shape = (-1, self.nreco, self.ntruth+1)
+            values = self.counts_reco.values[:, :-1].reshape(shape)
+            sumw2 = self.counts_reco.sumw2[:, :-1].reshape(shape)
+        return values, sumw2
+
+    def getReco(self):
+        values, sumw2 = self._getGrid()
+        return values.sum(axis=2), np.sqrt(sumw2.sum(axis=2))
+
+    def getTruth(self):
+        values, sumw2 = self._getGrid(mcweight=True)
+        return values.sum(axis=1), np.sqrt(sumw2.sum(axis=1))
+
+    def getResponse(self, mcweight=False):
+        values, sumw2 = self._getGrid(mcweight)
+        if mcweight:
+            values, sumw2 = values[:, :-1, :], sumw2[:, :-1, :]
+        else:
+            values, sumw2 = values[:, :, :-1], sumw2[:, :, :-1]
+        return values, np.sqrt(sumw2)
+
+    def getAcceptance(self, flow=True):
+        """
+        Fraction of reco events that pass the truth selection in each reco bin
+        """
+        resp, err_resp = self.getResponse()
+        reco, err_reco = self.getReco()
+        s = slice(None) if flow else slice(1, -1) # exclude the truth underflow and overflow bins
+        return divide(resp[:, :, s].sum(axis=2), reco, np.sqrt((err_resp[:, :, s]**2).sum(axis=2)), err_reco)
+
+    def getEfficiency(self, flow=True):
+        """
+        Fraction of truth events that pass the reco selection in each truth bin
+        """
+        resp, err_resp = self.getResponse(mcweight=True)
+        truth, err_truth = self.getTruth()
+        s = slice(None) if flow else slice(1, -1) # exclude the reco underflow and overflow bins
+        return divide(resp[:, s, :].sum(axis=1), truth, np.sqrt((err_resp[:, s, :]**2).sum(axis=1)), err_truth)
+
+    def getArrays(self):
+        """
+        Dictionary of histogram name -> (bin contents, bin errors)
+        """
+        return {
+            'reco': self.getReco(),
+            'truth': self.getTruth(),
+            'response': self.getResponse(),
+            'response_mcweight': self.getResponse(mcweight=True),
+            'acceptance': self.getAcceptance(flow=True),
+            'acceptance_noflow': self.getAcceptance(flow=False),
+            'efficiency': self.getEfficiency(flow=True),
+            'efficiency_noflow': self.getEfficiency(flow=False)
+        }
+
+    def toROOT(self):
+        """
+        Dictionary of histogram name -> ROOT histogram
+        Histograms of weight variations other than the nominal have the variation name as suffix.
+        """
+        import ROOT
+
+        vnames = {}
+        for level in ['reco', 'truth']:
+            vnames[level] = '_vs_'.join(
+                obsConfig_dict[ob][level] + ('_abs' if ob.endswith('_abs') else '') for ob in getObservableComponents(self.observable))
+        vname_reco, vname_truth = vnames['reco'], vnames['truth']
+
+        hists = {}
+        for hname, (values_all, errors_all) in self.getArrays().items():
+            for ivar, varname in enumerate(self.variations):
+                values, errors = values_all[ivar], errors_all[ivar]
+                suffix = '' if ivar == 0 else f"_{varname}"
+
+                if values.ndim == 2:
+                    h = ROOT.TH2D(f"h2d_{self.observable}_{hname}{suffix}", "", len(self.edges_reco)-1, self.edges_reco, len(self.edges_truth)-1, self.edges_truth)
+                    h.GetXaxis().SetTitle(vname_reco)
+                    h.GetYaxis().SetTitle(vname_truth)
+                    # ROOT global bin = ix + (nx+2) * iy
+                    values, errors = values.T, errors.T
+                else:
+                    edges = self.edges_truth if hname.startswith('truth') or hname.startswith('efficiency') else self.edges_reco
+                    h = ROOT.TH1D(f"h_{self.observable}_{hname}{suffix}", "", len(edges)-1, edges)
+                    h.GetXaxis().SetTitle(vname_truth if edges is self.edges_truth else vname_reco)
+
+                h.Sumw2()
+                for ibin, (v, e) in enumerate(zip(values.ravel(), errors.ravel())):
+                    h.SetBinContent(ibin, v)
+                    h.SetBinError(ibin, e)
+                h.SetEntries(h.GetEffectiveEntries())
+                hists[f"{hname}{suffix}"] = h
+
+        return hists
+
+def buildResponses(
+    files_reco,
+    binning_config,
+    observables = default_observables,
+    files_truth = None,
+    chunk_size = 2**20,
+    weight_name = 'normalized_weight',
+    weight_mc_name = 'normalized_weight_mc',
+    weight_variations = False,
+    sumw_variations = None
+    ):
+    """ Fill the response histograms of observables from the NtupleRDF outputs
+    ______
+    Arguments
+    files_reco: list of str; paths to the <name>_ljets.h5 files
+    binning_config: str; json file of the bin edges of each observable
+    observables: list of str; observable names in obsConfig_dict, or multi-dimensional
+                 observables of them e.g. ptt_vs_mtt
+    files_truth: list of str; paths to the unmatched truth files. Default: the
+                 <name>_ljets_unmatched_truth.h5 files next to the reco files
+    chunk_size: int; number of events read at a time
+    weight_name, weight_mc_name: str; names of the reco-level and truth-level event weights
+    weight_variations: bool or list of str; if True, fill all scale factor and generator
+                       weight variations found in the first reco file, or only the listed columns
+    sumw_variations: dict or str; sum weight variations written by computeSumWeights.py or
+                     path to its sumWeights_variations yaml. If provided, each generator weight
+                     variation is normalized with its own sum of weights instead of the nominal one
+
+    Return
+    A dictionary: observable -> ResponseHistograms
+    """
+    with open(binning_config) as f:
+        bins_d = json.load(f)
+
+    if files_truth is None:
+        files_truth = [f for f in (getUnmatchedTruthFile(fr) for fr in files_reco) if f]
+
+    # weight variations: list of (variation column, nominal column)
+    variations = []
+    if weight_variations and files_reco:
+        with h5py.File(files_reco[0], 'r') as f:
+            variations = getWeightVariations(list(f.keys()))
+        if not weight_variations is True:
+            variations = [v for v in variations if v[0] in weight_variations]
+        logger.info(f"Number of weight variations: {len(variations)}")
+
+    varnames = ['nominal'] + [v[0] for v in variations]
+    cols_variations = sorted(set(c for v in variations for c in v))
+
+    # only generator weight variations change the mc weights
+    variations_mc = [v for v in variations if v[1] == 'weight_mc']
+
+    # columns to look up the sum of weights of each generator weight variation
+    cols_sumw = []
+    if variations_mc:
+        if sumw_variations is None:
+            logger.warning("No sum weight variations provided. Generator weight variations are normalized with the nominal sum of weights")
+        else:
+            if isinstance(sumw_variations, str):
+                sumw_variations = read_config(sumw_variations)
+            weight_index = compileWeightIndex(sumw_variations)
+            cols_sumw = ['sum_weights', 'mcChannelNumber', 'runNumber']
+
+    def getScales(arrays):
+        if not cols_sumw:
+            return {}
+        return {v: getSumWeightsScale(arrays, v, sumw_variations, weight_index) for v, _ in variations_mc}
+    mc_rows = [0] + [1 + variations_mc.index(v) if v in variations_mc else 0 for v in variations]
+
+    histograms = {}
+    for ob in observables:
+        if not isConfigured(ob) or not ob in bins_d:
+            logger.warning(f"Observable {ob} is not configured. Skip...")
+            continue
+        histograms[ob] = ResponseHistograms(ob, bins_d[ob], variations=varnames, mc_rows=mc_rows)
+
+    vnames_reco = [v for ob in histograms for v in getVariableNames(ob, 'reco')]
+    vnames_truth = [v for ob in histograms for v in getVariableNames(ob, 'truth')]
+    flags = ['pass_truth', 'isMatched', weight_name, weight_mc_name]
+
+    tstart = time.time()
+    nevents = 0
+
+    # reco-level events
+    for arrays in iterChunks(files_reco, sorted(set(vnames_reco + vnames_truth + flags + cols_variations + cols_sumw)), chunk_size, optional_columns=['pass_reco']):
+        sel_reco = arrays['pass_reco'].astype(bool) if 'pass_reco' in arrays else np.ones(len(arrays[weight_name]), dtype=bool)
+        sel_truth = arrays['pass_truth'].astype(bool) & arrays['isMatched'].astype(bool)
+
+        # weights of all variations, computed once for all observables
+        scales = getScales(arrays)
+        weights = getWeightMatrix(arrays, weight_name, variations, scales)
+        weights_mc = getWeightMatrix(arrays, weight_mc_name, variations_mc, scales)
+
+        for hists in histograms.values():
+            hists.fillReco(arrays, sel_reco, sel_truth, weights, weights_mc)
+
+        nevents += len(sel_reco)
+
+    # truth-level events that are not matched to reco-level events
+    cols_truth = sorted(set(vnames_truth + ['pass_truth', weight_mc_name] + cols_sumw))
+    for arrays in iterChunks(files_truth, cols_truth, chunk_size, optional_columns=cols_variations):
+        sel_truth = arrays['pass_truth'].astype(bool)
+        weights_mc = getWeightMatrix(arrays, weight_mc_name, variations_mc, getScales(arrays))
+
+        for hists in histograms.values():
+            hists.fillTruth(arrays, sel_truth, weights_mc)
+
+        nevents += len(sel_truth)
+
+    logger.info(f"Processed {nevents} events in {time.time()-tstart:.2f} seconds")
+
+    return histograms
+
+def writeResponses(histograms, output):
+    """
+    Write the histograms to a ROOT file, or to a npz file if the output name ends with '.npz'
+    """
+    logger.info(f"Write histograms to {output}")
+
+    if output.endswith('.npz'):
+        arrays = {}
+        for ob, hists in histograms.items():
+            arrays[f"{ob}/edges_reco"] = hists.edges_reco
+            arrays[f"{ob}/edges_truth"] = hists.edges_truth
+            arrays[f"{ob}/variations"] = np.array(hists.variations)
+            for hname, (values, errors) in hists.getArrays().items():
+                arrays[f"{ob}/{hname}"] = values
+                arrays[f"{ob}/{hname}_err"] = errors
+        np.savez(output, **arrays)
+    else:
+        import ROOT
+        outfile = ROOT.TFile(output, "recreate")
+        for ob, hists in histograms.items():
+            subdir = outfile.mkdir(ob)
+            subdir.cd()
+            for h in hists.toROOT().values():
+                h.Write()
+        outfile.Close()
+
+if __name__ == "__main__":
+
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+
+    parser.add_argument("inputs", nargs='+', type=str,
+                        help="NtupleRDF outputs <name>_ljets.h5")
+    parser.add_argument("-o", "--output", type=str, default="responses.root",
+                        help="Output file name. Write numpy arrays if it ends with '.npz'")
+    parser.add_argument("-b", "--binning-config", type=str,
+                        help="Binning config. Default: configs/deprecated/binning/bins_ttdiffxs_run2_ljets.json")
+    parser.add_argument("-s", "--observables", nargs='+', default=default_observables,
+                        help="Observables, including multi-dimensional ones e.g. ptt_vs_mtt")
+    parser.add_argument("-c", "--chunk-size", type=int, default=2**20,
+                        help="Number of events read at a time")
+    parser.add_argument("-w", "--weight-variations", nargs='*',
+                        help="Fill the weight variations with these column names, or all of them if no name is given")
+    parser.add_argument("--sumweight-variations", type=str,
+                        help="sumWeights_variations yaml written by computeSumWeights.py to normalize each generator weight variation with its own sum of weights")
+    parser.add_argument("-v", "--verbose", action='store_true',
+                        help="If True, set logging level to DEBUG")
+
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        format='%(asctime)s %(levelname)-7s %(name)-10s %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S',
+        level=logging.DEBUG if args.verbose else logging.INFO
+        )
+
+    binning_config = args.binning_config
+    if binning_config is None:
+        srcdir = os.getenv('SourceDIR', os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+        binning_config = os.path.join(srcdir, 'configs/deprecated/binning/bins_ttdiffxs_run2_ljets.json')
+
+    histograms = buildResponses(
+        [f for f in args.inputs if not f.endswith('_unmatched_truth.h5')],
+        binning_config,
+        observables = args.observables,
+        chunk_size = args.chunk_size,
+        weight_variations = (args.weight_variations or True) if args.weight_variations is not None else False,
+        sumw_variations = args.sumweight_variations
+        )
+
+    writeResponses(histograms, args.output)
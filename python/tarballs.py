@@ -0,0 +1,190 @@
+"""
+Incremental uncompressed tarballs with a member index
+
+Next to each archive <name>.tar, an index <name>.tar.index.json records for
+every member the offset and size of its data in the archive and the size and
+mtime of the source file when it was added. With the index:
+  - updating an archive only appends the files that are new or changed since the
+    last update, as `tar --update` does; the index points to the latest copy.
+    The archive is rebuilt if files were removed or too much of it is outdated.
+  - a single member can be read by seeking to its offset, without scanning the archive.
+"""
+import os
+import json
+import time
+import gzip
+import shutil
+import tarfile
+import subprocess
+
+import logging
+logger = logging.getLogger(__name__)
+
+index_suffix = '.index.json'
+
+def getIndexName(tarfile_name):
+    return tarfile_name + index_suffix
+
+def getSourceStamp(fpath):
+    st = os.stat(fpath)
+    return {'size': st.st_size, 'mtime': st.st_mtime_ns}
+
+def readIndex(tarfile_name, fname_index=None):
+    """
+    Read the index of an archive, by default next to it. Return None if there is
+    no index or if it does not match the archive.
+    """
+    try:
+        with open(fname_index or getIndexName(tarfile_name)) as f:
+            index = json.load(f)
+        size = os.path.getsize(tarfile_name)
+    except (OSError, ValueError):
+        return None
+
+    if index.get('archive_size') != size:
+        logger.debug(f"Index of {tarfile_name} is outdated")
+        return None
+
+    return index
+
+def writeIndex(tarfile_name, index, fname_index=None):
+    fname_index = fname_index or getIndexName(tarfile_name)
+    ftmp = f"{fname_index}.{os.getpid()}.tmp"
+    with open(ftmp, 'w') as f:
+        json.dump(index, f, indent=1)
+    os.replace(ftmp, fname_index)
+
+def _addMembers(tar, members, index):
+    """
+    Add files to an open archive and record the offsets of their data in the index
+    members: list of (source path, name in the archive)
+    """
+    for fullname, arcname in members:
+        logger.debug(f" {fullname} --> {arcname}")
+        stamp = getSourceStamp(fullname)
+        tar.add(fullname, arcname=arcname)
+
+        # the data is written last, padded to a multiple of the block size
+        size = tar.members[-1].size
+        padded = -(-size // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+        index['members'][arcname] = {'offset': tar.offset - padded, 'size': size, 'source': stamp}
+
+    index['end'] = tar.offset
+
+def updateTarball(tarfile_name, members, rebuild=False, max_outdated_fraction=0.5):
+    """ Bring an archive up to date with a list of files
+    ______
+    Arguments
+    tarfile_name: str; path to the archive
+    members: list of (source path, name in the archive)
+    rebuild: bool; if True, rebuild the archive from scratch
+    max_outdated_fraction: float; rebuild if more than this fraction of the archive
+                           would be outdated copies of changed files
+
+    Return
+    Number of files written to the archive
+    """
+    members = list(dict((arcname, (fullname, arcname)) for fullname, arcname in members).values())
+    wanted = set(arcname for _, arcname in members)
+
+    index = None if rebuild else readIndex(tarfile_name)
+
+    if index is not None:
+        removed = [a for a in index['members'] if not a in wanted]
+        todo = [(f, a) for f, a in members if index['members'].get(a, {}).get('source') != getSourceStamp(f)]
+
+        outdated = sum(index['members'][a]['size'] for _, a in todo if a in index['members']) + index.get('outdated', 0)
+        if removed:
+            logger.info(f"{len(removed)} files were removed from the inputs of {tarfile_name}. Rebuild")
+            index = None
+        elif outdated > max_outdated_fraction * index['end']:
+            logger.info(f"More than {max_outdated_fraction*100:.0f}% of {tarfile_name} would be outdated. Rebuild")
+            index = None
+
+    tstart = time.time()
+
+    if index is None:
+        # write to a temporary file so that an interrupted build leaves the previous archive
+        index = {'members': {}, 'outdated': 0}
+        ftmp = f"{tarfile_name}.{os.getpid()}.tmp"
+        with tarfile.open(ftmp, 'w') as tar:
+            _addMembers(tar, members, index)
+        os.replace(ftmp, tarfile_name)
+        nadded = len(members)
+        logger.info(f"Built {tarfile_name} with {nadded} files in {time.time()-tstart:.1f} s")
+
+    elif todo:
+        index['outdated'] = outdated
+        end = index['end']
+        with open(tarfile_name, 'r+b') as f:
+            f.seek(end)
+            try:
+                # overwrite the end-of-archive blocks with the new members
+                with tarfile.open(fileobj=f, mode='w') as tar:
+                    _addMembers(tar, todo, index)
+            except BaseException:
+                # restore the previous end of the archive
+                f.seek(end)
+                f.write(bytes(2 * tarfile.BLOCKSIZE))
+                f.truncate()
+                raise
+            f.truncate()
+        nadded = len(todo)
+        logger.info(f"Appended {nadded} new or changed files to {tarfile_name} in {time.time()-tstart:.1f} s")
+
+    else:
+        logger.info(f"{tarfile_name} is up to date")
+        return 0
+
+    index['archive_size'] = os.path.getsize(tarfile_name)
+    writeIndex(tarfile_name, index)
+
+    return nadded
+
+def compressTarball(tarfile_name, nthreads=1):
+    """
+    Write <tarfile_name>.gz unless it is newer than the archive. Use pigz with nthreads if available.
+    Return the name of the compressed archive.
+    """
+    fname_gz = f"{tarfile_name}.gz"
+    if os.path.isfile(fname_gz) and os.path.getmtime(fname_gz) >= os.path.getmtime(tarfile_name):
+        logger.debug(f"{fname_gz} is up to date")
+        return fname_gz
+
+    tstart = time.time()
+    ftmp = f"{fname_gz}.{os.getpid()}.tmp"
+
+    pigz = shutil.which('pigz')
+    with open(ftmp, 'wb') as fout:
+        if pigz:
+            subprocess.run([pigz, '-p', str(nthreads), '-c', tarfile_name], stdout=fout, check=True)
+        else:
+            with open(tarfile_name, 'rb') as fin, gzip.GzipFile(fileobj=fout, mode='wb', compresslevel=6) as gz:
+                shutil.copyfileobj(fin, gz, 16*1024**2)
+
+    os.replace(ftmp, fname_gz)
+    logger.info(f"Compressed {tarfile_name} in {time.time()-tstart:.1f} s")
+
+    return fname_gz
+
+def extractMember(tarfile_name, arcname, output):
+    """
+    Copy one member of an indexed archive to output by seeking to its offset
+    """
+    index = readIndex(tarfile_name)
+    if index is None:
+        raise RuntimeError(f"No valid index of {tarfile_name}")
+
+    entry = index['members'].get(arcname)
+    if entry is None:
+        raise KeyError(f"{arcname} is not in {tarfile_name}")
+
+    with open(tarfile_name, 'rb') as fin, open(output, 'wb') as fout:
+        fin.seek(entry['offset'])
+        remaining = entry['size']
+        while remaining > 0:
+            block = fin.read(min(remaining, 16*1024**2))
+            if not block:
+                raise RuntimeError(f"Unexpected end of {tarfile_name} while reading {arcname}")
+            fout.write(block)
+            remaining -= len(block)
@@ -0,0 +1,248 @@
+"""
+Read the HDF5 outputs inside the archives of makeTarballs.py without extracting them
+
+The member index written with the archive (see tarballs.py) gives the offset of
+every member. If an archive has no valid index, one is built by scanning the
+tar headers once and cached next to the archive, or in ~/.cache/ntuplerTT if
+the archive directory is not writable.
+
+The archive is memory-mapped: contiguous columns are numpy views of the mapped
+archive, and other columns are read with h5py through a file object that
+reads the byte range of the member.
+
+  with TarballReader('nominal.tar') as reader:
+      names = reader.members('ttbar/nominal/mc16a/*_ljets.h5')
+      arrays = reader.read(names, columns=['normalized_weight', 'PseudoTop_Reco_ttbar_m'])
+"""
+import io
+import os
+import mmap
+import time
+import fnmatch
+import tarfile
+import hashlib
+
+import numpy as np
+import h5py
+
+from tarballs import readIndex, writeIndex
+from h5columns import getColumnLayout, isMappable, mapColumn
+
+import logging
+logger = logging.getLogger(__name__)
+
+def getCachedIndexName(tarfile_name):
+    key = hashlib.sha1(os.path.abspath(tarfile_name).encode()).hexdigest()[:16]
+    cache_dir = os.path.join(os.path.expanduser('~'), '.cache', 'ntuplerTT')
+    return os.path.join(cache_dir, f"{os.path.basename(tarfile_name)}.{key}.index.json")
+
+def scanTarball(tarfile_name):
+    """
+    Build the member index of an archive by reading its headers
+    """
+    tstart = time.time()
+    index = {'members': {}, 'outdated': 0}
+    with tarfile.open(tarfile_name, 'r:') as tar:
+        for member in tar:
+            if member.isfile():
+                # later copies of a member replace the earlier ones, as in tar extraction
+                index['members'][member.name] = {'offset': member.offset_data, 'size': member.size}
+        index['end'] = tar.offset
+    index['archive_size'] = os.path.getsize(tarfile_name)
+    logger.debug(f"Scanned {len(index['members'])} members of {tarfile_name} in {time.time()-tstart:.2f} s")
+    return index
+
+def getIndex(tarfile_name):
+    """
+    Member index of an archive: the one written with it, a cached one, or a new one built by scanning the archive
+    """
+    index = readIndex(tarfile_name)
+    if index is not None:
+        return index
+
+    fname_cache = getCachedIndexName(tarfile_name)
+    index = readIndex(tarfile_name, fname_cache)
+    if index is not None:
+        return index
+
+    logger.info(f"Build the member index of {tarfile_name}")
+    index = scanTarball(tarfile_name)
+
+    try:
+        writeIndex(tarfile_name, index)
+    except OSError:
+        os.makedirs(os.path.dirname(fname_cache), exist_ok=True)
+        writeIndex(tarfile_name, index, fname_cache)
+        logger.debug(f"Cached the index in {fname_cache}")
+
+    return index
+
+class MemberFile(io.RawIOBase):
+    """
+    Read-only file object of the byte range [offset, offset+size) of a buffer, e.g. an mmap of an archive
+    """
+    def __init__(self, buffer, offset, size):
+        self.view = memoryview(buffer)[offset:offset+size]
+        self.pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.pos
+
+    def seek(self, pos, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            self.pos = pos
+        elif whence == io.SEEK_CUR:
+            self.pos += pos
+        elif whence == io.SEEK_END:
+            self.pos = len(self.view) + pos
+        return self.pos
+
+    def readinto(self, b):
+        n = max(0, min(len(b), len(self.view) - self.pos))
+        b[:n] = self.view[self.pos:self.pos+n]
+        self.pos += n
+        return n
+
+    def close(self):
+        self.view.release()
+        super().close()
+
+class TarballReader():
+    """ Random access to the HDF5 members of an uncompressed archive
+    ______
+    Arguments
+    tarfile_name: str; path to the archive
+    """
+    def __init__(self, tarfile_name):
+        self.tarfile_name = tarfile_name
+        self.index = getIndex(tarfile_name)
+
+        self._file = open(tarfile_name, 'rb')
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # member name -> column layout
+        self._layouts = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        try:
+            self._mm.close()
+        except BufferError:
+            # arrays returned by read() still refer to the mapping, which is released with them
+            pass
+        self._file.close()
+
+    def members(self, pattern='*.h5'):
+        """
+        Names of the members matching a glob pattern
+        """
+        return [name for name in self.index['members'] if fnmatch.fnmatch(name, pattern)]
+
+    def _getEntry(self, name):
+        entry = self.index['members'].get(name)
+        if entry is None:
+            raise KeyError(f"{name} is not in {self.tarfile_name}")
+        return entry
+
+    def open(self, name):
+        """
+        h5py.File of a member, read in place
+        """
+        entry = self._getEntry(name)
+        return h5py.File(MemberFile(self._mm, entry['offset'], entry['size']), 'r')
+
+    def getLayout(self, name):
+        if not name in self._layouts:
+            with self.open(name) as f:
+                self._layouts[name] = getColumnLayout(f)
+        return self._layouts[name]
+
+    def readMember(self, name, columns=None):
+        """
+        Dictionary of column name -> array of one member. Contiguous columns are
+        read-only views of the mapped archive; the others are read with h5py.
+        """
+        entry = self._getEntry(name)
+        layout = self.getLayout(name)
+
+        if columns is None:
+            columns = list(layout)
+
+        missing = [c for c in columns if not c in layout]
+        if missing:
+            raise KeyError(f"Columns {missing} are not in {name}")
+
+        arrays = {}
+        unmapped = []
+        for c in columns:
+            if isMappable(layout[c]):
+                arrays[c] = mapColumn(self._mm, layout[c], entry['offset'])
+            else:
+                unmapped.append(c)
+
+        if unmapped:
+            with self.open(name) as f:
+                for c in unmapped:
+                    arrays[c] = f[c][:]
+
+        return arrays
+
+    def read(self, names, columns=None):
+        """
+        Dictionary of column name -> array concatenated over members.
+        A single member is returned without copying.
+        """
+        if isinstance(names, str):
+            names = [names]
+
+        per_member = [self.readMember(name, columns) for name in names]
+        if not per_member:
+            return {}
+        if len(per_member) == 1:
+            return per_member[0]
+
+        return {c: np.concatenate([arrs[c] for arrs in per_member]) for c in per_member[0]}
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="List or read the HDF5 members of an archive made by makeTarballs.py")
+
+    parser.add_argument("tarball", type=str,
+                        help="Uncompressed archive")
+    parser.add_argument("-p", "--pattern", type=str, default='*.h5',
+                        help="Glob pattern of the members")
+    parser.add_argument("-c", "--columns", nargs='+', type=str,
+                        help="Columns to read. If not provided, list the members")
+    parser.add_argument("-v", "--verbose", action='store_true',
+                        help="If True, set logging level to DEBUG, otherwise INFO")
+
+    args = parser.parse_args()
+
+    logging.basicConfig(format='%(asctime)s %(levelname)-7s %(name)-10s %(message)s')
+    logger.setLevel(logging.DEBUG if args.verbose else logging.INFO)
+
+    with TarballReader(args.tarball) as reader:
+        names = reader.members(args.pattern)
+
+        if not args.columns:
+            for name in names:
+                print(f"{reader.index['members'][name]['size']:>12}  {name}")
+        else:
+            tstart = time.time()
+            arrays = reader.read(names, args.columns)
+            nevents = len(next(iter(arrays.values()))) if arrays else 0
+            logger.info(f"Read {len(args.columns)} columns of {nevents} events from {len(names)} members in {(time.time()-tstart)*1000:.1f} ms")
+            for c, arr in arrays.items():
+                print(f"{c}: {arr.dtype} {arr[:5]} ...")
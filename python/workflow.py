@@ -0,0 +1,224 @@
+"""
+A make-like runner of workflow steps
+
+Each step declares the steps it depends on, its inputs and its outputs. Instead
+of comparing modification times, a step is stale if one of its outputs is
+missing or if the signature of its inputs differs from the one recorded the last
+time it succeeded. Inputs can be files (fingerprinted by their content) or
+values, e.g. the part of a config that concerns the step, so that a change in
+one entry of a shared config only makes the steps using that entry stale.
+
+Steps whose dependencies are done run in parallel in a thread pool. Steps that
+share a lock name run one at a time, e.g. steps writing the same file.
+"""
+import os
+import json
+import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import logging
+logger = logging.getLogger(__name__)
+
+def fingerprintFile(fpath, max_hash_size=64*1024**2):
+    """
+    Fingerprint of a file: the hash of its content, or of its size and modification
+    time if it is larger than max_hash_size. None if the file does not exist.
+    """
+    if not os.path.isfile(fpath):
+        return None
+
+    st = os.stat(fpath)
+    if st.st_size > max_hash_size:
+        return f"{st.st_size}:{st.st_mtime_ns}"
+
+    h = hashlib.sha1()
+    with open(fpath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024**2), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def fingerprintValue(value):
+    return hashlib.sha1(json.dumps(value, sort_keys=True, default=str).encode()).hexdigest()
+
+class Step():
+    """ A step of the workflow
+    ______
+    Arguments
+    name: str; unique name of the step
+    action: callable taking no argument; raises an exception if the step fails
+    deps: list of str; names of the steps to be done before this one
+    inputs: callable returning a dict of input name -> file path or value.
+            It is evaluated when the dependencies are done, so it can read their outputs.
+            Strings that are paths to existing files are fingerprinted by their content.
+    outputs: list of str; paths of the output files, or a callable returning them
+    lock: str; steps with the same lock run one at a time
+    """
+    def __init__(self, name, action, deps=[], inputs=None, outputs=[], lock=None):
+        self.name = name
+        self.action = action
+        self.deps = list(deps)
+        self.inputs = inputs
+        self.outputs = outputs
+        self.lock = lock
+
+    def getOutputs(self):
+        return self.outputs() if callable(self.outputs) else self.outputs
+
+    def signature(self):
+        inputs = self.inputs() if self.inputs else {}
+        fingerprints = {}
+        for k, v in inputs.items():
+            if isinstance(v, str) and os.path.isfile(v):
+                fingerprints[k] = fingerprintFile(v)
+            else:
+                fingerprints[k] = fingerprintValue(v)
+        return fingerprintValue(fingerprints)
+
+class WorkflowState():
+    """
+    Signatures of the steps that succeeded, in a JSON file
+    """
+    def __init__(self, filename):
+        self.filename = filename
+        self.signatures = {}
+        if os.path.isfile(filename):
+            with open(filename) as f:
+                self.signatures = json.load(f)
+
+    def save(self):
+        dirname = os.path.dirname(self.filename)
+        if dirname and not os.path.isdir(dirname):
+            os.makedirs(dirname)
+        ftmp = f"{self.filename}.{os.getpid()}.tmp"
+        with open(ftmp, 'w') as f:
+            json.dump(self.signatures, f, indent=1, sort_keys=True)
+        os.replace(ftmp, self.filename)
+
+class Workflow():
+    def __init__(self, state_file):
+        self.steps = {}
+        self.state = WorkflowState(state_file)
+
+    def add(self, step):
+        if step.name in self.steps:
+            raise RuntimeError(f"Duplicate step {step.name}")
+        self.steps[step.name] = step
+        return step
+
+    def getSelected(self, targets=None):
+        """
+        Names of the target steps and all the steps they depend on
+        """
+        if not targets:
+            return set(self.steps)
+
+        selected = set()
+        todo = list(targets)
+        while todo:
+            name = todo.pop()
+            if name in selected:
+                continue
+            if not name in self.steps:
+                raise RuntimeError(f"Unknown step {name}")
+            selected.add(name)
+            todo += self.steps[name].deps
+        return selected
+
+    def isStale(self, step, signature):
+        if self.state.signatures.get(step.name) != signature:
+            return True
+        return any(not os.path.exists(o) for o in step.getOutputs())
+
+    def run(self, targets=None, max_workers=4, dry_run=False, force=False, keep_going=False):
+        """ Run the stale steps among the targets and their dependencies
+        ______
+        Arguments
+        targets: list of str; names of the steps to bring up to date. All steps if None
+        max_workers: int; max number of steps running at the same time
+        dry_run: bool; if True, only report the stale steps. Steps depending on a
+                 stale step are reported as stale without evaluating their inputs
+        force: bool; if True, run the steps even if they are up to date
+        keep_going: bool; if True, keep running the steps that do not depend on a failed step
+
+        Return
+        dictionary: step name -> 'uptodate', 'done', 'failed', 'skipped' or 'stale' (dry run)
+        """
+        selected = self.getSelected(targets)
+        for name in selected:
+            for d in self.steps[name].deps:
+                if not d in self.steps:
+                    raise RuntimeError(f"Step {name} depends on unknown step {d}")
+
+        results = {}
+        locks = {}
+        state_lock = threading.Lock()
+
+        def execute(step):
+            lock = locks.setdefault(step.lock, threading.Lock()) if step.lock else None
+            if lock:
+                lock.acquire()
+            try:
+                signature = step.signature()
+                if not force and not self.isStale(step, signature):
+                    return 'uptodate'
+
+                if dry_run:
+                    return 'stale'
+
+                logger.info(f"Run {step.name}")
+                tstart = time.time()
+                step.action()
+                logger.info(f"Done {step.name} ({time.time()-tstart:.0f} s)")
+
+                # inputs may be outputs of the step itself e.g. a file updated in place
+                with state_lock:
+                    self.state.signatures[step.name] = step.signature()
+                    self.state.save()
+                return 'done'
+            finally:
+                if lock:
+                    lock.release()
+
+        pending = set(selected)
+        running = {}
+        failed = False
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while pending or running:
+                # submit the steps whose dependencies are finished
+                for name in sorted(pending):
+                    step = self.steps[name]
+                    dep_results = [results.get(d) for d in step.deps]
+                    if any(r is None for r in dep_results):
+                        continue
+
+                    pending.discard(name)
+                    if any(r in ['failed', 'skipped'] for r in dep_results) or (failed and not keep_going):
+                        results[name] = 'skipped'
+                    elif dry_run and any(r == 'stale' for r in dep_results):
+                        results[name] = 'stale'
+                    else:
+                        running[executor.submit(execute, step)] = name
+
+                if not running:
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        logger.error(f"Step {name} failed: {e}")
+                        results[name] = 'failed'
+                        failed = True
+
+        return results
+
+def summarizeResults(results):
+    counts = {}
+    for r in results.values():
+        counts[r] = counts.get(r, 0) + 1
+    return ', '.join(f"{n} {r}" for r, n in sorted(counts.items()))
@@ -0,0 +1,230 @@
+"""
+SQLite queue of processing units shared by long-lived workers
+
+A unit is one array task of a job file: the command line arguments of
+processMiniNtuples.py, i.e. the input lists, the tree name and the options.
+Workers started with processMiniNtuples.py --worker <queue.db> claim units one
+at a time and record their completion in a transaction. The transactions rely on
+POSIX advisory file locks: several workers on different nodes can share one queue
+only on a file system whose locks are coherent across the nodes (e.g. NFS with a
+working lock manager, Lustre mounted with -o flock); otherwise keep the workers on
+one node or the queue on a local disk. The default rollback journal is used since
+SQLite's write-ahead log needs shared memory between the processes and does not
+work over a network file system.
+  python python/workqueue.py <queue.db> status
+  python python/workqueue.py <queue.db> requeue --failed --stale 4
+"""
+import os
+import json
+import time
+import socket
+import sqlite3
+from contextlib import contextmanager
+
+schema = """
+CREATE TABLE IF NOT EXISTS units (
+    id INTEGER PRIMARY KEY,
+    jobfile TEXT,
+    arrayid INTEGER,
+    args TEXT NOT NULL, -- json list of arguments of processMiniNtuples.py
+    cost REAL, -- predicted processing time in seconds
+    status TEXT DEFAULT 'pending', -- pending, running, done, failed
+    worker TEXT,
+    attempts INTEGER DEFAULT 0,
+    exit_code INTEGER,
+    claimed REAL,
+    heartbeat REAL,
+    finished REAL,
+    UNIQUE (jobfile, arrayid)
+);
+CREATE INDEX IF NOT EXISTS idx_units_status ON units (status);
+"""
+
+def getWorkerName():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+class WorkQueue():
+    def __init__(self, filename, timeout=120.):
+        self.filename = filename
+        self.conn = sqlite3.connect(filename, timeout=timeout, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        # also switches back queues created in WAL mode, which persists in the file
+        self.conn.execute("PRAGMA journal_mode=DELETE")
+        self.conn.executescript(schema)
+
+    def close(self):
+        self.conn.close()
+
+    @contextmanager
+    def transaction(self):
+        # take the write lock at the beginning so that two workers never claim the same unit
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self.conn
+        except:
+            self.conn.execute("ROLLBACK")
+            raise
+        else:
+            self.conn.execute("COMMIT")
+
+    def addUnits(self, units, reset=False):
+        """ Add units to the queue
+        ______
+        Arguments
+        units: list of dict with keys 'args', and optionally 'jobfile', 'arrayid', 'cost'
+        reset: bool; if True, units already in the queue are set back to pending
+
+        Return
+        number of units added or reset
+        """
+        n = 0
+        with self.transaction() as c:
+            for u in units:
+                cur = c.execute("INSERT OR IGNORE INTO units (jobfile, arrayid, args, cost) VALUES (?,?,?,?)",
+                                (u.get('jobfile'), u.get('arrayid'), json.dumps(u['args']), u.get('cost')))
+                if cur.rowcount == 0 and reset:
+                    cur = c.execute("UPDATE units SET args=?, cost=?, status='pending', worker=NULL, exit_code=NULL WHERE jobfile=? AND arrayid=?",
+                                    (json.dumps(u['args']), u.get('cost'), u.get('jobfile'), u.get('arrayid')))
+                n += cur.rowcount
+        return n
+
+    def claim(self, worker=None):
+        """
+        Claim the next pending unit, the most expensive first.
+        Return a dict with keys 'id', 'jobfile', 'arrayid', 'args', or None if no unit is pending.
+        """
+        worker = worker or getWorkerName()
+        now = time.time()
+        with self.transaction() as c:
+            row = c.execute("SELECT id, jobfile, arrayid, args FROM units WHERE status='pending' ORDER BY cost DESC, id LIMIT 1").fetchone()
+            if row is None:
+                return None
+            c.execute("UPDATE units SET status='running', worker=?, attempts=attempts+1, claimed=?, heartbeat=? WHERE id=?",
+                      (worker, now, now, row['id']))
+
+        unit = dict(row)
+        unit['args'] = json.loads(unit['args'])
+        return unit
+
+    def heartbeat(self, unit_id, worker=None):
+        """
+        Mark a unit claimed by worker as alive. Return False if the worker no longer holds the claim.
+        """
+        worker = worker or getWorkerName()
+        with self.transaction() as c:
+            cur = c.execute("UPDATE units SET heartbeat=? WHERE id=? AND status='running' AND worker=?", (time.time(), unit_id, worker))
+            return cur.rowcount > 0
+
+    def complete(self, unit_id, exit_code, worker=None):
+        """
+        Record the end of a unit claimed by worker: done if exit_code is 0, otherwise failed.
+        Return False if the unit was requeued and claimed by another worker meanwhile, in which case it is left untouched.
+        """
+        worker = worker or getWorkerName()
+        with self.transaction() as c:
+            cur = c.execute("UPDATE units SET status=?, exit_code=?, finished=? WHERE id=? AND worker=?",
+                            ('done' if exit_code == 0 else 'failed', exit_code, time.time(), unit_id, worker))
+            return cur.rowcount > 0
+
+    def beatUntilDone(self, unit_id, worker, interval, parent_pid):
+        """
+        Send heartbeats of a unit every interval seconds as long as the process parent_pid
+        running it is alive and holds the claim. Run in a separate process, as the
+        event loop of the unit does not release the GIL for a heartbeat thread.
+        """
+        while os.getppid() == parent_pid:
+            if not self.heartbeat(unit_id, worker):
+                break
+            time.sleep(interval)
+
+    def requeue(self, failed=False, stale=None, max_attempts=None):
+        """ Set units back to pending
+        ______
+        Arguments
+        failed: bool; if True, requeue the failed units
+        stale: float; requeue the running units without a heartbeat for this many seconds,
+               e.g. the worker was killed
+        max_attempts: int; do not requeue units that have been attempted this many times
+
+        Return
+        number of units requeued
+        """
+        conditions = []
+        params = []
+        if failed:
+            conditions.append("status='failed'")
+        if stale:
+            conditions.append("(status='running' AND heartbeat<?)")
+            params.append(time.time() - stale)
+        if not conditions:
+            return 0
+
+        sql = f"UPDATE units SET status='pending', worker=NULL WHERE ({' OR '.join(conditions)})"
+        if max_attempts:
+            sql += " AND attempts<?"
+            params.append(max_attempts)
+
+        with self.transaction() as c:
+            return c.execute(sql, params).rowcount
+
+    def counts(self):
+        """
+        Number of units by status
+        """
+        return {row['status']: row['n'] for row in self.conn.execute("SELECT status, COUNT(*) AS n FROM units GROUP BY status")}
+
+    def listUnits(self, status=None):
+        sql = "SELECT id, jobfile, arrayid, status, worker, attempts, exit_code, claimed, finished FROM units"
+        params = []
+        if status:
+            sql += " WHERE status=?"
+            params.append(status)
+        return [dict(row) for row in self.conn.execute(sql + " ORDER BY id", params)]
+
+if __name__ == "__main__":
+
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+
+    parser.add_argument("queue", type=str, help="Work queue")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    p_status = subparsers.add_parser('status', help="Number of units by status")
+    p_status.add_argument("-l", "--list", choices=['pending', 'running', 'done', 'failed'],
+                          help="List the units with this status")
+
+    p_requeue = subparsers.add_parser('requeue', help="Set failed or stale units back to pending")
+    p_requeue.add_argument("--failed", action='store_true',
+                           help="Requeue the failed units")
+    p_requeue.add_argument("--stale", type=float,
+                           help="Requeue the running units without a heartbeat for this many hours")
+    p_requeue.add_argument("--max-attempts", type=int,
+                           help="Do not requeue units attempted this many times")
+
+    p_beat = subparsers.add_parser('heartbeat', help="Send heartbeats of a unit while the parent process runs it. Started by the workers")
+    p_beat.add_argument("unit_id", type=int, help="Unit id")
+    p_beat.add_argument("--worker", type=str, required=True,
+                        help="Worker holding the claim")
+    p_beat.add_argument("--interval", type=float, default=60.,
+                        help="Seconds between heartbeats")
+
+    args = parser.parse_args()
+
+    queue = WorkQueue(args.queue)
+
+    if args.command == 'status':
+        for status, n in sorted(queue.counts().items()):
+            print(f"{status:<10} {n}")
+        if args.list:
+            for u in queue.listUnits(args.list):
+                print(f"{u['id']:>6} {u['jobfile'] or ''} [{u['arrayid']}] {u['worker'] or ''} attempts={u['attempts']} exit_code={u['exit_code']}")
+
+    elif args.command == 'requeue':
+        n = queue.requeue(args.failed, args.stale * 3600 if args.stale else None, args.max_attempts)
+        print(f"Requeued {n} units")
+
+    elif args.command == 'heartbeat':
+        queue.beatUntilDone(args.unit_id, args.worker, args.interval, os.getppid())
+
+    queue.close()
@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Analyze batch job logs <jobid>_<arrayid>.out
+
+Logs are read from the end. Failed jobs are classified based on the messages
+near the end of the logs, and the number of processed events, throughput, peak
+memory and processing time are extracted from the output of processMiniNtuples.py.
+"""
+import os
+import re
+
+# Failure classes in the order of precedence
+# e.g. a MemoryError traceback is classified as 'oom' rather than 'python_exception'
+failure_patterns = {
+    'oom': [
+        r'oom[-_ ]kill',
+        r'Out Of Memory',
+        r'Exceeded (job|step) memory limit',
+        r'MemoryError',
+        r'std::bad_alloc',
+        r'job killed: mem',
+    ],
+    'walltime': [
+        r'DUE TO TIME LIMIT',
+        r'job killed: walltime',
+        r'walltime \d+ exceeded limit',
+    ],
+    'missing_input': [
+        r'FileNotFoundError',
+        r'No such file or directory',
+        r'Error in <TFile::TFile>: file .* does not exist',
+        r'Error in <TNetXNGFile::Open>',
+        r'Failed to stage input files',
+        r'\[ERROR\] Server responded with an error',
+    ],
+    'root_error': [
+        r'\*\*\* Break \*\*\*',
+        r'segmentation violation',
+        r'Error in <',
+        r'cling::InvalidDerefException',
+        r'terminate called after throwing',
+    ],
+    'python_exception': [
+        r'Traceback \(most recent call last\)',
+    ],
+}
+
+failure_regex = {k: re.compile('|'.join(v)) for k, v in failure_patterns.items()}
+
+re_exit_code = re.compile(r'exit code (-?\d+)')
+re_events = re.compile(r'([\d.]+(?:e[+-]?\d+)?)\s*([kMG]?)\s*(?:evts?|events)\b(?!/)')
+re_rate = re.compile(r'([\d.]+(?:e[+-]?\d+)?)\s*([kMG]?)\s*(?:evts?|events)/s')
+re_total_events = re.compile(r'Total number of events: (\d+)')
+re_proc_time = re.compile(r'Total processing time: ([\d.]+) seconds')
+re_peak_mem = re.compile(r'Maximum resident set size: ([\d.]+) MB')
+
+unit_prefix = {'': 1., 'k': 1e3, 'M': 1e6, 'G': 1e9}
+
+def readTail(logname, nbytes=256*1024):
+    """
+    Read the last nbytes of a log and return its lines.
+    Progress bar updates separated by carriage returns are split into lines.
+    """
+    with open(logname, 'rb') as flog:
+        flog.seek(0, os.SEEK_END)
+        size = flog.tell()
+        flog.seek(max(0, size-nbytes))
+        tail = flog.read().decode('utf-8', errors='replace')
+
+    if size > nbytes:
+        # drop the first partial line
+        tail = tail.split('\n', 1)[-1]
+
+    return re.split(r'[\r\n]+', tail)
+
+def classifyFailure(lines):
+    """
+    Return the failure class and the line that matches it, or (None, None)
+    """
+    for fclass, regex in failure_regex.items():
+        # search from the end
+        for line in reversed(lines):
+            if regex.search(line):
+                return fclass, line.strip()
+
+    return None, None
+
+def verifyLogs(logname):
+    """
+    Check the event counters in the progress output never go backwards within a run
+    """
+    nevents = 0
+    with open(logname, 'r', errors='replace') as flog:
+        for line in flog:
+            for segment in line.split('\r'):
+                if "Construct RDataFrame" in segment:
+                    # a new event loop
+                    nevents = 0
+                    continue
+
+                m = re_events.search(segment)
+                if not m:
+                    continue
+
+                nevt_cur = float(m.group(1)) * unit_prefix[m.group(2)]
+                if nevt_cur < nevents:
+                    # something is wrong
+                    return False
+                nevents = nevt_cur
+
+    return True
+
+def analyzeLog(logname, verify=False, nbytes=256*1024):
+    """ Analyze one job log
+    ______
+    Arguments
+    logname: str; path to the log
+    verify: bool; if True, also stream through the whole log to check the progress output
+    nbytes: int; number of bytes at the end of the log to look at
+
+    Return
+    A dictionary with keys:
+      'exit_code': int or None if the log does not end with an exit code
+      'status': 'success', 'failed' or 'incomplete'
+      'failure': failure class or None
+      'message': the log line the failure class is based on
+      'events': number of events processed in the last event loop
+      'throughput': events per second
+      'processing_time': seconds
+      'peak_memory': MB
+      'consistent': result of verifyLogs if verify is True
+    """
+    lines = readTail(logname, nbytes)
+
+    result = {
+        'exit_code': None,
+        'status': 'incomplete',
+        'failure': None,
+        'message': None,
+        'events': None,
+        'throughput': None,
+        'processing_time': None,
+        'peak_memory': None,
+    }
+
+    # exit code from the last non-empty line
+    for line in reversed(lines):
+        if not line.strip():
+            continue
+        m = re_exit_code.search(line)
+        if m:
+            result['exit_code'] = int(m.group(1))
+        break
+
+    # the exit code line may be followed by messages from the batch system
+    if result['exit_code'] is None:
+        for line in reversed(lines):
+            m = re_exit_code.search(line)
+            if m:
+                result['exit_code'] = int(m.group(1))
+                break
+
+    # progress and resource usage
+    for line in reversed(lines):
+        if result['events'] is None:
+            m = re_events.search(line)
+            if m:
+                result['events'] = float(m.group(1)) * unit_prefix[m.group(2)]
+        if result['throughput'] is None:
+            m = re_rate.search(line)
+            if m:
+                result['throughput'] = float(m.group(1)) * unit_prefix[m.group(2)]
+        if result['processing_time'] is None:
+            m = re_proc_time.search(line)
+            if m:
+                result['processing_time'] = float(m.group(1))
+        if result['peak_memory'] is None:
+            m = re_peak_mem.search(line)
+            if m:
+                result['peak_memory'] = float(m.group(1))
+
+    if result['events'] is None:
+        for line in reversed(lines):
+            m = re_total_events.search(line)
+            if m:
+                result['events'] = float(m.group(1))
+                break
+
+    if result['throughput'] is None and result['events'] and result['processing_time']:
+        result['throughput'] = result['events'] / result['processing_time']
+
+    # failure class
+    fclass, message = classifyFailure(lines)
+
+    if result['exit_code'] == 0 and not fclass in ['oom', 'walltime']:
+        result['status'] = 'success'
+    else:
+        # jobs killed by the batch system may not print the exit code
+        killed = fclass in ['oom', 'walltime']
+        result['status'] = 'failed' if result['exit_code'] is not None or killed else 'incomplete'
+        result['failure'] = fclass if fclass else 'unknown'
+        result['message'] = message
+
+    if verify:
+        result['consistent'] = verifyLogs(logname)
+
+    return result
+
+def getLatestLogs(dirname):
+    """
+    Return a dictionary: array index -> path to the log of the latest job
+
+    The latest log is the one written last. Job ids only break ties: the ids of
+    local runs (runJobsLocal.py) and of the different schedulers are not ordered
+    with respect to each other.
+    """
+    latest = {}
+
+    for fname in os.listdir(dirname):
+        # expect log extension '.out'
+        if os.path.splitext(fname)[-1] != '.out':
+            continue
+
+        # expect the log name is the job id: 1234_5.out
+        # or 1234_5.unit7.out for array index 7 processed by batch task 1234_5 (planBatches.py)
+        fullid, _, unit = os.path.splitext(fname)[0].partition('.unit')
+        try:
+            jid, arrayid = [int(x) for x in fullid.split('_')]
+            if unit:
+                arrayid = int(unit)
+        except ValueError:
+            continue
+
+        try:
+            key = (os.path.getmtime(os.path.join(dirname, fname)), jid)
+        except OSError:
+            continue
+
+        if not arrayid in latest or key > latest[arrayid][0]:
+            latest[arrayid] = (key, fname)
+
+    return {arrayid: os.path.join(dirname, fname) for arrayid, (_, fname) in latest.items()}
+
+def analyzeLogsInDir(dirname, verify=False):
+    """
+    Analyze the latest logs in dirname. Return a dictionary: array index -> result of analyzeLog
+    """
+    return {arrayid: analyzeLog(logname, verify) for arrayid, logname in sorted(getLatestLogs(dirname).items())}
+
+###
+# Resources of the resubmitted jobs
+def parseTime(time_str):
+    """
+    Convert a time string in the format of [D-]HH:MM:SS, HH:MM or MM to seconds
+    """
+    days = 0
+    if '-' in time_str:
+        d, time_str = time_str.split('-')
+        days = int(d)
+
+    fields = [int(x) for x in time_str.split(':')]
+    if len(fields) == 1:
+        h, m, s = 0, fields[0], 0
+    elif len(fields) == 2:
+        h, m, s = fields[0], fields[1], 0
+    else:
+        h, m, s = fields[-3:]
+
+    return ((days*24 + h)*60 + m)*60 + s
+
+def formatTime(seconds):
+    seconds = int(seconds)
+    return f"{seconds//3600}:{seconds%3600//60:02d}:{seconds%60:02d}"
+
+def parseMemory(mem_str):
+    """
+    Convert a memory string e.g. 8G, 4000M, 8gb to GB
+    """
+    m = re.match(r'([\d.]+)\s*([kKmMgGtT]?)[bB]?$', mem_str.strip())
+    if not m:
+        raise ValueError(f"Cannot parse memory: {mem_str}")
+
+    scale = {'k': 1./1024**2, 'm': 1./1024, '': 1., 'g': 1., 't': 1024.}
+    return float(m.group(1)) * scale[m.group(2).lower()]
+
+default_walltime = 8*3600 # seconds, same as submitJobs.submit()
+
+def adjustResources(lines, mem_increase=0, mem_factor=1., time_factor=1., max_mem=None, max_time=None):
+    """ Adjust the memory and walltime requested in a job script
+    ______
+    Arguments
+    lines: list of str; lines of the job script
+    mem_increase: float; memory to add in GB
+    mem_factor: float; factor to scale the memory with
+    time_factor: float; factor to scale the walltime with
+    max_mem: float; upper limit of the memory in GB
+    max_time: float; upper limit of the walltime in seconds
+
+    Return
+    A new list of lines
+    """
+    is_slurm = any(l.startswith('#SBATCH') for l in lines)
+
+    new_lines = []
+    has_time = False
+    last_directive = 0
+
+    for line in lines:
+        if line.startswith('#SBATCH') or line.startswith('#PBS'):
+            last_directive = len(new_lines)+1
+
+        if (mem_increase > 0 or mem_factor != 1.) and (line.startswith('#SBATCH --mem=') or line.startswith('#PBS -l mem=')):
+            mem_cur = parseMemory(line.split('=')[-1])
+            mem_new = mem_cur * mem_factor + mem_increase
+            if max_mem:
+                mem_new = min(mem_new, max_mem)
+            mem_new = int(-(-mem_new//1)) # round up
+            prefix = '#SBATCH --mem=' if is_slurm else '#PBS -l mem='
+            # Torque reads 'Gb' as gigabits
+            new_lines.append(f"{prefix}{mem_new}" + ("G\n" if is_slurm else "gb\n"))
+
+        elif line.startswith('#SBATCH --time=') or line.startswith('#PBS -l walltime='):
+            has_time = True
+            time_new = parseTime(line.split('=')[-1].strip()) * time_factor
+            if max_time:
+                time_new = min(time_new, max_time)
+            prefix = '#SBATCH --time=' if is_slurm else '#PBS -l walltime='
+            new_lines.append(f"{prefix}{formatTime(time_new)}\n")
+
+        else:
+            new_lines.append(line)
+
+    if time_factor != 1. and not has_time:
+        # the job script relies on the default walltime of the submission
+        time_new = default_walltime * time_factor
+        if max_time:
+            time_new = min(time_new, max_time)
+        prefix = '#SBATCH --time=' if is_slurm else '#PBS -l walltime='
+        new_lines.insert(last_directive, f"{prefix}{formatTime(time_new)}\n")
+
+    return new_lines
+
+def getResourcePolicy(fclass, extra_mem=0, mem_factor=1.5, time_factor=2.):
+    """
+    Keyword arguments of adjustResources for a failure class
+    """
+    if fclass == 'oom':
+        if extra_mem > 0:
+            return {'mem_increase': extra_mem}
+        else:
+            return {'mem_factor': mem_factor}
+    elif fclass == 'walltime':
+        return {'time_factor': time_factor}
+    else:
+        # same resources as before
+        return {}
+
+if __name__ == "__main__":
+
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+
+    parser.add_argument("paths", nargs='+', type=str,
+                        help="Job logs or directories containing job logs")
+    parser.add_argument("-c", "--check-log", action='store_true',
+                        help="If True, also check the progress output in the whole logs")
+    parser.add_argument("-f", "--failed-only", action='store_true',
+                        help="If True, only print the failed jobs")
+
+    args = parser.parse_args()
+
+    def fmt(x, f='.0f'):
+        return '-' if x is None else format(x, f)
+
+    print(f"{'log':<50} {'status':>10} {'failure':>16} {'events':>10} {'evt/s':>9} {'time [s]':>9} {'mem [MB]':>9}")
+    for path in args.paths:
+        if os.path.isdir(path):
+            lognames = [l for _, l in sorted(getLatestLogs(path).items())]
+        else:
+            lognames = [path]
+
+        for logname in lognames:
+            res = analyzeLog(logname, args.check_log)
+            if args.failed_only and res['status'] == 'success':
+                continue
+
+            print(f"{logname[-50:]:<50} {res['status']:>10} {res['failure'] or '':>16} {fmt(res['events']):>10} {fmt(res['throughput'], '.1f'):>9} {fmt(res['processing_time'], '.1f'):>9} {fmt(res['peak_memory'], '.1f'):>9}")
+            if res['message']:
+                print(f"    {res['message'][:120]}")
+            if args.check_log and not res['consistent']:
+                print("    Something is wrong in the progress output")
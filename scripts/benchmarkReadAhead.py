@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Benchmark NtupleRDF with different TTreeCache sizes and prefetching settings
+
+Each configuration is run in a separate process since ROOT's I/O counters are global.
+Remote access is simulated on local files by serving them over HTTP from a local
+server that waits for a fixed latency before answering each read request, so the
+measured wall time includes the I/O wait.
+"""
+import os
+import sys
+import json
+import time
+import tempfile
+import threading
+import subprocess
+import urllib.parse
+import http.server
+
+from datasets import getInputFileNames
+
+class LatencyHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Serve local files with HTTP range requests, as read by ROOT's TWebFile or TDavixFile,
+    and wait for the latency before answering each request
+    """
+    protocol_version = 'HTTP/1.1'
+    files = {} # URL path -> local file path
+    latency = 0. # seconds
+
+    def log_message(self, format, *args):
+        pass
+
+    def getFile(self):
+        fpath = self.files.get(urllib.parse.unquote(self.path.split('?')[0]))
+        if fpath is None:
+            self.send_error(404)
+        return fpath
+
+    def getRanges(self, size):
+        # list of (first, last) byte positions from a header like 'bytes=0-99,200-299'
+        header = self.headers.get('Range', '')
+        if not header.startswith('bytes='):
+            return []
+
+        ranges = []
+        for r in header[len('bytes='):].split(','):
+            first, last = r.strip().split('-')
+            if first:
+                ranges.append((int(first), min(int(last), size-1) if last else size-1))
+            else:
+                # suffix range: the last N bytes
+                ranges.append((max(size-int(last), 0), size-1))
+        return ranges
+
+    def do_HEAD(self):
+        time.sleep(self.latency)
+        fpath = self.getFile()
+        if fpath is None:
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Length', str(os.path.getsize(fpath)))
+        self.send_header('Accept-Ranges', 'bytes')
+        self.end_headers()
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        fpath = self.getFile()
+        if fpath is None:
+            return
+
+        size = os.path.getsize(fpath)
+        ranges = self.getRanges(size)
+
+        with open(fpath, 'rb') as f:
+            if not ranges:
+                self.send_response(200)
+                body = f.read()
+                content_type = 'application/octet-stream'
+            elif len(ranges) == 1:
+                first, last = ranges[0]
+                f.seek(first)
+                body = f.read(last-first+1)
+                self.send_response(206)
+                self.send_header('Content-Range', f"bytes {first}-{last}/{size}")
+                content_type = 'application/octet-stream'
+            else:
+                boundary = 'BENCHMARKREADAHEAD'
+                parts = []
+                for first, last in ranges:
+                    f.seek(first)
+                    parts.append(f"--{boundary}\r\nContent-Type: application/octet-stream\r\nContent-Range: bytes {first}-{last}/{size}\r\n\r\n".encode())
+                    parts.append(f.read(last-first+1))
+                    parts.append(b"\r\n")
+                parts.append(f"--{boundary}--\r\n".encode())
+                body = b''.join(parts)
+                self.send_response(206)
+                content_type = f'multipart/byteranges; boundary={boundary}'
+
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+def startLatencyServer(inputFiles, latency):
+    """
+    Serve inputFiles from a local HTTP server with latency in seconds per request
+
+    Return the server and a dictionary: local file path -> URL
+    """
+    # keep the file names in the URLs so that they still end with .root
+    paths = {f"/{i}/{os.path.basename(f)}": os.path.abspath(f) for i, f in enumerate(inputFiles)}
+    handler = type('Handler', (LatencyHandler,), {'files': paths, 'latency': latency})
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    host, port = server.server_address[:2]
+    urls = {f: f"http://{host}:{port}{p}" for p, f in zip(paths, inputFiles)}
+
+    return server, urls
+
+def runSingle(args):
+    from ntuplerRDF import NtupleRDF
+
+    # the file lists have been expanded by runBenchmark and may contain URLs
+    inputFiles_reco = getInputFileNames(args.reco_files, check_file=False)
+    inputFiles_truth = getInputFileNames(args.parton_files, check_file=False) if args.parton_files else []
+
+    tstart = time.time()
+
+    ntupler = NtupleRDF(
+        os.path.join(args.outdir, 'benchmark'),
+        inputFiles_reco,
+        inputFiles_truth,
+        recoAlgo = args.algorithm_topreco,
+        truthLevel = 'parton' if inputFiles_truth else '',
+        treename = args.treename,
+        treename_truth = args.treename,
+        cacheSize = args.cache_size * 1024**2 if args.cache_size else None,
+        prefetch = args.prefetch
+    )
+
+    ntupler(
+        maxevents = args.maxevents,
+        saveUnmatchedTruth = False
+    )
+
+    stats = dict(ntupler.readStats)
+    stats['wall_time'] = time.time() - tstart
+
+    # the last line of the output
+    print(json.dumps(stats))
+
+def runBenchmark(args):
+    inputFiles_reco = getInputFileNames(args.reco_files)
+    inputFiles_truth = getInputFileNames(args.parton_files) if args.parton_files else []
+    bytes_files = sum(os.path.getsize(f) for f in inputFiles_reco + inputFiles_truth)
+
+    server = None
+    if args.latency > 0:
+        server, urls = startLatencyServer(inputFiles_reco + inputFiles_truth, args.latency)
+        inputFiles_reco = [urls[f] for f in inputFiles_reco]
+        inputFiles_truth = [urls[f] for f in inputFiles_truth]
+
+    results = []
+
+    for cache_size in args.cache_sizes:
+        for prefetch in ([False, True] if args.prefetch_modes == 'both' else [args.prefetch_modes == 'on']):
+            commands = [sys.executable, os.path.abspath(__file__), '--single']
+            commands += ['-r'] + inputFiles_reco
+            if inputFiles_truth:
+                commands += ['-t'] + inputFiles_truth
+            commands += ['-a', args.algorithm_topreco, '--treename', args.treename]
+            commands += ['-o', args.outdir]
+            if args.maxevents:
+                commands += ['-m', str(args.maxevents)]
+            if cache_size > 0:
+                commands += ['--cache-size', str(cache_size)]
+            if prefetch:
+                commands += ['--prefetch']
+
+            output = subprocess.check_output(commands, encoding='UTF-8')
+            stats = json.loads(output.strip().splitlines()[-1])
+            stats['cache_size'] = cache_size
+            stats['prefetch'] = prefetch
+            stats['bytes_files'] = bytes_files
+            stats['latency'] = args.latency
+            results.append(stats)
+
+    if server is not None:
+        server.shutdown()
+
+    print(f"{'cache [MB]':>10} {'prefetch':>8} {'wall [s]':>9} {'read [MB]':>10} {'in trees [MB]':>14} {'in files [MB]':>14} {'calls':>8}")
+    for r in results:
+        print(f"{r['cache_size']:>10} {str(r['prefetch']):>8} {r['wall_time']:>9.1f} {r['bytes_read']/1024**2:>10.1f} {r['bytes_trees']/1024**2:>14.1f} {r['bytes_files']/1024**2:>14.1f} {r['read_calls']:>8}")
+
+    return results
+
+if __name__ == "__main__":
+
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+
+    parser.add_argument('-r', '--reco-files', required=True, nargs='+', type=str,
+                        help="Input root files containing reco trees")
+    parser.add_argument('-t', '--parton-files', nargs='+', type=str,
+                        help="Input root files containing parton level trees")
+    parser.add_argument('-a', '--algorithm-topreco', choices=['pseudotop', 'klfitter'], default='pseudotop',
+                        help="Top reconstruction algorithm")
+    parser.add_argument('--treename', type=str, default='nominal',
+                        help="Tree name of the inputs")
+    parser.add_argument('-m', '--maxevents', type=int,
+                        help="Max number of events to process")
+    parser.add_argument('-o', '--outdir', type=str, default=tempfile.gettempdir(),
+                        help="Directory for the output files of the benchmark runs")
+    parser.add_argument('-c', '--cache-sizes', nargs='+', type=float, default=[0, 10, 50, 200],
+                        help="TTreeCache sizes in MB to try. 0 for ROOT's default")
+    parser.add_argument('-p', '--prefetch-modes', choices=['on', 'off', 'both'], default='both',
+                        help="Run with prefetching on, off or both")
+    parser.add_argument('-l', '--latency', type=float, default=0.,
+                        help="Simulated latency per read request in seconds. If positive, the inputs are read over HTTP from a local server")
+    # internal: run one configuration
+    parser.add_argument('--single', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--cache-size', type=float, help=argparse.SUPPRESS)
+    parser.add_argument('--prefetch', action='store_true', help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    if args.single:
+        runSingle(args)
+    else:
+        runBenchmark(args)
@@ -1,7 +1,14 @@
 import os
+import json
 import yaml
 import ROOT
 import h5py
+from concurrent.futures import ProcessPoolExecutor
+
+from manifest import readManifest, checkManifest
+from analyzeJobLogs import analyzeLog, getLatestLogs, adjustResources, getResourcePolicy
+from jobstate import openJobStore
+from resources import re_array_index
 
 import logging
 logging.basicConfig(
@@ -17,6 +24,10 @@ def checkNumInputs(dirname):
     indices = set()
 
     for fname in os.listdir(inlistdir):
+        # only the input lists e.g. filelist_ttbar_tt_0.txt
+        if not fname.startswith('filelist_'):
+            continue
+
         # get the index from the file name
         index_str = os.path.splitext(fname)[0].split('_')[-1]
         indices.add(index_str)
@@ -24,205 +35,389 @@ def checkNumInputs(dirname):
     # return the number of indices
     return len(indices)
 
-def verifyLogs(file_log):
-    nevents = 0
-    for line in file_log:
-        if "processing event #" in line:
-            nevt_cur = int(line.split("processing event #")[-1].strip())
-            if nevt_cur == 0:
-                nevents = 0
-
-            if nevt_cur < nevents:
-                # something is wrong
-                return False
-
-    return True
-
-def checkJobLogs(dirname, bad_job_indices, verify=False):
+def checkJobLogs(dirname, bad_job_indices, verify=False, failures=None, task_results=None):
     # Get the expected number of jobs from the number of input lists
     njobs_exp = checkNumInputs(dirname)
     njobs_success = 0
 
-    jobids = [None] * njobs_exp
+    # Read the latest logs for all jobs
+    lognames = getLatestLogs(dirname)
 
-    # Check job logs
-    for fname in os.listdir(dirname):
-        # expect log extension '.out'
-        if os.path.splitext(fname)[-1] != '.out':
+    for arrayid in range(njobs_exp):
+        if not arrayid in lognames:
+            bad_job_indices.add(arrayid)
+            if task_results is not None:
+                task_results[arrayid] = {'status': 'incomplete'}
             continue
 
-        # expect the log name is the job id: 1234_5.out
-        fullid = os.path.splitext(fname)[0]
-        jid, arrayid = fullid.split('_')
-        jid = int(jid)
-        arrayid = int(arrayid)
+        logname = lognames[arrayid]
+        res = analyzeLog(logname, verify=verify)
 
-        if jobids[arrayid] is None or jid > jobids[arrayid]:
-            # assume newer jobs have larger ids
-            jobids[arrayid] = jid
+        if task_results is not None:
+            task_results[arrayid] = {
+                'status': res['status'],
+                'failure': res['failure'],
+                'exit_code': res['exit_code'],
+                'peak_memory': res['peak_memory'],
+                'runtime': res['processing_time'],
+                'logname': logname
+            }
 
-    # Read the latest logs for all jobs
-    for arrayid, jobid in enumerate(jobids):
-        if jobid is None:
-            bad_job_indices.add(arrayid)
-            continue
+        if verify and not res['consistent']:
+            logger.critical(f"Something is wrong. Check {logname}")
 
-        logname = os.path.join(dirname, f"{jobid}_{arrayid}.out")
-        with open(logname, 'r') as flog:
-            last_line = flog.readlines()[-1]
-            if verify:
-                logOk = verifyLogs(flog)
-                if not logOk:
-                    logger.critical(f"Something is wrong. Check {logname}")
+        if res['status'] == 'success':
+            njobs_success += 1
+        else:
+            logger.debug(f"Job {res['status']} ({res['failure']}): {logname}")
+            if res['message']:
+                logger.debug(f"  {res['message']}")
 
-        if not "exit code " in last_line:
-            logger.debug(f"ERROR: cannot find the exit code in the last line of the log {logname}")
             bad_job_indices.add(arrayid)
-        else:
-            # extract the exit code
-            exit_code = int(last_line.split('exit code ')[1])
-            if exit_code == 0:
-                njobs_success += 1
-            else:
-                bad_job_indices.add(arrayid)
+            if failures is not None:
+                failures[arrayid] = res['failure']
 
     return str(njobs_success)+'/'+str(njobs_exp)
 
-def checkROOTinDir(dirname):
-    logger.debug(f"Check ROOT files in {dirname}")
-    nfiles = 0
-    ngood = 0
+def checkROOTFile(fullname):
+    treenames = []
+    ngoodtrees = 0
+
+    # try to open it
+    try:
+        rootfile = ROOT.TFile.Open(fullname)
+        keys = rootfile.GetListOfKeys()
+        for k in keys:
+            if k.GetClassName() != 'TTree': # not TTree, skip
+                continue
+            tname = k.GetName()
+            if tname in treenames: # Already checked, skip
+                continue
+            treenames.append(tname)
+
+            # check number of events
+            tree = rootfile.Get(tname)
+            if tree.GetEntries() > 0:
+                ngoodtrees += 1
+        rootfile.Close()
+    except Exception as e:
+        logger.debug(f"Failed to open ROOT file {fullname}: {e}")
+
+    if treenames:
+        return ngoodtrees == len(treenames)
+    else:
+        return False
+
+def checkHDF5File(fullname):
+    # try to open it
+    try:
+        with h5py.File(fullname, 'r') as f:
+            goodfile = True
+
+            arraynames = list(f.keys())
+            if len(arraynames) == 0:
+                logger.debug(f"No arrays in {fullname}")
+                return False
+
+            # check if 'normalized_weight' is in the file
+            if '_unmatched_truth' in os.path.basename(fullname):
+                # a special case for the unmatched truth files
+                if not 'normalized_weight_mc' in arraynames:
+                    logger.debug(f"normalized_weight_mc is not in {fullname}")
+                    goodfile = False
+            else:
+                if not 'normalized_weight' in arraynames:
+                    logger.debug(f"normalized_weight is not in {fullname}")
+                    goodfile = False
+
+            # check if all arrays are of the same length
+            # only the shapes are read from the metadata
+            lengths = [f[aname].shape[0] if f[aname].shape else 0 for aname in arraynames]
+            for aname, alen in zip(arraynames, lengths):
+                if alen != lengths[0]:
+                    logger.debug(f"Array {aname} has different length from the first array")
+                    goodfile = False
+
+            # check if arrays are empty
+            if lengths[0] == 0:
+                logger.debug(f"Arrays are empty")
+                goodfile = False
+
+        return goodfile
+
+    except  Exception as e:
+        logger.debug(f"Failed to open HDF5 file {fullname}: {e}")
+        return False
+
+def listOutputFiles(dirname, output_format):
+    fnames = []
+
+    if not os.path.isdir(dirname):
+        return fnames
 
     for fname in os.listdir(dirname):
-        if not fname.endswith(".root"):
-            continue
+        if output_format == 'root':
+            if not fname.endswith(".root"):
+                continue
 
-        if fname.endswith("_acc.root") or fname.endswith("_eff.root"):
-            continue
+            if fname.endswith("_acc.root") or fname.endswith("_eff.root"):
+                continue
+
+            if fname.endswith("_histograms.root"):
+                continue
 
-        if fname.endswith("_histograms.root"):
+        elif output_format == 'h5':
+            if not fname.endswith(".h5"):
+                continue
+
+        else:
             continue
 
-        # found a ROOT file
-        nfiles += 1
-        fullname = os.path.join(dirname, fname)
-        treenames = []
-        ngoodtrees = 0
+        fnames.append(os.path.join(dirname, fname))
+
+    return fnames
+
+class VerdictCache():
+    """
+    Verdicts of the file checks keyed by file path, valid as long as the file size and mtime are unchanged
+    """
+    def __init__(self, filename=None):
+        self.filename = filename
+        self.verdicts = {}
+
+        if filename and os.path.isfile(filename):
+            try:
+                with open(filename) as f:
+                    self.verdicts = json.load(f)
+            except ValueError:
+                logger.warning(f"Cannot read the verdict cache {filename}. Start a new one.")
+
+    @staticmethod
+    def _stat(fpath):
+        st = os.stat(fpath)
+        return st.st_size, st.st_mtime_ns
+
+    def get(self, fpath):
+        entry = self.verdicts.get(fpath)
+        if entry is None:
+            return None
 
-        # try to open it
         try:
-            rootfile = ROOT.TFile.Open(fullname)
-            keys = rootfile.GetListOfKeys()
-            for k in keys:
-                if k.GetClassName() != 'TTree': # not TTree, skip
-                    continue
-                tname = k.GetName()
-                if tname in treenames: # Already checked, skip
-                    continue
-                treenames.append(tname)
-
-                # check number of events
-                tree = rootfile.Get(tname)
-                if tree.GetEntries() > 0:
-                    ngoodtrees += 1
-            rootfile.Close()
-        except Exception as e:
-            logger.debug(f"Failed to open ROOT file {fullname}: {e}")
-
-        if treenames:
-            ngood += int(ngoodtrees / len(treenames))
-
-    return str(ngood)+'/'+str(nfiles)
-
-def checkHDF5inDir(dirname):
-    logger.debug(f"Check HDF5 files in {dirname}")
-    nfiles = 0
-    ngood = 0
+            size, mtime = self._stat(fpath)
+        except OSError:
+            return None
 
-    for fname in os.listdir(dirname):
-        if not fname.endswith(".h5"):
-            continue
+        if entry['size'] != size or entry['mtime'] != mtime:
+            return None
 
-        # found a HDF5 file
-        nfiles += 1
-        fullname = os.path.join(dirname, fname)
+        return entry['good']
 
-        # try to open it
+    def put(self, fpath, good):
         try:
-            with h5py.File(fullname, 'r') as f:
-                goodfile = True
+            size, mtime = self._stat(fpath)
+        except OSError:
+            return
+        self.verdicts[fpath] = {'size': size, 'mtime': mtime, 'good': good}
+
+    def save(self):
+        if not self.filename:
+            return
+
+        ftmp = self.filename + '.tmp'
+        with open(ftmp, 'w') as f:
+            json.dump(self.verdicts, f)
+        os.replace(ftmp, self.filename)
+
+def checkHDF5Manifest(fpath):
+    """
+    Check an HDF5 output based on its manifest. Return None if there is no valid manifest.
+    """
+    manifest = readManifest(fpath)
+    if manifest is None:
+        return None
+
+    if '_unmatched_truth' in os.path.basename(fpath):
+        return checkManifest(manifest, weight_name='normalized_weight_mc')
+    else:
+        return checkManifest(manifest, weight_name='normalized_weight')
 
-                arraynames = list(f.keys())
-                if len(arraynames) == 0:
-                    logger.debug(f"No arrays in {fullname}")
-                    goodfile = False
+def checkFile(fpath, output_format):
+    if output_format == 'root':
+        return checkROOTFile(fpath)
+    elif output_format == 'h5':
+        return checkHDF5File(fpath)
+    else:
+        return False
+
+def validateFiles(fpaths, output_format, cache=None, nprocesses=1):
+    """
+    Check files and return a dictionary of verdicts. Files with a valid cached verdict or manifest are not opened.
+    """
+    if cache is None:
+        cache = VerdictCache()
+
+    verdicts = {}
+    todo = []
+    for fpath in fpaths:
+        good = cache.get(fpath)
+        if good is None and output_format == 'h5':
+            # trust the manifest if it matches the file
+            good = checkHDF5Manifest(fpath)
+            if good is not None:
+                cache.put(fpath, good)
+        if good is None:
+            todo.append(fpath)
+        else:
+            verdicts[fpath] = good
 
-                # check if 'normalized_weight' is in the file
-                if '_unmatched_truth' in fname:
-                    # a special case for the unmatched truth files
-                    if not 'normalized_weight_mc' in arraynames:
-                        logger.debug(f"normalized_weight_mc is not in {fullname}")
-                        goodfile = False
-                else:
-                    if not 'normalized_weight' in arraynames:
-                        logger.debug(f"normalized_weight is not in {fullname}")
-                        goodfile = False
-
-                # check if all arrays are of the same length
-                for aname in arraynames:
-                    if len(f[aname]) != len(f[arraynames[0]]):
-                        logger.debug(f"Array {aname} has different length from the first array")
-                        goodfile = False
-
-                # check if arrays are empty
-                if len(f[arraynames[0]]) == 0:
-                    logger.debug(f"Arrays are empty")
-                    goodfile = False
+    logger.debug(f"{len(verdicts)} cached verdicts, {len(todo)} files to check")
 
-            if goodfile:
-                ngood += 1
+    if nprocesses > 1 and len(todo) > 1:
+        with ProcessPoolExecutor(max_workers=nprocesses) as executor:
+            results = executor.map(checkFile, todo, [output_format]*len(todo), chunksize=max(1, len(todo)//(nprocesses*4)))
+            results = list(results)
+    else:
+        results = [checkFile(fpath, output_format) for fpath in todo]
 
-        except  Exception as e:
-            logger.debug(f"Failed to open HDF5 file {fullname}: {e}")
+    for fpath, good in zip(todo, results):
+        verdicts[fpath] = good
+        cache.put(fpath, good)
 
-    return str(ngood)+'/'+str(nfiles)
+    return verdicts
 
-def prepareResub(fname_orig, indices_resub, extra_mem=0):
-    dirname = os.path.dirname(fname_orig)
-    basename = os.path.basename(fname_orig)
-    fname_resub = os.path.join(dirname, 're'+basename)
+def checkROOTinDir(dirname, cache=None, nprocesses=1):
+    logger.debug(f"Check ROOT files in {dirname}")
+
+    fpaths = listOutputFiles(dirname, 'root')
+    verdicts = validateFiles(fpaths, 'root', cache, nprocesses)
+    ngood = sum(verdicts.values())
+
+    return str(ngood)+'/'+str(len(fpaths))
+
+def checkHDF5inDir(dirname, cache=None, nprocesses=1):
+    logger.debug(f"Check HDF5 files in {dirname}")
+
+    fpaths = listOutputFiles(dirname, 'h5')
+    verdicts = validateFiles(fpaths, 'h5', cache, nprocesses)
+    ngood = sum(verdicts.values())
+
+    return str(ngood)+'/'+str(len(fpaths))
+
+def getTaskOutputStatus(dirname, output_format, njobs, cache):
+    """
+    Output status of each array task: 'good' if all its output files pass the checks,
+    'bad' if any of them does not, 'missing' if there is no output file
+    """
+    status = {i: 'missing' for i in range(njobs)}
+
+    fpaths = listOutputFiles(dirname, output_format)
+    verdicts = validateFiles(fpaths, output_format, cache)
+
+    for fpath, good in verdicts.items():
+        m = re_array_index.search(os.path.basename(fpath))
+        if not m:
+            continue
+        arrayid = int(m.group(1))
+        if status.get(arrayid) == 'bad':
+            continue
+        status[arrayid] = 'good' if good else 'bad'
+
+    return status
+
+def collectJobDirs(jDict, sDict):
+    """
+    Directories of all submitted jobs in the job config dictionary
+    """
+    dirs = []
+    for k in jDict:
+        if isinstance(jDict[k], dict):
+            dirs += collectJobDirs(jDict[k], sDict.get(k, {}))
+        else:
+            if sDict and not sDict[k]: # skip if the job is not yet submitted
+                continue
+            if jDict[k] is None:
+                continue
+            dirs.append(os.path.dirname(jDict[k]))
+    return dirs
 
+def prevalidate(jDict, sDict, output_format, cache, nprocesses):
+    """
+    Check the output files of all jobs in one process pool and fill the cache
+    """
+    fpaths = []
+    for dirname in collectJobDirs(jDict, sDict):
+        fpaths += listOutputFiles(dirname, output_format)
+
+    logger.info(f"Validate {len(fpaths)} output files with {nprocesses} processes")
+    validateFiles(fpaths, output_format, cache, nprocesses)
+
+def writeResubScript(fname_orig, fname_resub, indices_resub, **resources):
     # Read the original submit script
     with open(fname_orig, 'r') as forig:
         lines = forig.readlines()
 
+    # adjust the requested resources
+    lines = adjustResources(lines, **resources)
+
     # modify the line that sets job arrays and write to a new file fname_resub
     with open(fname_resub, 'w') as fresub:
         for line in lines:
             if "#SBATCH --array=" in line:
                 fresub.write("#SBATCH --array=" + ",".join([str(x) for x in indices_resub]) + "\n")
-            elif '#SBATCH --mem=' in line and extra_mem > 0:
-                mem_str = line.split("=")[-1].strip()
-                # It is assumed the mem_str is in the unit of GB
-                assert(len(mem_str.split('G'))==2)
-                mem_cur = int(mem_str.split('G')[0].strip())
-                mem_new = mem_cur + extra_mem
-                fresub.write(f"#SBATCH --mem={mem_new}G\n")
+            elif line.startswith("#PBS -t "):
+                fresub.write("#PBS -t " + ",".join([str(x) for x in indices_resub]) + "\n")
             else:
                 fresub.write(line)
 
     return os.path.realpath(fname_resub)
 
-def checkOutputs(jDict, sDict, output_format, verify, extra_mem=0):
+def prepareResub(fname_orig, indices_resub, extra_mem=0, failures={}, mem_factor=1.5, time_factor=2.):
+    """
+    Write scripts to resubmit the failed jobs. Jobs are grouped by the failure class:
+    more memory is requested only for the jobs that ran out of memory and longer
+    walltime only for the jobs that timed out.
+
+    Return a list of the new job scripts
+    """
+    dirname = os.path.dirname(fname_orig)
+    basename = os.path.basename(fname_orig)
+
+    # group jobs by the resources to adjust
+    groups = {}
+    for index in indices_resub:
+        fclass = failures.get(index)
+        if not fclass in ['oom', 'walltime']:
+            fclass = ''
+        groups.setdefault(fclass, []).append(index)
+
+    flist_resub = []
+    for fclass, indices in sorted(groups.items()):
+        if fclass:
+            fname_resub = os.path.join(dirname, f're_{fclass}_'+basename)
+        else:
+            fname_resub = os.path.join(dirname, 're'+basename)
+
+        # increase the resources further if the jobs were resubmitted for the same reason before
+        fname_base = fname_resub if fclass and os.path.isfile(fname_resub) else fname_orig
+
+        resources = getResourcePolicy(fclass, extra_mem, mem_factor, time_factor)
+        if resources:
+            logger.info(f"Adjust resources for jobs {indices} ({fclass}): {resources}")
+
+        flist_resub.append(writeResubScript(fname_base, fname_resub, indices, **resources))
+
+    return flist_resub
+
+def checkOutputs(jDict, sDict, output_format, verify, extra_mem=0, cache=None, mem_factor=1.5, time_factor=2., store=None):
     oDict = {}
     flist_resub = []
 
     for k in jDict:
         if isinstance(jDict[k], dict):
-            oDict[k], flist = checkOutputs(jDict[k], sDict.get(k, {}), output_format, verify, extra_mem)
+            oDict[k], flist = checkOutputs(jDict[k], sDict.get(k, {}), output_format, verify, extra_mem, cache, mem_factor, time_factor, store)
             flist_resub += flist
         else:
-            if sDict and not sDict[k]: # skip if the job is not yet submitted
+            if sDict and not sDict.get(k): # skip if the job is not yet submitted
                 continue
 
             # get directory name
@@ -231,17 +426,21 @@ def checkOutputs(jDict, sDict, output_format, verify, extra_mem=0):
 
             # indices of jobs to be resubmitted
             jobarray_index_resubmit = set()
+            # array index -> failure class
+            failures = {}
+            # array index -> status of the task
+            task_results = {}
 
             # check files
             if output_format == 'root':
-                res = checkROOTinDir(dirname)
+                res = checkROOTinDir(dirname, cache)
             elif output_format == 'h5':
-                res = checkHDF5inDir(dirname)
+                res = checkHDF5inDir(dirname, cache)
             else:
                 res = 'n/a'
 
             # check logs
-            logs = checkJobLogs(dirname, jobarray_index_resubmit, verify=verify)
+            logs = checkJobLogs(dirname, jobarray_index_resubmit, verify=verify, failures=failures, task_results=task_results)
 
             # write to the result dictionary
             res_str = f"{res} (files) {logs} (jobs)"
@@ -249,12 +448,25 @@ def checkOutputs(jDict, sDict, output_format, verify, extra_mem=0):
             if len(jobarray_index_resubmit) > 0:
                 res_str += f" failed: {sorted(jobarray_index_resubmit)}"
 
+                failure_classes = sorted(set(failures.values()))
+                if failure_classes:
+                    res_str += " (" + ", ".join(f"{fc}: {sorted(i for i in failures if failures[i]==fc)}" for fc in failure_classes) + ")"
+
                 # prepare job files to be resubmitted
-                fpath_resub = prepareResub(jDict[k], sorted(jobarray_index_resubmit), extra_mem)
-                flist_resub.append(fpath_resub)
+                flist_resub += prepareResub(jDict[k], sorted(jobarray_index_resubmit), extra_mem, failures, mem_factor, time_factor)
 
             oDict[k] = res_str
 
+            # update the job states
+            if store is not None:
+                if output_format in ['root', 'h5']:
+                    for arrayid, ostatus in getTaskOutputStatus(dirname, output_format, len(task_results), cache).items():
+                        if arrayid in task_results:
+                            task_results[arrayid]['output_status'] = ostatus
+
+                store.updateTasks(jDict[k], task_results)
+                store.setResult(jDict[k], res_str)
+
     return oDict, flist_resub
 
 if __name__ == "__main__":
@@ -275,7 +487,17 @@ if __name__ == "__main__":
     parser.add_argument("-c", "--check-log", action="store_true",
                         help="If True, check the job logs more carefully")
     parser.add_argument("-m", "--increase-mem", type=int, default=0,
-                        help="Amount of extra memory (GB) to request for he failed jobs")
+                        help="Amount of extra memory (GB) to request for the jobs that ran out of memory. If 0, scale the memory by --mem-factor")
+    parser.add_argument("--mem-factor", type=float, default=1.5,
+                        help="Factor to scale the memory of the jobs that ran out of memory")
+    parser.add_argument("--time-factor", type=float, default=2.,
+                        help="Factor to scale the walltime of the jobs that timed out")
+    parser.add_argument("-n", "--nprocesses", type=int, default=os.cpu_count(),
+                        help="Number of processes to check the output files")
+    parser.add_argument("--verdict-cache", type=str,
+                        help="File to cache the verdicts of the file checks. If not provided, use <job_config>_verdicts.json")
+    parser.add_argument("--no-cache", action='store_true',
+                        help="If True, check all files again ignoring the cached verdicts")
     parser.add_argument("-v", "--verbose", action='store_true',
                         help="If True, set logging level to DEBUG, else INFO")
 
@@ -291,17 +513,25 @@ if __name__ == "__main__":
         jobs_dict = yaml.load(f, yaml.FullLoader)
     jcfg_names = os.path.splitext(args.job_config)
 
+    # job states. Import the submission status from the yaml file if the store is new
     if args.submit_config is None:
         args.submit_config = jcfg_names[0] + '_submitted' + jcfg_names[1]
-    try:
-        logger.info(f"Read job submission status from {args.submit_config}")
-        with open(args.submit_config) as f:
-            submit_dict = yaml.load(f, yaml.FullLoader)
-    except:
-        submit_dict = {}
+    logger.info(f"Read job submission status")
+    job_store = openJobStore(args.job_config, jobs_dict, args.submit_config)
+    # check all jobs if none is recorded as submitted
+    submit_dict = job_store.exportSubmitted() if job_store.countSubmitted() else {}
+
+    if args.verdict_cache is None:
+        args.verdict_cache = jcfg_names[0] + '_verdicts.json'
+    verdict_cache = VerdictCache(None if args.no_cache else args.verdict_cache)
+    verdict_cache.filename = args.verdict_cache
+
+    if args.output_format:
+        prevalidate(jobs_dict, submit_dict, args.output_format, verdict_cache, args.nprocesses)
+        verdict_cache.save()
 
     logger.info(f"Start checking jobs")
-    result_dict, fresub_list = checkOutputs(jobs_dict, submit_dict, output_format=args.output_format, verify=args.check_log, extra_mem=args.increase_mem)
+    result_dict, fresub_list = checkOutputs(jobs_dict, submit_dict, output_format=args.output_format, verify=args.check_log, extra_mem=args.increase_mem, cache=verdict_cache, mem_factor=args.mem_factor, time_factor=args.time_factor, store=job_store)
 
     if args.output is None:
         args.output = jcfg_names[0] + '_results' + jcfg_names[1]
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Collect the states of batch jobs from the scheduler accounting in batched queries
+
+Slurm: one 'sacct' call per batch of array jobs instead of one 'seff' per log.
+PBS/Torque: 'tracejob' can only look up one job at a time, so the lookups run in parallel.
+Final states are cached and never asked for again: in the job state store if a
+job summary yaml is given, otherwise in <directory>/.job_states.json.
+Local runs of runJobsLocal.py and runWorkflow.py are not asked for: their states
+are read from their logs.
+
+The accounting command can be replaced with --command or the environment variable
+JOB_ACCOUNTING_COMMAND, e.g. a script printing a fixed sacct output for testing.
+"""
+import os
+import re
+import json
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+# slurm job states that no longer change
+final_states = {'COMPLETED', 'FAILED', 'TIMEOUT', 'OUT_OF_MEMORY', 'CANCELLED', 'NODE_FAIL', 'PREEMPTED', 'BOOT_FAIL', 'DEADLINE'}
+
+# failure classes as in analyzeJobLogs.py
+state_failures = {'OUT_OF_MEMORY': 'oom', 'TIMEOUT': 'walltime', 'DEADLINE': 'walltime'}
+
+def parseElapsed(elapsed):
+    """
+    Convert [D-]HH:MM:SS or MM:SS(.sss) to seconds
+    """
+    if not elapsed:
+        return None
+
+    days = 0
+    if '-' in elapsed:
+        d, elapsed = elapsed.split('-')
+        days = int(d)
+
+    fields = [float(x) for x in elapsed.split(':')]
+    seconds = 0.
+    for x in fields:
+        seconds = seconds*60 + x
+
+    return days*86400 + seconds
+
+def parseMemoryMB(mem):
+    """
+    Convert e.g. 123456K, 1.5G, 2048kb to MB
+    """
+    m = re.match(r'([\d.]+)\s*([kKmMgGtT]?)[bB]?$', mem.strip()) if mem else None
+    if not m:
+        return None
+
+    scale = {'': 1./1024**2, 'k': 1./1024, 'm': 1., 'g': 1024., 't': 1024.**2}
+    return float(m.group(1)) * scale[m.group(2).lower()]
+
+class SacctCollector():
+    """
+    Query slurm accounting for many jobs in one sacct call
+    """
+    def __init__(self, command='sacct', batch_size=200):
+        self.command = command.split()
+        self.batch_size = batch_size
+
+    @staticmethod
+    def taskId(batch_jobid, arrayid):
+        return f"{batch_jobid}_{arrayid}"
+
+    def _run(self, jobids):
+        commands = self.command + ['-n', '-P', '--format=JobID,State,ExitCode,Elapsed,MaxRSS', '-j', ','.join(jobids)]
+        return subprocess.check_output(commands, encoding='UTF-8')
+
+    def parse(self, output):
+        """
+        Parse the sacct output. Return a dictionary: job id -> state dict
+        The steps of a job (<jobid>.batch, <jobid>.extern) contribute their memory usage.
+        """
+        states = {}
+        for line in output.splitlines():
+            fields = line.strip().split('|')
+            if len(fields) < 5:
+                continue
+
+            jobid, state, exitcode, elapsed, maxrss = fields[:5]
+            jobid_main, _, step = jobid.partition('.')
+
+            if '[' in jobid_main:
+                # pending array tasks not started yet
+                continue
+
+            st = states.setdefault(jobid_main, {'sched_state': None, 'exit_code': None, 'runtime': None, 'peak_memory': None})
+
+            if not step:
+                st['sched_state'] = state.split()[0] if state else None # e.g. 'CANCELLED by 1234'
+                if exitcode:
+                    code, signal = [int(x) for x in exitcode.split(':')]
+                    st['exit_code'] = code if code else (128 + signal if signal else 0)
+                st['runtime'] = parseElapsed(elapsed)
+
+            mem = parseMemoryMB(maxrss)
+            if mem is not None:
+                st['peak_memory'] = max(st['peak_memory'] or 0., mem)
+
+        return states
+
+    def query(self, jobids):
+        """
+        States of jobs. Array tasks are given as <jobid>_<arrayid>; the whole array is asked for once.
+        """
+        jobids = list(jobids)
+        query_ids = sorted(set(j.split('_')[0] for j in jobids))
+
+        states = {}
+        for i in range(0, len(query_ids), self.batch_size):
+            output = self._run(query_ids[i:i+self.batch_size])
+            states.update(self.parse(output))
+
+        return {j: states[j] for j in jobids if j in states}
+
+class TracejobCollector():
+    """
+    Query PBS/Torque server logs with tracejob, one job per call in parallel threads
+    """
+    def __init__(self, command='tracejob', max_workers=8):
+        self.command = command.split()
+        self.max_workers = max_workers
+
+    @staticmethod
+    def taskId(batch_jobid, arrayid):
+        return f"{batch_jobid}[{arrayid}]"
+
+    def _query_one(self, jobid):
+        try:
+            report = subprocess.check_output(self.command + ['-q', jobid], encoding='UTF-8')
+        except (subprocess.CalledProcessError, OSError):
+            return jobid, None
+
+        st = {'sched_state': None, 'exit_code': None, 'runtime': None, 'peak_memory': None}
+        for x in report.split():
+            if x.startswith('Exit_status='):
+                st['exit_code'] = int(x.split('=')[-1])
+            elif x.startswith('resources_used.walltime='):
+                st['runtime'] = parseElapsed(x.split('=')[-1])
+            elif x.startswith('resources_used.mem='):
+                st['peak_memory'] = parseMemoryMB(x.split('=')[-1])
+
+        if st['exit_code'] is not None:
+            if st['exit_code'] == -11: # killed for exceeding the walltime
+                st['sched_state'] = 'TIMEOUT'
+            else:
+                st['sched_state'] = 'COMPLETED' if st['exit_code'] == 0 else 'FAILED'
+
+        return jobid, st
+
+    def query(self, jobids):
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = executor.map(self._query_one, list(jobids))
+        return {j: st for j, st in results if st is not None}
+
+slurm_backends = ['slurm', 'sbatch', 'atlasserv', 'cedar']
+pbs_backends = ['pbs', 'torque', 'qsub', 'flashy']
+
+def getCollector(batch_system, command=None):
+    command = command or os.getenv('JOB_ACCOUNTING_COMMAND')
+    if batch_system in slurm_backends:
+        return SacctCollector(command or 'sacct')
+    elif batch_system in pbs_backends:
+        return TracejobCollector(command or 'tracejob')
+    else:
+        raise RuntimeError(f"Unknown batch system {batch_system}")
+
+def isFinal(st):
+    return st is not None and st.get('sched_state') in final_states
+
+def isSuccess(st):
+    return st.get('sched_state') == 'COMPLETED' and st.get('exit_code') == 0
+
+###
+# Job state store
+def updateJobStore(store, collector, backends=None, jobfiles=None):
+    """
+    Ask for the states of all open attempts in the job state store, or only of the
+    ones of jobfiles if provided, and record the final ones
+    """
+    attempts = store.getOpenAttempts(backends)
+    if jobfiles is not None:
+        attempts = [a for a in attempts if a['jobfile'] in jobfiles]
+    if not attempts:
+        return {}
+
+    fullids = {a['id']: collector.taskId(a['batch_jobid'], a['arrayid']) for a in attempts}
+    states = collector.query(fullids.values())
+
+    final = {}
+    for attempt_id, fullid in fullids.items():
+        st = states.get(fullid)
+        if not isFinal(st):
+            continue
+
+        st = dict(st)
+        if isSuccess(st):
+            st['status'] = 'success'
+        else:
+            st['status'] = 'failed'
+            st['failure'] = state_failures.get(st['sched_state'])
+        final[attempt_id] = st
+
+    store.setSchedulerStates(final)
+
+    return final
+
+###
+# Logs in directories
+def findJobLogs(top_directory, log_suffix='.out'):
+    """
+    Job ids from the logs under top_directory: dictionary log path -> job id
+    Logs are named <jobid>_<arrayid>.out (slurm) or <jobid>.<server>.out (PBS)
+    """
+    jobids = {}
+    for r, dirs, files in os.walk(top_directory):
+        for f in files:
+            if not f.endswith(log_suffix):
+                continue
+            jobids[os.path.join(r, f)] = f.split('.')[0]
+    return jobids
+
+def isLocalLog(logname):
+    """
+    True if the log was written by runJobsLocal.py or runWorkflow.py, whose job ids are unknown to the scheduler
+    """
+    with open(logname) as f:
+        for _, line in zip(range(5), f):
+            if line.strip() == 'BATCH_SYSTEM=local':
+                return True
+    return False
+
+def readLocalState(logname):
+    """
+    State of a local run from the 'exit code N' line and the time limit message in its log
+    """
+    st = {'sched_state': None, 'exit_code': None, 'runtime': None, 'peak_memory': None}
+    with open(logname) as f:
+        for line in f:
+            if 'DUE TO TIME LIMIT' in line:
+                st['sched_state'] = 'TIMEOUT'
+            m = re.match(r'exit code (-?\d+)', line)
+            if m:
+                st['exit_code'] = int(m.group(1))
+
+    if st['exit_code'] is not None and st['sched_state'] is None:
+        st['sched_state'] = 'COMPLETED' if st['exit_code'] == 0 else 'FAILED'
+
+    return st
+
+class StateCache():
+    """
+    Final job states in a JSON file
+    """
+    def __init__(self, filename):
+        self.filename = filename
+        self.states = {}
+        if os.path.isfile(filename):
+            try:
+                with open(filename) as f:
+                    self.states = json.load(f)
+            except ValueError:
+                pass
+
+    def save(self):
+        ftmp = f"{self.filename}.{os.getpid()}.tmp"
+        with open(ftmp, 'w') as f:
+            json.dump(self.states, f)
+        os.replace(ftmp, self.filename)
+
+def collectDirectory(top_directory, collector, cache_file=None, log_suffix='.out'):
+    """
+    States of the jobs whose logs are under top_directory.
+    Return dictionaries of successful and failed job ids by directory.
+    """
+    if cache_file is None:
+        cache_file = os.path.join(top_directory, '.job_states.json')
+    cache = StateCache(cache_file)
+
+    jobids = findJobLogs(top_directory, log_suffix)
+    local_logs = {p for p in jobids if isLocalLog(p)}
+
+    to_query = sorted(set(j for p, j in jobids.items() if p not in local_logs and not isFinal(cache.states.get(j))))
+    if to_query:
+        states = collector.query(to_query)
+        for j, st in states.items():
+            if isFinal(st):
+                cache.states[j] = st
+        cache.save()
+    else:
+        states = {}
+
+    success_jobs, failed_jobs = {}, {}
+    for p, j in sorted(jobids.items()):
+        if p in local_logs:
+            st = readLocalState(p)
+        else:
+            st = cache.states.get(j) or states.get(j)
+
+        d = os.path.dirname(p)
+        if st is not None and isSuccess(st):
+            success_jobs.setdefault(d, []).append(j)
+        else:
+            failed_jobs.setdefault(d, []).append(j)
+
+    return success_jobs, failed_jobs
+
+def printFailedJobs(failed_jobs):
+    print("Jobs with nonzero exit status:")
+    for d in failed_jobs:
+        print(d, ': ', failed_jobs[d])
+
+if __name__ == "__main__":
+
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+
+    parser.add_argument("path", type=str,
+                        help="Job summary yaml to update its job state store, or a directory to search for job logs")
+    parser.add_argument("-b", "--batch-system", choices=['slurm', 'pbs'], default='slurm',
+                        help="Batch system")
+    parser.add_argument("-c", "--command", type=str,
+                        help="Accounting command to use instead of sacct or tracejob")
+
+    args = parser.parse_args()
+
+    collector = getCollector(args.batch_system, args.command)
+
+    if os.path.isdir(args.path):
+        success_jobs, failed_jobs = collectDirectory(args.path, collector)
+        printFailedJobs(failed_jobs)
+    else:
+        from jobstate import openJobStore
+        store = openJobStore(args.path)
+        backends = slurm_backends if args.batch_system == 'slurm' else pbs_backends
+        final = updateJobStore(store, collector, backends)
+        nfailed = sum(1 for st in final.values() if st['status'] != 'success')
+        print(f"{len(final)} tasks finished since the last query, {nfailed} of them failed")
+        for r in store.query(status='failed'):
+            print(f"{r['sample']} {r['syst'] or ''} {r['era']} [{r['arrayid']}]: {r['failure'] or ''}")
+        store.close()
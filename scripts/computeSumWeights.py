@@ -4,6 +4,7 @@ import numpy as np
 from ROOT import RDataFrame
 
 from datasets import read_config, listDataFiles
+from mc_weight_variations import compileWeightIndex, writeWeightIndex, getWeightIndexFileName
 
 import logging
 logging.basicConfig(
@@ -50,8 +51,17 @@ def computeSumWeights(
     host = '',
     subcampaigns = ['mc16a', 'mc16d', 'mc16e'],
     outdir = None,
-    verbosity = 0
+    verbosity = 0,
+    samples = None,
+    update = False
     ):
+    """
+    Compute the sum weights of the samples in dataset_config and write them to
+    sumWeights*.yaml next to the dataset config (or in outdir).
+    If samples is provided, only compute the sum weights of these samples.
+    If update is True, start from the existing sum weight files so that the
+    entries of the other samples are kept.
+    """
 
     if verbosity > 1:
         logger.setLevel(logging.DEBUG)
@@ -67,6 +77,27 @@ def computeSumWeights(
     sumw_afii_map = dict()
     sumw_vars_afii_map = dict()
 
+    fname_wcfg = getSumWeightsConfigName(dataset_config)
+    if outdir is None:
+        # save the sum weight file to the same directory as the dataset_config
+        outdir = os.path.dirname(dataset_config)
+    fname_wcfg = os.path.join(outdir, fname_wcfg)
+
+    fname_wcfg_base, fname_wcfg_ext = os.path.splitext(fname_wcfg)
+    fname_wcfg_afii = fname_wcfg_base+'_AFII'+fname_wcfg_ext
+
+    if update:
+        # keep the sum weights of the samples that are not recomputed
+        for fname, map_to_update in [
+            (fname_wcfg, sumw_map),
+            (fname_wcfg_afii, sumw_afii_map),
+            (fname_wcfg.replace("sumWeights", "sumWeights_variations"), sumw_vars_map),
+            (fname_wcfg_afii.replace("sumWeights", "sumWeights_variations"), sumw_vars_afii_map)
+            ]:
+            if os.path.isfile(fname):
+                logger.info(f"Read existing sum weights from {fname}")
+                map_to_update.update(read_config(fname) or {})
+
     logger.info(f"Read dataset config from {dataset_config}")
     datasets_dict = read_config(dataset_config)
 
@@ -75,6 +106,9 @@ def computeSumWeights(
         if sample_name == 'data':
             continue
 
+        if samples is not None and not sample_name in samples:
+            continue
+
         if sample_name == 'unused':
             continue
 
@@ -145,12 +179,6 @@ def computeSumWeights(
         logger.warning("No sum weight map produced!")
         return
 
-    fname_wcfg = getSumWeightsConfigName(dataset_config)
-    if outdir is None:
-        # save the sum weight file to the same directory as the dataset_config
-        outdir = os.path.dirname(dataset_config)
-    fname_wcfg = os.path.join(outdir, fname_wcfg)
-
     if sumw_map:
         logger.info(f"Write sum weight map to file {fname_wcfg}")
         with open(fname_wcfg, 'w') as outfile:
@@ -158,9 +186,6 @@ def computeSumWeights(
 
     # write sumw_afii_map to a separate file if it is not empty
     if sumw_afii_map:
-        fname_wcfg_base, fname_wcfg_ext = os.path.splitext(fname_wcfg)
-        fname_wcfg_afii = fname_wcfg_base+'_AFII'+fname_wcfg_ext
-
         logger.info(f"Write sum weight map to file {fname_wcfg_afii}")
 
         with open(fname_wcfg_afii, 'w') as outfile:
@@ -174,6 +199,10 @@ def computeSumWeights(
         with open(fname_wvars_cfg, 'w') as outfile:
             yaml.dump(sumw_vars_map, outfile)
 
+        fname_gwindex = getWeightIndexFileName(fname_wvars_cfg)
+        logger.info(f"Write generator weight index to file {fname_gwindex}")
+        writeWeightIndex(compileWeightIndex(sumw_vars_map), fname_gwindex)
+
     if sumw_vars_afii_map:
         fname_wvars_afii_cfg = fname_wcfg_afii.replace("sumWeights", "sumWeights_variations")
 
@@ -182,6 +211,10 @@ def computeSumWeights(
         with open(fname_wvars_afii_cfg, 'w') as outfile:
             yaml.dump(sumw_vars_afii_map, outfile)
 
+        fname_gwindex_afii = getWeightIndexFileName(fname_wvars_afii_cfg)
+        logger.info(f"Write generator weight index to file {fname_gwindex_afii}")
+        writeWeightIndex(compileWeightIndex(sumw_vars_afii_map), fname_gwindex_afii)
+
 if __name__ == "__main__":
 
     import argparse
@@ -196,6 +229,10 @@ if __name__ == "__main__":
     #                    help="Site to run the script. (Deprecated)")
     parser.add_argument('-o', '--outdir', type=str, default=None,
                         help="Output directory. If None, use the same directory as the dataset_config")
+    parser.add_argument('-s', '--samples', nargs='+',
+                        help="Samples to compute the sum weights. If None, all samples in the dataset config")
+    parser.add_argument('-u', '--update', action='store_true',
+                        help="If True, update the existing sum weight files instead of overwriting them")
     parser.add_argument('-v', '--verbosity', action='count', default=0,
                         help="Verbosity level")
 
@@ -205,5 +242,7 @@ if __name__ == "__main__":
         args.dataset_config,
         args.local_dir,
         outdir = args.outdir,
-        verbosity = args.verbosity
+        verbosity = args.verbosity,
+        samples = args.samples,
+        update = args.update
     )
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 import yaml
-from datasets import listFiles_rucio
+from datasets import listFiles_rucio, prefetchFiles_rucio
 
 import argparse
 
@@ -25,45 +25,61 @@ datasets_d = yaml.load(open(args.config), yaml.FullLoader)
 totalsize = 0. # MB
 nfiles = 0
 
-for sample in args.samples:
-    # check if sample in the config
-    if not sample in datasets_d:
-        if args.verbosity > 0:
-            print(f"Cannot find sample {sample} in the config")
-        continue
-    else:
-        if args.verbosity > 0:
-            print(f"Processing sample {sample}")
-
+def getEras(sample):
     # Sub-campaigns or years
     if not args.era:
         if sample == 'data':
-            era = ['2015', '2016', '2017', '2018']
+            return ['2015', '2016', '2017', '2018']
         else:
-            era = ['mc16a', 'mc16d', 'mc16e']
+            return ['mc16a', 'mc16d', 'mc16e']
     else:
-        era = args.era
+        return args.era
 
-    # Suffix
+def getSuffix(sample):
     if sample == 'data':
         # collision data
-        suffix = ['tt']
+        return ['tt']
     elif 'ttbar' in sample:
         # signal MC
-        suffix = ['tt', 'sumWeights', 'tt_truth', 'tt_PL']
+        return ['tt', 'sumWeights', 'tt_truth', 'tt_PL']
     else:
         # other MC
-        suffix =['tt', 'sumWeights']
+        return ['tt', 'sumWeights']
+
+def getDIDs(sample, era):
+    dids = datasets_d[sample][era]
+    if isinstance(dids, str):
+        dids = [dids]
+    return dids
+
+# resolve all datasets in batched queries first
+dids_all = []
+for sample in args.samples:
+    if not sample in datasets_d:
+        continue
+
+    for e in getEras(sample):
+        dids_all += [f"{d}_{suf}.root" for suf in getSuffix(sample) for d in getDIDs(sample, e)]
+
+prefetchFiles_rucio(dids_all)
+
+for sample in args.samples:
+    # check if sample in the config
+    if not sample in datasets_d:
+        if args.verbosity > 0:
+            print(f"Cannot find sample {sample} in the config")
+        continue
+    else:
+        if args.verbosity > 0:
+            print(f"Processing sample {sample}")
 
-    for e in era:
+    for e in getEras(sample):
         if args.verbosity > 1:
             print(f"{e}")
 
-        dids = datasets_d[sample][e]
-        if isinstance(dids, str):
-            dids = [dids]
+        dids = getDIDs(sample, e)
 
-        for suf in suffix:
+        for suf in getSuffix(sample):
             fnames = [f"{d}_{suf}.root" for d in dids]
             filesizes = listFiles_rucio(fnames)[1]
 
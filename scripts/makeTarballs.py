@@ -1,7 +1,10 @@
 import os
-import tarfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 from datasets import getSystTreeNames
+from manifest import readManifest, checkManifest, getManifestName
+from tarballs import updateTarball, compressTarball, extractMember
 
 import logging
 logging.basicConfig(
@@ -24,81 +27,107 @@ samples_alt_bkg = ['singleTop_tW_DS_dyn']
 subcampaigns = ['mc16a', 'mc16d', 'mc16e']
 years = ['2015', '2016', '2017', '2018']
 
-def makeTarballMC(
-    sample_names,
-    syst_name,
-    sample_top_dir,
-    tarfile_name,
-    mode = 'w' # or 'a' to append to the existing file
-    ):
-    logger.info(syst_name)
-
-    with tarfile.open(tarfile_name, mode) as tar:
-        # loop over samples
-        for sample in sample_names:
-            # check if sample directory exists
-            sample_dir = os.path.join(sample_top_dir, sample, syst_name)
-            if not os.path.isdir(sample_dir):
-                logger.debug(f" Directory not found: {sample_dir}")
+def listOutputFiles(sample_top_dir, subdir, use_manifest=True):
+    """
+    h5 files in sample_top_dir/subdir and their manifests as (path, name in the archive)
+    """
+    members = []
+    for f in sorted(os.listdir(os.path.join(sample_top_dir, subdir))):
+        arcname = os.path.join(subdir, f)
+        fullname = os.path.join(sample_top_dir, arcname)
+
+        # only include h5 files
+        if not os.path.isfile(fullname) or os.path.splitext(f)[-1]!=".h5":
+            continue
+
+        # skip the file if it has a manifest matching its size and mtime that reports it as bad
+        manifest = readManifest(fullname) if use_manifest else None
+        if manifest is not None:
+            weight_name = 'normalized_weight_mc' if '_unmatched_truth' in arcname else 'normalized_weight'
+            if not checkManifest(manifest, weight_name):
+                logger.warning(f"Skip {fullname}: bad output according to its manifest")
                 continue
 
-            logger.info(f" adding {sample}")
+        members.append((fullname, arcname))
+
+        if manifest is not None:
+            members.append((getManifestName(fullname), getManifestName(arcname)))
 
-            for era in subcampaigns:
-                era_dir = os.path.join(sample_dir, era)
-                if not os.path.isdir(era_dir):
-                    logger.warning(f"Found no directory {era_dir}! Skipping")
-                    continue
+    return members
 
-                for f in os.listdir(era_dir):
-                    arcname = os.path.join(sample, syst_name, era, f)
-                    fullname = os.path.join(sample_top_dir, arcname)
+def listMembersMC(sample_names, syst_name, sample_top_dir, use_manifest=True):
+    members = []
+    for sample in sample_names:
+        # check if sample directory exists
+        sample_dir = os.path.join(sample_top_dir, sample, syst_name)
+        if not os.path.isdir(sample_dir):
+            logger.debug(f" Directory not found: {sample_dir}")
+            continue
 
-                    # only include h5 files
-                    if not os.path.isfile(fullname) or os.path.splitext(f)[-1]!=".h5":
-                        continue
+        for era in subcampaigns:
+            era_dir = os.path.join(sample_dir, era)
+            if not os.path.isdir(era_dir):
+                logger.warning(f"Found no directory {era_dir}! Skipping")
+                continue
 
-                    logger.debug(f" {fullname} --> {arcname}")
-                    tar.add(fullname, arcname=arcname)
+            members += listOutputFiles(sample_top_dir, os.path.join(sample, syst_name, era), use_manifest)
 
-def makeTarballData(
-    sample_names,
-    sample_top_dir,
-    tarfile_name,
-    mode = 'w' # or 'a' to append to the existing file
-    ):
+    return members
 
-    with tarfile.open(tarfile_name, mode) as tar:
-        for sample in sample_names:
-            # check if sample directory exists
-            sample_dir = os.path.join(sample_top_dir, sample)
-            if not os.path.isdir(sample_dir):
-                logger.debug(f" Directory not found: {sample_dir}")
+def listMembersData(sample_names, sample_top_dir, use_manifest=True):
+    members = []
+    for sample in sample_names:
+        # check if sample directory exists
+        sample_dir = os.path.join(sample_top_dir, sample)
+        if not os.path.isdir(sample_dir):
+            logger.debug(f" Directory not found: {sample_dir}")
+            continue
+
+        for year in years:
+            year_dir = os.path.join(sample_dir, year)
+            if not os.path.isdir(year_dir):
+                logger.warning(f"Found no directory: {year_dir}! Skipping")
                 continue
 
-            logger.info(f" adding {sample}")
+            members += listOutputFiles(sample_top_dir, os.path.join(sample, year), use_manifest)
+
+    return members
+
+def listMembersSyst(top_sample_dir, syst, use_manifest=True):
+    """
+    Files of the MC samples, the alternative background samples and, for the
+    nominal, the data samples for one systematic
+    """
+    members = listMembersMC(samples_MC + samples_alt_bkg, syst, top_sample_dir, use_manifest)
+
+    if syst == 'nominal':
+        members += listMembersData(samples_data, top_sample_dir, use_manifest)
 
-            for year in years:
-                year_dir = os.path.join(sample_dir, year)
-                if not os.path.isdir(year_dir):
-                    logger.warning(f"Found no directory: {year_dir}! Skipping")
-                    continue
+    return members
 
-                for f in os.listdir(year_dir):
-                    arcname = os.path.join(sample, year, f)
-                    fullname = os.path.join(sample_top_dir, arcname)
+def makeTarballSyst(top_sample_dir, syst, tarfile_name, use_manifest=True, rebuild=False):
+    return updateTarball(tarfile_name, listMembersSyst(top_sample_dir, syst, use_manifest), rebuild=rebuild)
 
-                    # only include h5 files
-                    if not os.path.isfile(fullname) or os.path.splitext(f)[-1]!=".h5":
-                        continue
+def makeTarballAlt(top_sample_dir, sample, tarfile_name, use_manifest=True, rebuild=False):
+    return updateTarball(tarfile_name, listMembersMC([sample], 'nominal', top_sample_dir, use_manifest), rebuild=rebuild)
 
-                    logger.debug(f" {fullname} --> {arcname}")
-                    tar.add(fullname, arcname)
+def buildTarball(tarfile_name, members, rebuild=False, compress=False, nthreads=1):
+    """
+    Update one archive and compress it if required. Run in a worker process.
+    """
+    nadded = updateTarball(tarfile_name, members, rebuild=rebuild)
+    if compress:
+        compressTarball(tarfile_name, nthreads)
+    return nadded
 
 def makeTarballs(
     data_dir,
     output_dir=None,
     systematics = [],
+    use_manifest = True,
+    nprocesses = 1,
+    rebuild = False,
+    compress = False
     ):
 
     # input sample directory
@@ -128,40 +157,43 @@ def makeTarballs(
         # Take all possible ones if no systematics are provided
         systematics = ['nominal'] + getSystTreeNames(syst_config)
 
+    # archive name -> files to archive
+    tarballs = {}
     for syst in systematics:
-        makeTarballMC(
-            samples_MC,
-            syst,
-            top_sample_dir,
-            tarfile_name = os.path.join(output_dir, f"{syst}.tar"),
-        )
-
-        # add alternative background samples here too
-        makeTarballMC(
-            samples_alt_bkg,
-            syst,
-            top_sample_dir,
-            tarfile_name = os.path.join(output_dir, f"{syst}.tar"),
-            mode = 'a' # append
-        )
-
-        if syst == 'nominal':
-            # add data samples
-            makeTarballData(
-                samples_data,
-                top_sample_dir,
-                tarfile_name = os.path.join(output_dir, f"nominal.tar"),
-                mode = 'a' # append
-            )
+        tarballs[os.path.join(output_dir, f"{syst}.tar")] = listMembersSyst(top_sample_dir, syst, use_manifest)
 
     # alternative ttbar samples
     for ttbar_alt in samples_alt_ttbar:
-        makeTarballMC(
-            [ttbar_alt],
-            "nominal",
-            top_sample_dir,
-            tarfile_name = os.path.join(output_dir, f"{ttbar_alt}.tar")
-        )
+        tarballs[os.path.join(output_dir, f"{ttbar_alt}.tar")] = listMembersMC([ttbar_alt], 'nominal', top_sample_dir, use_manifest)
+
+    # skip archives with nothing to add
+    tarballs = {k: v for k, v in tarballs.items() if v or os.path.isfile(k)}
+
+    logger.info(f"Update {len(tarballs)} archives with {nprocesses} processes")
+    tstart = time.time()
+
+    # threads left to compress each archive
+    nthreads = max(1, (os.cpu_count() or 1) // max(1, nprocesses))
+
+    failed = []
+    with ProcessPoolExecutor(max_workers=nprocesses) as executor:
+        futures = {
+            executor.submit(buildTarball, fname, members, rebuild, compress, nthreads): fname
+            for fname, members in tarballs.items()
+            }
+        for future in as_completed(futures):
+            fname = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Failed to build {fname}: {e}")
+                failed.append(fname)
+
+    logger.info(f"Done in {time.time()-tstart:.1f} s")
+    if failed:
+        logger.error(f"{len(failed)} archives failed: {failed}")
+
+    return failed
 
 if __name__ == "__main__":
     import argparse
@@ -174,14 +206,38 @@ if __name__ == "__main__":
                         help="Output tarball name")
     parser.add_argument("-s", "--systematics", type=str, nargs="*", default=[],
                         help="List of systematics. If not provided, take all available")
+    parser.add_argument("--ignore-manifests", action='store_true',
+                        help="If True, add all h5 files without checking their manifests")
+    parser.add_argument("-j", "--nprocesses", type=int, default=1,
+                        help="Number of archives built in parallel")
+    parser.add_argument("-r", "--rebuild", action='store_true',
+                        help="If True, rebuild the archives instead of appending the new or changed files")
+    parser.add_argument("-z", "--compress", action='store_true',
+                        help="If True, also write gzip compressed archives <name>.tar.gz (with pigz if available)")
+    parser.add_argument("-x", "--extract", type=str, nargs=2, metavar=('TARBALL', 'MEMBER'),
+                        help="Extract one member of an archive using its index, to the current directory")
     parser.add_argument("-v", "--verbose", action='store_true',
                         help="If True, set logging level to debug")
     
     args = parser.parse_args()
 
-    if args.verbose:
-        logger.setLevel(logging.DEBUG)
-    else:
-        logger.setLevel(logging.INFO)
+    for lg in [logger, logging.getLogger('tarballs')]:
+        if args.verbose:
+            lg.setLevel(logging.DEBUG)
+        else:
+            lg.setLevel(logging.INFO)
 
-    makeTarballs(args.data_dir, args.output_dir, args.systematics)
\ No newline at end of file
+    if args.extract:
+        tarball, member = args.extract
+        logger.info(f"Extract {member} from {tarball}")
+        extractMember(tarball, member, os.path.basename(member))
+    else:
+        makeTarballs(
+            args.data_dir,
+            args.output_dir,
+            args.systematics,
+            use_manifest = not args.ignore_manifests,
+            nprocesses = args.nprocesses,
+            rebuild = args.rebuild,
+            compress = args.compress
+            )
\ No newline at end of file
@@ -0,0 +1,354 @@
+"""
+Merge the per-job HDF5 outputs into one file per sample, tree and era
+
+The outputs <name>_<ARRAYID>_<algo>_<truth>_ljets.h5 of the jobs in
+<topdir>/<sample>/<syst>/<era>/ (or <topdir>/<sample>/<year>/ for data) are
+merged into <outdir>/<sample>/<syst>/<era>/<name>_<algo>_<truth>_ljets.h5, in
+which every column is an HDF5 virtual dataset mapping onto the columns of the job
+outputs: nothing is copied, and the merged file reads like one output. The job
+outputs are referred to by their paths relative to the merged file, so the two
+directory trees can be moved together.
+
+With --compact, the merged files are physical copies of the columns in chunked
+datasets instead, written in parallel.
+"""
+import os
+import re
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import h5py
+
+from cutflow import readCutflow, mergeCutflows
+from tarballs import getSourceStamp
+
+import logging
+logging.basicConfig(
+    format='%(asctime)s %(levelname)-7s %(name)-10s %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+    )
+logger = logging.getLogger(__name__)
+
+def getMergedName(fname):
+    """
+    <name>_<ARRAYID>_<rest>.h5 -> (<name>_<rest>.h5, ARRAYID). None if fname is not a job output name.
+    """
+    m = re.match(r'^(.+)_(\d+)_(.+\.h5)$', fname)
+    if m is None:
+        return None
+    return f"{m.group(1)}_{m.group(3)}", int(m.group(2))
+
+def groupOutputFiles(topdir, across_eras=False):
+    """
+    Job outputs under topdir grouped by merged file.
+    Return a dictionary: merged file path relative to topdir -> list of job output paths
+    ordered by array id (and era if across_eras)
+    """
+    groups = {}
+    for dirpath, dirnames, fnames in os.walk(topdir):
+        dirnames.sort()
+        reldir = os.path.relpath(dirpath, topdir)
+        if across_eras:
+            reldir = os.path.dirname(reldir)
+
+        for fname in fnames:
+            merged = getMergedName(fname)
+            if merged is None:
+                continue
+            merged_name, array_id = merged
+            groups.setdefault(os.path.join(reldir, merged_name), []).append((dirpath, array_id, os.path.join(dirpath, fname)))
+
+    return {k: [p for _, _, p in sorted(v)] for k, v in sorted(groups.items())}
+
+def getCommonColumns(sources):
+    """
+    Lengths of the sources and the columns with the same dtype in all of them: list of (name, dtype)
+    """
+    lengths = []
+    columns = None
+    allnames = set()
+    for fpath in sources:
+        with h5py.File(fpath, 'r') as f:
+            cols = {k: ds.dtype for k, ds in f.items() if isinstance(ds, h5py.Dataset) and ds.ndim == 1}
+            lengths.append(len(f[next(iter(cols))]) if cols else 0)
+
+        allnames.update(cols)
+        if columns is None:
+            columns = cols
+        else:
+            columns = {k: v for k, v in columns.items() if cols.get(k) == v}
+
+    columns = columns or {}
+    dropped = sorted(allnames - set(columns))
+    if dropped:
+        logger.warning(f"Columns {dropped} are missing or of different types in some of the files. Skip them")
+
+    return lengths, list(columns.items())
+
+def getMergedCutflow(sources):
+    """
+    Merged cutflow of the sources. None unless all of them have one.
+    """
+    cutflows = []
+    for fpath in sources:
+        cutflow = readCutflow(fpath)
+        if cutflow is None:
+            return None
+        cutflows.append(cutflow)
+    return mergeCutflows(cutflows)
+
+def getSourceNames(output, sources):
+    # as stored in the merged file: relative to its directory
+    return [os.path.relpath(p, os.path.dirname(output)) for p in sources]
+
+def readMergedAttribute(output, name):
+    """
+    JSON attribute of a merged file, or None if it cannot be read or has no such attribute
+    """
+    try:
+        with h5py.File(output, 'r') as f:
+            return json.loads(f.attrs[name]) if name in f.attrs else None
+    except (OSError, ValueError):
+        return None
+
+def readSourceNames(output):
+    """
+    Sources recorded in a merged file, or None if it cannot be read or has no record of them
+    """
+    return readMergedAttribute(output, 'sources')
+
+def getSourceStamps(sources):
+    # size and mtime of each source: copies with 'cp -p' keep the mtime of an older file, but rarely also its size
+    return [getSourceStamp(p) for p in sources]
+
+def checkSources(sources):
+    """
+    Raise FileNotFoundError if any source is missing. Return the stamps of the sources
+    taken before they are read.
+    """
+    missing = [p for p in sources if not os.path.isfile(p)]
+    if missing:
+        raise FileNotFoundError(f"{len(missing)} job outputs are missing, e.g. {missing[0]}")
+    return getSourceStamps(sources)
+
+def writeMergedAttributes(fout, output, sources, stamps):
+    fout.attrs['sources'] = json.dumps(getSourceNames(output, sources))
+    fout.attrs['source_stamps'] = json.dumps(stamps)
+    cutflow = getMergedCutflow(sources)
+    if cutflow is not None:
+        fout.attrs['cutflow'] = json.dumps(cutflow)
+
+def buildVirtualFile(output, sources):
+    """
+    Write output with one virtual dataset per column mapping onto the sources
+    """
+    stamps = checkSources(sources)
+    lengths, columns = getCommonColumns(sources)
+    total = sum(lengths)
+
+    ftmp = f"{output}.{os.getpid()}.tmp"
+    with h5py.File(ftmp, 'w') as fout:
+        for cname, dtype in columns:
+            layout = h5py.VirtualLayout(shape=(total,), dtype=dtype)
+            start = 0
+            for fpath, n in zip(sources, lengths):
+                if n > 0:
+                    # relative to the directory of the merged file, where HDF5 looks for it
+                    relpath = os.path.relpath(fpath, os.path.dirname(output))
+                    layout[start:start+n] = h5py.VirtualSource(relpath, cname, shape=(n,))
+                start += n
+            fout.create_virtual_dataset(cname, layout)
+
+        writeMergedAttributes(fout, output, sources, stamps)
+
+    os.replace(ftmp, output)
+    return total
+
+def compactFile(output, sources, chunk_size=2**16, compression=None):
+    """
+    Write output with the columns of the sources copied one after the other into chunked datasets
+    """
+    stamps = checkSources(sources)
+    lengths, columns = getCommonColumns(sources)
+    total = sum(lengths)
+
+    ftmp = f"{output}.{os.getpid()}.tmp"
+    with h5py.File(ftmp, 'w') as fout:
+        dsets = {}
+        for cname, dtype in columns:
+            dsets[cname] = fout.create_dataset(
+                cname, shape=(total,), dtype=dtype,
+                chunks=(min(chunk_size, total),) if total else None,
+                compression=compression)
+
+        start = 0
+        for fpath, n in zip(sources, lengths):
+            if n > 0:
+                with h5py.File(fpath, 'r') as fin:
+                    for cname, _ in columns:
+                        dsets[cname][start:start+n] = fin[cname][:]
+            start += n
+
+        writeMergedAttributes(fout, output, sources, stamps)
+
+    os.replace(ftmp, output)
+    return total
+
+def isUpToDate(output, sources):
+    """
+    True if output was merged from exactly these sources and none of them has changed
+    since, i.e. their sizes and mtimes are the ones recorded in output.
+    A virtual dataset would read the rows of a removed source as zeros.
+    """
+    if not os.path.isfile(output):
+        return False
+    if readSourceNames(output) != getSourceNames(output, sources):
+        return False
+    try:
+        return readMergedAttribute(output, 'source_stamps') == getSourceStamps(sources)
+    except OSError:
+        return False
+
+def removeOrphans(outdir, samples, outputs):
+    """
+    Remove the merged files under outdir/<sample> other than outputs that refer to job outputs
+    that no longer exist, e.g. all the job outputs of the file were removed
+    """
+    for sample in samples:
+        for dirpath, _, fnames in os.walk(os.path.join(outdir, sample)):
+            for fname in fnames:
+                fpath = os.path.join(dirpath, fname)
+                if not fname.endswith('.h5') or fpath in outputs:
+                    continue
+                names = readSourceNames(fpath)
+                if names is None or all(os.path.isfile(os.path.join(dirpath, n)) for n in names):
+                    continue
+                logger.warning(f"Remove {fpath}: some of its job outputs were removed")
+                os.remove(fpath)
+
+def mergeGroup(output, sources, compact=False, compression=None, force=False):
+    if not force and isUpToDate(output, sources):
+        logger.debug(f"{output} is up to date")
+        return None
+
+    outdir = os.path.dirname(output)
+    if outdir and not os.path.isdir(outdir):
+        os.makedirs(outdir, exist_ok=True)
+
+    tstart = time.time()
+    if compact:
+        nevents = compactFile(output, sources, compression=compression)
+    else:
+        nevents = buildVirtualFile(output, sources)
+    logger.debug(f"{output}: {nevents} events from {len(sources)} files in {time.time()-tstart:.2f} s")
+
+    return nevents
+
+def mergeOutputs(
+    topdir,
+    outdir = None,
+    samples = [],
+    across_eras = False,
+    compact = False,
+    compression = None,
+    nprocesses = 1,
+    force = False
+    ):
+    """ Merge the job outputs of each sample, tree and era
+    ______
+    Arguments
+    topdir: str; top directory of the job outputs
+    outdir: str; top directory of the merged files. Default: <topdir>/merged
+    samples: list of str; sample names to merge. All if empty
+    across_eras: bool; if True, merge the outputs of all eras of a sample and tree into one file
+    compact: bool; if True, write physical chunked files instead of virtual datasets
+    compression: str; compression of the compact files e.g. 'gzip' or 'lzf'
+    nprocesses: int; number of files written in parallel
+    force: bool; if True, rewrite the merged files whose sources have not changed
+    """
+    topdir = os.path.expanduser(topdir)
+    if outdir is None:
+        outdir = os.path.join(topdir, 'merged')
+
+    groups = {}
+    samples = [s for s in (samples or sorted(os.listdir(topdir))) if os.path.isdir(os.path.join(topdir, s))]
+    samples = [s for s in samples if os.path.abspath(os.path.join(topdir, s)) != os.path.abspath(outdir)]
+    for sample in samples:
+        for relpath, sources in groupOutputFiles(os.path.join(topdir, sample), across_eras).items():
+            groups[os.path.join(outdir, sample, relpath)] = sources
+
+    removeOrphans(outdir, samples, groups)
+
+    logger.info(f"Merge {sum(len(v) for v in groups.values())} outputs into {len(groups)} {'compact' if compact else 'virtual'} files")
+    tstart = time.time()
+
+    failed = []
+    nmerged = 0
+    if nprocesses > 1 and len(groups) > 1:
+        with ProcessPoolExecutor(max_workers=nprocesses) as executor:
+            futures = {
+                executor.submit(mergeGroup, output, sources, compact, compression, force): output
+                for output, sources in groups.items()
+                }
+            for future in as_completed(futures):
+                try:
+                    nmerged += future.result() is not None
+                except Exception as e:
+                    logger.error(f"Failed to merge {futures[future]}: {e}")
+                    failed.append(futures[future])
+    else:
+        for output, sources in groups.items():
+            try:
+                nmerged += mergeGroup(output, sources, compact, compression, force) is not None
+            except Exception as e:
+                logger.error(f"Failed to merge {output}: {e}")
+                failed.append(output)
+
+    logger.info(f"Wrote {nmerged} files ({len(groups)-nmerged-len(failed)} up to date) in {time.time()-tstart:.1f} s")
+    if failed:
+        logger.error(f"{len(failed)} files failed")
+
+    return failed
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument("-i", "--data-dir", type=str,
+                        default="~/data/ntuplerTT/latest/",
+                        help="Top directory of the job outputs")
+    parser.add_argument("-o", "--output-dir", type=str,
+                        help="Top directory of the merged files. Default: <data_dir>/merged")
+    parser.add_argument("-s", "--samples", type=str, nargs="*", default=[],
+                        help="List of samples. If not provided, take all")
+    parser.add_argument("-a", "--across-eras", action='store_true',
+                        help="If True, merge all eras of a sample and tree into one file")
+    parser.add_argument("-c", "--compact", action='store_true',
+                        help="If True, copy the columns into chunked datasets instead of writing virtual datasets")
+    parser.add_argument("-z", "--compression", type=str, choices=['gzip', 'lzf'],
+                        help="Compression of the compact files")
+    parser.add_argument("-j", "--nprocesses", type=int, default=1,
+                        help="Number of files written in parallel")
+    parser.add_argument("-f", "--force", action='store_true',
+                        help="If True, rewrite the merged files even if their job outputs have not changed")
+    parser.add_argument("-v", "--verbose", action='store_true',
+                        help="If True, set logging level to debug")
+
+    args = parser.parse_args()
+
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
+    else:
+        logger.setLevel(logging.INFO)
+
+    mergeOutputs(
+        args.data_dir,
+        args.output_dir,
+        args.samples,
+        across_eras = args.across_eras,
+        compact = args.compact,
+        compression = args.compression,
+        nprocesses = args.nprocesses,
+        force = args.force
+        )
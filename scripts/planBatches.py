@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Pack the array tasks of small jobs into shared batch jobs
+
+Many background samples (single top, W/Z+jets, ttV, VV, ttH) have small inputs
+for each systematic tree and era, so their runtime is dominated by the job
+startup: setting up the environment, importing ROOT and compiling the helper
+functions. This script takes the job files in a job summary yaml, predicts the
+cost of each array task (unit) with the resource model and packs the small units
+into array tasks of a new job file up to a target cost. The units of a task are
+processed in sequence by one processMiniNtuples.py process, each in a forked
+child. Each unit writes its outputs to its usual <sample>/<tree>/<era> directory
+and its log <batch jobid>_<batch arrayid>.unit<arrayid>.out to the directory of
+its original job file, so checkOutputs.py works as before.
+
+The job files of the batched units are removed from the job summary written
+with the suffix '_unbatched', which can be submitted with submitJobs.py as usual.
+
+With --queue, the units are put in a SQLite work queue instead, and the job file
+starts long-lived workers (processMiniNtuples.py --worker) that pull units from
+the queue, so the load balances itself across the workers.
+"""
+import os
+import json
+import shlex
+import yaml
+
+from resources import ResourceModel, getOutputOptions, input_sizes_name
+from runJobsLocal import readJobFile, getDirectCommand, expandVariables, getJobFiles
+from writeJobFile import writeBatchJobFile
+
+# background samples whose jobs are batched by default
+default_samples = ['singleTop_sch', 'singleTop_tch', 'singleTop_tW_DR_dyn', 'singleTop_tW_DS_dyn', 'Wjets', 'Zjets', 'ttV', 'VV', 'ttH']
+
+def getUnitArguments(fname_job, arrayids):
+    """
+    Command line arguments of processMiniNtuples.py for each array task of a job file:
+    dictionary array index -> list of arguments
+    Inputs are read from their original location and outputs are written to the output directory directly.
+    """
+    cmdline, variables = getDirectCommand(fname_job)
+    srcdir = os.getenv('SourceDIR', os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+    arguments = {}
+    for arrayid in arrayids:
+        env = {
+            'SourceDIR': srcdir,
+            'SLURM_ARRAY_TASK_ID': str(arrayid),
+            'PBS_ARRAYID': str(arrayid),
+            'array_id': str(arrayid)
+        }
+        for vname, value in variables.items():
+            env[vname] = expandVariables(value, env)
+
+        tokens = shlex.split(expandVariables(cmdline, env))
+        # arguments after the script name
+        iscript = [i for i, t in enumerate(tokens) if t.endswith('processMiniNtuples.py')][0]
+        arguments[arrayid] = tokens[iscript+1:]
+
+    return arguments
+
+def getUnitOptions(arguments):
+    """
+    Output options of processMiniNtuples.py from its arguments
+    """
+    if '-t' in arguments or '--parton-files' in arguments:
+        truth_level = 'parton'
+    elif '-p' in arguments or '--particle-files' in arguments:
+        truth_level = 'particle'
+    else:
+        truth_level = ''
+
+    return getOutputOptions(' '.join(arguments), truth_level)
+
+def collectUnits(jobfiles, model, max_unit_cost):
+    """ Collect the array tasks of the job files that are cheap enough to be batched
+    ______
+    Arguments
+    jobfiles: list of (keys, job file) as returned by runJobsLocal.getJobFiles
+    model: ResourceModel
+    max_unit_cost: float; max predicted walltime in seconds of a unit to be batched
+
+    Return
+    list of units, each a dict with keys 'jobfile', 'arrayid', 'args', 'keys',
+    'cost' (predicted walltime excluding the startup, in seconds), 'memory' (MB);
+    list of job files of which all array tasks are batched
+    """
+    units = []
+    batched_jobfiles = []
+
+    for keys, fname_job in jobfiles:
+        if not os.path.isfile(fname_job):
+            print(f"WARNING: cannot find job file {fname_job}")
+            continue
+
+        fname_sizes = os.path.join(os.path.dirname(fname_job), 'inputs', input_sizes_name)
+        if not os.path.isfile(fname_sizes):
+            print(f"WARNING: no input sizes for {fname_job}. Skip.")
+            continue
+
+        with open(fname_sizes) as f:
+            input_sizes = json.load(f)
+
+        arrayids, _, _ = readJobFile(fname_job)
+        arguments = getUnitArguments(fname_job, arrayids)
+
+        job_units = []
+        for arrayid in arrayids:
+            options = getUnitOptions(arguments[arrayid])
+            memory, walltime = model.predict(input_sizes.get(str(arrayid), 0), options)
+            if walltime > max_unit_cost:
+                break
+
+            job_units.append({
+                'jobfile': fname_job,
+                'arrayid': arrayid,
+                'args': arguments[arrayid],
+                'keys': keys,
+                'cost': walltime - model.coefficients['time_base'],
+                'memory': memory
+            })
+        else:
+            # batch a job only if all its tasks are small
+            units += job_units
+            batched_jobfiles.append(fname_job)
+
+    return units, batched_jobfiles
+
+def packUnits(units, target_cost):
+    """
+    Pack units into batches whose total cost is at most target_cost (first fit decreasing).
+    A unit more expensive than target_cost gets a batch of its own.
+    """
+    batches = []
+    costs = []
+
+    for unit in sorted(units, key=lambda u: u['cost'], reverse=True):
+        for ib, cost in enumerate(costs):
+            if cost + unit['cost'] <= target_cost:
+                batches[ib].append(unit)
+                costs[ib] += unit['cost']
+                break
+        else:
+            batches.append([unit])
+            costs.append(unit['cost'])
+
+    return batches
+
+def planBatches(
+    jobs_config,
+    batch_dir,
+    samples = default_samples,
+    systematics = [],
+    eras = [],
+    target_cost = 2*3600,
+    max_unit_cost = None,
+    resource_model = None,
+    site = 'atlasserv',
+    max_task = None,
+    mem_margin = 1.3,
+    time_margin = 1.5,
+    queue = None,
+    nworkers = None
+    ):
+    """
+    Plan the batches of small units of the jobs in jobs_config and write the batch job file
+    to batch_dir. Return the path to the batch job file and the unbatched job summary.
+
+    If queue is provided, the units are added to this SQLite work queue instead and the
+    job file starts nworkers workers (by default as many as the planned batches) that
+    pull units from the queue until it is empty or their time is used up.
+    """
+    with open(jobs_config) as f:
+        jobs_dict = yaml.load(f, yaml.FullLoader)
+
+    model = ResourceModel(resource_model)
+    time_base = model.coefficients['time_base']
+
+    if max_unit_cost is None:
+        max_unit_cost = target_cost / 2 + time_base
+
+    jobfiles = getJobFiles(jobs_dict, samples, systematics, eras)
+    units, batched_jobfiles = collectUnits(jobfiles, model, max_unit_cost)
+
+    if not units:
+        print("No units to batch")
+        return None, None
+
+    batches = packUnits(units, target_cost)
+    print(f"Pack {len(units)} units of {len(batched_jobfiles)} jobs into {len(batches)} batches")
+
+    if not os.path.isdir(batch_dir):
+        os.makedirs(batch_dir)
+
+    memory = max(u['memory'] for u in units) * mem_margin / 1024
+    memory = max(int(-(-memory//1)), 2)
+
+    if queue:
+        from workqueue import WorkQueue
+
+        wq = WorkQueue(queue)
+        nadded = wq.addUnits(units)
+        print(f"Add {nadded} units to the work queue {queue}: {wq.counts()}")
+        wq.close()
+
+        nworkers = nworkers or len(batches)
+
+        # a worker stops claiming units after the target cost, and may then run the largest unit
+        max_cost = max(u['cost'] for u in units)
+        walltime = int((time_base + target_cost + max_cost * time_margin) * 1.1)
+
+        fname_batch = writeBatchJobFile(
+            batch_dir,
+            nworkers,
+            mem = f"{memory}G",
+            walltime = f"{walltime//3600}:{walltime%3600//60:02d}:00",
+            site = site,
+            max_task = max_task,
+            name = 'workers',
+            queue = queue,
+            max_time = target_cost / 3600,
+            verbosity = 1
+            )
+    else:
+        for ib, batch in enumerate(batches):
+            with open(os.path.join(batch_dir, f"units_{ib}.json"), 'w') as f:
+                json.dump([{k: u[k] for k in ['jobfile', 'arrayid', 'args']} for u in batch], f, indent=1)
+
+        # resources of the largest batch with the startup paid once
+        walltime = int((time_base + max(sum(u['cost'] for u in b) for b in batches)) * time_margin)
+        walltime = max(walltime, 3600)
+
+        fname_batch = writeBatchJobFile(
+            batch_dir,
+            len(batches),
+            mem = f"{memory}G",
+            walltime = f"{walltime//3600}:{walltime%3600//60:02d}:00",
+            site = site,
+            max_task = max_task,
+            verbosity = 1
+            )
+
+    # job summary without the batched job files
+    def remove_batched(d):
+        return {k: remove_batched(v) if isinstance(v, dict) else (None if v in batched_jobfiles else v) for k, v in d.items()}
+
+    fname_unbatched = os.path.splitext(jobs_config)[0] + '_unbatched.yaml'
+    print(f"Write the job summary without the batched jobs: {fname_unbatched}")
+    with open(fname_unbatched, 'w') as f:
+        yaml.dump(remove_batched(jobs_dict), f)
+
+    return fname_batch, fname_unbatched
+
+if __name__ == "__main__":
+
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+
+    parser.add_argument("jobs_config", type=str,
+                        help="Job summary yaml produced by generate_jobfiles_*.py")
+    parser.add_argument("-d", "--batch-dir", type=str,
+                        help="Directory to write the batch job file and the unit lists. Default: 'batches' next to the job summary")
+    parser.add_argument("-s", "--samples", nargs='+', default=default_samples,
+                        help="Samples whose jobs may be batched")
+    parser.add_argument("-u", "--systematics", nargs='+', default=[],
+                        help="Only batch systematic trees that contain one of the names")
+    parser.add_argument("-e", "--eras", nargs='+', default=[],
+                        help="Only batch jobs of these eras")
+    parser.add_argument("-c", "--target-cost", type=float, default=2.,
+                        help="Target processing time of a batch in hours")
+    parser.add_argument("--max-unit-cost", type=float,
+                        help="Max predicted walltime in hours of a unit to be batched. Default: half of the target cost plus the job startup")
+    parser.add_argument("--resource-model", type=str,
+                        help="Calibrated resource model. If not provided, use the default coefficients")
+    parser.add_argument("--site", choices=['flashy', 'cedar', 'atlasserv'], default='atlasserv',
+                        help="Host to run batch jobs")
+    parser.add_argument("-m", "--max-tasks", type=int,
+                        help="Max number of active tasks at any one time")
+    parser.add_argument("-q", "--queue", type=str,
+                        help="SQLite work queue. If provided, add the units to the queue and write a job file of workers pulling from it")
+    parser.add_argument("-w", "--nworkers", type=int,
+                        help="Number of workers. Default: the number of planned batches")
+
+    args = parser.parse_args()
+
+    batch_dir = args.batch_dir or os.path.join(os.path.dirname(os.path.abspath(args.jobs_config)), 'batches')
+
+    planBatches(
+        args.jobs_config,
+        batch_dir,
+        samples = args.samples,
+        systematics = args.systematics,
+        eras = args.eras,
+        target_cost = args.target_cost * 3600,
+        max_unit_cost = args.max_unit_cost * 3600 if args.max_unit_cost else None,
+        resource_model = args.resource_model,
+        site = args.site,
+        max_task = args.max_tasks,
+        queue = args.queue,
+        nworkers = args.nworkers
+        )
@@ -1,7 +1,8 @@
-from ROOT import TChain, TFile, gDirectory
+from histbooking import HistogramBooker
 
-def drawFromTree(
-    tree,
+def bookResolutions(
+    booker,
+    directory,
     label = "ttbar",
     reco_prefix = "PseudoTop_Reco_ttbar",
     truth_prefix = "MC_ttbar_afterFSR",
@@ -9,7 +10,7 @@ def drawFromTree(
     good_events_cut = "!isnan(MC_thad_afterFSR_y)&&isDummy==0"
     ):
 
-    print(label)
+    print(f"{directory}: {label}")
 
     if not selections:
         selections = good_events_cut
@@ -19,147 +20,53 @@ def drawFromTree(
     # pt resolution
     pt_reco = f"{reco_prefix}_pt"
     pt_truth = f"({truth_prefix}_pt/1000)" # convert MeV to GeV
-    hname_pt = f"h_{label}_res_pt"
-    bins_pt = "(100, -1, 5)"
-
-    tree.Draw(f"({pt_reco}/{pt_truth})-1>>{hname_pt}{bins_pt}", selections)
-    h_res_pt = gDirectory.Get(hname_pt)
-    h_res_pt.Write()
+    booker.book1D(f"h_{label}_res_pt", f"({pt_reco}/{pt_truth})-1", (100, -1, 5), selections, directory=directory)
 
     # mass resolution
     m_reco = f"{reco_prefix}_m"
     m_truth = f"({truth_prefix}_m/1000)" # convert MeV to GeV
-    hname_m = f"h_{label}_res_m"
-    bins_m = "(100, -1, 5)"
-
-    tree.Draw(f"({m_reco}/{m_truth})-1>>{hname_m}{bins_m}", selections)
-    h_res_m = gDirectory.Get(hname_m)
-    h_res_m.Write()
+    booker.book1D(f"h_{label}_res_m", f"({m_reco}/{m_truth})-1", (100, -1, 5), selections, directory=directory)
 
     # y residual
     y_reco = f"{reco_prefix}_y"
     y_truth = f"{truth_prefix}_y"
-    hname_y = f"h_{label}_res_y"
-    bins_y = "(100, -2, 2)"
-
-    tree.Draw(f"{y_reco}-{y_truth}>>{hname_y}{bins_y}", selections)
-    h_res_y = gDirectory.Get(hname_y)
-    h_res_y.Write()
+    booker.book1D(f"h_{label}_res_y", f"{y_reco}-{y_truth}", (100, -2, 2), selections, directory=directory)
 
     # phi residual
     phi_reco = f"{reco_prefix}_phi"
     phi_truth = f"{truth_prefix}_phi"
-    hname_phi = f"h_{label}_res_phi"
-    bins_phi = "(100, -3.2, 3.2)"
+    booker.book1D(f"h_{label}_res_phi", f"TVector2::Phi_mpi_pi({phi_reco}-{phi_truth})", (100, -3.2, 3.2), selections, directory=directory)
+
+# selection regions: output directory -> selection
+regions = {
+    "PseudoTop": "",
+    "PseudoTop_highPt": "MC_ttbar_afterFSR_pt/1000>250",
+    "PseudoTop_central": "abs(MC_ttbar_afterFSR_eta)<2.5",
+    "PseudoTop_central_highPt": "abs(MC_ttbar_afterFSR_eta)<2.5&&MC_ttbar_afterFSR_pt/1000>250"
+}
+
+# objects: label -> (reco prefix, truth prefix)
+objects = {
+    "ttbar": ("PseudoTop_Reco_ttbar", "MC_ttbar_afterFSR"),
+    "thad": ("PseudoTop_Reco_top_had", "MC_thad_afterFSR"),
+    "tlep": ("PseudoTop_Reco_top_lep", "MC_tlep_afterFSR")
+}
+
+def plotRecoPerf(inputfiles, output, treename_reco, treename_truth=None, nthreads=0):
+    print("Read trees from", inputfiles)
 
-    tree.Draw(f"TVector2::Phi_mpi_pi({phi_reco}-{phi_truth})>>{hname_phi}{bins_phi}", selections)
-    h_res_phi = gDirectory.Get(hname_phi)
-    h_res_phi.Write()
+    # all histograms are filled in one pass over the trees
+    booker = HistogramBooker(inputfiles, treename_reco, friend_treename=treename_truth, nthreads=nthreads)
 
-def plotRecoPerf(inputfiles, output, treename_reco, treename_truth=None):
-    print("Read trees from", inputfiles)
+    for directory, selections in regions.items():
+        for label, (reco_prefix, truth_prefix) in objects.items():
+            bookResolutions(
+                booker, directory, label,
+                reco_prefix = reco_prefix,
+                truth_prefix = truth_prefix,
+                selections = selections)
 
-    tree_reco = TChain(treename_reco)
-    for infile in inputfiles:
-        print(f"Add file {infile}")
-        tree_reco.Add(infile)
-
-    if treename_truth:
-        tree_truth = TChain(treename_truth)
-        for infile in inputfiles:
-            tree_truth.Add(infile)
-
-        # make them friends!
-        tree_reco.AddFriend(tree_truth)
-
-    # output file
-    outfile = TFile.Open(output, 'recreate')
-    outfile.cd()
-
-    # PseudoTop
-    print("PseudoTop")
-    outfile.mkdir("PseudoTop")
-    outfile.cd("PseudoTop")
-
-    drawFromTree(
-        tree_reco, "ttbar",
-        reco_prefix = "PseudoTop_Reco_ttbar",
-        truth_prefix = "MC_ttbar_afterFSR")
-
-    drawFromTree(
-        tree_reco, "thad",
-        reco_prefix = "PseudoTop_Reco_top_had",
-        truth_prefix = "MC_thad_afterFSR")
-
-    drawFromTree(
-        tree_reco, "tlep",
-        reco_prefix = "PseudoTop_Reco_top_lep",
-        truth_prefix = "MC_tlep_afterFSR")
-
-    print("PseudoTop high pT")
-    outfile.mkdir("PseudoTop_highPt")
-    outfile.cd("PseudoTop_highPt")
-    drawFromTree(
-        tree_reco, "ttbar",
-        reco_prefix = "PseudoTop_Reco_ttbar",
-        truth_prefix = "MC_ttbar_afterFSR",
-        selections="MC_ttbar_afterFSR_pt/1000>250")
-
-    drawFromTree(
-        tree_reco, "thad",
-        reco_prefix = "PseudoTop_Reco_top_had",
-        truth_prefix = "MC_thad_afterFSR",
-        selections="MC_ttbar_afterFSR_pt/1000>250")
-
-    drawFromTree(
-        tree_reco, "tlep",
-        reco_prefix = "PseudoTop_Reco_top_lep",
-        truth_prefix = "MC_tlep_afterFSR",
-        selections="MC_ttbar_afterFSR_pt/1000>250")
-
-    print("PseudoTop central eta")
-    outfile.mkdir("PseudoTop_central")
-    outfile.cd("PseudoTop_central")
-    drawFromTree(
-        tree_reco, "ttbar",
-        reco_prefix = "PseudoTop_Reco_ttbar",
-        truth_prefix = "MC_ttbar_afterFSR",
-        selections="abs(MC_ttbar_afterFSR_eta)<2.5")
-
-    drawFromTree(
-        tree_reco, "thad",
-        reco_prefix = "PseudoTop_Reco_top_had",
-        truth_prefix = "MC_thad_afterFSR",
-        selections="abs(MC_ttbar_afterFSR_eta)<2.5")
-
-    drawFromTree(
-        tree_reco, "tlep",
-        reco_prefix = "PseudoTop_Reco_top_lep",
-        truth_prefix = "MC_tlep_afterFSR",
-        selections="abs(MC_ttbar_afterFSR_eta)<2.5")
-
-    print("PseudoTop central eta high pT")
-    outfile.mkdir("PseudoTop_central_highPt")
-    outfile.cd("PseudoTop_central_highPt")
-    drawFromTree(
-        tree_reco, "ttbar",
-        reco_prefix = "PseudoTop_Reco_ttbar",
-        truth_prefix = "MC_ttbar_afterFSR",
-        selections="abs(MC_ttbar_afterFSR_eta)<2.5&&MC_ttbar_afterFSR_pt/1000>250")
-
-    drawFromTree(
-        tree_reco, "thad",
-        reco_prefix = "PseudoTop_Reco_top_had",
-        truth_prefix = "MC_thad_afterFSR",
-        selections="abs(MC_ttbar_afterFSR_eta)<2.5&&MC_ttbar_afterFSR_pt/1000>250")
-
-    drawFromTree(
-        tree_reco, "tlep",
-        reco_prefix = "PseudoTop_Reco_top_lep",
-        truth_prefix = "MC_tlep_afterFSR",
-        selections="abs(MC_ttbar_afterFSR_eta)<2.5&&MC_ttbar_afterFSR_pt/1000>250")
-
-    outfile.Close()
+    booker.write(output)
 
 if __name__ == "__main__":
 
@@ -175,10 +82,13 @@ if __name__ == "__main__":
                         help="Reco tree name")
     parser.add_argument('-t', '--treename-truth', default='parton', type=str,
                         help="Truth tree name")
+    parser.add_argument('-j', '--nthreads', type=int, default=0,
+                        help="Number of threads to fill the histograms. 0 to use all cores")
 
     args = parser.parse_args()
 
     plotRecoPerf(
         args.inputfiles, args.output,
-        args.treename_reco, args.treename_truth
+        args.treename_reco, args.treename_truth,
+        args.nthreads
         )
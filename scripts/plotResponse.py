@@ -1,4 +1,6 @@
-from ROOT import TChain, TFile, TCanvas, gDirectory, gStyle
+from ROOT import TFile, TCanvas, gStyle
+
+from histbooking import HistogramBooker
 
 import argparse
 
@@ -12,21 +14,15 @@ parser.add_argument('-r', '--reco-tree', default='reco', type=str,
                     help="Reco tree name")
 parser.add_argument('-t', '--truth-tree', default='parton',
                     choices=['particle','parton'], help="Truth tree name")
+parser.add_argument('-j', '--nthreads', type=int, default=0,
+                    help="Number of threads to fill the histograms. 0 to use all cores")
 
 args = parser.parse_args()
 
 print("Read trees from", args.inputfiles)
 
-tree_reco = TChain(args.reco_tree)
-for infile in args.inputfiles:
-    tree_reco.Add(infile)
-
-tree_truth = TChain(args.truth_tree)
-for infile in args.inputfiles:
-    tree_truth.Add(infile)
-
-# make them friends!
-tree_reco.AddFriend(tree_truth)
+# all histograms are filled in one pass over the reco tree and its truth friend tree
+booker = HistogramBooker(args.inputfiles, args.reco_tree, friend_treename=args.truth_tree, nthreads=args.nthreads)
 
 branches_reco = {}
 branches_truth = {}
@@ -150,7 +146,26 @@ elif args.truth_tree == 'particle':
         ('ttbar','yboost') : 'PseudoTop_Particle_ttbar_yboost'
     }
 
-foutroot = TFile.Open(args.output+'.root', 'recreate')
+# binning of the response histograms
+binning = {
+    'pt'     : (40, 0, 800),
+    'eta'    : (40, -5, 5),
+    'y'      : (40, -2.5, 2.5),
+    'phi'    : (40, -3.2, 3.2),
+    'm'      : (40, 100, 250),
+    'E'      : (40, 0, 2000),
+    'pout'   : (40, -400, 400),
+    'dphi'   : (40, 0, 3.2),
+    'Ht'     : (40, 0, 1000),
+    'chi'    : (40, 1, 20),
+    'ystar'  : (40, -2.5, 2.5),
+    'yboost' : (40, -2.5, 2.5)
+}
+binning_ttbar = {
+    'pt'     : (40, 0, 600),
+    'm'      : (40, 300, 1500),
+    'E'      : (40, 300, 3000)
+}
 
 histnames = []
 
@@ -165,14 +180,10 @@ for t in ['tlep', 'thad', 'ttbar']:
         hname = "h_"+t+"_"+v
         histnames.append(hname)
 
-        tree_reco.Draw(btruth+":"+breco+">>"+hname, cuts, "goff")
-        hresp = gDirectory.Get(hname)
-        hresp.SetTitle(t+"_"+v)
-        hresp.GetXaxis().SetTitle(breco)
-        hresp.GetYaxis().SetTitle(btruth)
-        hresp.Write()
+        bins = binning_ttbar.get(v, binning[v]) if t == 'ttbar' else binning[v]
+        booker.book2D(hname, breco, btruth, bins, bins, selection=cuts, title=t+"_"+v)
 
-foutroot.Close()
+booker.write(args.output+'.root')
 
 # Get all histograms and plot them
 foutroot = TFile.Open(args.output+'.root', 'read')
@@ -1,10 +1,20 @@
 #!/usr/bin/env python3
 import os
+import sys
+import json
+import time
+import shlex
+import subprocess
+import traceback
+import resource
 import tracemalloc
+from contextlib import contextmanager, nullcontext
 
 #from ntupler import Ntupler
 from ntuplerRDF import NtupleRDF
 from datasets import getInputFileNames, read_config
+from mc_weight_variations import getWeightIndexFileName
+from manifest import writeManifest
 
 import logging
 logging.basicConfig(
@@ -15,103 +25,373 @@ logger = logging.getLogger(__name__)
 
 import argparse
 
-parser = argparse.ArgumentParser()
-
-parser.add_argument('-r', '--reco-files', required=True, nargs='+', type=str,
-                    help="Input root files containing reco trees")
-#
-# either parton level or particle level input files, but not both
-mgroup = parser.add_mutually_exclusive_group()
-mgroup.add_argument('-t', '--parton-files', nargs='+', type=str,
-                    help="Input root files containing parton level trees")
-mgroup.add_argument('-p', '--particle-files', nargs='+', type=str,
-                    help="Input root files containing particle level trees")
-#
-parser.add_argument('-w', '--sumweight-config', type=str,
-                    help="Config file to read sum weight from")
-parser.add_argument('-o', '--outdir', default='.',
-                    help="Output directory")
-parser.add_argument('-n', '--name', type=str, default='ntuple',
-                    help="Prefix of the output file names")
-parser.add_argument('-m', '--maxevents', type=int,
-                    help="Max number of events to process")
-parser.add_argument('-a', '--algorithm-topreco',
-                    choices=['pseudotop', 'klfitter'], default='pseudotop',
-                    help="Top reconstruction algorithm")
-parser.add_argument('-g', '--generator-weights', action='store_true',
-                    help="If True, store the variations of MC generator weights")
-parser.add_argument('--treename', type=str, default='nominal',
-                    help="Tree name of reco level input")
-parser.add_argument('-u', '--save-unmatched', action='store_true', 
-                    help="If True, save the unmatched truth events")
-parser.add_argument('-v', '--verbose', action='store_true',
-                    help="If True, set logging level to DEBUG, otherwise INFO")
-
-args = parser.parse_args()
-
-if args.verbose:
-    logger.setLevel(logging.DEBUG)
-else:
-    logger.setLevel(logging.INFO)
-
-# get input files
-inputFiles_reco = getInputFileNames(args.reco_files)
-if args.reco_files:
-    logger.info(f"Get reco input files from {args.reco_files}")
-
-if args.sumweight_config:
-    logger.info(f"Get sum weights map from {args.sumweight_config}")
-    sumw_dict = read_config(args.sumweight_config)
-else:
-    sumw_dict = None
-
-if args.parton_files:
-    # parton level
-    logger.info(f"Get parton level input files from {args.parton_files}")
-    inputFiles_mctruth = getInputFileNames(args.parton_files)
-    truth_level = 'parton'
-elif args.particle_files:
-    # particle level
-    logger.info(f"Get particle level input files from {args.particle_files}")
-    inputFiles_mctruth = getInputFileNames(args.particle_files)
-    truth_level = 'particle'
-else:
-    # reco only
-    inputFiles_mctruth = []
-    truth_level = ''
-
-# output directory
-if not os.path.isdir(args.outdir):
-    logger.info("Create output directory: {}".format(args.outdir))
-    os.makedirs(args.outdir)
-
-assert(len(inputFiles_reco) > 0)
-
-# start processing
-tracemalloc.start()
-
-ntupler = NtupleRDF(
-    os.path.join(args.outdir, args.name),
-    inputFiles_reco,
-    inputFiles_mctruth,
-    sumWeights_dict = sumw_dict,
-    recoAlgo = args.algorithm_topreco,
-    truthLevel = truth_level,
-    treename = args.treename,
-    treename_truth = args.treename,
-    verbose = args.verbose
-)
-
-# run
-ntupler(
-    maxevents = args.maxevents,
-    saveUnmatchedReco = True, # always true
-    saveUnmatchedTruth = args.save_unmatched,
-    include_dR = True,
-    include_gen_weights = args.generator_weights
-)
-
-mcurrent, mpeak = tracemalloc.get_traced_memory()
-logger.info(f"Current memory usage is {mcurrent*1e-6:.1f} MB; Peak was {mpeak*1e-6:.1f} MB")
-
-tracemalloc.stop()
\ No newline at end of file
+def getArgParser():
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument('-r', '--reco-files', nargs='+', type=str,
+                        help="Input root files containing reco trees")
+    #
+    # either parton level or particle level input files, but not both
+    mgroup = parser.add_mutually_exclusive_group()
+    mgroup.add_argument('-t', '--parton-files', nargs='+', type=str,
+                        help="Input root files containing parton level trees")
+    mgroup.add_argument('-p', '--particle-files', nargs='+', type=str,
+                        help="Input root files containing particle level trees")
+    #
+    parser.add_argument('-w', '--sumweight-config', type=str,
+                        help="Config file to read sum weight from")
+    parser.add_argument('-o', '--outdir', default='.',
+                        help="Output directory")
+    parser.add_argument('-n', '--name', type=str, default='ntuple',
+                        help="Prefix of the output file names")
+    parser.add_argument('-m', '--maxevents', type=int,
+                        help="Max number of events to process")
+    parser.add_argument('-a', '--algorithm-topreco',
+                        choices=['pseudotop', 'klfitter'], default='pseudotop',
+                        help="Top reconstruction algorithm")
+    parser.add_argument('-g', '--generator-weights', action='store_true',
+                        help="If True, store the variations of MC generator weights")
+    parser.add_argument('--all-generator-weights', action='store_true',
+                        help="If True, store all MC generator weight variations instead of only the ones with an alias")
+    parser.add_argument('--treename', type=str, default='nominal',
+                        help="Tree name of reco level input")
+    parser.add_argument('-u', '--save-unmatched', action='store_true',
+                        help="If True, save the unmatched truth events")
+    parser.add_argument('--cache-size', type=float,
+                        help="TTreeCache size in MB. If provided, the cache is trained on the branches used in processing")
+    parser.add_argument('--prefetch', action='store_true',
+                        help="If True, prefetch baskets and open remote input files asynchronously")
+    parser.add_argument('--histograms', type=str,
+                        help="A json file of observables and bins, e.g. a binning config. If provided, fill their reco, truth and response histograms in the same event loops and write them to <name>_..._histograms.root")
+    parser.add_argument('--no-manifest', action='store_true',
+                        help="If True, do not write the manifest sidecar files of the outputs")
+    parser.add_argument('--no-checksum', action='store_true',
+                        help="If True, do not compute the checksums of the outputs for the manifests")
+    parser.add_argument('--units', type=str,
+                        help="A json file of processing units written by planBatches.py. If provided, process the units in sequence in this process instead of the input files given by the other arguments")
+    parser.add_argument('--worker', type=str,
+                        help="A SQLite work queue filled by planBatches.py --queue. If provided, pull units from the queue and process them until it is empty")
+    parser.add_argument('--max-time', type=float,
+                        help="Worker mode: do not claim new units after this many hours")
+    parser.add_argument('--log-taskid', type=str,
+                        help="Batch task id <jobid>_<arrayid> used to name the log of each unit in its job directory when processing units")
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help="If True, set logging level to DEBUG, otherwise INFO")
+
+    return parser
+
+def processMiniNtuples(args):
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
+    else:
+        logger.setLevel(logging.INFO)
+
+    # get input files
+    inputFiles_reco = getInputFileNames(args.reco_files)
+    if args.reco_files:
+        logger.info(f"Get reco input files from {args.reco_files}")
+
+    if args.sumweight_config:
+        logger.info(f"Get sum weights map from {args.sumweight_config}")
+        sumw_dict = read_config(args.sumweight_config)
+    else:
+        sumw_dict = None
+
+    # compiled generator weight index
+    fname_gwindex = None
+    if args.generator_weights or args.all_generator_weights:
+        if args.sumweight_config:
+            fname_gwindex = getWeightIndexFileName(args.sumweight_config)
+            logger.info(f"Get generator weight index from {fname_gwindex}")
+        else:
+            logger.warning("No sum weight config provided. Cannot locate the generator weight index.")
+
+    if args.parton_files:
+        # parton level
+        logger.info(f"Get parton level input files from {args.parton_files}")
+        inputFiles_mctruth = getInputFileNames(args.parton_files)
+        truth_level = 'parton'
+    elif args.particle_files:
+        # particle level
+        logger.info(f"Get particle level input files from {args.particle_files}")
+        inputFiles_mctruth = getInputFileNames(args.particle_files)
+        truth_level = 'particle'
+    else:
+        # reco only
+        inputFiles_mctruth = []
+        truth_level = ''
+
+    # output directory
+    if not os.path.isdir(args.outdir):
+        logger.info("Create output directory: {}".format(args.outdir))
+        os.makedirs(args.outdir)
+
+    assert(len(inputFiles_reco) > 0)
+
+    # start processing
+    tracemalloc.start()
+    tstart = time.time()
+
+    ntupler = NtupleRDF(
+        os.path.join(args.outdir, args.name),
+        inputFiles_reco,
+        inputFiles_mctruth,
+        sumWeights_dict = sumw_dict,
+        genWeightsIndex = fname_gwindex,
+        recoAlgo = args.algorithm_topreco,
+        truthLevel = truth_level,
+        treename = args.treename,
+        treename_truth = args.treename,
+        cacheSize = args.cache_size * 1024**2 if args.cache_size else None,
+        prefetch = args.prefetch,
+        verbose = args.verbose
+    )
+
+    # run
+    ntupler(
+        maxevents = args.maxevents,
+        saveUnmatchedReco = True, # always true
+        saveUnmatchedTruth = args.save_unmatched,
+        include_dR = True,
+        include_gen_weights = args.generator_weights or args.all_generator_weights,
+        all_gen_weights = args.all_generator_weights,
+        histConfig = args.histograms
+    )
+
+    mcurrent, mpeak = tracemalloc.get_traced_memory()
+    logger.info(f"Current memory usage is {mcurrent*1e-6:.1f} MB; Peak was {mpeak*1e-6:.1f} MB")
+
+    # tracemalloc only sees the python heap, not the allocations of ROOT, which dominate the memory used by the job
+    # ru_maxrss is in kB on Linux
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    logger.info(f"Maximum resident set size: {max_rss/1024**2:.1f} MB")
+
+    # manifests of the outputs
+    if not args.no_manifest:
+        for fname_out, summary in ntupler.outputs.items():
+            logger.info(f"Write manifest of {fname_out}")
+            timing = dict(summary['timing'], total=time.time()-tstart)
+            extra = {k: summary[k] for k in ['cutflow', 'histograms'] if k in summary}
+            writeManifest(
+                fname_out,
+                columns = summary['columns'],
+                event_counts = summary['event_counts'],
+                input_files = ntupler.inputFiles,
+                timing = timing,
+                checksum = not args.no_checksum,
+                peak_memory = mpeak,
+                max_rss = max_rss,
+                options = vars(args),
+                **extra
+                )
+
+    tracemalloc.stop()
+
+    return ntupler.outputs
+
+@contextmanager
+def redirectOutput(logname):
+    """
+    Redirect stdout and stderr, including the output of ROOT, to logname
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved_out, saved_err = os.dup(1), os.dup(2)
+
+    with open(logname, 'a') as flog:
+        os.dup2(flog.fileno(), 1)
+        os.dup2(flog.fileno(), 2)
+        try:
+            yield flog
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.dup2(saved_out, 1)
+            os.dup2(saved_err, 2)
+            os.close(saved_out)
+            os.close(saved_err)
+
+def runUnit(parser, unit, label, log_taskid=None, verbose=False, local=False):
+    """ Process one unit in a process forked from this one
+    ______
+    Arguments
+    parser: argument parser of this script
+    unit: dict with keys 'args' (command line arguments of this script), and
+          optionally 'jobfile' and 'arrayid' of the job the unit is taken from
+    label: str; name of the unit in the messages
+    log_taskid: str; batch task <jobid>_<arrayid> processing the unit. If provided,
+                the output of the unit is written to <job directory>/<log_taskid>.unit<arrayid>.out,
+                where arrayid is the one of the original job, ending with its exit code
+    verbose: bool; if True, set logging level to DEBUG
+    local: bool; if True, mark the log as one of a run outside of the batch system
+
+    Return
+    exit code: 0 if successful, 128 + the signal number if the unit was killed, otherwise 1
+    """
+    logname = None
+    if log_taskid and unit.get('jobfile'):
+        logname = os.path.join(os.path.dirname(unit['jobfile']), f"{log_taskid}.unit{unit['arrayid']}.out")
+        logger.info(f"{label}: {unit['jobfile']} [{unit['arrayid']}]. Log: {logname}")
+    else:
+        logger.info(f"{label}: {shlex.join(unit['args'])}")
+
+    tstart = time.time()
+
+    # run the unit in a forked process: its maximum resident set size and ROOT's
+    # I/O counters in the manifests are then those of the unit alone
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pid = os.fork()
+    if pid == 0:
+        exit_code = 1
+        try:
+            exit_code = processUnit(parser, unit, label, logname, verbose, local)
+        finally:
+            os._exit(exit_code)
+
+    _, status = os.waitpid(pid, 0)
+    if os.WIFSIGNALED(status):
+        # killed e.g. by the OOM killer before it could write its exit code
+        exit_code = 128 + os.WTERMSIG(status)
+        if logname:
+            with open(logname, 'a') as flog:
+                flog.write(f"exit code {exit_code}\n")
+    else:
+        exit_code = os.WEXITSTATUS(status)
+
+    logger.info(f"{label} finished with exit code {exit_code} in {time.time()-tstart:.1f} seconds")
+
+    return exit_code
+
+def processUnit(parser, unit, label, logname=None, verbose=False, local=False):
+    """
+    Process one unit in the current process with its output written to logname if provided.
+    Return 0 if successful, otherwise 1
+    """
+    with redirectOutput(logname) if logname else nullcontext():
+        if logname:
+            print(f"HOSTNAME={os.uname().nodename}", flush=True)
+            if local:
+                print("BATCH_SYSTEM=local", flush=True)
+            # the job the unit is taken from
+            print(f"JOBFILE={unit['jobfile']}", flush=True)
+            print(f"ARRAYID={unit['arrayid']}", flush=True)
+            print(label, flush=True)
+
+        try:
+            args = parser.parse_args(unit['args'])
+            args.verbose |= verbose
+            processMiniNtuples(args)
+            exit_code = 0
+        except SystemExit as e:
+            # invalid arguments of the unit, reported by argparse
+            print(f"Exited with {e.code}", flush=True)
+            exit_code = 1
+        except Exception:
+            traceback.print_exc()
+            exit_code = 1
+
+        if logname:
+            print(f"exit code {exit_code}", flush=True)
+
+    return exit_code
+
+def processUnits(fname_units, log_taskid=None, verbose=False):
+    """
+    Process the units listed in the json file fname_units in sequence in this process.
+    Return the number of failed units.
+    """
+    with open(fname_units) as f:
+        units = json.load(f)
+
+    logger.info(f"Process {len(units)} units from {fname_units}")
+
+    parser = getArgParser()
+    nfailed = 0
+
+    for i, unit in enumerate(units):
+        exit_code = runUnit(parser, unit, f"Batched unit {i} of {fname_units}", log_taskid, verbose)
+        nfailed += exit_code != 0
+
+    return nfailed
+
+def runWorker(fname_queue, log_taskid=None, verbose=False, max_units=None, max_time=None, heartbeat_interval=60.):
+    """ Pull units from a work queue and process them until the queue is empty
+    ______
+    Arguments
+    fname_queue: str; SQLite work queue filled by planBatches.py --queue
+    log_taskid: str; batch task id to name the logs of the units. If None, use the current time
+    verbose: bool; if True, set logging level to DEBUG
+    max_units: int; stop after this many units
+    max_time: float; do not claim new units after this many seconds, e.g. to stay
+              within the walltime of the allocation
+
+    Return
+    number of processed units, number of failed units
+    """
+    import workqueue
+    from workqueue import WorkQueue, getWorkerName
+
+    queue = WorkQueue(fname_queue)
+    worker = getWorkerName()
+    logger.info(f"Worker {worker} pulls units from {fname_queue}")
+
+    parser = getArgParser()
+    tstart = time.time()
+    nprocessed, nfailed = 0, 0
+
+    while True:
+        if max_units and nprocessed >= max_units:
+            break
+        if max_time and time.time() - tstart > max_time:
+            logger.info("No time left for another unit")
+            break
+
+        unit = queue.claim(worker)
+        if unit is None:
+            logger.info("No more pending units")
+            break
+
+        # keep the claim alive from another process: the event loop holds the GIL, so a thread could not beat
+        heartbeat = subprocess.Popen([
+            sys.executable, workqueue.__file__, fname_queue, 'heartbeat', str(unit['id']),
+            '--worker', worker, '--interval', str(heartbeat_interval)
+            ])
+
+        try:
+            exit_code = runUnit(
+                parser, unit, f"Unit {unit['id']} of {fname_queue}",
+                log_taskid or f"{int(time.time())}_0", verbose, local = log_taskid is None)
+        finally:
+            heartbeat.terminate()
+            heartbeat.wait()
+
+        if not queue.complete(unit['id'], exit_code, worker):
+            logger.error(f"Unit {unit['id']} was requeued while it ran and is now held by another worker. Its outputs may be overwritten")
+        nprocessed += 1
+        nfailed += exit_code != 0
+
+    logger.info(f"Worker {worker} processed {nprocessed} units, {nfailed} failed, in {time.time()-tstart:.1f} seconds")
+    queue.close()
+
+    return nprocessed, nfailed
+
+if __name__ == "__main__":
+
+    parser = getArgParser()
+    args = parser.parse_args()
+
+    if args.units or args.worker:
+        if args.worker:
+            nprocessed, nfailed = runWorker(args.worker, args.log_taskid, args.verbose, max_time=args.max_time*3600 if args.max_time else None)
+        else:
+            nfailed = processUnits(args.units, args.log_taskid, args.verbose)
+
+        if nfailed:
+            logger.error(f"{nfailed} units failed")
+            sys.exit(1)
+    else:
+        if not args.reco_files:
+            parser.error("the following arguments are required: -r/--reco-files")
+
+        processMiniNtuples(args)
@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+Run the array tasks of batch job files on the local machine
+
+Take the job summary yaml (or job files, or a list of job files such as
+resubmit_list.txt) produced by writeJobFile.py and run the array tasks with a
+bounded pool of processes within a CPU and memory budget. Logs are written to
+<jobid>_<arrayid>.out in the job directories and end with 'exit code N' as
+expected by checkOutputs.py.
+"""
+import os
+import re
+import sys
+import time
+import yaml
+import signal
+import subprocess
+
+from analyzeJobLogs import parseMemory, parseTime
+from jobstate import openJobStore
+
+def parseArraySpec(spec):
+    """
+    Array indices from a job array specification e.g. '0-9%4' or '1,3,5-7'
+    """
+    spec = spec.split('%')[0]
+    indices = []
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            first, last = part.split('-')
+            indices += list(range(int(first), int(last)+1))
+        else:
+            indices.append(int(part))
+    return indices
+
+class LocalTask():
+    """
+    One array task of a job file
+    """
+    def __init__(self, jobfile, arrayid, jobid, memory, walltime, command, env):
+        self.jobfile = jobfile
+        self.arrayid = arrayid
+        self.jobid = jobid
+        self.memory = memory # GB
+        self.walltime = walltime # seconds or None
+        self.command = command
+        self.env = env
+
+        self.logname = os.path.join(os.path.dirname(jobfile), f"{jobid}_{arrayid}.out")
+        self.process = None
+        self.flog = None
+        self.tstart = None
+        self.timed_out = False
+
+    def start(self):
+        self.flog = open(self.logname, 'w')
+        self.flog.write(f"HOSTNAME={os.uname().nodename}\n")
+        # the job id is not known to any scheduler (see collectJobStatus.py)
+        self.flog.write("BATCH_SYSTEM=local\n")
+        self.flog.flush()
+        self.tstart = time.time()
+        self.process = subprocess.Popen(
+            self.command, stdout=self.flog, stderr=subprocess.STDOUT,
+            env=self.env, start_new_session=True
+            )
+
+    def poll(self):
+        if self.walltime and time.time() - self.tstart > self.walltime and not self.timed_out:
+            self.timed_out = True
+            os.killpg(self.process.pid, signal.SIGTERM)
+
+        return self.process.poll()
+
+    def finish(self, write_exit_code=True):
+        exit_code = self.process.returncode
+        if self.timed_out:
+            # same message as slurm so that the failure is classified as a timeout
+            self.flog.write(f"\nlocal: error: *** JOB {self.jobid} CANCELLED AT {time.strftime('%Y-%m-%dT%H:%M:%S')} DUE TO TIME LIMIT ***\n")
+        if write_exit_code:
+            self.flog.write(f"exit code {exit_code}\n")
+        self.flog.close()
+        return exit_code
+
+def readJobFile(fname_job):
+    """
+    Array indices, memory (GB) and walltime (seconds) requested in a job file
+    """
+    with open(fname_job) as f:
+        lines = f.readlines()
+
+    indices, memory, walltime = [0], 8., None
+    for line in lines:
+        if line.startswith('#SBATCH --array=') or line.startswith('#PBS -t '):
+            indices = parseArraySpec(line.split('=' if line.startswith('#SBATCH') else '-t ')[-1].strip())
+        elif line.startswith('#SBATCH --mem=') or line.startswith('#PBS -l mem='):
+            memory = parseMemory(line.split('=')[-1])
+        elif line.startswith('#SBATCH --time=') or line.startswith('#PBS -l walltime='):
+            walltime = parseTime(line.split('=')[-1].strip())
+
+    return indices, memory, walltime
+
+def getDirectCommand(fname_job):
+    """
+    The processMiniNtuples.py command line in the job file and the variables it uses.
+    Inputs are read from their original location and outputs are written to the output directory directly.
+    """
+    with open(fname_job) as f:
+        script = f.read()
+
+    # the run script of cedar jobs is sourced by the job file
+    m = re.search(r'^source (\S+runJob\S+\.sh) ', script, re.M)
+    if m:
+        with open(m.group(1)) as f:
+            script = f.read()
+
+    m = re.search(r'^python3 (\S*processMiniNtuples\.py.*)$', script, re.M)
+    if not m:
+        raise RuntimeError(f"Cannot find the processMiniNtuples.py command in {fname_job}")
+    cmdline = m.group(1)
+
+    variables = {}
+    m = re.search(r'^OUTDIR=(.*)$', script, re.M)
+    if m:
+        variables['OUTDIR'] = m.group(1).strip()
+        variables['OUTDIR_LOCAL'] = variables['OUTDIR']
+
+    # the last assignment is the original input arguments for jobs with staged inputs
+    input_args = re.findall(r'^\s*INPUT_ARGS="(.*)"\s*$', script, re.M)
+    if input_args:
+        variables['INPUT_ARGS'] = input_args[-1]
+
+    return f"{sys.executable} {cmdline}", variables
+
+def expandVariables(value, env):
+    """
+    Expand $VAR and ${VAR} in value with env. Unknown variables are kept as they are.
+    """
+    return re.sub(r'\$\{?(\w+)\}?', lambda m: env.get(m.group(1), m.group(0)), value)
+
+def makeTasks(fname_job, jobid, mode='direct', task_mem=None, enforce_walltime=False, indices=None):
+    indices_job, memory, walltime = readJobFile(fname_job)
+    if indices is None:
+        indices = indices_job
+
+    if task_mem:
+        memory = task_mem
+
+    srcdir = os.getenv('SourceDIR', os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+    if mode == 'direct':
+        cmdline, variables = getDirectCommand(fname_job)
+    else:
+        cmdline, variables = f"bash {fname_job}", {}
+
+    tasks = []
+    for arrayid in indices:
+        env = dict(os.environ)
+        env['SourceDIR'] = srcdir
+        env['SLURM_ARRAY_TASK_ID'] = str(arrayid)
+        env['SLURM_JOB_ID'] = str(jobid)
+        env['SLURM_ARRAY_JOB_ID'] = str(jobid)
+        env['PBS_ARRAYID'] = str(arrayid)
+        env['PBS_JOBID'] = str(jobid)
+        env['array_id'] = str(arrayid)
+        env.setdefault('SLURM_TMPDIR', os.getenv('TMPDIR', '/tmp'))
+
+        # variables of the job file may refer to the array index
+        for vname, value in variables.items():
+            env[vname] = expandVariables(value, env)
+
+        command = ['bash', '-c', cmdline] if mode == 'direct' else cmdline.split()
+        tasks.append(LocalTask(fname_job, arrayid, jobid, memory, walltime if enforce_walltime else None, command, env))
+
+    return tasks
+
+# data taking years of the subcampaigns
+era_years = {'mc16a': ['2015', '2016'], 'mc16d': ['2017'], 'mc16e': ['2018']}
+
+def getJobFiles(jobs_dict, samples=[], systematics=[], eras=[]):
+    """
+    Job files in the job summary dictionary: list of (keys, job file)
+    """
+    jobfiles = []
+
+    def walk(d, keys):
+        for k, v in d.items():
+            if isinstance(v, dict):
+                walk(v, keys+[k])
+            elif v:
+                jobfiles.append((keys+[k], v))
+
+    walk(jobs_dict, [])
+
+    selected = []
+    for keys, fname_job in jobfiles:
+        if samples and not keys[0] in samples:
+            continue
+        if systematics and len(keys) > 2 and not any(s in keys[1] for s in systematics):
+            continue
+        if eras and not keys[-1] in eras and not keys[-1] in [y for e in eras for y in era_years.get(e, [])]:
+            continue
+        selected.append((keys, fname_job))
+
+    return selected
+
+def getAvailableMemory():
+    """
+    Total physical memory in GB
+    """
+    try:
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') / 1024**3
+    except (ValueError, OSError):
+        return 8.
+
+def runTasks(tasks, max_processes=None, max_memory=None, poll_interval=1., write_exit_code=True, slots=None):
+    """ Run tasks in a bounded pool of processes
+    ______
+    Arguments
+    tasks: list of LocalTask
+    max_processes: int; max number of tasks running at the same time. Number of CPUs if None
+    max_memory: float; memory budget in GB shared by the running tasks. Total physical memory if None
+    poll_interval: float; seconds between checks of the running tasks
+    write_exit_code: bool; if True, append 'exit code N' to the logs
+    slots: threading.Semaphore; if provided, a slot is held by each running task, so that
+           calls in several threads share one budget of processes
+
+    Return
+    A dictionary: (job file, array index) -> exit code
+    """
+    if max_processes is None:
+        max_processes = os.cpu_count()
+    if max_memory is None:
+        max_memory = getAvailableMemory()
+
+    pending = list(tasks)
+    running = []
+    exit_codes = {}
+
+    try:
+        while pending or running:
+            # start new tasks within the budget
+            mem_used = sum(t.memory for t in running)
+            i = 0
+            while i < len(pending) and len(running) < max_processes:
+                task = pending[i]
+                # a task larger than the budget runs alone
+                if mem_used + task.memory <= max_memory or not running:
+                    if slots is not None and not slots.acquire(blocking=False):
+                        # all processes of the shared budget are in use
+                        break
+                    pending.pop(i)
+                    print(f"Start {os.path.basename(task.jobfile)} [{task.arrayid}] ({task.memory:.0f}G): {task.logname}")
+                    task.start()
+                    running.append(task)
+                    mem_used += task.memory
+                else:
+                    i += 1
+
+            time.sleep(poll_interval)
+
+            for task in list(running):
+                if task.poll() is None:
+                    continue
+
+                running.remove(task)
+                if slots is not None:
+                    slots.release()
+                exit_code = task.finish(write_exit_code)
+                exit_codes[(task.jobfile, task.arrayid)] = exit_code
+                print(f"Done {os.path.basename(task.jobfile)} [{task.arrayid}]: exit code {exit_code} ({time.time()-task.tstart:.0f} s)")
+
+    except KeyboardInterrupt:
+        print("Interrupted. Stop the running tasks")
+        for task in running:
+            os.killpg(task.process.pid, signal.SIGTERM)
+            task.process.wait()
+            task.finish(write_exit_code)
+            if slots is not None:
+                slots.release()
+        raise
+
+    return exit_codes
+
+def runJobsLocal(
+    paths,
+    samples = [],
+    systematics = [],
+    eras = [],
+    mode = 'direct',
+    max_processes = None,
+    max_memory = None,
+    task_mem = None,
+    enforce_walltime = False,
+    dry_run = False
+    ):
+
+    jobfiles = [] # (keys, job file)
+    jobs_configs = [] # (yaml, list of keys)
+
+    for path in paths:
+        if path.endswith('.yaml') or path.endswith('.yml'):
+            with open(path) as f:
+                jobs_dict = yaml.load(f, yaml.FullLoader)
+            selected = getJobFiles(jobs_dict, samples, systematics, eras)
+            jobfiles += selected
+            jobs_configs.append((path, [keys for keys, _ in selected]))
+        elif path.endswith('.txt'):
+            with open(path) as f:
+                jobfiles += [([], l.strip()) for l in f if l.strip()]
+        else:
+            jobfiles.append(([], path))
+
+    # local job ids, unique across runs. checkOutputs.py takes the logs written last, whatever their job ids
+    jobid_base = int(time.time())
+
+    tasks = []
+    for i, (keys, fname_job) in enumerate(jobfiles):
+        if not os.path.isfile(fname_job):
+            print(f"WARNING: job file {fname_job} does not exist. Skip...")
+            continue
+        tasks += makeTasks(fname_job, jobid_base+i, mode, task_mem, enforce_walltime)
+
+    print(f"{len(tasks)} tasks from {len(jobfiles)} job files")
+
+    if dry_run:
+        for t in tasks:
+            print(f"{t.logname}: {' '.join(t.command)} ({t.memory:.0f}G)")
+        return {}
+
+    # job files run as a whole print their exit code themselves
+    # record the attempts in the job state stores
+    stores = [openJobStore(fname_config) for fname_config, _ in jobs_configs]
+
+    def getStoreAndJob(fname_job):
+        for store in stores:
+            jobfile = store.findJobFile(fname_job)
+            if jobfile:
+                return store, jobfile
+        return None, None
+
+    for t in tasks:
+        store, jobfile = getStoreAndJob(t.jobfile)
+        if store:
+            store.addAttempts(jobfile, [t.arrayid], str(t.jobid), 'local', t.memory, t.walltime, {t.arrayid: t.logname})
+
+    exit_codes = runTasks(tasks, max_processes, max_memory, write_exit_code = mode=='direct')
+
+    for (fname_job, arrayid), exit_code in exit_codes.items():
+        store, jobfile = getStoreAndJob(fname_job)
+        if store:
+            store.updateTasks(jobfile, {arrayid: {'status': 'success' if exit_code == 0 else 'failed', 'exit_code': exit_code}})
+
+    # export the job submission status in the same way as submitJobs.py
+    for store, (fname_config, _) in zip(stores, jobs_configs):
+        jcfg_names = os.path.splitext(fname_config)
+        fname_submitted = jcfg_names[0] + '_submitted' + jcfg_names[1]
+        print(f"Update job submission status in {fname_submitted}")
+        with open(fname_submitted, 'w') as outfile:
+            yaml.dump(store.exportSubmitted(), outfile)
+        store.close()
+
+    nfailed = sum(1 for c in exit_codes.values() if c != 0)
+    print(f"{len(exit_codes)-nfailed}/{len(exit_codes)} tasks succeeded")
+
+    return exit_codes
+
+if __name__ == "__main__":
+
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+
+    parser.add_argument("paths", nargs='+', type=str,
+                        help="Job summary yaml files, job files, or txt files listing job files")
+    parser.add_argument("-s", "--samples", nargs="+", default=[],
+                        help="List of samples")
+    parser.add_argument("-u", "--systematics", nargs="+", default=[],
+                        help="List of systematic uncertainties")
+    parser.add_argument("-e", "--eras", nargs="+", default=[],
+                        help="List of subcampaigns/years of datasets")
+    parser.add_argument("--mode", choices=['direct', 'script'], default='direct',
+                        help="'direct': run the processMiniNtuples.py command of the job files in the current environment; 'script': run the whole job files with bash")
+    parser.add_argument("-j", "--max-processes", type=int,
+                        help="Max number of tasks running at the same time. Default: number of CPUs")
+    parser.add_argument("-m", "--max-memory", type=float,
+                        help="Memory budget in GB. Default: total physical memory")
+    parser.add_argument("--task-mem", type=float,
+                        help="Memory in GB assumed for each task. Default: the memory requested in the job files")
+    parser.add_argument("--enforce-walltime", action='store_true',
+                        help="If True, stop the tasks that exceed the walltime requested in the job files")
+    parser.add_argument("-d", "--dry-run", action="store_true",
+                        help="If True, print the tasks instead of running them")
+
+    args = parser.parse_args()
+
+    exit_codes = runJobsLocal(
+        args.paths,
+        samples = args.samples,
+        systematics = args.systematics,
+        eras = args.eras,
+        mode = args.mode,
+        max_processes = args.max_processes,
+        max_memory = args.max_memory,
+        task_mem = args.task_mem,
+        enforce_walltime = args.enforce_walltime,
+        dry_run = args.dry_run
+    )
+
+    sys.exit(0 if all(c == 0 for c in exit_codes.values()) else 1)
@@ -0,0 +1,470 @@
+#!/usr/bin/env python3
+"""
+Run the production as a workflow of steps: sum weights -> job files -> processing -> checks -> tarballs
+
+  sumweights/<sample>                      computeSumWeights.py for one sample (updates the shared sum weight files)
+  jobgen/<sample>/<syst>/<era>             writeJobFile.py for one sample/tree/era (obs|fakes/<year> for data)
+  process/<sample>/<syst>/<era>            run the job locally or submit it and wait for it to finish
+  check/<sample>/<syst>/<era>              check the job logs and the outputs
+  tarball/<syst>, tarball/<ttbar_alt>      pack the outputs
+
+Only stale steps are run: a step runs again only if the part of the dataset
+config, the sum weights and the files it depends on have changed, or its outputs
+are missing. Changing one DSID in the dataset config therefore only reprocesses
+the jobs of that DSID and rebuilds the tarballs containing them. Independent
+steps run in parallel.
+
+  python scripts/runWorkflow.py -d configs/datasets/ttdiffxs382/datasets.yaml -i <sample_dir> -o <output_dir> [targets]
+"""
+import os
+import glob
+import time
+import yaml
+import threading
+
+from workflow import Workflow, Step, summarizeResults
+from datasets import read_config, getSystTreeNames
+from computeSumWeights import getSumWeightsConfigName
+from makeTarballs import samples_MC, samples_alt_ttbar, samples_alt_bkg, subcampaigns, years
+
+import logging
+logging.basicConfig(
+    format='%(asctime)s %(levelname)-7s %(name)-10s %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+    )
+logger = logging.getLogger('runWorkflow')
+
+# number of jobs for each sample as in test/generate_jobfiles_mini382_v1.py
+njobs_dict = {'ttbar': 10, 'ttbar_amchw': 10, 'ttbar_hdamp': 10, 'ttbar_hw': 10, 'ttbar_mt169': 10, 'ttbar_mt176': 10, 'ttbar_AFII': 10, 'ttbar_madspin': 10, 'ttbar_pthard1': 10, 'ttbar_pthard2': 10, 'ttbar_sh2212': 10, 'ttbar_recoil': 10, 'ttbar_minnlops': 10}
+
+def getDSID(dataset_name):
+    # e.g. user.mromano.410470.PhPy8EG.DAOD_TOPQ1.e6337_s3126_r9364_p4514.274_vv01.MINI382
+    try:
+        return int(dataset_name.split('.')[2])
+    except (IndexError, ValueError):
+        return None
+
+_yaml_cache = {}
+
+def readConfigCached(fpath):
+    """
+    Read a yaml file once as long as it does not change
+    """
+    if not os.path.isfile(fpath):
+        return {}
+    key = (fpath, os.stat(fpath).st_mtime_ns)
+    if not key in _yaml_cache:
+        _yaml_cache[key] = read_config(fpath) or {}
+    return _yaml_cache[key]
+
+class ProductionJob():
+    """
+    Settings of one job file: a sample, a systematic tree (None for data) and an era or year
+    """
+    def __init__(self, sample, syst, era, topdir, sumw_config):
+        self.sample = sample
+        self.syst = syst
+        self.era = era
+        self.sumw_config = sumw_config
+
+        # same rules as test/generate_jobfiles_mini382_v1.py
+        if sample in ['obs', 'fakes']:
+            self.dataset_sample = 'data'
+            self.outdir = os.path.join(topdir, sample, era)
+            self.truth_level = ''
+            self.extra_args = "--treename nominal_Loose" if sample == 'fakes' else ''
+            self.key = f"{sample}/{era}"
+        else:
+            self.dataset_sample = sample
+            self.outdir = os.path.join(topdir, sample, syst, era)
+            isSignal = sample.startswith('ttbar')
+            isNominal = syst == 'nominal'
+
+            if sample == 'ttbar_AFII':
+                self.truth_level = 'parton'
+                self.extra_args = "-g"
+            elif sample in samples_alt_ttbar:
+                self.truth_level = 'parton'
+                self.extra_args = f"--treename {syst}"
+            else:
+                self.truth_level = 'parton' if isNominal and isSignal else ''
+                self.extra_args = f"--treename {syst}"
+                if isNominal and isSignal:
+                    # store generator weights and unmatched truth events
+                    self.extra_args += " -g -u"
+
+            self.key = f"{sample}/{syst}/{era}"
+
+        self.njobs = njobs_dict.get(self.dataset_sample, 1)
+        self.jobfile = os.path.realpath(os.path.join(self.outdir, f"submitJob_{self.dataset_sample}_{era}.sh"))
+
+    def getInputLists(self):
+        return sorted(glob.glob(os.path.join(self.outdir, 'inputs', 'filelist_*.txt')))
+
+    def getArrayIndices(self):
+        return sorted(set(int(os.path.splitext(f)[0].split('_')[-1]) for f in self.getInputLists() if '_tt_' in os.path.basename(f)))
+
+    def getExpectedOutputs(self, algo='pseudotop'):
+        name = self.dataset_sample
+        suffix = f"{algo}_{self.truth_level}_ljets.h5" if self.truth_level else f"{algo}_ljets.h5"
+        return [os.path.join(self.outdir, f"{name}_{i}_{suffix}") for i in self.getArrayIndices()]
+
+    def listOutputs(self):
+        """
+        Names, sizes and modification times of the outputs and their manifests
+        """
+        outputs = []
+        if os.path.isdir(self.outdir):
+            for f in sorted(os.listdir(self.outdir)):
+                if f.endswith('.h5') or f.endswith('.manifest.json'):
+                    st = os.stat(os.path.join(self.outdir, f))
+                    outputs.append((f, st.st_size, st.st_mtime_ns))
+        return outputs
+
+def getJobInputs(job, datasets_dict):
+    """
+    The part of the dataset config and the sum weights that a job depends on
+    """
+    dsnames = datasets_dict.get(job.dataset_sample, {}).get(job.era)
+    if isinstance(dsnames, str):
+        dsnames = [dsnames]
+    dsnames = dsnames or []
+
+    inputs = {
+        'datasets': dsnames,
+        'options': [job.truth_level, job.extra_args, job.njobs],
+    }
+
+    if job.dataset_sample != 'data':
+        sumw = readConfigCached(job.sumw_config)
+        dsids = [getDSID(dn) for dn in dsnames]
+        inputs['sumweights'] = {dsid: sumw.get(dsid, {}).get(job.era) for dsid in dsids}
+
+        if '-g' in job.extra_args.split():
+            # generator weight variations of these DSIDs
+            fname_vars = job.sumw_config.replace('sumWeights', 'sumWeights_variations')
+            sumw_vars = readConfigCached(fname_vars)
+            inputs['sumweights_variations'] = {dsid: sumw_vars.get(dsid, {}).get(job.era) for dsid in dsids}
+
+    return inputs
+
+def getProcessInputs(job, datasets_dict):
+    """
+    The files read by the processing of a job and the sum weights it reads at run time
+    """
+    inputs = dict({'jobfile': job.jobfile}, **{os.path.basename(f): f for f in job.getInputLists()})
+
+    # the outputs are normalized with the sum weights, which do not change the job file
+    job_inputs = getJobInputs(job, datasets_dict)
+    for k in ['sumweights', 'sumweights_variations']:
+        if k in job_inputs:
+            inputs[k] = job_inputs[k]
+
+    return inputs
+
+def buildWorkflow(
+    dataset_config,
+    local_dir,
+    topdir,
+    samples = [],
+    systematics = [],
+    eras = [],
+    site = 'atlasserv',
+    executor = 'local',
+    batch_system = 'slurm',
+    max_processes = None,
+    syst_config = None
+    ):
+
+    datasets_dict = read_config(dataset_config)
+
+    jobs_dir = os.path.join(topdir, 'jobs')
+    workflow = Workflow(os.path.join(jobs_dir, 'workflow_state.json'))
+    jobs_config = os.path.join(jobs_dir, 'jobfiles.yaml')
+
+    srcdir = os.getenv('SourceDIR', os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+    if syst_config is None:
+        syst_config = os.path.join(srcdir, 'configs/datasets/systematics.yaml')
+    treenames = ['nominal'] + getSystTreeNames(syst_config)
+
+    sumw_config = os.path.join(os.path.dirname(dataset_config), getSumWeightsConfigName(dataset_config))
+    sumw_config_afii = os.path.splitext(sumw_config)[0] + '_AFII.yaml'
+
+    def selected(sample, syst, era):
+        if samples and not sample in samples:
+            return False
+        if systematics and syst is not None and not any(s in syst for s in systematics):
+            return False
+        if eras and not era in eras:
+            return False
+        return True
+
+    ###
+    # jobs
+    jobs = []
+    for sample in ['obs', 'fakes']:
+        for year in years:
+            if selected(sample, None, year):
+                jobs.append(ProductionJob(sample, None, year, topdir, None))
+
+    for sample in samples_MC + samples_alt_bkg:
+        for syst in treenames:
+            for era in subcampaigns:
+                if selected(sample, syst, era):
+                    jobs.append(ProductionJob(sample, syst, era, topdir, sumw_config))
+
+    for sample in samples_alt_ttbar:
+        for era in subcampaigns:
+            if selected(sample, 'nominal', era):
+                jobs.append(ProductionJob(sample, 'nominal', era, topdir, sumw_config_afii if sample == 'ttbar_AFII' else sumw_config))
+
+    ###
+    # sum weights
+    for sample in sorted(set(j.dataset_sample for j in jobs if j.dataset_sample != 'data')):
+        def compute(sample=sample):
+            from computeSumWeights import computeSumWeights
+            computeSumWeights(dataset_config, local_dir, samples=[sample], update=True)
+
+        workflow.add(Step(
+            f"sumweights/{sample}",
+            compute,
+            inputs = lambda sample=sample: {'datasets': datasets_dict.get(sample)},
+            outputs = [sumw_config_afii if sample == 'ttbar_AFII' else sumw_config],
+            lock = 'sumweights' # the steps update the same files
+            ))
+
+    ###
+    # job files, processing and checks
+
+    # the local executor runs the array tasks of all process steps within one budget of processes
+    slots = threading.BoundedSemaphore(max_processes or os.cpu_count())
+
+    for job in jobs:
+        deps_jobgen = [] if job.dataset_sample == 'data' else [f"sumweights/{job.dataset_sample}"]
+
+        def generate(job=job):
+            from writeJobFile import writeJobFile
+            writeJobFile(
+                job.dataset_sample,
+                dataset_config,
+                outdir = job.outdir,
+                subcampaigns = [job.era],
+                truth_level = job.truth_level,
+                njobs = job.njobs,
+                extra_args = job.extra_args,
+                sumw_config = job.sumw_config,
+                site = site,
+                local_dir = local_dir,
+                verbosity = 0
+                )
+
+        workflow.add(Step(
+            f"jobgen/{job.key}",
+            generate,
+            deps = deps_jobgen,
+            inputs = lambda job=job: getJobInputs(job, datasets_dict),
+            outputs = [job.jobfile]
+            ))
+
+        def process(job=job):
+            runJob(job, jobs_config, executor, batch_system, max_processes, slots)
+
+        workflow.add(Step(
+            f"process/{job.key}",
+            process,
+            deps = [f"jobgen/{job.key}"],
+            inputs = lambda job=job: getProcessInputs(job, datasets_dict),
+            outputs = lambda job=job: job.getExpectedOutputs()
+            ))
+
+        def check(job=job):
+            checkJob(job)
+
+        workflow.add(Step(
+            f"check/{job.key}",
+            check,
+            deps = [f"process/{job.key}"],
+            inputs = lambda job=job: {'outputs': job.listOutputs()}
+            ))
+
+    ###
+    # tarballs
+    tarball_dir = os.path.join(topdir, 'tarballs')
+
+    def addTarballStep(name, jobs_in_tarball, build):
+        tarfile_name = os.path.join(tarball_dir, f"{name}.tar")
+
+        def action():
+            if not os.path.isdir(tarball_dir):
+                os.makedirs(tarball_dir)
+            # appends the new or changed outputs, or rebuilds the archive in a temporary file
+            build(tarfile_name)
+
+        workflow.add(Step(
+            f"tarball/{name}",
+            action,
+            deps = [f"check/{j.key}" for j in jobs_in_tarball],
+            inputs = lambda: {j.key: j.listOutputs() for j in jobs_in_tarball},
+            outputs = [tarfile_name]
+            ))
+
+    from makeTarballs import makeTarballSyst, makeTarballAlt
+
+    for syst in treenames:
+        jobs_syst = [j for j in jobs if (j.syst == syst and not j.sample in samples_alt_ttbar) or (syst == 'nominal' and j.syst is None)]
+        if jobs_syst:
+            addTarballStep(syst, jobs_syst, lambda fname, syst=syst: makeTarballSyst(topdir, syst, fname))
+
+    for sample in samples_alt_ttbar:
+        jobs_alt = [j for j in jobs if j.sample == sample]
+        if jobs_alt:
+            addTarballStep(sample, jobs_alt, lambda fname, sample=sample: makeTarballAlt(topdir, sample, fname))
+
+    # job summary in the same layout as generate_jobfiles_*.py for the other tools
+    jobs_dict = {}
+    for job in jobs:
+        if job.syst is None:
+            jobs_dict.setdefault(job.sample, {})[job.era] = job.jobfile
+        else:
+            jobs_dict.setdefault(job.sample, {}).setdefault(job.syst, {})[job.era] = job.jobfile
+
+    return workflow, jobs_config, jobs_dict
+
+def runJob(job, jobs_config, executor='local', batch_system='slurm', max_processes=None, slots=None, poll_interval=60.):
+    """
+    Run the array tasks of a job locally, or submit the job and wait for it to finish
+
+    slots: threading.Semaphore; budget of local processes shared by the steps running in parallel
+    poll_interval: float; seconds between the queries of the batch system accounting
+    """
+    from jobstate import openJobStore
+    from runJobsLocal import readJobFile
+
+    indices, mem, walltime = readJobFile(job.jobfile)
+    store = openJobStore(jobs_config)
+
+    if executor == 'local':
+        from runJobsLocal import makeTasks, runTasks
+        tasks = makeTasks(job.jobfile, int(time.time()*1000) % 10**10)
+        for t in tasks:
+            store.addAttempts(job.jobfile, [t.arrayid], str(t.jobid), 'local', t.memory, t.walltime, {t.arrayid: t.logname})
+
+        exit_codes = runTasks(tasks, max_processes=max_processes, slots=slots)
+        store.updateTasks(job.jobfile, {i: {'status': 'success' if c == 0 else 'failed', 'exit_code': c} for (_, i), c in exit_codes.items()})
+        store.close()
+
+        nfailed = sum(1 for c in exit_codes.values() if c != 0)
+        if nfailed:
+            raise RuntimeError(f"{nfailed} tasks of {job.jobfile} failed")
+    else:
+        from submitJobs import submit
+        from collectJobStatus import getCollector, updateJobStore
+
+        batch_jobid = submit(job.jobfile, batch_system=batch_system)
+        if not batch_jobid:
+            store.close()
+            raise RuntimeError(f"Failed to submit {job.jobfile}")
+        store.addAttempts(job.jobfile, indices, batch_jobid, batch_system, mem, walltime)
+
+        # poll the accounting until all array tasks are finished instead of keeping a blocking sbatch/qsub
+        collector = getCollector(batch_system)
+        final = {}
+        while True:
+            final.update(updateJobStore(store, collector, [batch_system], [job.jobfile]))
+            if not any(a['jobfile'] == job.jobfile for a in store.getOpenAttempts([batch_system])):
+                break
+            time.sleep(poll_interval)
+        store.close()
+
+        nfailed = sum(1 for st in final.values() if st['status'] != 'success')
+        if nfailed:
+            raise RuntimeError(f"{nfailed} tasks of {job.jobfile} failed")
+
+def checkJob(job):
+    """
+    Check the job logs and the outputs. Raise an exception if any task failed or any output is bad.
+    """
+    from checkOutputs import checkJobLogs, checkHDF5inDir
+
+    bad_indices = set()
+    failures = {}
+    checkJobLogs(job.outdir, bad_indices, failures=failures)
+    if bad_indices:
+        raise RuntimeError(f"Failed tasks {sorted(bad_indices)} in {job.outdir}: {failures}")
+
+    ngood, ntotal = [int(x) for x in checkHDF5inDir(job.outdir).split('/')]
+    if ngood != ntotal or ntotal == 0:
+        raise RuntimeError(f"{ntotal-ngood} of {ntotal} outputs are bad in {job.outdir}")
+
+if __name__ == "__main__":
+
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+
+    parser.add_argument("targets", nargs='*', default=[],
+                        help="Steps to bring up to date, or prefixes of their names e.g. 'tarball/nominal', 'process/ttH'. Default: all steps")
+    parser.add_argument("-d", "--dataset-config", type=str, required=True,
+                        help="Dataset yaml config")
+    parser.add_argument("-i", "--input-dir", type=str,
+                        help="Local directory where input sample files are stored. If None, look for datasets via Rucio")
+    parser.add_argument("-o", "--output-dir", type=str, required=True,
+                        help="Top output directory")
+    parser.add_argument("-s", "--samples", nargs='+', default=[],
+                        help="Only include these samples (obs and fakes for data)")
+    parser.add_argument("-u", "--systematics", nargs='+', default=[],
+                        help="Only include systematic trees that contain one of the names")
+    parser.add_argument("-e", "--eras", nargs='+', default=[],
+                        help="Only include these subcampaigns or years")
+    parser.add_argument("--site", choices=['flashy', 'cedar', 'atlasserv'], default='atlasserv',
+                        help="Host to run batch jobs")
+    parser.add_argument("-x", "--executor", choices=['local', 'batch'], default='local',
+                        help="'local': run the array tasks on this machine; 'batch': submit the jobs and wait for them to finish")
+    parser.add_argument("-b", "--batch-system", choices=['slurm', 'pbs'], default='slurm',
+                        help="Batch system for the batch executor")
+    parser.add_argument("-j", "--max-workers", type=int, default=4,
+                        help="Max number of steps running at the same time")
+    parser.add_argument("-p", "--max-processes", type=int,
+                        help="Max number of array tasks running at the same time with the local executor, shared by all steps. Number of CPUs if None")
+    parser.add_argument("-n", "--dry-run", action='store_true',
+                        help="If True, only print the stale steps")
+    parser.add_argument("-f", "--force", action='store_true',
+                        help="If True, run the selected steps even if they are up to date")
+    parser.add_argument("-k", "--keep-going", action='store_true',
+                        help="If True, keep running the steps that do not depend on a failed step")
+    parser.add_argument("-v", "--verbose", action='store_true',
+                        help="If True, set logging level to DEBUG")
+
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.DEBUG if args.verbose else logging.INFO)
+
+    topdir = os.path.expanduser(args.output_dir)
+
+    workflow, jobs_config, jobs_dict = buildWorkflow(
+        args.dataset_config,
+        os.path.expanduser(args.input_dir) if args.input_dir else None,
+        topdir,
+        samples = args.samples,
+        systematics = args.systematics,
+        eras = args.eras,
+        site = args.site,
+        executor = args.executor,
+        batch_system = args.batch_system,
+        max_processes = args.max_processes
+        )
+
+    if not args.dry_run:
+        if not os.path.isdir(os.path.dirname(jobs_config)):
+            os.makedirs(os.path.dirname(jobs_config))
+        with open(jobs_config, 'w') as outfile:
+            yaml.dump(jobs_dict, outfile)
+
+    targets = [name for name in workflow.steps if not args.targets or any(name.startswith(t) for t in args.targets)]
+
+    results = workflow.run(targets, max_workers=args.max_workers, dry_run=args.dry_run, force=args.force, keep_going=args.keep_going)
+
+    for name in sorted(results):
+        if results[name] != 'uptodate':
+            print(f"{results[name]:<9} {name}")
+    print(summarizeResults(results))
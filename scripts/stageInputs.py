@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Copy input files of a job to node-local scratch and write new input lists pointing to the local copies
+"""
+import os
+import sys
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+from datasets import getInputFileNames
+
+def isRemote(fpath):
+    return '://' in fpath
+
+def copyFile(src, dest):
+    ftmp = dest + '.part'
+    if isRemote(src):
+        subprocess.run(['xrdcp', '--silent', '--force', src, ftmp], check=True)
+    else:
+        shutil.copyfile(src, ftmp)
+    os.replace(ftmp, dest)
+    return dest
+
+def stageInputs(input_lists, destdir, max_workers=8, reserve=0.1):
+    """ Copy files in input lists to destdir
+    ______
+    Arguments
+    input_lists: list of str; input lists or root files as taken by processMiniNtuples.py
+    destdir: str; local directory to copy the files to
+    max_workers: int; number of parallel copies
+    reserve: float; fraction of the total input size to keep free on the local disk
+
+    Return
+    A list of the staged input list file names. Raise RuntimeError if the files cannot be staged.
+    """
+    os.makedirs(destdir, exist_ok=True)
+
+    copies = [] # (source, destination)
+    staged_lists = []
+    for flist in input_lists:
+        label = os.path.splitext(os.path.basename(flist))[0]
+        subdir = os.path.join(destdir, label)
+        os.makedirs(subdir, exist_ok=True)
+
+        files = getInputFileNames([flist], check_file=False)
+        local_files = [os.path.join(subdir, os.path.basename(f)) for f in files]
+        copies += list(zip(files, local_files))
+
+        fname_staged = os.path.join(destdir, f"{label}.txt")
+        with open(fname_staged, 'w') as fstaged:
+            fstaged.write('\n'.join(local_files)+'\n')
+        staged_lists.append(fname_staged)
+
+    # check there is enough space on the local disk
+    total_size = sum(os.path.getsize(src) for src, _ in copies if not isRemote(src))
+    free_space = shutil.disk_usage(destdir).free
+    print(f"Stage {len(copies)} files ({total_size/1e9:.2f} GB) to {destdir} ({free_space/1e9:.2f} GB free)")
+    if any(isRemote(src) for src, _ in copies):
+        print("Sizes of remote files are not included in the check")
+
+    if total_size * (1 + reserve) > free_space:
+        raise RuntimeError("Not enough space on the local disk to stage the input files")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(lambda c: copyFile(*c), copies))
+
+    return staged_lists
+
+if __name__ == "__main__":
+
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Stage input files of a job to node-local scratch")
+
+    parser.add_argument('input_lists', nargs='+', type=str,
+                        help="Input lists or root files")
+    parser.add_argument('-d', '--destdir', type=str, required=True,
+                        help="Local directory to copy the input files to")
+    parser.add_argument('-j', '--max-workers', type=int, default=8,
+                        help="Number of parallel copies")
+    parser.add_argument('-r', '--reserve', type=float, default=0.1,
+                        help="Fraction of the total input size to keep free on the local disk")
+
+    args = parser.parse_args()
+
+    try:
+        staged = stageInputs(args.input_lists, args.destdir, args.max_workers, args.reserve)
+    except Exception as e:
+        print(f"Failed to stage input files: {e}")
+        sys.exit(1)
+
+    for fname in staged:
+        print(f"Staged input list: {fname}")
@@ -1,7 +1,11 @@
 import os
+import re
 import yaml
 import subprocess
 
+from jobstate import openJobStore
+from runJobsLocal import readJobFile
+
 def init_dict(job_file_dict, val=False):
     sub_dict = {}
     for k in job_file_dict:
@@ -19,10 +23,14 @@ def submit(fname_job, args='', dry_run=False, batch_system='flashy'):
 
     commands = []
 
+    # use the walltime requested in the job file if there is one
+    with open(fname_job) as fjob:
+        has_time = any(l.startswith('#SBATCH --time=') or l.startswith('#PBS -l walltime=') for l in fjob)
+
     if batch_system in ['flashy','pbs','torque', 'qsub']:
-        commands += ['qsub', '-l', 'walltime=8:0:0']
+        commands += ['qsub'] if has_time else ['qsub', '-l', 'walltime=8:0:0']
     elif batch_system in ['atlasserv', 'slurm', 'sbatch']:
-        commands += ['sbatch', '--time=8:0:0']
+        commands += ['sbatch'] if has_time else ['sbatch', '--time=8:0:0']
 
     if args:
         commands += args.split()
@@ -31,7 +39,12 @@ def submit(fname_job, args='', dry_run=False, batch_system='flashy'):
 
     print(" ".join(commands))
     if not dry_run:
-        subprocess.run(commands, check=True)
+        proc = subprocess.run(commands, check=True, stdout=subprocess.PIPE, encoding='utf-8')
+        print(proc.stdout.strip())
+
+        # job id e.g. "Submitted batch job 1234" or "1234[].server"
+        m = re.search(r'(\d+)', proc.stdout)
+        return m.group(1) if m else None
 
 def submitJobs(
     jobs_config, # yaml config of jobs that are ready to be submitted
@@ -58,21 +71,19 @@ def submitJobs(
         print(f"There is no job to be submitted from {jobs_config}")
         return
 
-    # A dictionary to keep track of if or not a job is submitted
-    submitted_dict = {}
-
     if jobs_submitted is None:
         # use the same file name as jobs_config but add a suffix _submitted
         jcfg_names = os.path.splitext(jobs_config)
         jobs_submitted = jcfg_names[0] + '_submitted' + jcfg_names[1]
 
-    if os.path.isfile(jobs_submitted):
-        # open and read it
-        with open(jobs_submitted) as f:
-            submitted_dict = yaml.load(f, yaml.FullLoader)
-    else:
-        # initialize submitted_dict according to keys in jobs_dict
-        submitted_dict = init_dict(jobs_dict)
+    # job states. Import the submission status from jobs_submitted if the store is new
+    store = openJobStore(jobs_config, jobs_dict, jobs_submitted)
+
+    def submit_and_record(fname_job):
+        batch_jobid = submit(fname_job, args_string, dry_run, batch_system)
+        if not dry_run and os.path.isfile(fname_job):
+            indices, mem, walltime = readJobFile(fname_job)
+            store.addAttempts(fname_job, indices, batch_jobid, batch_system, mem, walltime)
 
     #####
     if not samples:
@@ -94,17 +105,16 @@ def submitJobs(
                 years += ['2018']
 
             for year in years:
-                if submitted_dict[sample][year] and not resubmit:
-                    print(f"WARNING: [{sample}][{year}] has already been submitted")
-                    continue
-
                 fname_job = jobs_dict[sample][year]
                 if fname_job is None:
                     print(f"WARNING: job file for [{sample}][{year}] is None. Abort...")
                     continue
 
-                submit(fname_job, args_string, dry_run, batch_system)
-                submitted_dict[sample][year] = not dry_run
+                if store.isSubmitted(fname_job) and not resubmit:
+                    print(f"WARNING: [{sample}][{year}] has already been submitted")
+                    continue
+
+                submit_and_record(fname_job)
 
         else:
             # all available systematics
@@ -116,22 +126,23 @@ def submitJobs(
                     continue
 
                 for e in eras:
-                    if submitted_dict[sample][syst][e] and not resubmit:
-                        print(f"WARNING: [{sample}][{syst}][{e}] has already been submitted")
-                        continue
-
                     fname_job = jobs_dict[sample][syst][e]
                     if fname_job is None:
                         print(f"WARNING: job file for [{sample}][{syst}][{e}] is None. Abort...")
                         continue
 
-                    submit(fname_job, args_string, dry_run, batch_system)
-                    submitted_dict[sample][syst][e] = not dry_run
+                    if store.isSubmitted(fname_job) and not resubmit:
+                        print(f"WARNING: [{sample}][{syst}][{e}] has already been submitted")
+                        continue
 
-    # Save job submission status to file, replace the old one if it exists
+                    submit_and_record(fname_job)
+
+    # Export job submission status to file, replace the old one if it exists
     print(f"Update job submission status in {jobs_submitted}")
     with open(jobs_submitted, 'w') as outfile:
-        yaml.dump(submitted_dict, outfile)
+        yaml.dump(store.exportSubmitted(), outfile)
+
+    store.close()
 
 if __name__ == "__main__":
 
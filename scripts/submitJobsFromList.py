@@ -1,6 +1,8 @@
 import sys
 
 from submitJobs import submit
+from runJobsLocal import readJobFile
+from jobstate import openJobStore
 
 import argparse
 
@@ -14,16 +16,33 @@ parser.add_argument("-b", "--batch-system", choices=['pbs','slurm'],
                     default='slurm', help="Batch system")
 parser.add_argument("-d", "--dry-run", action="store_true",
                     help="If True, print the command instead of running it")
+parser.add_argument("-j", "--job-config", type=str,
+                    help="Job summary yaml. If provided, record the submissions in its job state store")
 
 args = parser.parse_args()
 
+store = openJobStore(args.job_config) if args.job_config else None
+
 print(f"Submit jobs from {args.job_list}")
 with open(args.job_list, 'r') as flist:
     for fname_sub in flist:
-        submit(
-            fname_sub.strip(), 
+        fname_sub = fname_sub.strip()
+        if not fname_sub:
+            continue
+
+        batch_jobid = submit(
+            fname_sub,
             args=args.arguments,
             dry_run=args.dry_run,
             batch_system=args.batch_system
             )
-        
+
+        if store and batch_jobid:
+            jobfile = store.findJobFile(fname_sub)
+            if jobfile:
+                indices, mem, walltime = readJobFile(fname_sub)
+                store.addAttempts(jobfile, indices, batch_jobid, args.batch_system, mem, walltime)
+
+if store:
+    store.close()
+
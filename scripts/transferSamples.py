@@ -0,0 +1,466 @@
+#!/usr/bin/env python3
+"""
+Transfer sample files to local disk with a pool of concurrent, resumable and verified transfers
+"""
+import os
+import json
+import time
+import shutil
+import zlib
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from datasets import read_config
+from replicas import did_str2dict
+
+import logging
+logging.basicConfig(
+    format='%(asctime)s %(levelname)-7s %(name)-10s %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+    )
+logger = logging.getLogger("transferSamples")
+
+def adler32(fpath, blocksize=16*1024*1024):
+    """
+    Compute the adler32 checksum of a file as an 8-digit hex string (same as Rucio)
+    """
+    value = 1
+    with open(fpath, 'rb') as f:
+        while True:
+            block = f.read(blocksize)
+            if not block:
+                break
+            value = zlib.adler32(block, value)
+    return f"{value & 0xffffffff:08x}"
+
+def getSuffix(sample):
+    suffix = ['tt']
+
+    # MC samples
+    if sample != 'data':
+        suffix.append('sumWeights')
+
+    # Truth level for signal MC samples
+    if sample.startswith('ttbar'):
+        suffix += ['tt_truth', 'tt_PL']
+
+    return suffix
+
+def getDefaultEras(sample):
+    if sample == 'data':
+        return ['2015', '2016', '2017', '2018']
+    else:
+        return ['mc16a', 'mc16d', 'mc16e']
+
+######
+# Transfer backends
+# A backend provides
+#   listFiles(dataset): a list of dicts with keys 'name', 'size', 'checksum' (adler32 or None), 'source'
+#   fetch(fileinfo, dest): transfer the file to dest, resuming from a partial file if possible
+class LocalCopyBackend():
+    """
+    Copy files from a directory on a mounted file system
+    Dataset files are expected in <sourcedir>/<dataset> or <sourcedir>/<dataset without .root>
+    """
+    def __init__(self, sourcedir, compute_checksum=False, blocksize=16*1024*1024):
+        self.sourcedir = sourcedir
+        self.compute_checksum = compute_checksum
+        self.blocksize = blocksize
+
+    def _dataset_dir(self, dataset):
+        for dname in [dataset, dataset[:-len('.root')] if dataset.endswith('.root') else dataset]:
+            dpath = os.path.join(self.sourcedir, dname)
+            if os.path.isdir(dpath):
+                return dpath
+        return None
+
+    def listFiles(self, dataset):
+        dpath = self._dataset_dir(dataset)
+        if dpath is None:
+            logger.warning(f"Cannot find {dataset} in {self.sourcedir}")
+            return []
+
+        files = []
+        for fname in sorted(os.listdir(dpath)):
+            fpath = os.path.join(dpath, fname)
+            if not os.path.isfile(fpath):
+                continue
+
+            files.append({
+                'name': fname,
+                'size': os.path.getsize(fpath),
+                # computed by getChecksum() for the files that are copied only
+                'checksum': None,
+                'source': fpath
+                })
+
+        return files
+
+    def getChecksum(self, fileinfo):
+        """
+        adler32 of the source file if compute_checksum, otherwise None
+        """
+        return adler32(fileinfo['source']) if self.compute_checksum else None
+
+    def fetch(self, fileinfo, dest):
+        fpart = dest + '.part'
+
+        # resume from the partial file if there is one
+        offset = os.path.getsize(fpart) if os.path.isfile(fpart) else 0
+        if offset > fileinfo['size']:
+            offset = 0
+
+        with open(fileinfo['source'], 'rb') as fsrc, open(fpart, 'ab' if offset else 'wb') as fdst:
+            fsrc.seek(offset)
+            shutil.copyfileobj(fsrc, fdst, self.blocksize)
+
+        os.replace(fpart, dest)
+
+class RsyncBackend():
+    """
+    Copy files with rsync, e.g. from EOS: user@lxplus.cern.ch:/eos/user/...
+    Dataset files are expected in <sourcedir>/<dataset without .root>/
+    """
+    def __init__(self, sourcedir, extra_args=[]):
+        self.sourcedir = sourcedir.rstrip('/')
+        self.extra_args = extra_args
+
+    def _dataset_dir(self, dataset):
+        dname = dataset[:-len('.root')] if dataset.endswith('.root') else dataset
+        return f"{self.sourcedir}/{dname}"
+
+    def listFiles(self, dataset):
+        src = self._dataset_dir(dataset) + '/'
+        try:
+            output = subprocess.check_output(['rsync', '--list-only', *self.extra_args, src], encoding='UTF-8')
+        except subprocess.CalledProcessError as e:
+            logger.warning(f"Failed to list {src}: {e}")
+            return []
+
+        files = []
+        for line in output.splitlines():
+            # e.g. -rw-r--r--    123,456,789 2022/05/01 12:00:00 user.mromano.123._000001.tt.root
+            fields = line.split()
+            if len(fields) < 5 or not fields[0].startswith('-'):
+                continue
+
+            fname = fields[-1]
+            files.append({
+                'name': fname,
+                'size': int(fields[1].replace(',', '')),
+                'checksum': None,
+                'source': src + fname
+                })
+
+        return files
+
+    def fetch(self, fileinfo, dest):
+        fpart = dest + '.part'
+        subprocess.run(['rsync', '-a', '--append-verify', *self.extra_args, fileinfo['source'], fpart], check=True, stdout=subprocess.DEVNULL)
+        os.replace(fpart, dest)
+
+class RucioBackend():
+    """
+    Download files via Rucio
+    """
+    def __init__(self, client=None, rse=None):
+        self._client = client
+        self.rse = rse
+
+    @property
+    def client(self):
+        if self._client is None:
+            import rucio.client
+            self._client = rucio.client.Client()
+        return self._client
+
+    def listFiles(self, dataset):
+        did = did_str2dict(dataset)
+        files = []
+        for f in self.client.list_files(did['scope'], did['name']):
+            files.append({
+                'name': f['name'],
+                'size': f['bytes'],
+                'checksum': f.get('adler32'),
+                'source': f"{f['scope']}:{f['name']}"
+                })
+        return files
+
+    def fetch(self, fileinfo, dest):
+        # rucio download takes care of partial files itself
+        commands = ['rucio', 'download', '--no-subdir', '--dir', os.path.dirname(dest)]
+        if self.rse:
+            commands += ['--rse', self.rse]
+        commands += [fileinfo['source']]
+        subprocess.run(commands, check=True, stdout=subprocess.DEVNULL)
+
+######
+class TransferManifest():
+    """
+    Record of the completed transfers, kept as a JSON file
+    """
+    def __init__(self, filename):
+        self.filename = filename
+        self._lock = threading.Lock()
+        self.entries = {}
+
+        if os.path.isfile(filename):
+            with open(filename) as f:
+                self.entries = json.load(f)
+
+    def isDone(self, dest, fileinfo):
+        entry = self.entries.get(dest)
+        if entry is None or entry['size'] != fileinfo['size']:
+            return False
+
+        if fileinfo['checksum'] and entry.get('checksum') and entry['checksum'] != fileinfo['checksum']:
+            return False
+
+        # the file should still be there
+        return os.path.isfile(dest) and os.path.getsize(dest) == entry['size']
+
+    def add(self, dest, fileinfo, checksum, elapsed):
+        with self._lock:
+            self.entries[dest] = {
+                'source': fileinfo['source'],
+                'size': fileinfo['size'],
+                'checksum': checksum,
+                'time': time.time(),
+                'elapsed': elapsed
+            }
+            self.save()
+
+    def save(self):
+        ftmp = self.filename + '.tmp'
+        with open(ftmp, 'w') as f:
+            json.dump(self.entries, f, indent=1)
+        os.replace(ftmp, self.filename)
+
+class TransferManager():
+    """
+    Run transfers in a bounded pool of concurrent workers
+    """
+    def __init__(
+        self,
+        backend,
+        manifest,
+        max_workers = 8,
+        verify_checksum = True,
+        retries = 2
+        ):
+        self.backend = backend
+        self.manifest = manifest if isinstance(manifest, TransferManifest) else TransferManifest(manifest)
+        self.max_workers = max_workers
+        self.verify_checksum = verify_checksum
+        self.retries = retries
+
+    def verify(self, fileinfo, dest):
+        if not os.path.isfile(dest):
+            raise RuntimeError(f"{dest} does not exist after transfer")
+
+        size = os.path.getsize(dest)
+        if size != fileinfo['size']:
+            raise RuntimeError(f"Size mismatch for {dest}: {size} != {fileinfo['size']}")
+
+        if not self.verify_checksum:
+            return None
+
+        expected = fileinfo['checksum']
+        if not expected and hasattr(self.backend, 'getChecksum'):
+            # backends without checksums in their listing compute them after the copy
+            expected = self.backend.getChecksum(fileinfo)
+
+        checksum = None
+        if expected:
+            checksum = adler32(dest)
+            if checksum != expected:
+                raise RuntimeError(f"Checksum mismatch for {dest}: {checksum} != {expected}")
+
+        return checksum
+
+    def _transfer(self, fileinfo, dest):
+        for attempt in range(self.retries+1):
+            tstart = time.time()
+            try:
+                self.backend.fetch(fileinfo, dest)
+                checksum = self.verify(fileinfo, dest)
+            except Exception as e:
+                logger.warning(f"Transfer of {fileinfo['source']} failed (attempt {attempt+1}): {e}")
+                if os.path.isfile(dest):
+                    # remove the bad file so that the next attempt starts over
+                    os.remove(dest)
+                continue
+
+            self.manifest.add(dest, fileinfo, checksum, time.time()-tstart)
+            return True
+
+        return False
+
+    def run(self, datasets_dests):
+        """ Transfer datasets
+        ______
+        Arguments
+        datasets_dests: list of (dataset name, destination directory)
+
+        Return
+        Number of files transferred, skipped and failed
+        """
+        # list the files of all datasets first
+        tasks = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            listings = executor.map(lambda dd: self.backend.listFiles(dd[0]), datasets_dests)
+            for (dataset, destdir), files in zip(datasets_dests, listings):
+                if not files:
+                    logger.warning(f"No files found for {dataset}")
+                for fileinfo in files:
+                    tasks.append((fileinfo, os.path.join(destdir, fileinfo['name'])))
+
+        nskipped = 0
+        todo = []
+        for fileinfo, dest in tasks:
+            if self.manifest.isDone(dest, fileinfo):
+                nskipped += 1
+            else:
+                todo.append((fileinfo, dest))
+
+        total_bytes = sum(fileinfo['size'] for fileinfo, _ in todo)
+        logger.info(f"{len(todo)} files ({total_bytes/1e9:.2f} GB) to transfer, {nskipped} already done")
+
+        ndone, nfailed = 0, 0
+        tstart = time.time()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {}
+            for fileinfo, dest in todo:
+                os.makedirs(os.path.dirname(dest), exist_ok=True)
+                futures[executor.submit(self._transfer, fileinfo, dest)] = dest
+
+            for future in as_completed(futures):
+                if future.result():
+                    ndone += 1
+                    logger.debug(f"Done: {futures[future]}")
+                else:
+                    nfailed += 1
+                    logger.error(f"Failed: {futures[future]}")
+
+        elapsed = time.time() - tstart
+        if elapsed > 0 and total_bytes > 0:
+            logger.info(f"Transferred {ndone} files in {elapsed:.1f} seconds ({total_bytes/elapsed/1e6:.1f} MB/s)")
+
+        return ndone, nskipped, nfailed
+
+def getTransferList(dataset_config, samples, localdir, eras=[]):
+    """
+    List (dataset name, destination directory) of the samples in the dataset config
+    """
+    datasets_d = read_config(dataset_config)
+
+    datasets_dests = []
+    for sample in samples:
+        if not sample in datasets_d:
+            logger.warning(f"Cannot find sample {sample} in {dataset_config}")
+            continue
+
+        for era in (eras if eras else getDefaultEras(sample)):
+            dids = datasets_d[sample].get(era)
+            if dids is None:
+                logger.warning(f"No datasets for [{sample}][{era}]")
+                continue
+
+            if not isinstance(dids, list):
+                dids = [dids]
+
+            outdir = os.path.join(localdir, sample, era)
+
+            for s in getSuffix(sample):
+                for d in dids:
+                    dataset = f"{d}_{s}.root"
+                    datasets_dests.append((dataset, os.path.join(outdir, dataset)))
+
+    return datasets_dests
+
+def transferSamples(
+    dataset_config,
+    samples,
+    localdir,
+    eras = [],
+    backend = 'rucio',
+    sourcedir = None,
+    max_workers = 8,
+    manifest = None,
+    verify_checksum = True
+    ):
+
+    if backend == 'rucio':
+        tbackend = RucioBackend()
+    elif backend == 'rsync':
+        tbackend = RsyncBackend(sourcedir)
+    elif backend == 'local':
+        tbackend = LocalCopyBackend(sourcedir, compute_checksum=verify_checksum)
+    else:
+        raise RuntimeError(f"Unknown transfer backend {backend}")
+
+    if manifest is None:
+        manifest = os.path.join(localdir, 'transfer_manifest.json')
+
+    os.makedirs(localdir, exist_ok=True)
+
+    manager = TransferManager(tbackend, manifest, max_workers=max_workers, verify_checksum=verify_checksum)
+
+    return manager.run(getTransferList(dataset_config, samples, localdir, eras))
+
+if __name__ == "__main__":
+
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Transfer sample files listed in a dataset config to local disk")
+
+    parser.add_argument('dataset_config', type=str,
+                        help="Path to the dataset yaml config file")
+    parser.add_argument('-s', '--samples', nargs='+', required=True,
+                        help="List of sample names")
+    parser.add_argument('-o', '--localdir', type=str,
+                        default=os.path.expanduser('~/data/ttbarDiffXs13TeV/MINI382_v1'),
+                        help="Local directory to store the sample files")
+    parser.add_argument('-e', '--eras', nargs='*', default=[],
+                        help="List of subcampaigns or years. If not provided, take all")
+    parser.add_argument('-b', '--backend', choices=['rucio', 'rsync', 'local'], default='rucio',
+                        help="Transfer backend")
+    parser.add_argument('--sourcedir', type=str,
+                        help="Source directory for the rsync and local backends")
+    parser.add_argument('-j', '--max-workers', type=int, default=8,
+                        help="Number of concurrent transfers")
+    parser.add_argument('-m', '--manifest', type=str,
+                        help="Transfer manifest file. If not provided, use <localdir>/transfer_manifest.json")
+    parser.add_argument('--no-checksum', action='store_true',
+                        help="If True, only verify the file sizes")
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help="If True, set logging level to DEBUG, else INFO")
+
+    args = parser.parse_args()
+
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
+    else:
+        logger.setLevel(logging.INFO)
+
+    if args.backend in ['rsync', 'local'] and not args.sourcedir:
+        parser.error(f"--sourcedir is required for the {args.backend} backend")
+
+    ndone, nskipped, nfailed = transferSamples(
+        args.dataset_config,
+        args.samples,
+        args.localdir,
+        eras = args.eras,
+        backend = args.backend,
+        sourcedir = args.sourcedir,
+        max_workers = args.max_workers,
+        manifest = args.manifest,
+        verify_checksum = not args.no_checksum
+    )
+
+    logger.info(f"Transferred: {ndone}, skipped: {nskipped}, failed: {nfailed}")
+
+    if nfailed:
+        exit(1)
@@ -1,6 +1,8 @@
 import os
 import subprocess
+import json
 from datasets import writeDataFileLists
+from resources import ResourceModel, getOutputOptions, input_sizes_name
 from computeSumWeights import getSumWeightsConfigName
 
 template_header_pbs = """#!/bin/bash
@@ -10,6 +12,8 @@ template_header_pbs = """#!/bin/bash
 ### #PBS -m abe
 ### #PBS -M
 #PBS -l nodes=1
+#PBS -l mem={mem_pbs}
+#PBS -l walltime={walltime}
 
 export FRONTIER="(http://frontier.triumf.ca:3128/ATLAS_frontier)(proxyurl=http://lcg-adm1.sfu.computecanada.ca:3128)(proxyurl=http://lcg-adm2.sfu.computecanada.ca:3128)(proxyurl=http://lcg-adm3.sfu.computecanada.ca:3128)"
 
@@ -23,7 +27,8 @@ template_header_slurm = """#!/bin/bash
 #SBATCH --output={outdir}/%A_%a.out
 ### #SBATCH --mail-type=ALL
 ### #SBATCH --mail-user=
-#SBATCH --mem=8G
+#SBATCH --mem={mem}
+#SBATCH --time={walltime}
 #SBATCH --export=NONE
 """
 
@@ -48,7 +53,7 @@ echo "SourceDIR = $SourceDIR"
 """
 
 template_workdir = """
-WorkDIR=#TMP#/$USER/$(date +'%Y%m%d%H%M%S')
+WorkDIR=#TMP#/$USER/$(date +'%Y%m%d%H%M%S')_$$
 mkdir -p $WorkDIR
 cd $WorkDIR
 echo "Change to work directory: $WorkDIR"
@@ -66,19 +71,92 @@ python3 $SourceDIR/scripts/processMiniNtuples.py -n {name}_#ARRAYID# -o $OUTDIR
 echo exit code $?
 """
 
+template_stage = """
+# stage input files to node-local scratch
+python3 $SourceDIR/scripts/stageInputs.py {input_lists} -d $WorkDIR/inputs -j {nstage}
+if [ $? -eq 0 ]; then
+    INPUT_ARGS="{input_args_staged}"
+else
+    echo "Read input files from their original location"
+    INPUT_ARGS="{input_args}"
+fi
+"""
+
+template_mntuple_staged = """
+# output directory
+OUTDIR={outdir}
+echo OUTDIR=$OUTDIR
+
+# write outputs to the work directory first
+OUTDIR_LOCAL=$WorkDIR/outputs
+mkdir -p $OUTDIR_LOCAL
+
+# start running
+python3 $SourceDIR/scripts/processMiniNtuples.py -n {name}_#ARRAYID# -o $OUTDIR_LOCAL $INPUT_ARGS {extra_args}
+exitcode=$?
+
+# move outputs to OUTDIR atomically
+if [ $exitcode -eq 0 ]; then
+    for fout in $OUTDIR_LOCAL/*; do
+        [ -e "$fout" ] || continue
+        fname=$(basename $fout)
+        cp -p $fout $OUTDIR/.$fname.tmp && mv $OUTDIR/.$fname.tmp $OUTDIR/$fname || exitcode=1
+    done
+fi
+
+echo exit code $exitcode
+"""
+
+template_batch = """
+# process the units of this task in sequence in one process
+# the output of each unit is logged in its own job directory
+python3 $SourceDIR/scripts/processMiniNtuples.py --units {units_dir}/units_#ARRAYID#.json --log-taskid #JOBID#_#ARRAYID#
+
+echo exit code $?
+"""
+
+template_worker = """
+# pull units from the shared work queue until it is empty
+# the output of each unit is logged in its own job directory
+python3 $SourceDIR/scripts/processMiniNtuples.py --worker {queue} --max-time {max_time} --log-taskid #JOBID#_#ARRAYID#
+
+echo exit code $?
+"""
+
 template_cleanup = """
 # clean up
 cd ..
 rm -rf $WorkDIR
 """
 
+def getRunTemplate(pars_dict):
+    if pars_dict.get('queue'):
+        # workers of a work queue filled by planBatches.py
+        return template_worker
+    elif pars_dict.get('units_dir'):
+        # batched units planned by planBatches.py
+        return template_batch
+    elif pars_dict.get('stage_inputs'):
+        # copy inputs to and write outputs in the work directory
+        return template_stage + template_mntuple_staged
+    else:
+        return template_mntuple
+
+def getMemoryPBS(mem):
+    """
+    Memory e.g. '8G' in the units of Torque e.g. '8gb'. An upper case 'b' would mean bits.
+    """
+    mem = mem.strip().lower()
+    return mem if mem.endswith('b') else mem + 'b'
+
 def writeJobFile_flashy(pars_dict, filename, verbosity=1):
     # PBS jobs on atlas-t3-ubc.westgrid.ca
     # $PBS_ARRAYID, $PBS_JOBID, /tmp
 
-    jobscripts = template_header_pbs + template_env_atlas + template_workdir + template_mntuple + template_cleanup
-    jobscripts = jobscripts.format(**pars_dict)
+    jobscripts = template_header_pbs + template_env_atlas + template_workdir + getRunTemplate(pars_dict) + template_cleanup
+    jobscripts = jobscripts.format(mem_pbs=getMemoryPBS(pars_dict['mem']), **pars_dict)
     jobscripts = jobscripts.replace('#ARRAYID#', '${PBS_ARRAYID}')
+    jobscripts = jobscripts.replace('#JOBID#', '${PBS_JOBID%%[!0-9]*}')
     jobscripts = jobscripts.replace('#TMP#', '/tmp')
 
     if verbosity > 0:
@@ -89,15 +167,22 @@ def writeJobFile_flashy(pars_dict, filename, verbosity=1):
 
     if verbosity > 0:
         print("To submit the job to cluster:")
-        print("qsub -l walltime=<hh:mm:ss>", filename)
+        print("qsub", filename)
 
 def writeJobFile_atlasserv(pars_dict, filename, verbosity=1):
     # Slurm jobs on atlasserv2.phas.ubc.ca
     # $SLURM_ARRAY_TASK_ID, $SLURM_JOB_ID, /mnt/xrootdg/tmp (for now)
-    jobscripts = template_header_slurm + template_env_atlas + template_mntuple
+    if pars_dict.get('stage_inputs'):
+        # need a node-local work directory
+        jobscripts = template_header_slurm + template_env_atlas + template_workdir + getRunTemplate(pars_dict) + template_cleanup
+        tmpdir = '${SLURM_TMPDIR:-/tmp}'
+    else:
+        jobscripts = template_header_slurm + template_env_atlas + getRunTemplate(pars_dict)
+        tmpdir = '/mnt/xrootdg/tmp' # For now
     jobscripts = jobscripts.format(**pars_dict)
     jobscripts = jobscripts.replace('#ARRAYID#', '${SLURM_ARRAY_TASK_ID}')
-    jobscripts = jobscripts.replace('#TMP#', '/mnt/xrootdg/tmp') # For now
+    jobscripts = jobscripts.replace('#JOBID#', '${SLURM_ARRAY_JOB_ID}')
+    jobscripts = jobscripts.replace('#TMP#', tmpdir)
 
     if verbosity > 0:
         print("Create job file:", filename)
@@ -107,7 +192,7 @@ def writeJobFile_atlasserv(pars_dict, filename, verbosity=1):
 
     if verbosity > 0:
         print("To submit the job to cluster:")
-        print("sbatch --time=<hh:mm:ss>", filename)
+        print("sbatch", filename)
 
 def writeJobFile_cedar(pars_dict, filename, verbosity=1):
     # Slurm jobs on cedar.computecanada.ca
@@ -122,10 +207,11 @@ def writeJobFile_cedar(pars_dict, filename, verbosity=1):
     template_jobfile = template_jobfile.replace("DIRECTIVES", template_header_slurm.format(**pars_dict))
 
     # run script
-    runscript = template_env_lcg + template_workdir + template_mntuple + template_cleanup
+    runscript = template_env_lcg + template_workdir + getRunTemplate(pars_dict) + template_cleanup
     runscript = runscript.format(**pars_dict)
     runscript = "array_id=${1}\n" + runscript
     runscript = runscript.replace('#ARRAYID#', '${array_id}')
+    runscript = runscript.replace('#JOBID#', '${SLURM_ARRAY_JOB_ID}')
     runscript = runscript.replace('#TMP#', '${SLURM_TMPDIR}')
     # save run script
     fname_run = filename.replace('submitJob', 'runJob')
@@ -143,7 +229,7 @@ def writeJobFile_cedar(pars_dict, filename, verbosity=1):
 
     if verbosity > 0:
         print("To submit the job to cluster:")
-        print("sbatch --export=None --time=<hh:mm:ss>", filename)
+        print("sbatch --export=None", filename)
 
 def writeJobFile(
     sample,
@@ -160,7 +246,11 @@ def writeJobFile(
     local_dir = None,
     max_task = None,
     verbosity = 0,
-    sumw_config = None
+    sumw_config = None,
+    stage_inputs = False,
+    nstage = 8,
+    resource_model = None,
+    predict_resources = True
     ):
 
     # get the type of job manager based on the site
@@ -212,7 +302,11 @@ def writeJobFile(
         'name' : sample,
         'extra_args' : extra_args,
         'outdir' : outdir,
-        'max_task' : max_task
+        'max_task' : max_task,
+        'stage_inputs' : stage_inputs,
+        'nstage' : nstage,
+        'mem' : '8G',
+        'walltime' : '8:00:00'
     }
 
     ########
@@ -228,7 +322,7 @@ def writeJobFile(
 
     ########
     # Create input file lists
-    datalists = writeDataFileLists(
+    datalists, input_sizes = writeDataFileLists(
         dataset_config,
         sample,
         subcampaigns,
@@ -237,7 +331,25 @@ def writeJobFile(
         host = site,
         truthLevel = truth_level,
         localDir = local_dir,
-        quiet = verbosity < 1)
+        quiet = verbosity < 1,
+        return_sizes = True)
+
+    # keep the input sizes for calibrating the resource model later
+    with open(os.path.join(submit_dir, 'inputs', input_sizes_name), 'w') as fsizes:
+        json.dump({str(i): b for i, b in enumerate(input_sizes)}, fsizes)
+
+    # memory and walltime to request
+    if predict_resources and any(input_sizes):
+        if not isinstance(resource_model, ResourceModel):
+            resource_model = ResourceModel(resource_model)
+
+        options = getOutputOptions(extra_args, truth_level if sample != 'data' else '')
+        mem_gb, walltime = resource_model.predictRequest(input_sizes, options)
+        params_dict['mem'] = f"{mem_gb}G"
+        params_dict['walltime'] = f"{walltime//3600}:{walltime%3600//60:02d}:00"
+
+        if verbosity > 0:
+            print(f"Request {params_dict['mem']} memory and {params_dict['walltime']} walltime per task")
 
     actual_njobs = len(datalists['tt'])
     assert(actual_njobs != 0)
@@ -259,6 +371,19 @@ def writeJobFile(
         fin_PL = datalists['tt_PL'][0].replace('_tt_PL_0.txt', '_tt_PL_#ARRAYID#.txt')
         params_dict['input_args'] += f" -p {fin_PL}"
 
+    # input lists to be staged to the work directory
+    input_lists = [fin_reco]
+    if 'tt_truth' in datalists:
+        input_lists.append(fin_truth)
+    if 'tt_PL' in datalists:
+        input_lists.append(fin_PL)
+
+    params_dict['input_lists'] = ' '.join(input_lists)
+    params_dict['input_args_staged'] = params_dict['input_args']
+    for fin in input_lists:
+        fin_staged = os.path.join('$WorkDIR/inputs', os.path.basename(fin))
+        params_dict['input_args_staged'] = params_dict['input_args_staged'].replace(fin, fin_staged)
+
     if sumw_config is None:
         # infer the sum weights config file name based on dataset_config
         # replace the prefix of the dataset config file name with 'sumWeights'
@@ -273,6 +398,7 @@ def writeJobFile(
 
         # add to input_args
         params_dict['input_args'] += f" -w {sumw_config}"
+        params_dict['input_args_staged'] += f" -w {sumw_config}"
 
     ########
     # job file name
@@ -292,6 +418,78 @@ def writeJobFile(
 
     return foutname
 
+def writeBatchJobFile(
+    units_dir,
+    nbatches,
+    mem,
+    walltime,
+    submit_dir = None,
+    site = 'atlasserv',
+    max_task = None,
+    name = 'batched',
+    queue = None,
+    max_time = None,
+    verbosity = 0
+    ):
+    """ Write a job file whose array tasks each process a list of units
+    ______
+    Arguments
+    units_dir: str; directory of the unit lists units_<arrayid>.json
+    nbatches: int; number of array tasks
+    queue: str; if provided, the array tasks are workers pulling units from this
+           work queue instead of processing the unit lists in units_dir
+    max_time: float; hours after which a worker stops claiming new units
+    mem: str; memory to request per task e.g. '4G'
+    walltime: str; walltime to request per task e.g. '2:00:00'
+    submit_dir: str; directory to write the job file and the job logs. If None, set to units_dir
+    site: str; host to run batch jobs
+    max_task: int; max number of active tasks at any one time
+
+    Return
+    path to the job file
+    """
+    srcdir = os.getenv('SourceDIR')
+    if srcdir is None:
+        raise RuntimeError("SourceDIR is not set.")
+
+    global template_header_pbs
+    global template_header_slurm
+
+    if not max_task:
+        template_header_pbs = template_header_pbs.replace(
+            '#PBS -t 0-{njobarray}%{max_task}', '#PBS -t 0-{njobarray}')
+        template_header_slurm = template_header_slurm.replace(
+            '#SBATCH --array=0-{njobarray}%{max_task}',
+            '#SBATCH --array=0-{njobarray}')
+
+    if not submit_dir:
+        submit_dir = units_dir
+
+    params_dict = {
+        'ntupler_dir' : srcdir,
+        'njobarray' : nbatches - 1,
+        'outdir' : submit_dir,
+        'max_task' : max_task,
+        'units_dir' : os.path.realpath(units_dir),
+        'queue' : os.path.realpath(queue) if queue else None,
+        'max_time' : f"{max_time:.2f}" if max_time else '24',
+        'mem' : mem,
+        'walltime' : walltime
+    }
+
+    foutname = os.path.realpath(os.path.join(submit_dir, f"submitJob_{name}.sh"))
+
+    if site == 'flashy':
+        writeJobFile_flashy(params_dict, foutname, verbosity)
+    elif site == 'atlasserv':
+        writeJobFile_atlasserv(params_dict, foutname, verbosity)
+    elif site == 'cedar':
+        writeJobFile_cedar(params_dict, foutname, verbosity)
+    else:
+        raise RuntimeError(f"Unknown site {site}")
+
+    return foutname
+
 if __name__ == "__main__":
 
     import argparse
@@ -329,6 +527,14 @@ if __name__ == "__main__":
                         help="Verbosity level")
     parser.add_argument('-w', '--sumw-config', type=str, default=None,
                         help="Path to th sum weights yaml config file. If None, infer the file name based on dataset config")
+    parser.add_argument('--stage-inputs', action='store_true',
+                        help="If True, copy the input files to node-local scratch before processing and move the outputs to the output directory once done")
+    parser.add_argument('--nstage', type=int, default=8,
+                        help="Number of parallel copies when staging the input files")
+    parser.add_argument('--resource-model', type=str,
+                        help="Calibrated resource model to predict the memory and walltime of the jobs. If not provided, use the default coefficients")
+    parser.add_argument('--fixed-resources', action='store_true',
+                        help="If True, request 8G memory and 8 hours walltime for all jobs instead of predicting them")
 
     args = parser.parse_args()
 
@@ -348,7 +554,11 @@ if __name__ == "__main__":
             local_dir = args.local_dir,
             max_task = args.max_tasks,
             verbosity = args.verbosity,
-            sumw_config = args.sumw_config
+            sumw_config = args.sumw_config,
+            stage_inputs = args.stage_inputs,
+            nstage = args.nstage,
+            resource_model = args.resource_model,
+            predict_resources = not args.fixed_resources
         )
     except:
         print("Failed to generate job files.")